@@ -1,4 +1,5 @@
 
+import numpy
 
 from TotalDepth.LIS.core import RepCode
 # Python reference methods
@@ -46,6 +47,61 @@ class TimeRepCode68:
         RepCode.from68(0x444C8000)
 
 
+class TimeRepCodeArray:
+    """Converts whole buffers of words with the batch kernels compared with a Python loop of scalar calls."""
+    params = ([49, 68, 73, 79], [1, 1024, 1024 * 1024])
+    param_names = ['rep_code', 'words']
+
+    def setup(self, rep_code, words):
+        self.word_length = RepCode.wordLength(rep_code)
+        self.bytes = bytes(range(256)) * (self.word_length * words // 256 + 1)
+        self.bytes = self.bytes[:self.word_length * words]
+        self.values = numpy.empty(words)
+
+    def time_readBytes_loop(self, rep_code, words):
+        if words > 1024:
+            raise NotImplementedError('Too slow')
+        for i in range(0, len(self.bytes), self.word_length):
+            RepCode.readBytes(rep_code, self.bytes[i:i + self.word_length])
+
+    def time_pRepCode_fromBytesArray(self, rep_code, words):
+        pRepCode.fromBytesArray(rep_code, self.bytes, self.values)
+
+    def time_cRepCode_fromBytesArray(self, rep_code, words):
+        cRepCode.fromBytesArray(rep_code, self.bytes, self.values)
+
+    def time_cpRepCode_fromBytesArray(self, rep_code, words):
+        cpRepCode.fromBytesArray(rep_code, self.bytes, self.values)
+
+    def time_RepCode_readBytesArray(self, rep_code, words):
+        RepCode.readBytesArray(rep_code, self.bytes)
+
+
+class TimeRepCode68ToArray:
+    """Converts whole buffers of values to Rep Code 68 words."""
+    params = [1, 1024, 1024 * 1024]
+    param_names = ['words']
+
+    def setup(self, words):
+        self.values = numpy.linspace(-1000.0, 1000.0, words)
+        self.out = bytearray(4 * words)
+
+    def time_writeBytes_loop(self, words):
+        if words > 1024:
+            raise NotImplementedError('Too slow')
+        for v in self.values:
+            RepCode.writeBytes(v, 68)
+
+    def time_pRepCode_toBytesArray(self, words):
+        pRepCode.toBytesArray(68, self.values, self.out)
+
+    def time_cRepCode_toBytesArray(self, words):
+        cRepCode.toBytesArray(68, self.values, self.out)
+
+    def time_cpRepCode_toBytesArray(self, words):
+        cpRepCode.toBytesArray(68, self.values, self.out)
+
+
 # class MemSuite:
 #     def mem_list(self):
 #         return [0] * 256
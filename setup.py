@@ -181,6 +181,28 @@ ext_modules = [
             '-std=c++14',
         ],
     ),
+    Extension(
+        "TotalDepth.RP66V1.core.cFile",
+        sources=[
+            "src/TotalDepth/RP66V1/core/src/cpy/cFile.cpp",
+            "src/TotalDepth/RP66V1/core/src/cpp/File.cpp",
+        ],
+        extra_compile_args=extra_compile_args + [
+            "-Isrc/TotalDepth/RP66V1/core/src/cpp",
+            '-std=c++14',
+        ],
+    ),
+    Extension(
+        "TotalDepth.RP66V1.core.cRepCode",
+        sources=[
+            "src/TotalDepth/RP66V1/core/src/cpy/cRepCode.cpp",
+            "src/TotalDepth/RP66V1/core/src/cpp/RepCode.cpp",
+        ],
+        extra_compile_args=extra_compile_args + [
+            "-Isrc/TotalDepth/RP66V1/core/src/cpp",
+            '-std=c++14',
+        ],
+    ),
 ]
 
 
@@ -287,21 +287,25 @@ def read_float(file: typing.BinaryIO) -> float:
     return bytes_to_float(file.read(LEN_FLOAT_BYTES))
 
 
+def floats_from_bytes(b: bytes, count: int = -1) -> np.ndarray:
+    """Returns a numpy float64 array of count floats from the bytes, all of them if count is -1.
+    Any trailing partial float is ignored.
+
+    The conversion is the same as ``gen_floats()`` but is done for all the values at once.
+    """
+    if count < 0:
+        count = len(b) // LEN_FLOAT_BYTES
+    words = np.frombuffer(b, dtype='>u4', count=count)
+    exponent = ((words >> 24) & 0x7f).astype(np.int32)
+    # Note: Division by 0xffffff, not 0x1000000, as gen_floats().
+    ret = np.ldexp((words & 0xffffff) / 0xffffff, 4 * (exponent - 64))
+    np.negative(ret, out=ret, where=(words & 0x80000000) != 0)
+    return ret
+
+
 def gen_floats(b: bytes) -> typing.Sequence[float]:
     """Yields a sequence of floats from the bytes."""
-    offset = 0
-    while len(b) > offset:
-        sign = b[offset] & 0x80
-        exp = b[offset] & 0x7f
-        mantissa = b[offset + 1] << 16
-        mantissa |= b[offset + 2] << 8
-        mantissa |= b[offset + 3]
-        m = mantissa / 0xffffff
-        value = m * 16 ** (exp - 64)
-        if sign:
-            value = -value
-        yield value
-        offset += LEN_FLOAT_BYTES
+    yield from floats_from_bytes(b).tolist()
 
 
 ASCII_PRINTABLE_BYTES = set(
@@ -534,7 +538,8 @@ class BITFrameArray:
         self.bit_log_pass_range = LogPassRange(*_temp)
         self.unknown_tail = block[offset:]
         self.frame_count = 0
-        self._temporary_frames: typing.List[typing.List[float]] = [list() for c in self.channel_names]
+        # Each block of frame data as a numpy array of shape (len_channels, number of frames in the block).
+        self._temporary_frames: typing.List[np.ndarray] = []
         self.frame_array: typing.Optional[LogPass.FrameArray] = None
 
     def long_str(self) -> str:
@@ -565,7 +570,6 @@ class BITFrameArray:
         if self.len_channels == 0:
             logger.warning(f'Ignoring block of length {len(block)} when no channels.')
         else:
-            assert len(self.channel_names) == len(self._temporary_frames), f'{len(self.channel_names)} != {len(self._temporary_frames)}'
             if len(block) % self.len_channels:
                 raise ExceptionTotalDepthBITDataBlocks(
                     f'The block length {len(block)} does not have equal data for the channels {self.len_channels}.'
@@ -578,45 +582,41 @@ class BITFrameArray:
                     f'Frame mismatch, byte_len={len(block)} channels={self.len_channels} num_frames={num_frames}'
                     f' Remaining bytes={remainder_bytes} ignored values={remainder_bytes / LEN_FLOAT_BYTES}'
                 )
-            for i, value in enumerate(gen_floats(block)):
-                if i >= num_frames * self.len_channels:
-                    logger.warning(
-                        f'Ignoring surplus values. Remaining bytes={remainder_bytes}'
-                        f' ignored values={remainder_bytes / LEN_FLOAT_BYTES}'
-                    )
-                    break
-                # Note: frame_number = i % num_frames
-                channel_number = i // num_frames
-                assert channel_number < len(self._temporary_frames), f'{channel_number} >= {len(self._temporary_frames)} byte len={len(block)} i={i} channels={self.len_channels} num_frames={num_frames}'
-                self._temporary_frames[channel_number].append(value)
+            if remainder_bytes >= LEN_FLOAT_BYTES:
+                logger.warning(
+                    f'Ignoring surplus values. Remaining bytes={remainder_bytes}'
+                    f' ignored values={remainder_bytes / LEN_FLOAT_BYTES}'
+                )
+            # The block is channel major, num_frames values for the first channel then the next channel and so on.
+            values = floats_from_bytes(block, num_frames * self.len_channels)
+            self._temporary_frames.append(values.reshape(self.len_channels, num_frames))
             self.frame_count += num_frames
 
     def complete(self) -> None:
         """Converts the existing frame data to a LogPass.FrameArray.
         This adds a computed X-axis and removes temporary data structures."""
         assert self.frame_array is None
-        if len(self._temporary_frames):
-            assert len(self.channel_names) == len(self._temporary_frames)
+        if self.len_channels:
             self.frame_array = LogPass.FrameArray(self.ident, self.description)
             # Compute X axis
             x_channel = LogPass.FrameChannel('X   ', 'Computed X-axis', b'', (1,), np.float64)
             x_channel.init_array(self.frame_count)
-            x_value = self.bit_log_pass_range.depth_from
-            for i in range(self.frame_count):
-                x_channel[i] = x_value
-                if self.bit_log_pass_range.is_increasing:
-                    x_value += self.bit_log_pass_range.spacing
-                else:
-                    x_value -= self.bit_log_pass_range.spacing
+            if self.bit_log_pass_range.is_increasing:
+                spacing = self.bit_log_pass_range.spacing
+            else:
+                spacing = -self.bit_log_pass_range.spacing
+            x_channel.array[:, 0] = self.bit_log_pass_range.depth_from + spacing * np.arange(self.frame_count)
             self.frame_array.append(x_channel)
-            for c, channel_name in enumerate(self.channel_names):
+            for channel_name in self.channel_names:
                 frame_channel = LogPass.FrameChannel(channel_name, channel_name, b'', (1,), np.float64)
-                frame_channel.init_array(len(self._temporary_frames[c]))
-                for i in range(len(self._temporary_frames[c])):
-                    frame_channel[i] = self._temporary_frames[c][i]
+                frame_channel.init_array(self.frame_count)
                 self.frame_array.append(frame_channel)
-            for data in self._temporary_frames:
-                data.clear()
+            frame_from = 0
+            for values in self._temporary_frames:
+                frame_to = frame_from + values.shape[1]
+                for c, frame_channel in enumerate(self.frame_array.channels[1:]):
+                    frame_channel.array[frame_from:frame_to, 0] = values[c]
+                frame_from = frame_to
             self._temporary_frames.clear()
 
 
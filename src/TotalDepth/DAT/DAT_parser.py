@@ -70,8 +70,9 @@ UTIM DATE TIME WAC BDIA <...> NPEN EPEN
 
 Performance
 -----------
-There is no particular effort made here for high performance.
-DAT files are small, typically <10Mb, so artful coding is not really required.
+DAT files are typically small, <10Mb, but the parser streams the file line by line and converts the data section in
+chunks so memory is bounded by the size of the result. Discovery with ``can_parse_file()`` stops reading after the first
+data row.
 
 API
 ---
@@ -192,13 +193,87 @@ _ASCII_PRINTABLE_MAP.update({ord(c): c for c in string.printable})
 ASCII_PRINTABLE_TABLE = str.maketrans(_ASCII_PRINTABLE_MAP)
 
 
+#: Data rows are converted to numpy arrays in chunks of this many frames.
+DATA_CHUNK_FRAMES = 8192
+#: When sniffing a file with ``can_parse_file()`` lines longer than this mean that this is not a DAT file.
+SNIFF_MAX_LINE_LENGTH = 4096
+
+
+class _ChannelBuffer:
+    """A growable numpy buffer of the values for a FrameChannel. The capacity is doubled as necessary."""
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, channel: LogPass.FrameChannel):
+        self.channel = channel
+        self.conversion_function = _ret_conversion_function(channel)
+        self.array = np.empty((self.INITIAL_CAPACITY, 1), dtype=channel.np_dtype)
+        self.size = 0
+
+    def extend(self, values: np.ndarray) -> None:
+        """Add a 1D array of values."""
+        size = self.size + len(values)
+        if size > len(self.array):
+            self.array.resize((max(size, 2 * len(self.array)), 1), refcheck=False)
+        self.array[self.size:size, 0] = values
+        self.size = size
+
+    def convert(self, column: typing.Sequence[str], line_number_start: int) -> np.ndarray:
+        """Converts a column of strings to an array of values. Float columns are converted by numpy in one go,
+        other columns, or a float column with a bad value, are converted value by value.
+        line_number_start is the line number of the first value for error messages."""
+        if self.conversion_function is float:
+            try:
+                return np.array(column, dtype=self.channel.np_dtype)
+            except ValueError:
+                # Find the offending value and report it.
+                pass
+        ret = np.empty(len(column), dtype=self.channel.np_dtype)
+        for j, value in enumerate(column):
+            try:
+                ret[j] = self.conversion_function(value)
+            except ValueError as err:
+                raise ExceptionDATRead(
+                    f'Line: {line_number_start + j + 1}: Can not convert value. Error: {str(err)}'
+                )
+        return ret
+
+    def complete(self) -> None:
+        """Trim the buffer and set it as the channel array."""
+        self.array.resize((self.size, 1), refcheck=False)
+        self.channel.array = self.array
+
+
+def _convert_rows(rows: typing.List[typing.List[str]], buffers: typing.List[_ChannelBuffer],
+                  line_number_start: int) -> None:
+    """Transposes the rows of strings and adds the converted values to the buffers.
+    line_number_start is the line number of the first row for error messages."""
+    if len(rows):
+        for buffer, column in zip(buffers, zip(*rows)):
+            buffer.extend(buffer.convert(column, line_number_start))
+
+
+def _gen_lines(file_object: typing.TextIO, max_line_length: int) -> typing.Iterator[str]:
+    """Yields lines from the file object, if max_line_length is > 0 this raises if a line is longer than that."""
+    if max_line_length > 0:
+        for line_number, line in enumerate(iter(lambda: file_object.readline(max_line_length + 1), '')):
+            if len(line) > max_line_length:
+                raise ExceptionDATRead(f'Line: {line_number + 1}: Line length exceeds {max_line_length}.')
+            yield line
+    else:
+        yield from file_object
+
+
 def _parse_file(file_object: typing.TextIO, ident: str = '', description: str = 'DAT File',
                 break_after_first_row: bool = False) -> LogPass.FrameArray:
     """
     Parses a DAT file into a FrameArray.
 
+    The file is read line by line and the data section is converted in chunks of DATA_CHUNK_FRAMES rows into
+    growable numpy buffers so memory use is bounded by the size of the result, not the size of the file as text.
+
     break_after_first_row is used for discovery, only the channel declaration section, the data header and first data
-    line are read. If no errors this is likely to be a DAT file.
+    line are read. If no errors this is likely to be a DAT file. In this mode no line may be longer than
+    SNIFF_MAX_LINE_LENGTH.
     """
     file_object.seek(0)
     # Defer creating the FrameArray until we have seen the Channel Header line as that tells us what channels have data
@@ -207,10 +282,13 @@ def _parse_file(file_object: typing.TextIO, ident: str = '', description: str =
     frame_array = LogPass.FrameArray(ident, description)
     in_channel_declaration_section = True
     channels_defined: typing.List[str] = []
-    # This is the data section transposed
-    data_table = []
-    line_number_data_start = 0
-    for line_number, line in enumerate(file_object.readlines()):
+    buffers: typing.List[_ChannelBuffer] = []
+    # Data rows as lists of strings that have not yet been converted.
+    rows: typing.List[typing.List[str]] = []
+    # Line number of rows[0]
+    line_number_rows = 0
+    max_line_length = SNIFF_MAX_LINE_LENGTH if break_after_first_row else 0
+    for line_number, line in enumerate(_gen_lines(file_object, max_line_length)):
         assert len(channels_defined) == len(frame_array), f'{len(channels_defined)} != {len(frame_array)}'
         # Sometimes there are spurious spaces at the end of line.
         line = line.strip()
@@ -240,10 +318,10 @@ def _parse_file(file_object: typing.TextIO, ident: str = '', description: str =
                         frame_array.append(channel)
                     except LogPass.ExceptionLogPassBase as err:
                         raise ExceptionDATRead(f'Line: {line_number + 1}: {str(err)}')
-                    data_table.append(list())
+                    buffers.append(_ChannelBuffer(channel))
                 in_channel_declaration_section = False
                 # Next line is data line 0
-                line_number_data_start = line_number + 1
+                line_number_rows = line_number + 1
             else:
                 m = RE_CHANNEL_DEFINITION.match(line)
                 if m:
@@ -261,33 +339,27 @@ def _parse_file(file_object: typing.TextIO, ident: str = '', description: str =
         else:
             # In the data section
             values = line.split()
-            if len(values) != len(data_table):
+            if len(values) != len(buffers):
                 raise ExceptionDATRead(
                     f'Line: {line_number + 1}:'
-                    f' Length of values is {len(values)} but data table length is {len(data_table)}.'
+                    f' Length of values is {len(values)} but data table length is {len(buffers)}.'
                     f' Missing channel declaration section?'
                 )
-            # Transpose row.
-            for i, v in enumerate(values):
-                data_table[i].append(v)
+            rows.append(values)
             if break_after_first_row:
                 break
+            if len(rows) >= DATA_CHUNK_FRAMES:
+                _convert_rows(rows, buffers, line_number_rows)
+                line_number_rows += len(rows)
+                rows = []
 
     if len(frame_array) == 0:
         raise ExceptionDATRead(f'Parsing DAT file results in no channels.')
-    assert len(frame_array.channels) == len(data_table)
-    # Convert the data and load the Frame Array
-    for i, channel in enumerate(frame_array.channels):
-        column = data_table[i]
-        channel.init_array(len(column))
-        conversion_function = _ret_conversion_function(channel)
-        for j, value in enumerate(column):
-            try:
-                channel[(j, 0)] = conversion_function(value)
-            except ValueError as err:
-                raise ExceptionDATRead(
-                    f'Line: {line_number_data_start + j + 1}: Can not convert value. Error: {str(err)}'
-                )
+    assert len(frame_array.channels) == len(buffers)
+    # Convert the remaining data and load the Frame Array
+    _convert_rows(rows, buffers, line_number_rows)
+    for buffer in buffers:
+        buffer.complete()
     return frame_array
 
 
@@ -60,6 +60,9 @@ __rights__ = 'Copyright (c) 2012 Paul Ross.'
 
 logger = logging.getLogger(__file__)
 
+#: The array section is converted to numpy arrays in chunks of this many frames.
+ARRAY_CHUNK_FRAMES = 8192
+
 
 class ExceptionLASRead(ExceptionTotalDepthLAS):
     """Specialisation of exception for LASRead."""
@@ -352,6 +355,11 @@ class LASSectionArray(LASSection):
         self._unwrap_buffer = []
         self._mnemonics_units = list(zip(curve_section.mnemonics(), curve_section.units()))
         self._duplicate_column_indexes: typing.Set[int] = set()
+        # Frames as lines of text that have not yet been converted, see _convert_pending_lines().
+        self._pending_lines: typing.List[str] = []
+        # Converted frames, each is a list of arrays, one array for each channel.
+        self._chunks: typing.List[typing.List[np.ndarray]] = []
+        self._number_of_frames = 0
         super().__init__(section_type, raise_on_error)
         self._null = null
         # TODO: If we have STRT, STOP and STEP we can predict the  length of the array section and initialise a
@@ -377,6 +385,12 @@ class LASSectionArray(LASSection):
                     self.frame_array.append(channel)
         except LogPass.ExceptionLogPassBase as err:
             raise ExceptionLASReadSection(str(err)) from err
+        # Column indexes of the channels, this excludes the duplicate columns.
+        self._channel_column_indexes = [
+            c for c in range(len(self._mnemonics_units)) if c not in self._duplicate_column_indexes
+        ]
+        # True if any channel is not float, for example a DATE channel.
+        self._has_object_channels = any(channel.np_dtype == np.dtype('O') for channel in self.frame_array.channels)
 
     def _add_buffer(self, line_number: int) -> None:
         """Adds the temporary buffer to the array. This is associated with the given line number."""
@@ -389,7 +403,7 @@ class LASSectionArray(LASSection):
                         len(self._mnemonics_units),
                     )
                 )
-            self.members.append(self._unwrap_buffer)
+            self._add_frame_line(' '.join(self._unwrap_buffer))
             self._unwrap_buffer = []
 
     def _convert_value(self, channel: LogPass.FrameChannel, value: str, line_number: int) -> typing.Any:
@@ -429,24 +443,71 @@ class LASSectionArray(LASSection):
 
     def add_member_line(self, line_number: int, line: str) -> None:
         """Process a line in an array section."""
-        # Convert to float inserting null where that can not be done
-        # values = []
-        # channel_index = 0
-        # for column_index, value in enumerate(line.strip().split()):
-        #     if column_index not in self._duplicate_column_indexes:
-        #         if channel_index >= len(self.frame_array):
-        #             raise ExceptionLASRead(
-        #                 f'Expected {len(self.frame_array)} channels but found {column_index + 1} in line {line_number}'
-        #             )
-        #         values.append(self._convert_value(self.frame_array[channel_index], value, line_number))
-        #         channel_index += 1
-        values = line.strip().split()
+        stripped_line = line.strip()
         # Add it to the members
-        if len(values) > 0:
+        if len(stripped_line) > 0:
             if self._wrap:
-                self._add_member_with_wrap_mode(line_number, line, values)
+                self._add_member_with_wrap_mode(line_number, line, stripped_line.split())
             else:
-                self.members.append(values)
+                self._add_frame_line(stripped_line)
+
+    def _add_frame_line(self, line: str) -> None:
+        """Adds a line of text that is a complete frame. These are converted in chunks of ARRAY_CHUNK_FRAMES."""
+        self._pending_lines.append(line)
+        if len(self._pending_lines) >= ARRAY_CHUNK_FRAMES:
+            self._convert_pending_lines()
+
+    def _convert_pending_lines(self) -> None:
+        """Converts the pending lines to numpy arrays and adds them to self._chunks."""
+        if len(self._pending_lines):
+            lines = self._pending_lines
+            self._pending_lines = []
+            chunk = None
+            if not self._has_object_channels:
+                chunk = self._convert_lines_fast(lines)
+            if chunk is None:
+                chunk = self._convert_lines_by_column(lines)
+            self._chunks.append(chunk)
+            self._number_of_frames += len(lines)
+
+    def _convert_lines_fast(self, lines: typing.List[str]) -> typing.Union[None, typing.List[np.ndarray]]:
+        """Converts all the lines with numpy. This returns None if that can not be done, for example if a value
+        is not a float or the number of columns is wrong."""
+        try:
+            values = np.loadtxt(lines, dtype=np.float64, comments=None, ndmin=2)
+        except ValueError:
+            return None
+        if values.shape[1] != len(self._mnemonics_units):
+            return None
+        return [values[:, c] for c in self._channel_column_indexes]
+
+    def _convert_lines_by_column(self, lines: typing.List[str]) -> typing.List[np.ndarray]:
+        """Converts the lines column by column. Float columns are converted with numpy unless a value can not be
+        converted, those columns, and DATE/TIME columns, are converted value by value."""
+        expected_number_of_columns = len(self._mnemonics_units)
+        rows = []
+        for line in lines:
+            row = line.split()
+            if len(row) != expected_number_of_columns:
+                raise ExceptionLASRead(
+                    f'Expected {expected_number_of_columns} columns'
+                    f' but found {len(row)} in frame {self._number_of_frames + len(rows)}'
+                )
+            rows.append(row)
+        ret = []
+        for channel, column_index in zip(self.frame_array.channels, self._channel_column_indexes):
+            column = [row[column_index] for row in rows]
+            if channel.np_dtype != np.dtype('O'):
+                try:
+                    ret.append(np.array(column, dtype=channel.np_dtype))
+                    continue
+                except ValueError:
+                    pass
+            array = np.empty(len(column), dtype=channel.np_dtype)
+            for i, value in enumerate(column):
+                array[i] = self._convert_value(channel, value, self._number_of_frames + i)
+            ret.append(array)
+        return ret
 
     def _add_member_with_wrap_mode(self, line_number: int, line: str, values: typing.List[typing.Any]) -> None:
         """Addes a line in wrap mode."""
@@ -458,7 +519,9 @@ class LASSectionArray(LASSection):
                 self._unwrap_buffer.append(values[0])
             else:
                 # Abandon existing data
-                self.members = []
+                self._pending_lines = []
+                self._chunks = []
+                self._number_of_frames = 0
                 raise ExceptionLASReadSectionArray(
                     'Line [{:d}] More than one [{:d}] index values, line is: {:s}'.format(
                         line_number, len(values), line.replace('\n', '\\n'),
@@ -503,28 +566,15 @@ class LASSectionArray(LASSection):
         try:
             self._add_buffer(-1)
         finally:
-            if len(self.members):
+            self._convert_pending_lines()
+            if self._number_of_frames:
                 try:
-                    self.frame_array.init_arrays(len(self.members))
-                    expected_number_of_columns = len(self.frame_array) + len(self._duplicate_column_indexes)
-                    for frame_number, member_frame in enumerate(self.members):
-                        if len(member_frame) != expected_number_of_columns:
-                            raise ExceptionLASRead(
-                                f'Expected {expected_number_of_columns} columns'
-                                f' but found {len(member_frame)} in frame {frame_number}'
-                            )
-                        channel_index = 0
-                        for column_index, value in enumerate(member_frame):
-                            if column_index not in self._duplicate_column_indexes:
-                                self.frame_array[channel_index][frame_number] = self._convert_value(
-                                    self.frame_array[channel_index], value, frame_number
-                                )
-                                channel_index += 1
+                    self.frame_array.init_arrays(self._number_of_frames)
+                    for channel_index, channel in enumerate(self.frame_array.channels):
+                        channel.array[:, 0] = np.concatenate([chunk[channel_index] for chunk in self._chunks])
+                    # Free up temporary chunks
+                    self._chunks.clear()
                     self.create_index()
-                    # Free up temporary members
-                    for member in self.members:
-                        member.clear()
-                    self.members.clear()
                     # Mask the array
                     self.frame_array.mask_array(self._null)
                 except LogPass.ExceptionLogPassBase as err:
@@ -422,7 +422,20 @@ def array_reduce(array: np.ndarray, method: str) -> typing.Union[float, int]:
     return getattr(np, method)(array)
 
 
+def array_reduce_frames(array: np.ndarray, method: str) -> np.ndarray:
+    """Take a numpy array of frames, shape (frames, ...), and reduce each frame to a single value.
+    This returns a one dimensional array of values, the value for each frame is the same as array_reduce().
+    For a masked array the underlying values are used."""
+    _check_array_reduction(method)
+    values = np.ma.getdata(array).reshape(len(array), -1)
+    if method == 'first':
+        return values[:, 0]
+    return getattr(np, method)(values, axis=1)
+
+
 RE_FLOAT_DECIMAL_FORMAT = re.compile(r'^\.[0-9]+')
+#: Float formats that can be used with the % operator. Others, such as '.3', are written with format().
+RE_FLOAT_PERCENT_FORMAT = re.compile(r'^\.[0-9]+[eEfFgG]$')
 
 
 def _check_float_decimal_places_format(float_decimal_places_format: str) -> None:
@@ -490,9 +503,12 @@ def write_array_section_header_to_las(
         channel_name_sub_set: typing.Set[str],
         field_width: int,
         out_stream: typing.TextIO,
+        num_writable_frames: typing.Union[int, None] = None,
     ) -> None:
     """
     Write the ``~Array Section`` header to the LAS file, the actual log data.
+    num_writable_frames is the total number of frames that will be written, by default the number of frames in the
+    FrameArray. This is needed when the frames are written in chunks.
 
     Example::
 
@@ -523,7 +539,8 @@ def write_array_section_header_to_las(
     else:
         out_stream.write(f'# All [{len(frame_array.channels)}] original channels reproduced here.\n')
     out_stream.write(f'# Where a channel has multiple values the reduction method is by "{array_reduction}" value.\n')
-    num_writable_frames = len(frame_array.x_axis)
+    if num_writable_frames is None:
+        num_writable_frames = len(frame_array.x_axis)
     out_stream.write(f'# Maximum number of original frames: {max_num_available_frames}\n')
     out_stream.write(
         f'# Requested frame slicing: {frame_slice.long_str(max_num_available_frames)}'
@@ -573,22 +590,30 @@ def write_array_section_data_to_las(
     _check_float_decimal_places_format(float_decimal_places_format)
     _add_x_axis_to_channels_to_write(frame_array, channel_name_sub_set)
     num_writable_frames = len(frame_array.x_axis)
-    for frame_number in range(num_writable_frames):
-        for c, channel in enumerate(frame_array.channels):
-            if len(channel_name_sub_set) == 0 or channel.ident in channel_name_sub_set:
-                if len(channel.array) == 0:
-                    raise ValueError(f'No frame data in channel {channel}')
-                value = array_reduce(channel.array[frame_number], array_reduction)
-                # NOTE: This will write a null value for masked array as the (null) value is still in the array.
-                if c > 0:
-                    out_stream.write(' ')
-                if np.issubdtype(channel.array.dtype, np.integer):
-                    out_stream.write(f'{value:{field_width}.0f}')
-                elif np.issubdtype(channel.array.dtype, np.floating):
-                    out_stream.write(f'{value:{field_width}{float_decimal_places_format}}')
+    # Each channel is reduced to a column of values with numpy then each row is formatted with a single % operation.
+    row_formats = []
+    columns = []
+    for channel in frame_array.channels:
+        if len(channel_name_sub_set) == 0 or channel.ident in channel_name_sub_set:
+            if len(channel.array) == 0:
+                raise ValueError(f'No frame data in channel {channel}')
+            # NOTE: This will write a null value for masked array as the (null) value is still in the array.
+            values = array_reduce_frames(channel.array[:num_writable_frames], array_reduction)
+            if np.issubdtype(channel.array.dtype, np.integer):
+                row_formats.append(f'%{field_width}.0f')
+                columns.append(values.tolist())
+            elif np.issubdtype(channel.array.dtype, np.floating):
+                if RE_FLOAT_PERCENT_FORMAT.match(float_decimal_places_format):
+                    row_formats.append(f'%{field_width}{float_decimal_places_format}')
+                    columns.append(values.tolist())
                 else:
-                    out_stream.write(str(value))
-        out_stream.write('\n')
+                    row_formats.append('%s')
+                    columns.append([f'{value:{field_width}{float_decimal_places_format}}' for value in values.tolist()])
+            else:
+                row_formats.append('%s')
+                columns.append([str(value) for value in values])
+    row_format = ' '.join(row_formats) + '\n'
+    out_stream.write(''.join(row_format % row for row in zip(*columns)))
     # To garbage collect the user can:
     # frame_array.init_arrays(0)
 
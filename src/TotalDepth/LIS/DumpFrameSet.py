@@ -30,6 +30,7 @@ from optparse import OptionParser
 from TotalDepth.LIS.core import File
 from TotalDepth.LIS.core import FileIndexer
 from TotalDepth.LIS.core import FrameSet
+from TotalDepth.common import cmn_cmd_opts
 
 __author__ = 'Paul Ross'
 __date__ = '2010-08-02'
@@ -132,12 +133,15 @@ Reads a LIS file and writes out tab separated values of each frame."""
                              help="Display summary. [default: %default]")
     option_parser.add_option("-c", "--channels", action="append", type="str",
                              help="Only dump these named curves.", default=[])
+    option_parser.add_option("--index-cache", type="str", dest="index_cache", default=None,
+                             help="Cache the index of each LIS file in this directory, an empty string puts the cache next to each file. [default: no cache]")
     opts, args = option_parser.parse_args()
     clock_start = time.perf_counter()
     # Initialise logging etc.
     logging.basicConfig(level=opts.loglevel,
                         format='%(asctime)s %(levelname)-8s %(message)s',
                         stream=sys.stdout)
+    cmn_cmd_opts.set_index_cache(opts)
     # Your code here
     if len(args) != 1:
         option_parser.print_help()
@@ -105,6 +105,7 @@ import pprint
 from TotalDepth.LIS import ExceptionTotalDepthLIS
 from TotalDepth.LIS.core import File
 from TotalDepth.LIS.core import FileIndexer
+from TotalDepth.common import job_engine
 
 
 class IndexTimer:
@@ -245,19 +246,22 @@ def generate_file_paths(d, r):
                 yield aFp
 
 
-def index_dir_multi_process(directory, recursive, num_times, verbose, keepGoing, jobs) -> typing.Dict[str, IndexTimer]:
-    if jobs < 1:
-        jobs = multiprocessing.cpu_count()
+def index_dir_multi_process(directory, recursive, num_times, verbose, keepGoing, jobs,
+                            timeout=0.0, journal_path='') -> typing.Dict[str, IndexTimer]:
+    """Multiprocessing code, see ``job_engine.run()`` for jobs, timeout and journal_path.
+    A file that times out or crashes the worker has an error count of one and no times."""
     logging.info('indexDirMultiProcess(): Setting MP jobs to %d' % jobs)
-    pool = multiprocessing.Pool(processes=jobs)
-    tasks = [(fp, num_times, verbose, keepGoing) for fp in generate_file_paths(directory, recursive)]
-    # result = IndexTimer(directory)
-    results = [
-        r.get() for r in [
-            pool.apply_async(index_file, t) for t in tasks
-        ]
+    tasks = [
+        job_engine.Job(fp, os.path.getsize(fp), (fp, num_times, verbose, keepGoing))
+        for fp in generate_file_paths(directory, recursive)
     ]
-    ret: typing.Dict[str, IndexTimer] = {v.path: v for v in results}
+    ret: typing.Dict[str, IndexTimer] = {}
+    for job_result in job_engine.run(index_file, tasks, jobs, timeout, journal_path):
+        if job_result.ok:
+            ret[job_result.key] = job_result.result
+        else:
+            ret[job_result.key] = IndexTimer(job_result.key)
+            ret[job_result.key].inc_error_count()
     return ret
 
 ################################
@@ -288,6 +292,14 @@ Indexes LIS files recursively."""
                     % multiprocessing.cpu_count() \
                     + " [default: %default]" 
         )      
+    optParser.add_option("--timeout", type="float", dest="timeout", default=0.0,
+            help="When multiprocessing the maximum time in seconds to index a single file, zero is no limit."
+                 " [default: %default]"
+        )
+    optParser.add_option("--journal", type="string", dest="journal", default='',
+            help="When multiprocessing record results in this journal file."
+                 " If the journal exists then files already indexed are not indexed again. [default: %default]"
+        )
     optParser.add_option("-t", "--times", type="int", dest="times", default=1,
             help="Number of times to repeat the read [default: %default]"
         )
@@ -324,7 +336,8 @@ Indexes LIS files recursively."""
             results = index_dir_single_process(args[0], opts.recursive, opts.times, opts.verbose, opts.keepGoing)
         else:
             # Multiprocess code 
-            results = index_dir_multi_process(args[0], opts.recursive, opts.times, opts.verbose, opts.keepGoing, opts.jobs)
+            results = index_dir_multi_process(args[0], opts.recursive, opts.times, opts.verbose, opts.keepGoing, opts.jobs,
+                                              opts.timeout, opts.journal)
     else:
         logging.error(f'Path {args[0]} does not exist!')
         return 1
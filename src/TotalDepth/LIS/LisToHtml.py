@@ -24,6 +24,7 @@ Created on Jun 14, 2011
 '''
 import codecs
 import logging
+import math
 import multiprocessing
 import os
 import sys
@@ -36,7 +37,6 @@ import TotalDepth
 from TotalDepth.LIS import ExceptionTotalDepthLIS
 from TotalDepth.LIS import ProcLISPath
 from TotalDepth.LIS.core import FileIndexer
-from TotalDepth.LIS.core import FrameSet
 from TotalDepth.LIS.core import LogiRec
 from TotalDepth.LIS.core import Mnem
 from TotalDepth.common import xxd
@@ -702,43 +702,22 @@ class LisToHtml(ProcLISPath.ProcLISPathBase):
         if self._accCh and theIe.logPass.totalFrames > 0:
             with XmlWrite.Element(theS, 'h5', {}):
                 theS.characters('Frame Data')
-            # Accumulate the channel data then write it out
-            theIe.logPass.setFrameSet(theFi, None, None)
-            myFrSet = theIe.logPass.frameSet
-#            # Print the channels and units
-#            hdrS = []
-#            if myFrSet.isIndirectX:
-#                hdrS.append('XAXIS [{:s}]'.format(myFrSet.xAxisDecl.depthUnits))
-#            hdrS.extend(['{:s} [{:s}]'.format(m, u) for m,u in theIe.logPass.genFrameSetHeadings()])
-#            #print('TRACE: len(hdrS)', len(hdrS))
-#            print('\t'.join(hdrS))
-#            for frIdx in range(myFrSet.numFrames):
-#                #print('TRACE: len(frame)', len(myFrSet.frame(frIdx)))
-#                if myFrSet.isIndirectX:
-#                    print(myFrSet.xAxisValue(frIdx), '\t', end='')
-#                print('\t'.join([str(v) for v in myFrSet.frame(frIdx)]))
-            # Accumulate min/mean/max
+            # Summarise the channel data a chunk of frames at a time then write it out
+            mySummaries = theIe.logPass.summariseFrameSet(theFi)
             schNameS = list(theIe.logPass.genFrameSetScNameUnit())
-            myAcc = myFrSet.accumulate(
-                [
-                    FrameSet.AccCount,
-                    FrameSet.AccMin,
-                    FrameSet.AccMean,
-                    FrameSet.AccMax,
-                    FrameSet.AccStDev,
-                    FrameSet.AccDec,
-                    FrameSet.AccEq,
-                    FrameSet.AccInc,
-                ]
-            )
-#            print()
-#            print('Sc Name     Count     Min      Mean     Max     StdDev')
-#            for scIdx, aRow in enumerate(myAcc):
-#                print('{:s} [{:s}]'.format(*schNameS[scIdx]),
-#                      '  ',
-#                      '  '.join(['{:7g}'.format(v) for v in aRow]))
             myTable = []
-            for scIdx, aRow in enumerate(myAcc):
+            for scIdx, mySummary in enumerate(mySummaries):
+                if mySummary.count > 0:
+                    myValues = [mySummary.min, mySummary.mean, mySummary.max]
+                else:
+                    myValues = [math.nan] * 3
+                # As FrameSet.AccStDev the standard deviation of a constant channel is NaN
+                myStdDev = mySummary.std(ddof=1)
+                if myStdDev == 0:
+                    myStdDev = math.nan
+                aRow = [mySummary.count] + myValues + [
+                    myStdDev, mySummary.count_dec, mySummary.count_eq, mySummary.count_inc,
+                ]
                 myTable.append([str(x) for x in schNameS[scIdx]] + ['{:7g}'.format(v) for v in aRow])
             self._HTMLGeneralTable(
                 theS,
@@ -909,6 +888,7 @@ Generates HTML from input LIS file or directory to an output destination."""
     )
     TotalDepth.common.cmn_cmd_opts.add_log_level(parser, level=20)
     TotalDepth.common.cmn_cmd_opts.add_multiprocessing(parser)
+    TotalDepth.common.cmn_cmd_opts.add_index_cache(parser)
     # TotalDepth.common.Slice.add_frame_slice_to_argument_parser(parser, use_what=True)
     TotalDepth.common.process.add_process_logger_to_argument_parser(parser)
     gnuplot.add_gnuplot_to_argument_parser(parser)
@@ -917,6 +897,7 @@ Generates HTML from input LIS file or directory to an output destination."""
     args = parser.parse_args()
     # print(args)
     TotalDepth.common.cmn_cmd_opts.set_log_level(args)
+    TotalDepth.common.cmn_cmd_opts.set_index_cache(args)
 
     clkStart = time.perf_counter()
     timStart = time.time()
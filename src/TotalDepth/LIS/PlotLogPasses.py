@@ -46,6 +46,7 @@ from TotalDepth.util.plot import PRESCfgXML
 from TotalDepth.util import DictTree
 from TotalDepth.util import DirWalk
 from TotalDepth.util import XmlWrite
+from TotalDepth.common import cmn_cmd_opts
 #from TotalDepth.util import HtmlUtils
 
 CSS_CONTENT_INDEX = """body {
@@ -613,6 +614,8 @@ Generates plot(s) from input LIS file or directory to an output destination."""
         )
     optParser.add_option("-x", "--xml", action="append", dest="LgFormat", default=[],
                       help="Add an XML LgFormat to use for plotting. Value is the UniqueId. Use -x? to see what LgFormats are available. [default: %default]")
+    optParser.add_option("--index-cache", type="str", dest="index_cache", default=None,
+                      help="Cache the index of each LIS file in this directory, an empty string puts the cache next to each file. [default: no cache]")
     opts, args = optParser.parse_args()
     clkStart = time.perf_counter()
     timStart = time.time()
@@ -621,6 +624,7 @@ Generates plot(s) from input LIS file or directory to an output destination."""
                     format='%(asctime)s %(levelname)-8s %(message)s',
                     #datefmt='%y-%m-%d % %H:%M:%S',
                     stream=sys.stdout)
+    cmn_cmd_opts.set_index_cache(opts)
     # Your code here
     # Handle -x?
     if '?' in opts.LgFormat:
@@ -375,8 +375,10 @@ def main():
     Reads LIS file(s) and writes them out as LAS files."""
     parser = WriteLAS.las_writer_command_line_arguments(description, prog='TotalDepth.LIS.ToLAS.main',
                                                         version=__version__, epilog=__rights__)
+    TotalDepth.common.cmn_cmd_opts.add_index_cache(parser)
     args = parser.parse_args()
     TotalDepth.common.cmn_cmd_opts.set_log_level(args)
+    TotalDepth.common.cmn_cmd_opts.set_index_cache(args)
     # Your code here
     ret_val = 0
     if args.frame_slice.strip() == '?' or args.channels.strip() == '?':
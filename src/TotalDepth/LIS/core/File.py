@@ -22,8 +22,10 @@
 Created on 14 Nov 2010
 
 """
+import contextlib
 import io
 import logging
+import mmap
 import pprint
 import struct
 import typing
@@ -153,6 +155,11 @@ class FileRead(FileBase):
     def isEOF(self):
         """True if at EOF."""
         return self._prh.isEOF
+
+    @property
+    def physicalRecordSettings(self):
+        """The PhysicalRecordSettings used to read the Physical Records."""
+        return PhysicalRecordSettings(self._prh.pad_modulo, self._prh.pad_non_null)
     
     #########################
     # Section: Reading words.
@@ -248,8 +255,9 @@ def best_physical_record_pad_settings(file_path_or_object: typing.Union[str, io.
     pr_limit limits the number of Physical Records to test if you want higher performance otherwise all Physical Records
     are read.
 
-    Typically 38Mb file with 46276 Physical Records processed in 0.380 (s) so 10ms/Mb or 100Mb/s.
-    This is proportionate so if limited to 100 records this would be around 0.001 (s)
+    All the padding options are tried in a single pass of the file, see scan_file_with_different_padding().
+    Typically 40Mb file with 40000 unpadded Physical Records processed in 0.150 (s) so 4ms/Mb or 250Mb/s.
+    This is proportionate so if limited to 100 records this would be around 0.0004 (s)
     """
     logging.debug('Finding best PR settings for: %s', file_path_or_object)
     pad_opts_to_prs = scan_file_with_different_padding(file_path_or_object, keep_going=True, pr_limit=pr_limit)
@@ -299,17 +307,202 @@ def scan_file_no_output(file_path_or_object: typing.Union[str, io.BytesIO], keep
     return pr_count
 
 
+#: The padding options tried by scan_file_with_different_padding() in order of preference.
+PAD_SETTINGS = tuple(
+    PhysicalRecordSettings(pad_modulo, pad_non_null) for pad_modulo in (0, 2, 4) for pad_non_null in (False, True)
+)
+
+
+class _PadScanner:
+    """Walks the TIF markers, Physical Record headers, trailers and pad bytes of a file with exactly the same
+    semantics as PhysRecRead.genPr() but without reading any Logical Data.
+
+    All the padding options are scanned together in a single pass. The padding option only matters after the
+    Physical Record trailer so options that have reached the same state after a Physical Record are advanced as one.
+    A file with no padding is scanned once rather than once for each option.
+
+    The state between Physical Records is a tuple of (tell, TIF type, TIF back, TIF next, TIF previous tell).
+    """
+    def __init__(self, data, keep_going: bool):
+        """data is a bytes like object of the complete file."""
+        self.data = data
+        self.data_len = len(data)
+        self.keep_going = keep_going
+        self.has_tif = False
+        self.tif_format = TifMarker.TIF_WORD_ALL_FORMAT
+        # Mirror TifMarker.TifMarkerRead.__init__()
+        if self.data_len >= TifMarker.TIF_TOTAL_BYTES:
+            tif_type, tif_back, tif_next = TifMarker.TIF_WORD_ALL_FORMAT.unpack_from(data, 0)
+            if tif_type == 0 and tif_back == 0:
+                self.has_tif = True
+                if tif_next > TifMarker.TIF_FIRST_WORD_LIMIT:
+                    self.tif_format = TifMarker.TIF_WORD_ALL_FORMAT_WRONG_SEX
+
+    def _read_tif(self, state: typing.Tuple) -> typing.Union[None, typing.Tuple]:
+        """Mirrors TifMarker.TifMarkerRead._read(), returns the new state or None on EOF."""
+        tell, tif_type, tif_back, tif_next, previous_tell = state
+        if previous_tell is not None and (tif_type, tif_back, tif_next) != (0, 0, 0) and tif_next != tell:
+            short_fall = tif_next - tell
+            if not (self.keep_going and short_fall > 0):
+                raise TifMarker.ExceptionTifMarker(
+                    'TIF read() expected 0x%X, got tell: 0x%X, Shortfall: 0x%X' % (tif_next, tell, short_fall)
+                )
+            tell = tif_next
+        if tell + TifMarker.TIF_TOTAL_BYTES > self.data_len:
+            return None
+        tif_type, tif_back, tif_next = self.tif_format.unpack_from(self.data, tell)
+        if previous_tell is not None and (tif_type, tif_back, tif_next) != (0, 0, 0) and tif_back != previous_tell:
+            raise TifMarker.ExceptionTifMarker(
+                'TIF read(): tell 0x%x expected previous 0x%X, got 0x%X' % (tell, tif_back, previous_tell)
+            )
+        return tell + TifMarker.TIF_TOTAL_BYTES, tif_type, tif_back, tif_next, tell
+
+    def read_head(self, state: typing.Tuple) -> typing.Union[None, typing.Tuple[typing.Tuple, int, int, int]]:
+        """Mirrors PhysRecRead._readHead() then skipping the Logical Data.
+        Returns None on EOF or a tuple of (state, logical data length, trailer length, PRH attributes)
+        where the state tell is the start of the trailer."""
+        if self.has_tif:
+            state = self._read_tif(state)
+            if state is not None and state[1] == 1:
+                state = self._read_tif(state)
+            if state is None:
+                return None
+        tell = state[0]
+        if tell + PhysRec.PR_PRH_LENGTH > self.data_len:
+            return None
+        pr_len = PhysRec.PR_PRH_LEN_FORMAT.unpack_from(self.data, tell)[0]
+        pr_attr = PhysRec.PR_PRH_ATTR_FORMAT.unpack_from(self.data, tell + 2)[0]
+        if pr_attr & (1 << PhysRec.PR_TYPE_BIT) and not self.keep_going:
+            raise PhysRec.ExceptionPhysRecUnknownType('Illegal PR type of 1')
+        trailer_len = 0
+        if pr_attr & (1 << PhysRec.PR_RECORD_NUMBER_BIT):
+            trailer_len += PhysRec.PR_PRT_REC_NUM_LEN
+        if pr_attr & (1 << PhysRec.PR_FILE_NUMBER_BIT):
+            trailer_len += PhysRec.PR_PRT_FILE_NUM_LEN
+        if pr_attr & (1 << PhysRec.PR_CHECKSUM_UNDEFINED_BIT) and not self.keep_going:
+            raise PhysRec.ExceptionPhysRecUndefinedChecksum('Undefined bit in checksum attribute')
+        if pr_attr & (1 << PhysRec.PR_CHECKSUM_BIT):
+            trailer_len += PhysRec.PR_PRT_CHECKSUM_LEN
+        ld_len = pr_len - PhysRec.PR_PRH_LENGTH - trailer_len
+        if ld_len < 0:
+            raise PhysRec.ExceptionPhysRec(
+                'PhysRecRead._readHead(): Illegal negative logical data length: {:d}'.format(ld_len)
+            )
+        return (tell + PhysRec.PR_PRH_LENGTH + ld_len,) + state[1:], ld_len, trailer_len, pr_attr
+
+    def read_tail(self, tell: int, trailer_len: int, pad_settings: PhysicalRecordSettings) -> int:
+        """Mirrors PhysRecRead._readTail() including PhysRecRead._consume_padding(), returns the new tell."""
+        tell += trailer_len
+        if trailer_len and tell > self.data_len:
+            raise PhysRec.ExceptionPhysRecEOF(f'PhysRecRead._readTail() encountered EOF at 0x{tell:08x}')
+        if pad_settings.pad_modulo and tell % pad_settings.pad_modulo:
+            pad_len = pad_settings.pad_modulo - (tell % pad_settings.pad_modulo)
+            pad_bytes = self.data[tell:tell + pad_len]
+            if len(pad_bytes) == pad_len and (pad_settings.pad_non_null or pad_bytes == b'\x00' * pad_len):
+                tell += pad_len
+        return tell
+
+    def _read_tails(self, state: typing.Tuple, trailer_len: int, tail_count: int,
+                    settings_list: typing.List[PhysicalRecordSettings]):
+        """Reads the trailer(s) for each of the settings and generates pairs of (tell, [PhysicalRecordSettings, ...]).
+        tell is None if reading the trailer fails."""
+        tell = state[0]
+        if tail_count == 1 and (tell + trailer_len) % 4 == 0:
+            # No padding possible so the settings are irrelevant.
+            try:
+                yield self.read_tail(tell, trailer_len, settings_list[0]), settings_list
+            except PhysRec.ExceptionPhysRec:
+                yield None, settings_list
+            return
+        for settings in settings_list:
+            settings_tell = tell
+            try:
+                for _i in range(tail_count):
+                    settings_tell = self.read_tail(settings_tell, trailer_len, settings)
+            except PhysRec.ExceptionPhysRec:
+                settings_tell = None
+            yield settings_tell, [settings]
+
+    def scan(self, pad_settings: typing.Sequence[PhysicalRecordSettings],
+             pr_limit=0) -> typing.Dict[PhysicalRecordSettings, int]:
+        """Returns a dict of {PhysicalRecordSettings : number of Physical Records} that is the same as calling
+        scan_file_no_output() for each of the pad_settings."""
+        result: typing.Dict[PhysicalRecordSettings, int] = {}
+        active: typing.Dict[typing.Tuple, typing.List[PhysicalRecordSettings]] = {
+            (0, 0, 0, 0, None): list(pad_settings)
+        }
+        pr_count = 0
+        while active:
+            pr_count += 1
+            next_active: typing.Dict[typing.Tuple, typing.List[PhysicalRecordSettings]] = {}
+            for state, settings_list in active.items():
+                try:
+                    head = self.read_head(state)
+                except (PhysRec.ExceptionPhysRec, TifMarker.ExceptionTifMarker):
+                    result.update((settings, 0) for settings in settings_list)
+                    continue
+                if head is None:
+                    result.update((settings, pr_count - 1) for settings in settings_list)
+                    continue
+                state, ld_len, trailer_len, pr_attr = head
+                # PhysRecRead.genPr() reads the trailer twice if there is no Logical Data.
+                tail_count = 1 if ld_len or pr_attr & (1 << PhysRec.PR_SUCCESSOR_ATTRIBUTE_BIT) else 2
+                for tell, tell_settings in self._read_tails(state, trailer_len, tail_count, settings_list):
+                    if tell is None:
+                        result.update((settings, 0) for settings in tell_settings)
+                    elif pr_limit and pr_count >= pr_limit:
+                        result.update((settings, pr_count) for settings in tell_settings)
+                    else:
+                        next_active.setdefault((tell,) + state[1:], []).extend(tell_settings)
+            active = next_active
+        return {settings: result[settings] for settings in pad_settings}
+
+
 def scan_file_with_different_padding(file_path_or_object: typing.Union[str, io.BytesIO], keep_going: bool, pr_limit=0) -> typing.Dict[PhysicalRecordSettings, int]:
-    """Tries all different padding options and returns a dict with the number of Physical Records parsed."""
-    result: typing.Dict[PhysicalRecordSettings, int] = {}
-    for pad_modulo in (0, 2, 4):
-        for pad_non_null in (False, True):
-            num_prs = scan_file_no_output(file_path_or_object, keep_going, pad_modulo, pad_non_null, pr_limit=pr_limit)
-            result[PhysicalRecordSettings(pad_modulo, pad_non_null)] = num_prs
-            logging.debug('File: %s pad_modulo %d pad_non_null %5s gives %d PRs', file_path_or_object, pad_modulo, pad_non_null, num_prs)
+    """Tries all different padding options and returns a dict with the number of Physical Records parsed.
+
+    This gives the same result as calling scan_file_no_output() for each option but all the options are tried in a
+    single pass of the file that only reads the TIF markers, Physical Record headers, trailers and pad bytes.
+    Where possible the file is memory mapped so pr_limit limits how much of the file is read.
+    """
+    try:
+        with _file_data(file_path_or_object) as data:
+            result = _PadScanner(data, keep_going).scan(PAD_SETTINGS, pr_limit)
+    except IOError:
+        logging.error('Can not open LIS file "%s" for read', file_path_or_object)
+        result = {settings: 0 for settings in PAD_SETTINGS}
+    for settings, num_prs in result.items():
+        logging.debug('File: %s pad_modulo %d pad_non_null %5s gives %d PRs',
+                      file_path_or_object, settings.pad_modulo, settings.pad_non_null, num_prs)
     return result
 
 
+@contextlib.contextmanager
+def _file_data(file_path_or_object: typing.Union[str, io.BytesIO]):
+    """Context manager that gives the complete contents of a file path or file-like object as a bytes like object.
+    This memory maps the file, or uses the buffer of a BytesIO, where possible otherwise it reads the file."""
+    if isinstance(file_path_or_object, str):
+        with open(file_path_or_object, 'rb') as file_object:
+            with _file_data(file_object) as data:
+                yield data
+        return
+    try:
+        data = mmap.mmap(file_path_or_object.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, io.UnsupportedOperation, OSError, ValueError):
+        # No file descriptor or an empty file.
+        data = None
+    if data is not None:
+        with data:
+            yield data
+        return
+    if isinstance(file_path_or_object, io.BytesIO):
+        with file_path_or_object.getbuffer() as data:
+            yield data
+        return
+    file_path_or_object.seek(0)
+    yield file_path_or_object.read()
+
+
 def ret_padding_options_with_max_records(pad_opts_to_prs: typing.Dict[PhysicalRecordSettings, int]) -> typing.List[PhysicalRecordSettings]:
     """Returns the list of padding options that maximises the number of Physical Records parsed from the structure
     provided by scan_file_with_different_padding()."""
@@ -29,11 +29,14 @@ Created on 10 Feb 2011
 import logging
 import typing
 
+import numpy as np
+
 from TotalDepth.LIS import ExceptionTotalDepthLIS
 #from TotalDepth.LIS.core import EngVal
 from TotalDepth.LIS.core import RepCode
 from TotalDepth.LIS.core import LogiRec
 from TotalDepth.LIS.core import LogPass
+from TotalDepth.LIS.core import IndexCache
 
 __author__  = 'Paul Ross'
 __date__    = '2011-02-10'
@@ -313,7 +316,8 @@ class IndexLogPass(IndexObjBase):
         return self._logPass.iflrType
 
     def add(self, tell, lrType, theF):
-        """Add an IFLR."""
+        """Add an IFLR. Returns the length of the Logical Record, not including the LRH, and the X axis value as a
+        tuple."""
         assert(self.canAdd(lrType))
         #print('add()', tell, lrType, theF)
         # Read the nth word of the Logical record and treat this
@@ -339,6 +343,7 @@ class IndexLogPass(IndexObjBase):
         skip += myLisSize
         skip += theF.skipToNextLr()
         self._logPass.addType01Data(tell, lrType, skip, myXval)
+        return skip, myXval
         
     def jsonObject(self):
         """Return an Python object that can be JSON encoded."""
@@ -404,15 +409,23 @@ class FileIndex:
     """Create an index for the LIS file, theF is a LIS File object.
     
     xAxisIndex is the channel index that is regarded as the X axis (default 0).
-    This is currently ignored in the absence of a reasonable use case."""
-    def __init__(self, theF, xAxisIndex=0):
+    This is currently ignored in the absence of a reasonable use case.
+
+    cacheDir controls a persistent cache of the index for files given by path, see ``IndexCache``.
+    None means no cache, the empty string means a sidecar file next to the LIS file, otherwise it is the directory
+    to keep the caches in. If not given the class attribute ``CACHE_DIR`` is used or, if that is None, the directory
+    given by the ``--index-cache`` command line option, see ``IndexCache.defaultCacheDir()``.
+    The cache is loaded if it is valid for the file and the Physical Record settings otherwise the file is indexed and
+    the cache (re)written. Loading the cache re-reads the indexed EFLRs, such as DFSRs and tables, from their cached
+    positions but skips reading every IFLR."""
+    #: The default cacheDir for all instances.
+    CACHE_DIR: typing.Union[None, str] = None
+
+    def __init__(self, theF, xAxisIndex=0, cacheDir: typing.Union[None, str] = None):
         self._fileId = theF.fileId
         self._xAxisIndex = xAxisIndex
-        theF.rewind()
         # List of indexable objects that are a IndexObjBase examples: IndexTable, IndexLogPass
         self._idx = []
-        # Indexes to log pass objects: {0 : None, 1 : None}
-        log_pass_index_map = FileIndex._reset_log_pass_index_map()
         # Despatch table for LR type
         self._despatchLrType = {
             # The first two should be handled by the LogPass, if not
@@ -450,6 +463,42 @@ class FileIndex:
             LogiRec.LR_TYPE_PICTURE             : IndexUnknownInternalFormat,
             LogiRec.LR_TYPE_IMAGE               : IndexUnknownInternalFormat,
         }
+        if cacheDir is None:
+            cacheDir = self.CACHE_DIR
+        if cacheDir is None:
+            cacheDir = IndexCache.defaultCacheDir()
+        # Only files given by path can be cached.
+        if cacheDir is None or not isinstance(theF.file, str):
+            self._indexFromFile(theF, None)
+            return
+        cachePath = IndexCache.cachePath(theF.file, cacheDir)
+        cacheKey = IndexCache.fileKey(
+            theF.file,
+            pad_modulo=theF.physicalRecordSettings.pad_modulo,
+            pad_non_null=theF.physicalRecordSettings.pad_non_null,
+            keep_going=theF.keepGoing,
+            x_axis_index=xAxisIndex,
+        )
+        cached = IndexCache.read(cachePath, cacheKey)
+        if cached is not None:
+            try:
+                self._indexFromCache(theF, *cached)
+            except (ExceptionTotalDepthLIS, IndexError, KeyError, TypeError, ValueError) as err:
+                logging.warning('Ignoring index cache %s that can not be restored: %s', cachePath, err)
+                self._idx = []
+            else:
+                return
+        # List of (index of the IndexLogPass, tell, lrType, lrLen, xVal) for every IFLR
+        iflrS = []
+        self._indexFromFile(theF, iflrS)
+        self._writeCache(cachePath, cacheKey, iflrS)
+
+    def _indexFromFile(self, theF, iflrS: typing.Union[None, typing.List[typing.Tuple]]) -> None:
+        """Index the file by reading every Logical Record. If iflrS is a list then the IFLR entries are appended to it
+        for writing the cache."""
+        theF.rewind()
+        # Indexes to log pass objects: {0 : None, 1 : None}
+        log_pass_index_map = FileIndex._reset_log_pass_index_map()
         while not theF.isEOF:
             # Grab the file position
             tell = theF.tellLr()
@@ -462,7 +511,9 @@ class FileIndex:
             if lrTy in log_pass_index_map:
                 if log_pass_index_map[lrTy] is not None:
                     # Normal/Alternate data with prior LogPass
-                    self._idx[log_pass_index_map[lrTy]].add(tell, lrTy, theF)
+                    lrLen, xVal = self._idx[log_pass_index_map[lrTy]].add(tell, lrTy, theF)
+                    if iflrS is not None:
+                        iflrS.append((log_pass_index_map[lrTy], tell, lrTy, lrLen, xVal))
                 else:
                     logging.warning(f'Logical record type {lrTy} at 0x{tell:08x} but no corresponding DFSR.')
                     theF.skipToNextLr()
@@ -488,6 +539,50 @@ class FileIndex:
                         # DFSR so update the map to point at the latest index
                         log_pass_index_map[self._idx[-1].iflrType()] = len(self._idx) - 1
 
+    def _indexFromCache(self, theF, metadata: typing.Dict[str, typing.Any], arrays: typing.Dict[str, np.ndarray]) -> None:
+        """Restore the index from the cache. The indexed Logical Records are read from their cached positions then the
+        IFLR entries are added to the log passes without reading the IFLRs."""
+        for tell, lrType in zip(arrays['lr_tell'].tolist(), arrays['lr_type'].tolist()):
+            theF.seekLr(tell)
+            myBy = theF.readLrBytes(LogiRec.STRUCT_LR_HEAD.size)
+            if myBy is None or len(myBy) != LogiRec.STRUCT_LR_HEAD.size:
+                raise ExceptionFileIndex('No Logical Record at 0x{:08x}'.format(tell))
+            lrTy, lrAt = LogiRec.STRUCT_LR_HEAD.unpack(myBy)
+            if lrTy != lrType:
+                raise ExceptionFileIndex(
+                    'Logical Record type {:d} at 0x{:08x} but expected {:d}'.format(lrTy, tell, lrType)
+                )
+            self._idx.append(self._despatchLrType[lrTy](tell, lrTy, theF))
+        for index, tell, lrType, lrLen, xVal, xIsInt in zip(
+                arrays['iflr_index'].tolist(),
+                arrays['iflr_tell'].tolist(),
+                arrays['iflr_type'].tolist(),
+                arrays['iflr_length'].tolist(),
+                arrays['iflr_x'].tolist(),
+                arrays['iflr_x_is_int'].tolist(),
+        ):
+            if xIsInt:
+                xVal = int(xVal)
+            self._idx[index].logPass.addType01Data(tell, lrType, lrLen, xVal)
+
+    def _writeCache(self, cachePath: str, cacheKey: typing.Dict[str, typing.Any],
+                    iflrS: typing.List[typing.Tuple]) -> None:
+        """Write the cache, failure is logged but is otherwise ignored."""
+        arrays = {
+            'lr_tell': np.array([v.tell for v in self._idx], dtype=np.int64),
+            'lr_type': np.array([v.lrType for v in self._idx], dtype=np.uint8),
+            'iflr_index': np.array([v[0] for v in iflrS], dtype=np.int64),
+            'iflr_tell': np.array([v[1] for v in iflrS], dtype=np.int64),
+            'iflr_type': np.array([v[2] for v in iflrS], dtype=np.uint8),
+            'iflr_length': np.array([v[3] for v in iflrS], dtype=np.int64),
+            'iflr_x': np.array([v[4] for v in iflrS], dtype=np.float64),
+            'iflr_x_is_int': np.array([isinstance(v[4], int) for v in iflrS], dtype=np.bool_),
+        }
+        try:
+            IndexCache.write(cachePath, cacheKey, {}, arrays)
+        except OSError as err:
+            logging.warning('Can not write index cache %s: %s', cachePath, err)
+
     def longDesc(self) -> str:
         """Returns a string that is the long description of this object."""
         return '{!r:s} "{!r:s}" [{:d}]:\n  '.format(
@@ -42,6 +42,7 @@ from TotalDepth.LIS import ExceptionTotalDepthLIS
 from TotalDepth.LIS.core import RepCode
 #from TotalDepth.LIS.core import LogiRec
 from TotalDepth.LIS.core import Units
+from TotalDepth.common import np_summary
 
 class ExceptionFrameSet(ExceptionTotalDepthLIS):
     """Specialisation of exception for FrameSet."""
@@ -312,6 +313,14 @@ class XAxisDecl(collections.namedtuple(
         """True if has indirect X axis."""
         return self.recordingMode == 1
 
+#: Decodes the bytes of a range of channels in a frame.
+#: frameSize is the number of bytes in the range of channels.
+#: conversions is a list of (rep_code, byte_index, value_index) for each Rep Code.
+#: byte_index selects the bytes of all the words of that Rep Code in the frame,
+#: value_index is where the converted values are written to in the frame array.
+#: Both of these are slices if contiguous, otherwise numpy index arrays.
+FrameDecoder = collections.namedtuple('FrameDecoder', 'frameSize conversions')
+
 class FrameSet(object):
     """Contains the representation of a list of Frames and thus a
     representation of and 'matrix' (non literal) of:
@@ -409,6 +418,8 @@ class FrameSet(object):
             self._indrXVector = None
             self._frameSpacing = None
         self._frames = None#numpy.empty((0), self.NUMPY_DATA_TYPE)
+        # Map of (chFrom, chTo) to FrameDecoder or None, see _frameDecoder()
+        self._frameDecoderCache = {}
         self._setFrames(self._totalNumFrames(self._frameSlice))
         # Create the offset tree
         self._offsetTree = self._retOffsetTree()
@@ -709,50 +720,112 @@ class FrameSet(object):
             chFrom = 0
         # chTo as None means just a single read of the indirect X channel
         if chTo is not None:
-            arrayPos = self.valueIdxStartExtCh(chFrom)
-            chInt = self.internalChIdx(chFrom)
-            #print('range(chFrom, chTo+1)', range(chFrom, chTo+1))
-            for chExt in range(chFrom, chTo+1):
-                #assert(arrayPos == self.valueIdxStartExtCh(chExt))
-                myCat = self._catS[chInt]
-                # TODO: Possible optimisation here, treat multi-sampled channels
-                # (or all channels) as we do reading dipmeter channels i.e.
-                # RepCode.readBytes() reads all values and returns a list
-                for i in range(myCat.numValues):
-#                    # For the moment be a bit clunky and treat dipmeter codes
-#                    # separately.
-#                    if myCat.repCode in RepCode.DIPMETER_REP_CODES:
-#                        byOfsEnd = byOfs + myCat.lisSize
-#                    else:
-#                        byOfsEnd = byOfs + myCat.wordLength
-                    byOfsEnd = byOfs + myCat.wordLength
-                    # Note: RepCode.readBytes() returns a single value
-                    # except with dipmeter codes when it returns a list of values.
-                    try:
-                        val = RepCode.readBytes(myCat.repCode, by[byOfs:byOfsEnd])
-                    except RepCode.ExceptionRepCode as err:
-                        raise ExceptionFrameSet(str(err))
-                    else:
-                        if isinstance(val, list):
-                            # Set numpy slice, for example
-                            #>>> y = np.array([[0, 1, 2, 3, 4,], [5, 6, 7, 8, 9]])
-                            #>>> y
-                            #array([[0, 1, 2, 3, 4],
-                            #       [5, 6, 7, 8, 9]])
-                            #>>> y[1, 1:4] = [1,4,6]
-                            #>>> y
-                            #array([[0, 1, 2, 3, 4],
-                            #       [5, 1, 4, 6, 9]])
-                            self._frames[fr, arrayPos:arrayPos+len(val)] = val
-                            arrayPos += len(val)
-                        else:
-                            self._frames[fr, arrayPos] = val
-                            arrayPos += 1
-                    byOfs = byOfsEnd
-                chInt += 1
+            myDecoder = self._frameDecoder(chFrom, chTo)
+            if myDecoder is None:
+                byOfs = self._setFrameBytesByValue(by, byOfs, fr, chFrom, chTo)
+            else:
+                # A length mismatch is reported below
+                if len(by) - byOfs == myDecoder.frameSize:
+                    self._decodeFrames(myDecoder, by, byOfs, fr, 1)
+                byOfs += myDecoder.frameSize
         if byOfs != len(by):
             raise ExceptionFrameSet('FrameSet.setFrameBytes() length missmatch byOfs={:d} len(by)={:d}'.format(byOfs, len(by)))
 
+    def setFramesBytes(self, by, frFrom, numFrames, chFrom, chTo):
+        """Given bytes that are numFrames consecutive frames of external channels
+        chFrom to chTo inclusive this converts them from Rep Codes to 'float64'
+        and populates frames frFrom to frFrom+numFrames.
+        This is equivalent to, and much faster than, calling setFrameBytes()
+        for each frame. chFrom can not be None i.e. there can not be an indirect X
+        value in by.
+        """
+        assert(chFrom is not None and chFrom <= chTo)
+        assert(by is not None)
+        myDecoder = self._frameDecoder(chFrom, chTo)
+        if myDecoder is None:
+            byOfs = 0
+            for fr in range(frFrom, frFrom + numFrames):
+                byOfs = self._setFrameBytesByValue(by, byOfs, fr, chFrom, chTo)
+        elif len(by) == myDecoder.frameSize * numFrames:
+            self._decodeFrames(myDecoder, by, 0, frFrom, numFrames)
+            byOfs = len(by)
+        else:
+            byOfs = myDecoder.frameSize * numFrames
+        if byOfs != len(by):
+            raise ExceptionFrameSet('FrameSet.setFramesBytes() length missmatch byOfs={:d} len(by)={:d}'.format(byOfs, len(by)))
+
+    def _frameDecoder(self, chFrom, chTo):
+        """Returns a FrameDecoder for external channels chFrom to chTo inclusive
+        or None if any channel has a Rep Code that numpy can not convert.
+        These are cached as a LogPass reads the same channel ranges repeatedly."""
+        try:
+            return self._frameDecoderCache[(chFrom, chTo)]
+        except KeyError:
+            pass
+        arrayPos = self.valueIdxStartExtCh(chFrom)
+        chInt = self.internalChIdx(chFrom)
+        byOfs = 0
+        # {repCode : ([byte_index, ...], [value_index, ...]), ...}
+        myRcMap = collections.OrderedDict()
+        myDecoder = None
+        for chExt in range(chFrom, chTo+1):
+            myCat = self._catS[chInt + chExt - chFrom]
+            if not RepCode.hasNumpyWordDtype(myCat.repCode):
+                break
+            byIdxS, valIdxS = myRcMap.setdefault(myCat.repCode, ([], []))
+            myLen = myCat.numValues * myCat.wordLength
+            byIdxS.extend(range(byOfs, byOfs + myLen))
+            valIdxS.extend(range(arrayPos, arrayPos + myCat.numValues))
+            byOfs += myLen
+            arrayPos += myCat.numValues
+        else:
+            myDecoder = FrameDecoder(
+                byOfs,
+                [
+                    (rc, self._indexOrSlice(byIdxS), self._indexOrSlice(valIdxS))
+                    for rc, (byIdxS, valIdxS) in myRcMap.items()
+                ],
+            )
+        self._frameDecoderCache[(chFrom, chTo)] = myDecoder
+        return myDecoder
+
+    def _indexOrSlice(self, theIdxS):
+        """Returns a slice if the list of indexes is contiguous, otherwise a numpy index array."""
+        if theIdxS == list(range(theIdxS[0], theIdxS[-1] + 1)):
+            return slice(theIdxS[0], theIdxS[-1] + 1)
+        return numpy.array(theIdxS, dtype=numpy.intp)
+
+    def _decodeFrames(self, theDecoder, by, byOfs, frFrom, numFrames):
+        """Converts numFrames frames from by starting at byOfs using a FrameDecoder
+        and writes them to self._frames starting at frame frFrom."""
+        myBytes = numpy.frombuffer(by, dtype=numpy.uint8, count=numFrames * theDecoder.frameSize, offset=byOfs)
+        myBytes = myBytes.reshape(numFrames, theDecoder.frameSize)
+        for myRepCode, byIdx, valIdx in theDecoder.conversions:
+            # Copy so that the words are contiguous then convert them all with one call.
+            myWords = numpy.ascontiguousarray(myBytes[:, byIdx])
+            myValues = numpy.empty((numFrames, myWords.shape[1] // RepCode.numpyWordDtype(myRepCode).itemsize))
+            RepCode.fromBytesArray(myRepCode, myWords.reshape(-1), myValues.reshape(-1))
+            self._frames[frFrom:frFrom+numFrames, valIdx] = myValues
+
+    def _setFrameBytesByValue(self, by, byOfs, fr, chFrom, chTo):
+        """Reads a frame value by value, this is used for Rep Codes that numpy
+        can not convert. Returns the new byte offset."""
+        arrayPos = self.valueIdxStartExtCh(chFrom)
+        chInt = self.internalChIdx(chFrom)
+        for chExt in range(chFrom, chTo+1):
+            myCat = self._catS[chInt]
+            for i in range(myCat.numValues):
+                byOfsEnd = byOfs + myCat.wordLength
+                try:
+                    val = RepCode.readBytes(myCat.repCode, by[byOfs:byOfsEnd])
+                except RepCode.ExceptionRepCode as err:
+                    raise ExceptionFrameSet(str(err))
+                self._frames[fr, arrayPos] = val
+                arrayPos += 1
+                byOfs = byOfsEnd
+            chInt += 1
+        return byOfs
+
     def setIndirectX(self, fr, val):
         """Sets an indirect X axis value directly, for example with an EXTRAPOLATE event."""
         assert(self._indrXVector is not None)
@@ -1059,6 +1132,33 @@ class FrameSet(object):
                     for p in self._genChScPointsSingle(frOfs):
                         yield p
 
+    def chScPointsArrays(self, ch, sc=0, chIsExt=True):
+        """Returns a pair of numpy arrays (xAxis, values) for the external
+        channel and sub-channel. These are the same values, in the same order,
+        as genChScPoints() but without the per-point overhead.
+        sc is ignored unless the channel has > 1 sub-channels.
+        If chIsExt is True then ch is the external channel index otherwise
+        it is the internal index."""
+        if self.numFrames > 0:
+            chInt = self.internalChIdx(ch) if chIsExt else ch
+            myCat = self._catS[chInt]
+            if myCat.numValues == 1 \
+            or (myCat.numSubChannels == 1 and myCat[0].samples == 1):
+                # Single sub-channel, single value or burst only so all values
+                # are 'aligned' with the X axis.
+                if self.isIndirectX:
+                    myX = self._indrXVector[:self.numFrames]
+                else:
+                    myX = self._frames[:self.numFrames, self._xAxisFrOffs]
+                frOfs = self._intChValIdxS[chInt]
+                myV = self._frames[:self.numFrames, frOfs:frOfs + myCat.numValues]
+                return numpy.repeat(myX, myCat.numValues), myV.reshape(-1)
+            # Super-sampled or dipmeter so fall back to the generator
+            myPoints = numpy.array(list(self.genChScPoints(ch, sc, chIsExt)), dtype=self.NUMPY_DATA_TYPE)
+            if len(myPoints) > 0:
+                return myPoints[:, 0], myPoints[:, 1]
+        return numpy.empty((0,), self.NUMPY_DATA_TYPE), numpy.empty((0,), self.NUMPY_DATA_TYPE)
+
     def _checkShapes(self, theIntChScS):
         """Checks a non-empty list of (ch,sc) and returns the tuple of
         shape (samples, bursts).
@@ -1208,11 +1308,27 @@ class FrameSet(object):
                 scOfs += 1
         return retArr
     
+    def _chScValuesArray(self, chInt, sc):
+        """Returns a 1D numpy array of the values that are not absent for the
+        internal channel and sub channel. The value order is that of
+        genChScValues()."""
+        myValues = self._frames[:, self._sliceTree[chInt][sc]].ravel()
+        return myValues[myValues != self._absentValue]
+
+    def _chScValuesMaskedArray(self, chInt, sc):
+        """Returns a 1D numpy masked array of all the values for the internal
+        channel and sub channel with the absent values masked."""
+        myValues = self._frames[:, self._sliceTree[chInt][sc]].ravel()
+        return numpy.ma.masked_array(myValues, mask=(myValues == self._absentValue))
+
     def accumulate(self, theAccs):
         """Calls .add() on every accumulator (with a unary function) for every
         internal channel and returns an numpy array of (numSubCh, len(theAccs))
         doubles. Each accumulator is expected to have __init__(), add() and
         value() that returns a double implemented.
+        If the accumulator has addArray() then that is called once for each
+        sub-channel with a numpy array of the values rather than calling add()
+        for every value.
         Will raise a ExceptionFrameSetEmpty if there are no values to analyse.
         Will return None if theAccs is zero length."""
         self._raiseOnEmpty()
@@ -1225,12 +1341,38 @@ class FrameSet(object):
         accArrayOffs = 0
         for chInt in range(self.numChannels):
             for sc in range(self._catS[chInt].numSubChannels):
-                for v in self.genChScValues(chInt, sc, chIsExternal=False):
-                    if v != self._absentValue:
-                        for a in range(len(theAccs)):
-                            accArray[accArrayOffs][a].add(v)
+                myValues = self._chScValuesArray(chInt, sc)
+                for a in range(len(theAccs)):
+                    myAcc = accArray[accArrayOffs][a]
+                    if hasattr(myAcc, 'addArray'):
+                        myAcc.addArray(myValues)
+                    else:
+                        for v in myValues:
+                            myAcc.add(v)
+                accArrayOffs += 1
+        return self._retAccumulatorValues(accArray)
+
+    def summarise(self, theSummaries=None):
+        """Adds the values of every internal channel and sub-channel to a
+        list of TotalDepth.common.np_summary.SummaryAccumulator objects and
+        returns that list. Absent values are ignored.
+        If theSummaries is None a new list is created, otherwise it must be the
+        list returned by a previous call on a FrameSet with the same channels.
+        This allows a LogPass to be summarised a chunk of frames at a time.
+        Will raise a ExceptionFrameSetEmpty if there are no values to analyse."""
+        self._raiseOnEmpty()
+        if theSummaries is None:
+            theSummaries = [
+                np_summary.SummaryAccumulator()
+                for chInt in range(self.numChannels)
+                for sc in range(self._catS[chInt].numSubChannels)
+            ]
+        accArrayOffs = 0
+        for chInt in range(self.numChannels):
+            for sc in range(self._catS[chInt].numSubChannels):
+                theSummaries[accArrayOffs].add(self._chScValuesMaskedArray(chInt, sc), flatten=False)
                 accArrayOffs += 1
-        return self._retAccumulatorValues(accArray)    
+        return theSummaries
     #==================================================
     # End: Mutation and functional programming etc.
     #==================================================
@@ -1252,6 +1394,11 @@ class AccMin(object):
         if self.min is None or v < self.min:
             self.min = v
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        if len(arr):
+            self.add(arr.min())
+
     def value(self):
         """Return the result."""
         return self.min
@@ -1267,6 +1414,11 @@ class AccMax(object):
         if self.max is None or v > self.max:
             self.max = v
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        if len(arr):
+            self.add(arr.max())
+
     def value(self):
         """Return the result."""
         return self.max
@@ -1283,6 +1435,11 @@ class AccMean(object):
         self.sum += v
         self.cntr += 1
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        self.sum += arr.sum()
+        self.cntr += len(arr)
+
     def value(self):
         """Return the result."""
         if self.cntr > 0:
@@ -1302,6 +1459,12 @@ class AccStDev(object):
         self.sumSq += v**2
         self.cntr += 1
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        self.sum += arr.sum()
+        self.sumSq += (arr**2).sum()
+        self.cntr += len(arr)
+
     def value(self):
         """Return the result."""
         if self.cntr > 1:
@@ -1321,6 +1484,10 @@ class AccCount(object):
         """Add a new value."""
         self.cntr += 1
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        self.cntr += len(arr)
+
     def value(self):
         """Return the result."""
         return self.cntr
@@ -1336,6 +1503,18 @@ class AccDelta(object):
         """Add a new value."""
         raise NotImplementedError
 
+    def _prevAndArray(self, arr):
+        """Returns a numpy array of the previous value (if any) followed by
+        arr and sets the previous value to the last of arr."""
+        if len(arr) == 0:
+            return arr
+        if self.prev is not None:
+            ret = numpy.concatenate(([self.prev], arr))
+        else:
+            ret = arr
+        self.prev = arr[-1]
+        return ret
+
     def value(self):
         """Return the result."""
         return self.cntr
@@ -1352,6 +1531,11 @@ class AccInc(AccDelta):
             self.cntr += 1
         self.prev = v
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        arr = self._prevAndArray(arr)
+        self.cntr += numpy.count_nonzero(arr[:-1] < arr[1:])
+
 
 class AccEq(AccDelta):
     """Counting how many values are equal to the previous value."""
@@ -1364,6 +1548,11 @@ class AccEq(AccDelta):
             self.cntr += 1
         self.prev = v
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        arr = self._prevAndArray(arr)
+        self.cntr += numpy.count_nonzero(arr[:-1] == arr[1:])
+
 
 class AccDec(AccDelta):
     """Counting how many values are less than the previous value."""
@@ -1376,6 +1565,11 @@ class AccDec(AccDelta):
             self.cntr += 1
         self.prev = v
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        arr = self._prevAndArray(arr)
+        self.cntr += numpy.count_nonzero(arr[:-1] > arr[1:])
+
 
 class AccBias(AccDelta):
     """Measures increment, equal, decrement and computes bias which is:
@@ -1397,6 +1591,13 @@ class AccBias(AccDelta):
             self.cntrDec += 1
         self.prev = v
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        arr = self._prevAndArray(arr)
+        self.cntrInc += numpy.count_nonzero(arr[:-1] > arr[1:])
+        self.cntrEq += numpy.count_nonzero(arr[:-1] == arr[1:])
+        self.cntrDec += numpy.count_nonzero(arr[:-1] < arr[1:])
+
     def value(self):
         """Return the result."""
         return (self.cntrInc - self.cntrDec) / (self.cntrInc + self.cntrEq + self.cntrDec)
@@ -1416,6 +1617,14 @@ class AccDrift(AccDelta):
         self.last = v
         self.cntr += 1
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        if len(arr):
+            if self.first is None:
+                self.first = arr[0]
+            self.last = arr[-1]
+            self.cntr += len(arr)
+
     def value(self):
         """Return the result."""
         if self.first is not None and self.last is not None:
@@ -1439,6 +1648,17 @@ class AccActivity(AccDelta):
         self.prevExp = myExp
         self.cntr += 1
 
+    def addArray(self, arr):
+        """Add a numpy array of values."""
+        if len(arr):
+            myMant, exp = numpy.frexp(arr)
+            myExp = exp + (2 * myMant) - 1.0
+            if self.cntr > 0:
+                myExp = numpy.concatenate(([self.prevExp], myExp))
+            self.actSum += ((myExp[1:] - myExp[:-1])**2).sum()
+            self.prevExp = myExp[-1]
+            self.cntr += len(arr)
+
     def value(self):
         """Return the result."""
         if self.cntr > 0:
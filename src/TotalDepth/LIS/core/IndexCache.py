@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Part of TotalDepth: Petrophysical data processing and presentation.
+# Copyright (C) 2011-2021 Paul Ross
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Paul Ross: apaulross@gmail.com
+"""Persistent binary cache of a LIS FileIndex.
+
+The cache is a numpy ``.npz`` file that contains numpy arrays of the indexed Logical Record positions and types and,
+for every IFLR, its position, type, length and X axis value. It is keyed on the absolute path, size, modification
+time and a hash of the start and end of the file so a stale cache is ignored (and replaced). Reading and writing is done
+by ``TotalDepth.common.npz_cache``.
+
+The cache is either a sidecar file next to the LIS file or in a cache directory, see ``cachePath()``.
+
+Loading the cache and replaying it into a ``FileIndex`` is done by ``FileIndexer.FileIndex``.
+
+Created on 17 Oct 2026
+
+@author: p2ross
+"""
+import typing
+
+import numpy as np
+
+from TotalDepth.LIS import ExceptionTotalDepthLIS
+from TotalDepth.common import npz_cache
+
+__author__  = 'Paul Ross'
+__date__    = '2026-10-17'
+__version__ = '0.1.0'
+__rights__  = 'Copyright (c) Paul Ross'
+
+
+class ExceptionIndexCache(ExceptionTotalDepthLIS):
+    """Specialisation of exception for the LIS index cache."""
+    pass
+
+
+#: Increment this when the layout of the cache changes.
+VERSION = 1
+#: Suffix of the sidecar file.
+SIDECAR_SUFFIX = '.td_index.npz'
+
+
+def cachePath(path: str, cacheDir: str) -> str:
+    """Returns the path of the cache file for the LIS file at path.
+    If cacheDir is the empty string then this is a sidecar file next to the LIS file, otherwise the cache is
+    in cacheDir with a name derived from the absolute path of the LIS file."""
+    return npz_cache.cache_path(path, cacheDir, SIDECAR_SUFFIX)
+
+
+def defaultCacheDir() -> typing.Union[None, str]:
+    """The cache directory set by the ``--index-cache`` command line option or None if the option was not given."""
+    return npz_cache.default_cache_dir()
+
+
+def fileKey(path: str, **kwargs) -> typing.Dict[str, typing.Any]:
+    """The key that identifies the version of the LIS file that the cache was created from.
+    Any keyword arguments, such as the Physical Record settings, are added to the key, they must be JSON serialisable."""
+    return npz_cache.file_key(path, VERSION, **kwargs)
+
+
+def write(pathCache: str, key: typing.Dict[str, typing.Any], metadata: typing.Dict[str, typing.Any],
+          arrays: typing.Dict[str, np.ndarray]) -> None:
+    """Writes the cache atomically. metadata must be JSON serialisable, the key is added to it."""
+    try:
+        npz_cache.write(pathCache, key, metadata, arrays)
+    except npz_cache.ExceptionNpzCache as err:
+        raise ExceptionIndexCache(str(err)) from err
+
+
+def read(pathCache: str, key: typing.Dict[str, typing.Any]) \
+        -> typing.Union[None, typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, np.ndarray]]]:
+    """Reads the cache and returns (metadata, arrays) or None if there is no cache, it is unreadable or the key does not
+    match."""
+    return npz_cache.read(pathCache, key)
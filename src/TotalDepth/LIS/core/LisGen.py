@@ -39,6 +39,8 @@ import math
 #import struct
 import random
 
+import numpy
+
 from TotalDepth.LIS import ExceptionTotalDepthLIS
 from TotalDepth.LIS.core import PhysRec
 from TotalDepth.LIS.core import File
@@ -587,6 +589,19 @@ class Channel(object):
         """Returns the value for the frame and sample."""
         return self._chGen.val(f, s)
 
+    @property
+    def rc(self):
+        return self._chSpec.rc
+
+    @property
+    def canWriteArray(self):
+        """True if the values can be converted with RepCode.writeBytesArray()."""
+        return RepCode.hasToArray(self._chSpec.rc)
+
+    def frameValues(self, f):
+        """Returns the list of values for the frame."""
+        return [self.val(f, s) for s in range(self._chSpec.sa)]
+
     def frameBytes(self, f):
         """Returns the bytes for the frame."""
         r = bytearray()
@@ -598,7 +613,8 @@ class Channel(object):
 # Section: Channel value generators for Dipmeters.
 #-------------------------------------------------
 class ChGenBase(object):
-    pass
+    # Values are written by frameBytes()
+    canWriteArray = False
 
     def _packListWithStruct(self, theStruct, *args):
         """Returns bytes packed with a struct. When called with a list the
@@ -776,14 +792,25 @@ class LogPassGen(object):
         This does not prepend indirect X axis value."""
         if numFrames < 0:
             raise ExceptionLisGen('LogPassGen._normalAlternateData(): to negative number of frames: {:d}'.format(numFrames))
-        r = bytearray()
-        i = 0
-        f = fFrom
-        for i in range(numFrames):
-            for c in self._chS:
-                r.extend(c.frameBytes(f))
-            f += 1
-        return r
+        # Generate the values in frame order so that any random values are
+        # reproducible then convert each channel's values with one call.
+        myChData = [[] for _c in self._chS]
+        for f in range(fFrom, fFrom + numFrames):
+            for c, myData in zip(self._chS, myChData):
+                if c.canWriteArray:
+                    myData.extend(c.frameValues(f))
+                else:
+                    myData.append(c.frameBytes(f))
+        if numFrames == 0:
+            return bytearray()
+        myColumns = []
+        for c, myData in zip(self._chS, myChData):
+            if c.canWriteArray:
+                myBytes = RepCode.writeBytesArray(myData, c.rc)
+            else:
+                myBytes = b''.join(myData)
+            myColumns.append(numpy.frombuffer(myBytes, dtype=numpy.uint8).reshape(numFrames, -1))
+        return bytearray(numpy.hstack(myColumns).tobytes())
 
     def lrBytes(self, fFrom, numFrames):
         """The Logical Record bytes for the frame range."""
@@ -77,6 +77,9 @@ EVENT_SKIP          = Type01Plan.EVENT_SKIP
 #: Event to extrapolate X axis
 EVENT_EXTRAPOLATE   = Type01Plan.EVENT_EXTRAPOLATE
 
+#: Default number of frames read at a time by summariseFrameSet()
+FRAME_SET_CHUNK_FRAMES = 4096
+
 ##################
 # Section: LogPass
 ##################
@@ -594,12 +597,24 @@ class LogPass(object):
             return
         # Iterate through frame plane for this LR
         xVal = None
+        # Consecutive whole frame reads of the same channels are batched and
+        # converted in one go by FrameSet.setFramesBytes().
+        # This is [size, frFrom, numFrames, chFrom, chTo] or None.
+        myReads = None
         #print('setFrameSet.setFrameSet():')
         # Note: We take the list of channel indexes from the frameSet as the
         # frameSet is free to add mandatory channels such as the X axis
         for ty, siz, frInt, chFrom, chTo in self._genFrameSetEvents(myFrSl, list(self._frameSet.genExtChIndexes())):
             #print('LogPass.setFrameSet(): type={:s} siz={:s} frInt={:s} chFrom={:s} chTo={:s}'.format(ty, str(siz), str(frInt), str(chFrom), str(chTo)))
             #print('LogPass.setFrameSet(): type={:s} frInt={:s}'.format(ty, str(frInt)))
+            if ty == EVENT_READ and chFrom is not None and myReads is not None \
+                    and myReads[0] == siz and myReads[1] + myReads[2] == frInt \
+                    and myReads[3] == chFrom and myReads[4] == chTo:
+                myReads[2] += 1
+                continue
+            if myReads is not None:
+                self._setFramesBytes(theFile, *myReads)
+                myReads = None
             # Note: fr is frame number in this LR
             if ty == EVENT_SEEK_LR:
                 theFile.seekLr(siz)
@@ -625,7 +640,42 @@ class LogPass(object):
                 theFile.skipLrBytes(siz)
             else:
                 assert(ty == EVENT_READ)
-                self._frameSet.setFrameBytes(theFile.readLrBytes(siz), frInt, chFrom, chTo)
+                if chFrom is None:
+                    self._frameSet.setFrameBytes(theFile.readLrBytes(siz), frInt, chFrom, chTo)
+                else:
+                    myReads = [siz, frInt, 1, chFrom, chTo]
+        if myReads is not None:
+            self._setFramesBytes(theFile, *myReads)
+
+    def genFrameSetChunks(self, theFile, chunkFrames, theChList=None):
+        """Populates the frame set with successive chunks of at most chunkFrames
+        frames and yields the FrameSet for each chunk. The FrameSet is only
+        valid until the next iteration. This limits the memory used for large
+        log passes.
+
+        theChList is as setFrameSet().
+        """
+        if chunkFrames < 1:
+            raise ExceptionLogPass('LogPass.genFrameSetChunks(): chunkFrames must be > 0 not {:d}'.format(chunkFrames))
+        totalFrames = self._rle.totalFrames()
+        for frFrom in range(0, totalFrames, chunkFrames):
+            self.setFrameSet(theFile, slice(frFrom, min(frFrom + chunkFrames, totalFrames), 1), theChList)
+            yield self._frameSet
+
+    def summariseFrameSet(self, theFile, chunkFrames=FRAME_SET_CHUNK_FRAMES, theChList=None):
+        """Returns a list of TotalDepth.common.np_summary.SummaryAccumulator,
+        one for each sub-channel in the order of genFrameSetScNameUnit(), by
+        reading the frames in chunks with genFrameSetChunks().
+        Returns None if there are no frames.
+        """
+        summaries = None
+        for frameSet in self.genFrameSetChunks(theFile, chunkFrames, theChList):
+            summaries = frameSet.summarise(summaries)
+        return summaries
+
+    def _setFramesBytes(self, theFile, siz, frFrom, numFrames, chFrom, chTo):
+        """Reads numFrames consecutive reads of siz bytes and populates the FrameSet."""
+        self._frameSet.setFramesBytes(theFile.readLrBytes(siz * numFrames), frFrom, numFrames, chFrom, chTo)
 
     def _rangeFromSlice(self, theSl):
         """Given a slice object this returns an iterable range object."""
@@ -683,6 +733,11 @@ class LogPass(object):
         fsCh, fsSc = self._mnemToChSc(theMnem)
         return self._frameSet.genChScPoints(fsCh, fsSc, chIsExt=True)
 
+    def outpPointsArrays(self, theMnem):
+        """Returns a pair of numpy arrays (xAxis, values) with the same values as genOutpPoints()."""
+        fsCh, fsSc = self._mnemToChSc(theMnem)
+        return self._frameSet.chScPointsArrays(fsCh, fsSc, chIsExt=True)
+
     def jsonObject(self):
         """Return an Python object that can be JSON encoded."""
         d = {
@@ -101,6 +101,8 @@ class ExceptionPhysRecTail(ExceptionPhysRec):
 PR_PRH_LEN_FORMAT               = struct.Struct('>H')
 #: The struct.Struct() format for the Physical Record Header attributes
 PR_PRH_ATTR_FORMAT              = struct.Struct('>H')
+#: The struct.Struct() format for the complete Physical Record Header, length and attributes
+PR_PRH_FORMAT                   = struct.Struct('>HH')
 #: The length of the Physical Record Header
 PR_PRH_LENGTH                   = 4
 #: Number of bits in the 2 byte attributes
@@ -171,6 +173,7 @@ PR_MAX_LENGTH                    = 2**16 - 1
 # Sanity check of struct compiled formats
 assert(PR_PRH_LEN_FORMAT.size == 2)
 assert(PR_PRH_ATTR_FORMAT.size == 2)
+assert(PR_PRH_FORMAT.size == PR_PRH_LENGTH)
 assert(PR_PRT_REC_NUM_FORMAT.size == PR_PRT_REC_NUM_LEN)
 assert(PR_PRT_FILE_NUM_FORMAT.size == PR_PRT_FILE_NUM_LEN)
 assert(PR_PRT_CHECKSUM_FORMAT.size == PR_PRT_CHECKSUM_LEN)
@@ -394,7 +397,7 @@ class PhysRecRead(PhysRecBase):
         self.pad_modulo = pad_modulo
         self.pad_non_null = pad_non_null
         try:
-            self.stream = RawStream.RawStream(theFile, mode='rb', fileId=self.fileId)
+            self.stream = RawStream.RawStreamRead(theFile, fileId=self.fileId)
         except IOError:
             raise ExceptionPhysRec('PhysRecRead: Can not open LIS file "%s" for read' % self.fileId)
         # Rewind to start of file
@@ -465,8 +468,7 @@ class PhysRecRead(PhysRecBase):
             myTell = self.tif.read(self.stream)
             if myTell is not None:
                 self.startPrPos = myTell
-            self.prLen = self.stream.readAndUnpack(PR_PRH_LEN_FORMAT)[0]
-            self.prAttr = self.stream.readAndUnpack(PR_PRH_ATTR_FORMAT)[0]
+            self.prLen, self.prAttr = self.stream.readAndUnpack(PR_PRH_FORMAT)
         except RawStream.ExceptionRawStreamEOF:
             self.isEOF = True
         else:
@@ -553,20 +555,17 @@ class PhysRecRead(PhysRecBase):
             if tell % self.pad_modulo:
                 pad_len = self.pad_modulo - (tell % self.pad_modulo)
                 # logging.info(f'XXXX tell={tell} pad_modulo={self.pad_modulo} pad len={pad_len}')
-                pad_bytes = bytearray()
-                for i in range(pad_len):
-                    byt = self.stream.read(1)
-                    if byt == b'' or (not self.pad_non_null and byt != b'\x00'):
-                        # Restore stream
-                        self.stream.seek(tell)
-                        return b''
-                    pad_bytes.append(byt[0])
-                return bytes(pad_bytes)
+                pad_bytes = self.stream.read(pad_len)
+                if len(pad_bytes) != pad_len or (not self.pad_non_null and pad_bytes != b'\x00' * pad_len):
+                    # Restore stream
+                    self.stream.seek(tell)
+                    return b''
+                return pad_bytes
         return b''
 
     def __readOrSkip(self, retVal, theFunc, theSize=-1):
         """Dual purpose function for reading or skipping logical data.
-        retVal is the accumulator (LogicaData for read, integer for skip).
+        retVal is the accumulator (list of LogicalData chunks for read, integer for skip).
         theFunc is the function to call to accumulate.
         theFunc takes retVal as an argument, updates it and returns it."""
         if self.isEOF:
@@ -615,7 +614,7 @@ class PhysRecRead(PhysRecBase):
                     'PhysRecRead.__readLdWithinPr() on EOF, wanted {0:d} got {1:d}'.format(size, len(myLd))
                 )
             # Note: No else: as _raiseOrErrorOnEOF() might continue
-            theLd += myLd
+            theLd.append(myLd)
             return theLd
         except RawStream.ExceptionRawStreamEOF as err:
             self._raiseOrErrorOnEOF('PhysRecRead.__readLdWithinPr() on EOF')
@@ -651,9 +650,11 @@ class PhysRecRead(PhysRecBase):
         Returns None on end of logical record."""
         if not self._readOrSkipPreamble():
             return None
-        if theLd is None:
-            theLd = bytes()
-        return self.__readOrSkip(theLd, self.__readLdWithinPr, theSize)
+        # Collect the Logical Data from each Physical Record and join once rather than repeatedly concatenating.
+        myChunks = self.__readOrSkip([] if theLd is None else [theLd], self.__readLdWithinPr, theSize)
+        if len(myChunks) == 1:
+            return bytes(myChunks[0])
+        return b''.join(myChunks)
 
     def skipLrBytes(self, theSize=-1):
         """Skips logical data and returns a count of skipped bytes.
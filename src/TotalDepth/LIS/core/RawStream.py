@@ -148,3 +148,113 @@ class RawStream(object):
 #        except struct.error as err:
 #            raise ExceptionRawStream(str(err))
 #===============================================================================
+
+
+#: The size of the in-memory window used by RawStreamRead.
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class RawStreamRead(RawStream):
+    """Read only specialisation of RawStream that reads the file in blocks into an in-memory window.
+    Small reads such as TIF markers, Physical Record headers and trailers are then unpacked directly from the window
+    rather than each being a read() on the underlying file object.
+
+    The position is maintained by this object, the position of the underlying file object is undefined.
+
+    f - A file like object or string, if the latter it assumed to be a path.
+
+    fileId - As RawStream.
+
+    blockSize - The minimum number of bytes to read from the underlying file object at a time, if None then
+    READ_BLOCK_SIZE is used.
+    """
+    def __init__(self, f, fileId=None, blockSize=None):
+        """Construct with:
+        f - A file like object or string, if the latter it assumed to be a path.
+        fileId - As RawStream.
+        blockSize - The minimum number of bytes to read from the underlying file object at a time.
+        """
+        super().__init__(f, mode='rb', fileId=fileId)
+        self._blockSize = READ_BLOCK_SIZE if blockSize is None else blockSize
+        self._window = b''
+        self._windowStart = 0
+        self._pos = self._stream.tell()
+        self._closed = False
+
+    def _checkClosed(self):
+        if self._closed:
+            raise ValueError('I/O operation on closed file.')
+
+    def _load(self, theLen):
+        """Fills the window with at least theLen bytes, if available, from the current position."""
+        self._checkClosed()
+        self._stream.seek(self._pos)
+        self._window = self._stream.read(max(theLen, self._blockSize))
+        self._windowStart = self._pos
+
+    def tell(self):
+        """Return the current position, like stdio's ftell."""
+        self._checkClosed()
+        return self._pos
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Set the current position, like stdio's fseek, see RawStream.seek().
+        Seeking with os.SEEK_SET or os.SEEK_CUR does not touch the underlying file object."""
+        self._checkClosed()
+        if whence == os.SEEK_SET:
+            pos = offset
+        elif whence == os.SEEK_CUR:
+            pos = self._pos + offset
+        else:
+            self._stream.seek(offset, whence)
+            pos = self._stream.tell()
+        if pos < 0:
+            # Let the underlying file object raise.
+            self._stream.seek(pos)
+        self._pos = pos
+
+    def read(self, theLen):
+        """Reads and returns theLen bytes. If theLen is negative the rest of the file is read."""
+        try:
+            if theLen < 0:
+                self._checkClosed()
+                self._stream.seek(self._pos)
+                ret = self._stream.read()
+            else:
+                offset = self._pos - self._windowStart
+                if offset < 0 or offset + theLen > len(self._window):
+                    self._load(theLen)
+                    offset = 0
+                ret = self._window[offset:offset + theLen]
+        except ValueError as err:
+            raise ExceptionRawStreamEOF(f'{str(err)} at tell: 0x{self._pos:08x}')
+        self._pos += len(ret)
+        return ret
+
+    def write(self, theB):
+        """Writing is not supported."""
+        raise ExceptionRawStream('RawStreamRead.write() is not supported.')
+
+    def close(self):
+        """Closes the underlying stream and releases the window."""
+        super().close()
+        self._closed = True
+        self._window = b''
+
+    def readAndUnpack(self, theStruct):
+        """Unpacks binary data at the current position according to the struct module format. This returns a tuple.
+
+        theStruct - A formated instance of struct.Struct()."""
+        offset = self._pos - self._windowStart
+        if offset < 0 or offset + theStruct.size > len(self._window):
+            self._load(theStruct.size)
+            offset = 0
+            if theStruct.size > len(self._window):
+                self._pos += len(self._window)
+                raise ExceptionRawStreamEOF(
+                    f'RawStream.readAndUnpack(): EOF at 0x{self._pos:08x}'
+                    f' read {self._window}'
+                    f' but need {theStruct.size} bytes'
+                )
+        self._pos += theStruct.size
+        return theStruct.unpack_from(self._window, offset)
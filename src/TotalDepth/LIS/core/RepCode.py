@@ -32,6 +32,8 @@ __date__    = '2010-08-02'
 __version__ = '0.1.0'
 __rights__  = 'Copyright (c) Paul Ross'
 
+import numpy
+
 # Import the Python reference methods
 from TotalDepth.LIS.core.pRepCode import *
 # Now overlay with any implemented in Cython
@@ -290,6 +292,31 @@ def readBytes(theRc, theB, theLen=None):
     except KeyError:
         raise ExceptionRepCodeUnknown('readBytes(): Unsupported representation code %s' % theRc)
 
+def readBytesArray(theRc, theB):
+    """Reads a whole number of Representation Code words from a bytes() object
+    and returns a numpy 'float64' array. The values are identical to calling
+    readBytes() on each word."""
+    dt = numpyWordDtype(theRc)
+    if len(theB) % dt.itemsize:
+        raise ExceptionRepCodeRead(
+            'RepCode.readBytesArray(): rc={:s} {:d} bytes is not a whole number of words'.format(str(theRc), len(theB))
+        )
+    myArray = numpy.empty(len(theB) // dt.itemsize, dtype=numpy.float64)
+    fromBytesArray(theRc, theB, myArray)
+    return myArray
+
+def writeBytesArray(theValues, theRc):
+    """Takes a sequence of values and a Representation Code and converts them
+    to a bytes() object. This is the same as joining writeBytes() for each
+    value except that integer Representation Codes truncate and wrap rather than
+    raising."""
+    if not hasToArray(theRc):
+        raise ExceptionRepCodeUnknown('RepCode.writeBytesArray(): Unsupported representation code %s' % theRc)
+    myValues = numpy.ascontiguousarray(theValues, dtype=numpy.float64).reshape(-1)
+    myBytes = bytearray(len(myValues) * numpyWordDtype(theRc).itemsize)
+    toBytesArray(theRc, myValues, myBytes)
+    return bytes(myBytes)
+
 def writeBytes(v, r):
     """Takes a value v and a Representation Code r and converts this to a
     bytes() object."""
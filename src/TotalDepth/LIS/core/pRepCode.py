@@ -30,10 +30,13 @@ __date__    = '2010-08-02'
 __version__ = '0.1.0'
 __rights__  = 'Copyright (c) Paul Ross'
 
+import functools
 import logging
 import math
 import struct
 
+import numpy
+
 from TotalDepth.LIS import ExceptionTotalDepthLIS
 
 class ExceptionRepCode(ExceptionTotalDepthLIS):
@@ -760,3 +763,190 @@ def read79(theFile):
 #############################
 # End: Python reference code.
 #############################
+
+####################################
+# Section: numpy array conversions.
+####################################
+# These convert many words at once, for example all the values of a channel
+# over many frames. The results are identical to the scalar fromNN()
+# functions above but are returned as a numpy 'float64' array.
+
+#: Map of Representation Code to the numpy dtype of its raw (big endian) word.
+NUMPY_WORD_DTYPE_MAP = {
+    49  : numpy.dtype('>i2'),
+    50  : numpy.dtype('>i4'),
+    56  : numpy.dtype('i1'),
+    66  : numpy.dtype('u1'),
+    68  : numpy.dtype('>u4'),
+    70  : numpy.dtype('>u4'),
+    73  : numpy.dtype('>i4'),
+    77  : numpy.dtype('u1'),
+    79  : numpy.dtype('>i2'),
+    # Dipmeter values are read a byte at a time.
+    DIPMETER_EDIT_TAPE_REP_CODE         : numpy.dtype('u1'),
+    DIPMETER_CSU_FIELD_TAPE_REP_CODE    : numpy.dtype('u1'),
+}
+
+def hasNumpyWordDtype(r):
+    """Returns True if the Representation Code can be converted by fromArray()."""
+    return r in NUMPY_WORD_DTYPE_MAP
+
+def numpyWordDtype(r):
+    """Returns the numpy dtype of the raw word for Representation Code r."""
+    try:
+        return NUMPY_WORD_DTYPE_MAP[r]
+    except KeyError:
+        raise ExceptionRepCodeUnknown('Representation Code {:s} has no numpy word type'.format(str(r)))
+
+def fromArray49(theWords):
+    """Returns a 'float64' array from an array of Rep code 49 words, see from49()."""
+    w = theWords.astype(numpy.int64)
+    m = w & 0xFFF0
+    m = numpy.where(w & 0x8000, m - 0x10000, m)
+    return numpy.ldexp(m / (1.0 * (1<<15)), (w & 0xF).astype(numpy.int32))
+
+def fromArray50(theWords):
+    """Returns a 'float64' array from an array of Rep code 50 words, see from50()."""
+    w = theWords.astype(numpy.int64)
+    mant = w & 0xFFFF
+    mant = numpy.where(w & 0x8000, mant - 0x10000, mant)
+    exp = ((w >> 16) & 0x3FF) - 15
+    exp = numpy.where(w & 0x80000000, exp - 0x10000, exp)
+    return numpy.ldexp(mant.astype(numpy.float64), exp.astype(numpy.int32))
+
+def fromArray68(theWords):
+    """Returns a 'float64' array from an array of Rep code 68 words, see from68()."""
+    w = theWords.astype(numpy.int64)
+    isNeg = (w & 0x80000000) != 0
+    mant = numpy.where(isNeg, -8388608, 0) | (w & 0x007FFFFF)
+    exp = (w & 0x7F800000) >> 23
+    exp = numpy.where(isNeg, 104 - exp, exp - 151)
+    return numpy.ldexp(mant.astype(numpy.float64), exp.astype(numpy.int32))
+
+def fromArray70(theWords):
+    """Returns a 'float64' array from an array of Rep code 70 words, see from70()."""
+    w = theWords.astype(numpy.int64)
+    retVal = ((w >> 16) & 0xFFFF) + (w & 0xFFFF) / (1 << 16)
+    return numpy.where(w & 0x80000000, retVal - 0x10000, retVal)
+
+def fromArrayInt(theWords):
+    """Returns a 'float64' array from an array of integer words, for Rep codes
+    56, 66, 73, 77, 79 and the dipmeter codes."""
+    return theWords.astype(numpy.float64)
+
+FROM_ARRAY_DESPATCH_MAP = {
+    49  : fromArray49,
+    50  : fromArray50,
+    56  : fromArrayInt,
+    66  : fromArrayInt,
+    68  : fromArray68,
+    70  : fromArray70,
+    73  : fromArrayInt,
+    77  : fromArrayInt,
+    79  : fromArrayInt,
+    DIPMETER_EDIT_TAPE_REP_CODE         : fromArrayInt,
+    DIPMETER_CSU_FIELD_TAPE_REP_CODE    : fromArrayInt,
+}
+
+def fromArray(r, theWords):
+    """Returns a 'float64' array from a numpy array of Representation Code r
+    words that have the dtype numpyWordDtype(r)."""
+    try:
+        return FROM_ARRAY_DESPATCH_MAP[r](theWords)
+    except KeyError:
+        raise ExceptionRepCodeUnknown('Representation Code {:s} has no array conversion'.format(str(r)))
+
+def toArray68(theValues):
+    """Returns an array of Rep code 68 words from an array of values, see to68()."""
+    v = numpy.asarray(theValues, dtype=numpy.float64)
+    mant, expOrig = numpy.frexp(v)
+    exp = expOrig.astype(numpy.int64)
+    # If exponent is <128 then reduce mantissa by excess 128
+    isDenorm = exp < -128
+    mant = numpy.where(isDenorm, numpy.ldexp(mant, numpy.where(isDenorm, exp + 128, 0).astype(numpy.int32)), mant)
+    exp = numpy.where(isDenorm, -128, exp)
+    # Set exponent as excess 128 and the sign bit
+    isNeg = v < 0.0
+    exp = numpy.where(isNeg, 127 - exp, exp - 128) & 0xFF
+    w = (isNeg.astype(numpy.int64) << 31) | (exp << 23) | ((mant * (1<<23)).astype(numpy.int64) & 0x007FFFFF)
+    # Overflow and underflow control
+    w = numpy.where(expOrig <= -(128+23), RC_68_CODE_ZERO, w)
+    w = numpy.where(expOrig > 127, numpy.where(isNeg, RC_68_CODE_MIN, RC_68_CODE_MAX), w)
+    return w.astype(NUMPY_WORD_DTYPE_MAP[68])
+
+def toArrayInt(r, theValues):
+    """Returns an array of integer words from an array of values, for Rep codes
+    56, 66, 73, 77, 79 and the dipmeter codes. Values are truncated towards zero
+    and wrap around if out of range."""
+    return numpy.asarray(theValues, dtype=numpy.float64).astype(numpy.int64).astype(NUMPY_WORD_DTYPE_MAP[r])
+
+TO_ARRAY_DESPATCH_MAP = {
+    56  : functools.partial(toArrayInt, 56),
+    66  : functools.partial(toArrayInt, 66),
+    68  : toArray68,
+    73  : functools.partial(toArrayInt, 73),
+    77  : functools.partial(toArrayInt, 77),
+    79  : functools.partial(toArrayInt, 79),
+    DIPMETER_EDIT_TAPE_REP_CODE         : functools.partial(toArrayInt, DIPMETER_EDIT_TAPE_REP_CODE),
+    DIPMETER_CSU_FIELD_TAPE_REP_CODE    : functools.partial(toArrayInt, DIPMETER_CSU_FIELD_TAPE_REP_CODE),
+}
+
+def hasToArray(r):
+    """Returns True if the Representation Code can be converted by toArray()."""
+    return r in TO_ARRAY_DESPATCH_MAP
+
+def toArray(r, theValues):
+    """Returns a numpy array of Representation Code r words that have the dtype
+    numpyWordDtype(r) from an array of values."""
+    try:
+        return TO_ARRAY_DESPATCH_MAP[r](theValues)
+    except KeyError:
+        raise ExceptionRepCodeUnknown('Representation Code {:s} has no array conversion'.format(str(r)))
+####################################
+# End: numpy array conversions.
+####################################
+
+###################################
+# Section: Buffer batch conversions.
+###################################
+# These convert a whole buffer of N words to or from a buffer of N doubles in
+# one call. cRepCode and cpRepCode overlay these with compiled kernels that
+# take any object that supports the buffer protocol (bytes, bytearray,
+# memoryview, contiguous numpy arrays). The results are identical.
+# These raise ValueError if the buffer sizes do not match or the Rep Code is
+# not supported.
+
+def fromBytesArray(r, theB, theOut):
+    """Converts len(theOut) words of Representation Code r from the bytes like
+    object theB into theOut which is a writable 'float64' buffer, for example
+    a numpy array."""
+    if r not in FROM_ARRAY_DESPATCH_MAP:
+        raise ValueError('fromBytesArray(): Unsupported representation code {:s}'.format(str(r)))
+    dt = NUMPY_WORD_DTYPE_MAP[r]
+    myOut = numpy.frombuffer(theOut, dtype=numpy.float64)
+    if len(theB) != dt.itemsize * len(myOut):
+        raise ValueError(
+            'fromBytesArray(): {:d} bytes can not be converted to {:d} values of representation code {:d}'.format(
+                len(theB), len(myOut), r
+            )
+        )
+    myOut[:] = fromArray(r, numpy.frombuffer(theB, dtype=dt))
+
+def toBytesArray(r, theValues, theOut):
+    """Converts the 'float64' buffer theValues to Representation Code r words
+    into theOut which is a writable bytes like object, for example a bytearray."""
+    if r not in TO_ARRAY_DESPATCH_MAP:
+        raise ValueError('toBytesArray(): Unsupported representation code {:s}'.format(str(r)))
+    dt = NUMPY_WORD_DTYPE_MAP[r]
+    myValues = numpy.frombuffer(theValues, dtype=numpy.float64)
+    myOut = numpy.frombuffer(theOut, dtype=numpy.uint8)
+    if len(myOut) != dt.itemsize * len(myValues):
+        raise ValueError(
+            'toBytesArray(): {:d} values can not be converted to {:d} bytes of representation code {:d}'.format(
+                len(myValues), len(myOut), r
+            )
+        )
+    myOut[:] = toArray(r, myValues).view(numpy.uint8)
+###################################
+# End: Buffer batch conversions.
+###################################
@@ -84,6 +84,106 @@ finally:
     return ret;
 }
 
+static PyObject *fromBytesArray(PyObject *module, PyObject *args) {
+    PyObject *ret = NULL;
+    int rep_code;
+    Py_buffer bytes_in = {NULL, NULL};
+    Py_buffer values_out = {NULL, NULL};
+    size_t word_length;
+    size_t count;
+    assert(! PyErr_Occurred());
+    if (! PyArg_ParseTuple(args, "iy*w*", &rep_code, &bytes_in, &values_out)) {
+        goto except;
+    }
+    word_length = _word_length(rep_code);
+    if (word_length == 0) {
+        PyErr_Format(PyExc_ValueError, "%s(): Unsupported representation code %d", __FUNCTION__, rep_code);
+        goto except;
+    }
+    if (values_out.len % sizeof(double)) {
+        PyErr_Format(PyExc_ValueError, "%s(): Output buffer of %zd bytes is not a whole number of doubles",
+                     __FUNCTION__, values_out.len);
+        goto except;
+    }
+    count = values_out.len / sizeof(double);
+    if (static_cast<size_t>(bytes_in.len) != word_length * count) {
+        PyErr_Format(PyExc_ValueError,
+                     "%s(): %zd bytes can not be converted to %zu values of representation code %d",
+                     __FUNCTION__, bytes_in.len, count, rep_code);
+        goto except;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    _from_bytes_array(rep_code, static_cast<const unsigned char *>(bytes_in.buf),
+                      static_cast<double *>(values_out.buf), count);
+    Py_END_ALLOW_THREADS
+    Py_INCREF(Py_None);
+    ret = Py_None;
+    assert(! PyErr_Occurred());
+    goto finally;
+except:
+    assert(PyErr_Occurred());
+    Py_XDECREF(ret);
+    ret = NULL;
+finally:
+    if (bytes_in.obj) {
+        PyBuffer_Release(&bytes_in);
+    }
+    if (values_out.obj) {
+        PyBuffer_Release(&values_out);
+    }
+    return ret;
+}
+
+static PyObject *toBytesArray(PyObject *module, PyObject *args) {
+    PyObject *ret = NULL;
+    int rep_code;
+    Py_buffer values_in = {NULL, NULL};
+    Py_buffer bytes_out = {NULL, NULL};
+    size_t word_length;
+    size_t count;
+    assert(! PyErr_Occurred());
+    if (! PyArg_ParseTuple(args, "iy*w*", &rep_code, &values_in, &bytes_out)) {
+        goto except;
+    }
+    word_length = _word_length(rep_code);
+    if (word_length == 0 || rep_code == 49 || rep_code == 50 || rep_code == 70) {
+        PyErr_Format(PyExc_ValueError, "%s(): Unsupported representation code %d", __FUNCTION__, rep_code);
+        goto except;
+    }
+    if (values_in.len % sizeof(double)) {
+        PyErr_Format(PyExc_ValueError, "%s(): Input buffer of %zd bytes is not a whole number of doubles",
+                     __FUNCTION__, values_in.len);
+        goto except;
+    }
+    count = values_in.len / sizeof(double);
+    if (static_cast<size_t>(bytes_out.len) != word_length * count) {
+        PyErr_Format(PyExc_ValueError,
+                     "%s(): %zu values can not be converted to %zd bytes of representation code %d",
+                     __FUNCTION__, count, bytes_out.len, rep_code);
+        goto except;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    _to_bytes_array(rep_code, static_cast<const double *>(values_in.buf),
+                    static_cast<unsigned char *>(bytes_out.buf), count);
+    Py_END_ALLOW_THREADS
+    Py_INCREF(Py_None);
+    ret = Py_None;
+    assert(! PyErr_Occurred());
+    goto finally;
+except:
+    assert(PyErr_Occurred());
+    Py_XDECREF(ret);
+    ret = NULL;
+finally:
+    if (values_in.obj) {
+        PyBuffer_Release(&values_in);
+    }
+    if (bytes_out.obj) {
+        PyBuffer_Release(&bytes_out);
+    }
+    return ret;
+}
+
 static PyMethodDef cpRepCode_methods[] = {
     {"from68", (PyCFunction)from68, METH_O,
         "Converts a 32bit integer word with representation code 68 to a float."
@@ -91,6 +191,14 @@ static PyMethodDef cpRepCode_methods[] = {
     {"to68", (PyCFunction)to68, METH_O,
         "Converts a float to a 32bit integer word with representation code 68."
     },
+    {"fromBytesArray", (PyCFunction)fromBytesArray, METH_VARARGS,
+        "fromBytesArray(rep_code, bytes_in, values_out) converts the words of a representation code in a bytes like"
+        " object to a writable buffer of doubles, for example a numpy 'float64' array."
+    },
+    {"toBytesArray", (PyCFunction)toBytesArray, METH_VARARGS,
+        "toBytesArray(rep_code, values_in, bytes_out) converts a buffer of doubles to the words of a representation"
+        " code in a writable bytes like object, for example a bytearray."
+    },
     /* Other functions here... */
     {NULL, NULL, 0, NULL}  /* Sentinel */
 };
@@ -134,6 +134,121 @@ uint32_t _to68(double value) {
     word |= exponent & 0xFF;
     // Shift for mantissa
     word <<= 23;
-    word |= static_cast<uint32_t>(mantissa * (1 << 23)) & 0x007FFFFF;
+    // Cast through a signed type as the mantissa may be negative.
+    word |= static_cast<uint32_t>(static_cast<int64_t>(mantissa * (1 << 23))) & 0x007FFFFF;
     return word;
 }
+
+/* Buffer batch conversions. */
+
+size_t _word_length(int rep_code) {
+    /* Returns the word length of the Representation Code or 0 if not supported. */
+    switch (rep_code) {
+        case 56:
+        case 66:
+        case 77:
+        case 130:
+        case 234:
+            return 1;
+        case 49:
+        case 79:
+            return 2;
+        case 50:
+        case 68:
+        case 70:
+        case 73:
+            return 4;
+        default:
+            return 0;
+    }
+}
+
+static uint32_t _read_word(const unsigned char *bytes, size_t word_length) {
+    /* Returns a big endian word. */
+    uint32_t word = 0;
+    for (size_t i = 0; i < word_length; ++i) {
+        word = (word << 8) | bytes[i];
+    }
+    return word;
+}
+
+static double _from50(uint32_t word) {
+    int mantissa = word & 0xFFFF;
+    int exponent = ((word >> 16) & 0x03FF) - 15;
+    if (word & 0x8000) {
+        mantissa -= 0x10000;
+    }
+    if (word & 0x80000000) {
+        exponent -= 0x10000;
+    }
+    return ldexp(mantissa, exponent);
+}
+
+static double _from70(uint32_t word) {
+    double value = ((word >> 16) & 0xFFFF) + (word & 0xFFFF) / 65536.0;
+    if (word & 0x80000000) {
+        value -= 0x10000;
+    }
+    return value;
+}
+
+int _from_bytes_array(int rep_code, const unsigned char *bytes, double *values, size_t count) {
+    /* Converts count words of the Representation Code to doubles.
+     * Returns 0 on success, non-zero if the Representation Code is not supported. */
+    size_t word_length = _word_length(rep_code);
+    if (word_length == 0) {
+        return -1;
+    }
+    for (size_t i = 0; i < count; ++i) {
+        uint32_t word = _read_word(bytes + i * word_length, word_length);
+        switch (rep_code) {
+            case 49:
+                values[i] = _from49(static_cast<uint16_t>(word));
+                break;
+            case 50:
+                values[i] = _from50(word);
+                break;
+            case 56:
+                values[i] = static_cast<int8_t>(word);
+                break;
+            case 68:
+                values[i] = _from68(word);
+                break;
+            case 70:
+                values[i] = _from70(word);
+                break;
+            case 73:
+                values[i] = static_cast<int32_t>(word);
+                break;
+            case 79:
+                values[i] = static_cast<int16_t>(word);
+                break;
+            default:
+                // 66, 77 and the dipmeter codes are unsigned bytes.
+                values[i] = word;
+                break;
+        }
+    }
+    return 0;
+}
+
+int _to_bytes_array(int rep_code, const double *values, unsigned char *bytes, size_t count) {
+    /* Converts count doubles to words of the Representation Code. Integer codes truncate towards zero and wrap.
+     * Returns 0 on success, non-zero if the Representation Code is not supported. */
+    size_t word_length = _word_length(rep_code);
+    if (word_length == 0 || rep_code == 49 || rep_code == 50 || rep_code == 70) {
+        return -1;
+    }
+    for (size_t i = 0; i < count; ++i) {
+        uint32_t word;
+        if (rep_code == 68) {
+            word = _to68(values[i]);
+        } else {
+            word = static_cast<uint32_t>(static_cast<int64_t>(values[i]));
+        }
+        for (size_t j = 0; j < word_length; ++j) {
+            bytes[i * word_length + j] = (word >> (8 * (word_length - 1 - j))) & 0xFF;
+        }
+    }
+    return 0;
+}
@@ -21,4 +21,9 @@ extern const size_t RC_68_SIZE;
 double _from68(uint32_t word);
 uint32_t _to68(double value);
 
+/* Buffer batch conversions, these return 0 on success. */
+size_t _word_length(int rep_code);
+int _from_bytes_array(int rep_code, const unsigned char *bytes, double *values, size_t count);
+int _to_bytes_array(int rep_code, const double *values, unsigned char *bytes, size_t count);
+
 #endif /* LisRepCode_h */
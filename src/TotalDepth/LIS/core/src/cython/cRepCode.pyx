@@ -22,7 +22,7 @@ Representation Codes ('RepCodes').
 
 Internal types are double, int or string.
 """
-cdef extern from "math.h":
+cdef extern from "math.h" nogil:
     double ldexp(double m, int exp)
     double frexp(double v, int *exp)
     double HUGE_VAL
@@ -163,3 +163,144 @@ def from79(signed short int theWord):
 ########################################
 
 
+
+###################################
+# Section: Buffer batch conversions.
+###################################
+# These convert a whole buffer of N words to or from a buffer of N doubles in
+# one call, see pRepCode.fromBytesArray() and pRepCode.toBytesArray().
+
+cdef unsigned int _RC_68_CODE_MIN = 0xFFC00000
+
+cdef int _wordLength(int r):
+    """Returns the word length of Rep Code r or 0 if not supported."""
+    if r in (56, 66, 77, 130, 234):
+        return 1
+    elif r in (49, 79):
+        return 2
+    elif r in (50, 68, 70, 73):
+        return 4
+    return 0
+
+cdef inline unsigned int _word(const unsigned char[::1] b, Py_ssize_t i, int wl) nogil:
+    """Returns the big endian word of length wl starting at b[i]."""
+    if wl == 1:
+        return b[i]
+    elif wl == 2:
+        return (b[i] << 8) | b[i+1]
+    return (<unsigned int>b[i] << 24) | (b[i+1] << 16) | (b[i+2] << 8) | b[i+3]
+
+cdef inline double _fromWord(int r, unsigned int w) nogil:
+    cdef int mant
+    cdef int exp
+    cdef double val
+    if r == 49:
+        mant = w & 0xFFF0
+        if w & 0x8000:
+            mant -= 0x10000
+        return ldexp(mant / 32768.0, w & 0x0F)
+    elif r == 50:
+        mant = w & 0xFFFF
+        exp = ((w >> 16) & 0x03FF) - 15
+        if w & 0x8000:
+            mant -= 0x10000
+        if w >> 31:
+            exp -= 0x10000
+        return ldexp(mant, exp)
+    elif r == 56:
+        return <signed char>w
+    elif r == 68:
+        if w >> 31:
+            mant = -8388608
+        else:
+            mant = 0
+        mant |= w & 0x007FFFFF
+        exp = (w & 0x7F800000) >> 23
+        if w >> 31:
+            exp = 104 - exp
+        else:
+            exp -= 151
+        return ldexp(mant, exp)
+    elif r == 70:
+        val = ((w >> 16) & 0xFFFF) + (w & 0xFFFF) / 65536.0
+        if w >> 31:
+            val -= 0x10000
+        return val
+    elif r == 73:
+        return <signed int>w
+    elif r == 79:
+        return <signed short>w
+    # 66, 77 and the dipmeter codes are unsigned bytes
+    return w
+
+def fromBytesArray(int r, const unsigned char[::1] theB not None, double[::1] theOut not None):
+    """Converts len(theOut) words of Representation Code r from the bytes like
+    object theB into theOut which is a writable 'float64' buffer."""
+    cdef int wl = _wordLength(r)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = theOut.shape[0]
+    if wl == 0:
+        raise ValueError('fromBytesArray(): Unsupported representation code {:d}'.format(r))
+    if theB.shape[0] != wl * n:
+        raise ValueError(
+            'fromBytesArray(): {:d} bytes can not be converted to {:d} values of representation code {:d}'.format(
+                theB.shape[0], n, r
+            )
+        )
+    with nogil:
+        for i in range(n):
+            theOut[i] = _fromWord(r, _word(theB, i * wl, wl))
+
+cdef inline unsigned int _to68(double v) nogil:
+    cdef unsigned int w = 0
+    cdef int exp = 0
+    cdef double mant = frexp(v, &exp)
+    if exp <= -(128+23):
+        return 0x40000000
+    elif exp > 127:
+        if v < 0:
+            return _RC_68_CODE_MIN
+        return 0x7FFFFFFF
+    if exp < -128:
+        mant = ldexp(mant, exp + 128)
+        exp = -128
+    if v < 0.0:
+        exp = 127 - exp
+        w = 1
+    else:
+        exp -= 128
+        w = 0
+    w <<= 8
+    w |= exp & 0xFF
+    w <<= 23
+    w |= (<long long> (mant * (1<<23))) & 0x007FFFFF
+    return w
+
+def toBytesArray(int r, const double[::1] theValues not None, unsigned char[::1] theOut not None):
+    """Converts the 'float64' buffer theValues to Representation Code r words
+    into theOut which is a writable bytes like object."""
+    cdef int wl = _wordLength(r)
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n = theValues.shape[0]
+    cdef unsigned int w
+    if wl == 0 or r in (49, 50, 70):
+        raise ValueError('toBytesArray(): Unsupported representation code {:d}'.format(r))
+    if theOut.shape[0] != wl * n:
+        raise ValueError(
+            'toBytesArray(): {:d} values can not be converted to {:d} bytes of representation code {:d}'.format(
+                n, theOut.shape[0], r
+            )
+        )
+    with nogil:
+        for i in range(n):
+            if r == 68:
+                w = _to68(theValues[i])
+            else:
+                # Truncate towards zero and wrap around
+                w = <unsigned int><long long>theValues[i]
+            for j in range(wl):
+                theOut[i * wl + j] = (w >> (8 * (wl - 1 - j))) & 0xFF
+
+###################################
+# End: Buffer batch conversions.
+###################################
@@ -31,7 +31,6 @@ import time
 import sys
 import os
 import logging
-import multiprocessing
 import collections
 import traceback
 #from optparse import OptionParser
@@ -53,9 +52,9 @@ from TotalDepth.util.plot import FILMCfgXML
 from TotalDepth.util.plot import XMLMatches
 # Utilities - general
 from TotalDepth.util import DictTree
-from TotalDepth.util import DirWalk
 from TotalDepth.util import XmlWrite
 from TotalDepth.common import cmn_cmd_opts
+from TotalDepth.common import job_engine
 
 CSS_CONTENT_INDEX = """body {
 font-size:      12px;
@@ -678,26 +677,18 @@ def processFile(fpIn, fpOut, opts):
     return myPlp.plotLogInfo
 
 def plotLogPassesMP(dIn, dOut, opts):
-    """Multiprocessing code to plot log passes. Returns a PlotLogInfo object."""
-    if opts.jobs < 1:
-        jobs = multiprocessing.cpu_count()
-    else:
-        jobs = opts.jobs
-    logging.info('plotLogPassesMP(): Setting multi-processing jobs to %d' % jobs)
-    myPool = multiprocessing.Pool(processes=jobs)
-    myTaskS = [
-        (t.filePathIn, t.filePathOut, opts) \
-            for t in DirWalk.dirWalk(dIn, dOut, opts.glob, opts.recurse, bigFirst=True)
-    ]
+    """Multiprocessing code to plot log passes. Returns a PlotLogInfo object.
+    See ``job_engine.run()`` for opts.jobs, opts.timeout and opts.journal, files that time out or crash the worker
+    are logged and omitted."""
+    logging.info('plotLogPassesMP(): Setting multi-processing jobs to %d' % opts.jobs)
     retResult = PlotLogInfo()
-    myResults = [
-        r.get() for r in [
-            myPool.apply_async(processFile, t) for t in myTaskS
-        ]
-    ]
-    for r in myResults:
-        # r is a PlotLogInfo object
-        retResult += r
+    myJobS = job_engine.dir_walk_jobs(dIn, dOut, opts.recurse, (opts,), fn_match=opts.glob or '')
+    for r in job_engine.run(processFile, myJobS, opts.jobs, opts.timeout, opts.journal):
+        # r.result is a PlotLogInfo object
+        if r.ok:
+            retResult += r.result
+        else:
+            logging.error('plotLogPassesMP(): failed to plot {:s}: {:s}'.format(r.key, r.error))
     return retResult
 ################################
 # End: Multiprocessing code.
@@ -714,6 +705,7 @@ def main():
     )
     cmn_cmd_opts.add_log_level(parser)
     cmn_cmd_opts.add_multiprocessing(parser)
+    cmn_cmd_opts.add_job_engine(parser)
     parser.add_argument("-A", "--API", action="store_true", dest="apiHeader", default=False,
                       help="Put an API header on each plot. [default: False]")
     parser.add_argument("-x", "--xml", action="append", dest="LgFormat", default=[],
@@ -19,7 +19,6 @@
 # Paul Ross: apaulross@gmail.com
 """Read RP66V1 files and saves the index a s pickle file."""
 import logging
-import multiprocessing
 import os
 import pickle
 import sys
@@ -29,9 +28,10 @@ import typing
 from TotalDepth.RP66V1 import ExceptionTotalDepthRP66V1
 from TotalDepth.RP66V1.core import LogicalFile
 from TotalDepth.common import cmn_cmd_opts
+from TotalDepth.common import job_engine
 from TotalDepth.common import data_table
 from TotalDepth.common import process
-from TotalDepth.util import gnuplot, DirWalk
+from TotalDepth.util import gnuplot
 from TotalDepth.util.DirWalk import dirWalk
 from TotalDepth.util.bin_file_type import binary_file_type_from_path
 
@@ -63,28 +63,24 @@ def unpickle(path: str) -> LogicalFile.LogicalIndex:
 
 
 def index_dir_multiprocessing(dir_in: str, dir_out: str, jobs: int,
-                              recurse: bool, read_back: bool) -> typing.Dict[str, IndexResult]:
-    """Multiprocessing code to plot log passes.
+                              recurse: bool, read_back: bool,
+                              timeout: float = 0.0, journal_path: str = '') -> typing.Dict[str, IndexResult]:
+    """Multiprocessing code to plot log passes, see ``job_engine.run()`` for jobs, timeout and journal_path.
     Returns a dict of {path_in : IndexResult, ...}"""
     assert os.path.isdir(dir_in)
-    if jobs < 1:
-        jobs = multiprocessing.cpu_count()
-    logging.info('scan_dir_multiprocessing(): Setting multi-processing jobs to %d' % jobs)
-    pool = multiprocessing.Pool(processes=jobs)
-    tasks = [
-        (t.filePathIn, t.filePathOut, read_back) for t in DirWalk.dirWalk(
-            dir_in, dir_out, theFnMatch='', recursive=recurse, bigFirst=True
-        )
-    ]
-    # print('tasks:')
-    # pprint.pprint(tasks, width=200)
-    # return {}
-    results = [
-        r.get() for r in [
-            pool.apply_async(index_a_single_file, t) for t in tasks
-        ]
-    ]
-    return {r.path_in: r for r in results}
+    logging.info('index_dir_multiprocessing(): Setting multi-processing jobs to %d' % jobs)
+    ret: typing.Dict[str, IndexResult] = {}
+    for job_result in job_engine.run(
+            index_a_single_file, job_engine.dir_walk_jobs(dir_in, dir_out, recurse, (read_back,)),
+            jobs, timeout, journal_path,
+    ):
+        if job_result.ok:
+            ret[job_result.key] = job_result.result
+        else:
+            ret[job_result.key] = IndexResult(
+                job_result.key, os.path.getsize(job_result.key), 0, job_result.time, 0.0, 0.0, True, False
+            )
+    return ret
 
 
 def index_a_single_file(path_in: str, path_out: str, read_back: bool) -> IndexResult:
@@ -237,6 +233,7 @@ Scans a RP66V1 file or directory and saves the index as a pickled file."""
     )
     cmn_cmd_opts.add_log_level(parser, level=20)
     cmn_cmd_opts.add_multiprocessing(parser)
+    cmn_cmd_opts.add_job_engine(parser)
     parser.add_argument('--read-back', action='store_true', help='Read and time the output. [default: %(default)s]')
     process.add_process_logger_to_argument_parser(parser)
     gnuplot.add_gnuplot_to_argument_parser(parser)
@@ -254,6 +251,8 @@ Scans a RP66V1 file or directory and saves the index as a pickled file."""
             args.jobs,
             args.recurse,
             args.read_back,
+            timeout=args.timeout,
+            journal_path=args.journal,
         )
     else:
         if args.log_process > 0.0:
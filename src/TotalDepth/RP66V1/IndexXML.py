@@ -20,7 +20,6 @@
 import datetime
 import io
 import logging
-import multiprocessing
 import os
 import sys
 import time
@@ -35,6 +34,7 @@ from TotalDepth.RP66V1.core.Index import ExceptionIndex
 from TotalDepth.RP66V1.core.XAxis import IFLRReference
 from TotalDepth.common import process
 from TotalDepth.common import cmn_cmd_opts
+from TotalDepth.common import job_engine
 from TotalDepth.common import Rle
 from TotalDepth.util import DirWalk
 from TotalDepth.util.bin_file_type import binary_file_type_from_path
@@ -345,27 +345,23 @@ def index_a_single_file(path_in: str, path_out: str, private: bool) -> IndexResu
     return IndexResult(path_in, 0, 0, 0.0, False, True)
 
 
-def index_dir_multiprocessing(dir_in: str, dir_out: str, private: bool, jobs: int) -> typing.Dict[str, IndexResult]:
-    """Multiprocessing code to index in XML.
+def index_dir_multiprocessing(dir_in: str, dir_out: str, private: bool, jobs: int,
+                              timeout: float = 0.0, journal_path: str = '') -> typing.Dict[str, IndexResult]:
+    """Multiprocessing code to index in XML, see ``job_engine.run()`` for jobs, timeout and journal_path.
     Returns a dict of {path_in : IndexResult, ...}"""
-    if jobs < 1:
-        jobs = multiprocessing.cpu_count()
-    logging.info('scan_dir_multiprocessing(): Setting multi-processing jobs to %d' % jobs)
-    pool = multiprocessing.Pool(processes=jobs)
-    tasks = [
-        (t.filePathIn, t.filePathOut, private) for t in DirWalk.dirWalk(
-            dir_in, dir_out, theFnMatch='', recursive=True, bigFirst=True
-        )
-    ]
-    # print('tasks:')
-    # pprint.pprint(tasks, width=200)
-    # return {}
-    results = [
-        r.get() for r in [
-            pool.apply_async(index_a_single_file, t) for t in tasks
-        ]
-    ]
-    return {r.path_input : r for r in results}
+    logging.info('index_dir_multiprocessing(): Setting multi-processing jobs to %d' % jobs)
+    ret: typing.Dict[str, IndexResult] = {}
+    for job_result in job_engine.run(
+            index_a_single_file, job_engine.dir_walk_jobs(dir_in, dir_out, True, (private,)),
+            jobs, timeout, journal_path,
+    ):
+        if job_result.ok:
+            ret[job_result.key] = job_result.result
+        else:
+            ret[job_result.key] = IndexResult(
+                job_result.key, os.path.getsize(job_result.key), 0, job_result.time, True, False
+            )
+    return ret
 
 
 def index_dir_or_file(path_in: str, path_out: str, recurse: bool, private: bool) -> typing.Dict[str, IndexResult]:
@@ -477,6 +473,8 @@ def main() -> int:
     )
     cmn_cmd_opts.add_log_level(parser, level=20)
     cmn_cmd_opts.add_multiprocessing(parser)
+    cmn_cmd_opts.add_job_engine(parser)
+    cmn_cmd_opts.add_index_cache(parser)
     parser.add_argument(
         '-e', '--encrypted', action='store_true',
         help='Output encrypted Logical Records as well. [default: %(default)s]',
@@ -491,6 +489,7 @@ def main() -> int:
     # print('args:', args)
     # return 0
     log_level = cmn_cmd_opts.set_log_level(args)
+    cmn_cmd_opts.set_index_cache(args)
     # Your code here
     clk_start = time.perf_counter()
     ret_val = 0
@@ -500,6 +499,8 @@ def main() -> int:
             args.path_out,
             args.private,
             args.jobs,
+            timeout=args.timeout,
+            journal_path=args.journal,
         )
     else:
         if args.log_process > 0.0:
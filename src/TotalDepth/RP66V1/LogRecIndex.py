@@ -21,7 +21,6 @@
 Exercises the LogicalRecordIndex on real files.
 """
 import logging
-import multiprocessing
 import os
 import pickle
 import sys
@@ -30,7 +29,7 @@ import typing
 
 from TotalDepth.RP66V1 import ExceptionTotalDepthRP66V1
 from TotalDepth.RP66V1.core import Index, File
-from TotalDepth.common import cmn_cmd_opts, process
+from TotalDepth.common import cmn_cmd_opts, job_engine, process
 from TotalDepth.util import bin_file_type, DirWalk, ExecTimer
 from TotalDepth.util import gnuplot
 
@@ -61,25 +60,24 @@ class IndexResult(typing.NamedTuple):
 
 
 def index_dir_multiprocessing(dir_in: str, dir_out: str, jobs: int,
-                              recurse: bool, read_back: bool, validate: bool) -> typing.Dict[str, IndexResult]:
-    """Multiprocessing code to plot log passes.
+                              recurse: bool, read_back: bool, validate: bool,
+                              timeout: float = 0.0, journal_path: str = '') -> typing.Dict[str, IndexResult]:
+    """Multiprocessing code to plot log passes, see ``job_engine.run()`` for jobs, timeout and journal_path.
     Returns a dict of {path_in : IndexResult, ...}"""
     assert os.path.isdir(dir_in)
-    if jobs < 1:
-        jobs = multiprocessing.cpu_count()
-    logging.info('scan_dir_multiprocessing(): Setting multi-processing jobs to %d' % jobs)
-    pool = multiprocessing.Pool(processes=jobs)
-    tasks = [
-        (t.filePathIn, t.filePathOut, read_back, validate) for t in DirWalk.dirWalk(
-            dir_in, dir_out, theFnMatch='', recursive=recurse, bigFirst=True
-        )
-    ]
-    results = [
-        r.get() for r in [
-            pool.apply_async(index_a_single_file, t) for t in tasks
-        ]
-    ]
-    return {r.path_in: r for r in results}
+    logging.info('index_dir_multiprocessing(): Setting multi-processing jobs to %d' % jobs)
+    ret: typing.Dict[str, IndexResult] = {}
+    for job_result in job_engine.run(
+            index_a_single_file, job_engine.dir_walk_jobs(dir_in, dir_out, recurse, (read_back, validate)),
+            jobs, timeout, journal_path,
+    ):
+        if job_result.ok:
+            ret[job_result.key] = job_result.result
+        else:
+            ret[job_result.key] = IndexResult(
+                job_result.key, os.path.getsize(job_result.key), 0, job_result.time, 0.0, 0.0, True, False
+            )
+    return ret
 
 
 def index_a_single_file(path_in: str, path_out: str, read_back: bool, validate: bool) -> IndexResult:
@@ -249,6 +247,7 @@ def main() -> int:
     )
     cmn_cmd_opts.add_log_level(parser, level=20)
     cmn_cmd_opts.add_multiprocessing(parser)
+    cmn_cmd_opts.add_job_engine(parser)
     process.add_process_logger_to_argument_parser(parser)
     gnuplot.add_gnuplot_to_argument_parser(parser)
     parser.add_argument(
@@ -273,6 +272,8 @@ def main() -> int:
             args.recurse,
             args.read_back,
             args.validate,
+            timeout=args.timeout,
+            journal_path=args.journal,
         )
     else:
         if args.log_process > 0.0:
@@ -42,9 +42,7 @@ import typing
 
 import colorama
 
-import TotalDepth.common.AbsentValue
 from TotalDepth.RP66V1 import ExceptionTotalDepthRP66V1
-from TotalDepth.RP66V1.core import AbsentValue
 from TotalDepth.RP66V1.core import File
 from TotalDepth.RP66V1.core import LogPass
 from TotalDepth.RP66V1.core import LogicalFile
@@ -54,7 +52,9 @@ from TotalDepth.RP66V1.core.LogicalRecord import EFLR
 from TotalDepth.RP66V1.core.LogicalRecord import IFLR
 from TotalDepth.common import Rle, statistics
 from TotalDepth.common import Slice
+from TotalDepth.common import cmn_cmd_opts
 from TotalDepth.common import data_table
+from TotalDepth.common import np_summary
 from TotalDepth.util import bin_file_type
 from TotalDepth.util import gnuplot
 from TotalDepth.util.DirWalk import dirWalk
@@ -72,6 +72,8 @@ __rights__  = 'Copyright (c) 2019 Paul Ross. All rights reserved.'
 logger = logging.getLogger(__file__)
 
 STANDARD_TEXT_WIDTH = 132
+#: Frames read at a time when summarising a Frame Array.
+DEFAULT_CHUNK_FRAMES = 4096
 
 
 @contextlib.contextmanager
@@ -319,14 +321,14 @@ def scan_RP66V1_file_logical_data(fobj: typing.BinaryIO, fout: typing.TextIO, **
                     if dump_bytes:
                         if dump_bytes == -1:
                             if dump_raw_bytes:
-                                messages.append(str(logical_data.logical_data.bytes))
+                                messages.append(str(bytes(logical_data.logical_data.bytes)))
                             else:
-                                messages.append(format_bytes(logical_data.logical_data.bytes))
+                                messages.append(format_bytes(bytes(logical_data.logical_data.bytes)))
                         else:
                             if dump_raw_bytes:
-                                messages.append(str(logical_data.logical_data.bytes[:dump_bytes]))
+                                messages.append(str(bytes(logical_data.logical_data.bytes[:dump_bytes])))
                             else:
-                                messages.append(format_bytes(logical_data.logical_data.bytes[:dump_bytes]))
+                                messages.append(format_bytes(bytes(logical_data.logical_data.bytes[:dump_bytes])))
                     fout.write(' '.join(messages))
                     fout.write('\n')
                 vr_position = logical_data.position.vr_position
@@ -490,9 +492,9 @@ def _scan_log_pass_content(
         with _output_section_header_trailer(f'Frame Array [{fa}/{len(lp.frame_arrays)}]', '^', os=fout):
             fout.write(str(frame_array))
             fout.write('\n')
-            num_frames = logical_file.populate_frame_array(
+            num_frames, accumulators = np_summary.accumulate_frame_array(
                 frame_array,
-                frame_slice,
+                logical_file.populate_frame_array_chunks(frame_array, DEFAULT_CHUNK_FRAMES, frame_slice),
             )
             if num_frames > 0:
                 x_axis: XAxis.XAxis = logical_index[logical_file_index].iflr_position_map[frame_array.ident]
@@ -512,20 +514,19 @@ def _scan_log_pass_content(
                 fout.write(
                     f'Frame spacing: {frame_slice.long_str(len(x_axis))}'
                     f' number of frames: {num_frames}'
-                    f' numpy size: {frame_array.sizeof_array:,d} bytes'
+                    f' numpy size: {frame_array.sizeof_frame * num_frames:,d} bytes'
                 )
                 fout.write('\n')
                 frame_table = [['Channel', 'Size', 'Absent', 'Min', 'Mean', 'Std.Dev.', 'Max', 'Units', 'dtype']]
-                for channel in frame_array.channels:
-                    channel_ident = channel.ident
-                    # arr = channel.array
-                    arr = TotalDepth.common.AbsentValue.mask_absent_values(channel.array)
+                for channel, accumulator in zip(frame_array.channels, accumulators):
+                    if accumulator.count:
+                        values = [accumulator.min, accumulator.mean, accumulator.std(), accumulator.max]
+                    else:
+                        values = ['--'] * 4
                     frame_table.append(
-                        [channel_ident, arr.size,
-                         # NOTE: Not the masked array!
-                         TotalDepth.common.AbsentValue.count_of_absent_values(channel.array),
-                         arr.min(), arr.mean(),
-                         arr.std(), arr.max(), channel.units, arr.dtype]
+                        [channel.ident, accumulator.len, accumulator.len - accumulator.count]
+                        + values
+                        + [channel.units, channel.array.dtype]
                     )
                 fout.write('\n'.join(data_table.format_table(frame_table, heading_underline='-', pad='   ')))
                 fout.write('\n')
@@ -539,7 +540,9 @@ def scan_RP66V1_file_data_content(fobj: typing.BinaryIO, fout: typing.TextIO,
     """
     Scans all of every EFLR and IFLR in the file using a ScanFile object.
     """
-    with LogicalFile.LogicalIndex(fobj) as logical_index:
+    # Index by path, if available, so that the index can be cached.
+    with LogicalFile.LogicalIndex(fobj.name if isinstance(getattr(fobj, 'name', None), str) else fobj) \
+            as logical_index:
         with _output_section_header_trailer('RP66V1 File Data Summary', '*', os=fout):
             fout.write(str(logical_index.storage_unit_label))
             fout.write('\n')
@@ -881,6 +884,7 @@ def main() -> int:
         help="Increase verbosity, additive [default: %(default)s]",
     )
     gnuplot.add_gnuplot_to_argument_parser(parser)
+    cmn_cmd_opts.add_index_cache(parser)
     parser.add_argument(
         '-T', '--test-data', action='store_true',
         help='Dump the file as annotated bytes, useful for creating test data. [default: %(default)s]',
@@ -900,6 +904,7 @@ def main() -> int:
                         format='%(asctime)s %(levelname)-8s %(message)s',
                         #datefmt='%y-%m-%d % %H:%M:%S',
                         stream=sys.stdout)
+    cmn_cmd_opts.set_index_cache(args)
     clk_start = time.perf_counter()
     # return 0
     # Your code here
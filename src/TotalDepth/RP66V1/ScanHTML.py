@@ -21,7 +21,6 @@
 Scans a RP66V1 file an writes out the summary in HTML.
 """
 import logging
-import multiprocessing
 import os
 import sys
 import time
@@ -29,7 +28,6 @@ import typing
 
 import colorama
 
-import TotalDepth.common.AbsentValue
 from TotalDepth.RP66V1 import ExceptionTotalDepthRP66V1
 from TotalDepth.RP66V1.core import File
 from TotalDepth.RP66V1.core import LogPass
@@ -39,6 +37,7 @@ from TotalDepth.RP66V1.core import stringify
 from TotalDepth.RP66V1.core.LogicalRecord import EFLR
 from TotalDepth.common import Slice, np_summary
 from TotalDepth.common import cmn_cmd_opts
+from TotalDepth.common import job_engine
 from TotalDepth.common import process
 from TotalDepth.common.ToHTML import HTMLFrameArraySummary, HTMLLogicalFileSummary, HTMLBodySummary, HTMLResult, \
     html_write_table
@@ -57,6 +56,9 @@ __rights__  = 'Copyright (c) 2019 Paul Ross. All rights reserved.'
 
 logger = logging.getLogger(__file__)
 
+#: Frames read at a time when summarising a Frame Array.
+DEFAULT_CHUNK_FRAMES = 4096
+
 # Examples:
 # https://jrgraphix.net/r/Unicode/
 # https://jrgraphix.net/r/Unicode/25A0-25FF
@@ -303,10 +305,9 @@ def _write_frame_array_in_html(
     #     xhtml_stream.characters('Frame Data')
     iflrs: typing.List[XAxis.IFLRReference] = logical_file.iflr_position_map[frame_array.ident]
     if len(iflrs):
-        num_frames = logical_file.populate_frame_array(
+        num_frames, accumulators = np_summary.accumulate_frame_array(
             frame_array,
-            frame_slice,
-            None,
+            logical_file.populate_frame_array_chunks(frame_array, DEFAULT_CHUNK_FRAMES, frame_slice),
         )
         x_axis: XAxis.XAxis = logical_file.iflr_position_map[frame_array.ident]
         _write_x_axis_summary(x_axis, xhtml_stream)
@@ -339,32 +340,22 @@ def _write_frame_array_in_html(
                 f' frame(s).'
                 f' Frame size: {frame_array.sizeof_frame} bytes.'
                 f' Number of frames created: {num_frames}'
-                f' Numpy total memory: {frame_array.sizeof_array:,d} bytes'
+                f' Numpy total memory: {frame_array.sizeof_frame * num_frames:,d} bytes'
             )
         with XmlWrite.Element(xhtml_stream, 'p'):
             xhtml_stream.characters(
-                f'RP66V1 Frame size {frame_array.sizeof_array} (bytes))'
+                f'RP66V1 Frame size {frame_array.sizeof_frame * num_frames} (bytes))'
                 f' represented internally as {frame_array.sizeof_frame} (bytes/frame).'
             )
         frame_table = [
             ['Channel',
              'Dims', 'Count', 'Units', 'Long Name',
-             'Size', 'Absent', 'Min', 'Mean', 'Median', 'Std.Dev.', 'Max', '--', '==', '++',  'Activity', 'dtype'],
+             'Size', 'Absent', 'Min', 'Mean', 'Median (approx.)', 'Std.Dev.', 'Max', '--', '==', '++',  'Activity', 'dtype'],
         ]
-        for channel in frame_array.channels:
-            # arr = channel.array
-            arr = TotalDepth.common.AbsentValue.mask_absent_values(channel.array)
-            array_summary = np_summary.summarise_array(arr)
-            frame_table.append(
-                [
-                    channel.ident,
-                    stringify.stringify_object_by_type(channel.dimensions),
-                    stringify.stringify_object_by_type(channel.count),
-                    stringify.stringify_object_by_type(channel.units),
-                    stringify.stringify_object_by_type(channel.long_name),
-                    f'{arr.size:d}',
-                    # NOTE: Not the masked array!
-                    f'{TotalDepth.common.AbsentValue.count_of_absent_values(channel.array):d}',
+        for channel, accumulator in zip(frame_array.channels, accumulators):
+            array_summary = accumulator.summary()
+            if array_summary is not None:
+                values = [
                     f'{array_summary.min:.3f}',
                     f'{array_summary.mean:.3f}',
                     f'{array_summary.median:.3f}',
@@ -374,8 +365,21 @@ def _write_frame_array_in_html(
                     f'{array_summary.count_eq:d}',
                     f'{array_summary.count_inc:d}',
                     f'{array_summary.activity:.3f}',
-                    f'{arr.dtype}',
                 ]
+            else:
+                values = ['N/A'] * 9
+            frame_table.append(
+                [
+                    channel.ident,
+                    stringify.stringify_object_by_type(channel.dimensions),
+                    stringify.stringify_object_by_type(channel.count),
+                    stringify.stringify_object_by_type(channel.units),
+                    stringify.stringify_object_by_type(channel.long_name),
+                    f'{accumulator.len:d}',
+                    f'{accumulator.len - accumulator.count:d}',
+                ]
+                + values
+                + [f'{channel.array.dtype}']
             )
         html_write_table(frame_table, xhtml_stream, class_style='monospace')
         x_axis_start = iflrs[0].x_axis
@@ -849,29 +853,22 @@ def _write_top_level_index_table_body(index_file_path: str,
 
 
 def scan_dir_multiprocessing(dir_in, dir_out, jobs,
-                             frame_slice: typing.Union[Slice.Slice, Slice.Sample], sort_eflr: bool) -> typing.Dict[str, HTMLResult]:
-    """Multiprocessing code to plot log passes.
-    Returns a dict of {path_in : HTMLResult, ...}"""
+                             frame_slice: typing.Union[Slice.Slice, Slice.Sample], sort_eflr: bool,
+                             timeout: float = 0.0, journal_path: str = '') -> typing.Dict[str, HTMLResult]:
+    """Multiprocessing code to plot log passes, see ``job_engine.run()`` for jobs, timeout and journal_path.
+    Returns a dict of {path_in : HTMLResult, ...}, files that time out or crash the worker are not included."""
     assert os.path.isdir(dir_in)
-    if jobs < 1:
-        jobs = multiprocessing.cpu_count()
     logging.info('scan_dir_multiprocessing(): Setting multi-processing jobs to %d' % jobs)
-    pool = multiprocessing.Pool(processes=jobs)
-    tasks = [
-        (t.filePathIn, t.filePathOut, False, frame_slice, sort_eflr) for t in DirWalk.dirWalk(
-            dir_in, dir_out, theFnMatch='', recursive=True, bigFirst=True
-        )
-    ]
-    # print('tasks:')
-    # pprint.pprint(tasks, width=200)
-    # return {}
-    results = [
-        r.get() for r in [
-            pool.apply_async(scan_a_single_file, t) for t in tasks
-        ]
-    ]
-    _write_indexes(dir_out, {r.path_output : r for r in results})
-    return {r.path_input: r for r in results}
+    ret: typing.Dict[str, HTMLResult] = {}
+    for job_result in job_engine.run(
+            scan_a_single_file,
+            job_engine.dir_walk_jobs(dir_in, dir_out, True, (False, frame_slice, sort_eflr)),
+            jobs, timeout, journal_path,
+    ):
+        if job_result.ok:
+            ret[job_result.key] = job_result.result
+    _write_indexes(dir_out, {r.path_output : r for r in ret.values()})
+    return ret
 
 
 def scan_dir_or_file(path_in: str, path_out: str,
@@ -1033,6 +1030,8 @@ def main() -> int:
     )
     cmn_cmd_opts.add_log_level(parser, level=20)
     cmn_cmd_opts.add_multiprocessing(parser)
+    cmn_cmd_opts.add_job_engine(parser)
+    cmn_cmd_opts.add_index_cache(parser)
     parser.add_argument(
         '-e', '--encrypted', action='store_true',
         help='Output encrypted Logical Records as well. [default: %(default)s]',
@@ -1046,6 +1045,7 @@ def main() -> int:
     gnuplot.add_gnuplot_to_argument_parser(parser)
     args = parser.parse_args()
     log_level = cmn_cmd_opts.set_log_level(args)
+    cmn_cmd_opts.set_index_cache(args)
     # print('args:', args)
     # return 0
     clk_start = time.perf_counter()
@@ -1068,6 +1068,8 @@ def main() -> int:
                 args.jobs,
                 frame_slice=Slice.create_slice_or_sample(args.frame_slice),
                 sort_eflr=args.sort_eflr,
+                timeout=args.timeout,
+                journal_path=args.journal,
             )
         else:
             result: typing.Dict[str, HTMLResult] = scan_dir_or_file(
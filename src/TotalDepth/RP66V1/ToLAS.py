@@ -31,6 +31,7 @@ Example reference to the LAS documentation in this source code::
 
 """
 import datetime
+import functools
 import logging
 import os
 import sys
@@ -57,6 +58,8 @@ __rights__  = 'Copyright (c) 2019 Paul Ross. All rights reserved.'
 
 
 LAS_PRODUCER_VERSION = '0.1.2'
+#: Default number of frames that are read and written at a time.
+DEFAULT_CHUNK_FRAMES = 4096
 
 
 logger = logging.getLogger(__file__)
@@ -297,26 +300,31 @@ def _write_array_section_to_las(
         field_width: int,
         float_format: str,
         ostream: typing.TextIO,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
     ) -> None:
-    """Write the ``~Array Section`` to the LAS file, the actual log data"""
-    # TODO: Could optimise memory by reading one frame at a time
+    """Write the ``~Array Section`` to the LAS file, the actual log data.
+    The frames are read and written chunk_frames at a time to limit memory, less than one means all at once."""
     max_num_available_frames = logical_file.num_frames(frame_array)
-    if len(channel_name_sub_set):
-        array_channels = {c.ident for c in frame_array.channels if c.ident in channel_name_sub_set}
-        num_writable_frames = logical_file.populate_frame_array(frame_array, frame_slice, array_channels)
-    else:
-        num_writable_frames = logical_file.populate_frame_array(frame_array, frame_slice)
+    num_writable_frames = frame_slice.count(max_num_available_frames)
     if num_writable_frames > 0:
-        TotalDepth.LAS.core.WriteLAS.write_curve_and_array_section_to_las(
-            frame_array,
-            max_num_available_frames,
-            array_reduction,
-            frame_slice,
-            channel_name_sub_set,
-            field_width,
-            float_format,
-            ostream,
+        if len(channel_name_sub_set):
+            array_channels = {c.ident for c in frame_array.channels if c.ident in channel_name_sub_set}
+        else:
+            array_channels = None
+        WriteLAS.write_curve_section_to_las(frame_array, channel_name_sub_set, ostream)
+        WriteLAS.write_array_section_header_to_las(
+            frame_array, max_num_available_frames, array_reduction, frame_slice, channel_name_sub_set, field_width,
+            ostream, num_writable_frames,
         )
+        for _num_frames in logical_file.populate_frame_array_chunks(
+                frame_array, chunk_frames, frame_slice, array_channels
+        ):
+            WriteLAS.write_array_section_data_to_las(
+                frame_array, array_reduction, channel_name_sub_set, field_width, float_format, ostream
+            )
+        # Release the last chunk.
+        for channel in frame_array.channels:
+            channel.init_array(0)
 
 
 def write_logical_index_to_las(
@@ -327,8 +335,10 @@ def write_logical_index_to_las(
         channels: typing.Set[str],
         field_width: int,
         float_format: str,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
 ) -> typing.List[str]:
-    """Take a Logical Index for a Logical File within a RP66V1 file and write out a set of LAS 2.0 files."""
+    """Take a Logical Index for a Logical File within a RP66V1 file and write out a set of LAS 2.0 files.
+    chunk_frames is the number of frames read and written at a time, less than one means all at once."""
     assert array_reduction in TotalDepth.LAS.core.WriteLAS.ARRAY_REDUCTIONS
     ret = []
     for lf, logical_file in enumerate(logical_index.logical_files):
@@ -350,7 +360,7 @@ def write_logical_index_to_las(
                     write_parameter_section_to_las(logical_file, ostream)
                     _write_array_section_to_las(
                         logical_file, frame_array, array_reduction, frame_slice,
-                        channels, field_width, float_format, ostream
+                        channels, field_width, float_format, ostream, chunk_frames
                     )
                     ret.append(file_path_out)
         else:
@@ -375,8 +385,10 @@ def single_rp66v1_file_to_las(
         channels: typing.Set[str],
         field_width: int,
         float_format: str,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
 ) -> WriteLAS.LASWriteResult:
-    """Convert a single RP66V1 file to a set of LAS files."""
+    """Convert a single RP66V1 file to a set of LAS files.
+    chunk_frames is the number of frames read and written at a time, less than one means all at once."""
     # logging.info(f'index_a_single_file(): "{path_in}" to "{path_out}"')
     assert array_reduction in TotalDepth.LAS.core.WriteLAS.ARRAY_REDUCTIONS, f'{array_reduction} not in {TotalDepth.LAS.core.WriteLAS.ARRAY_REDUCTIONS}'
     binary_file_type = bin_file_type.binary_file_type_from_path(path_in)
@@ -384,9 +396,10 @@ def single_rp66v1_file_to_las(
         logger.info(f'Converting RP66V1 {path_in} to LAS {os.path.splitext(path_out)[0]}*')
         try:
             t_start = time.perf_counter()
-            with LogicalFile.LogicalIndex(path_in) as logical_index:
+            with LogicalFile.LogicalIndex(path_in, lazy_eflrs=True) as logical_index:
                 las_files_written = write_logical_index_to_las(
-                    logical_index, array_reduction, path_out, frame_slice, channels, field_width, float_format
+                    logical_index, array_reduction, path_out, frame_slice, channels, field_width, float_format,
+                    chunk_frames
                 )
                 output_size = sum(os.path.getsize(f) for f in las_files_written)
                 result = WriteLAS.LASWriteResult(
@@ -418,7 +431,7 @@ def _dump_frames_and_or_channels_single_rp66v1_file(path_in: str, frame_slices,
         logger.info(f'Reading RP66V1 {path_in}')
         try:
             with TotalDepth.common.colorama.section(f'File {path_in}', '=', out_stream=sys.stdout):
-                with LogicalFile.LogicalIndex(path_in) as logical_index:
+                with LogicalFile.LogicalIndex(path_in, lazy_eflrs=True) as logical_index:
                     for l, logical_file in enumerate(logical_index.logical_files):
                         with TotalDepth.common.colorama.section(f'Logical file [{l:04d}]: {logical_file}', '-',
                                                                 out_stream=sys.stdout):
@@ -494,15 +507,25 @@ def main() -> int:
 Reads RP66V1 file(s) and writes them out as LAS files."""
     parser = WriteLAS.las_writer_command_line_arguments(description, prog='TotalDepth.RP66V1.ToLAS.main',
                                                         version=__version__, epilog=__rights__)
+    parser.add_argument(
+        '--chunk-frames', type=int,
+        help='Number of frames to read and write at a time, this limits memory use.'
+             ' Zero means all frames at once. [default: %(default)s]',
+        default=DEFAULT_CHUNK_FRAMES,
+    )
+    TotalDepth.common.cmn_cmd_opts.add_index_cache(parser)
     args = parser.parse_args()
     TotalDepth.common.cmn_cmd_opts.set_log_level(args)
+    TotalDepth.common.cmn_cmd_opts.set_index_cache(args)
     # Your code here
     ret_val = 0
     if args.frame_slice.strip() == '?' or args.channels.strip() == '?':
         _dump_frames_and_or_channels(args.path_in, args.recurse, args.frame_slice.strip(), args.channels.strip())
     else:
         clk_start = time.perf_counter()
-        result: typing.Dict[str, WriteLAS.LASWriteResult] = WriteLAS.process_to_las(args, single_rp66v1_file_to_las)
+        result: typing.Dict[str, WriteLAS.LASWriteResult] = WriteLAS.process_to_las(
+            args, functools.partial(single_rp66v1_file_to_las, chunk_frames=args.chunk_frames)
+        )
         clk_exec = time.perf_counter() - clk_start
         _failed_file_count = WriteLAS.report_las_write_results_and_performance(result, clk_exec, args.gnuplot, include_ignored=False)
     print('Bye, bye!')
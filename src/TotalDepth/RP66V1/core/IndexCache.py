@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Part of TotalDepth: Petrophysical data processing and presentation.
+# Copyright (C) 2011-2021 Paul Ross
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Paul Ross: apaulross@gmail.com
+"""
+Persistent binary cache of a LogicalIndex.
+
+The cache is a numpy ``.npz`` file that contains numpy arrays of the Logical Record positions, the EFLR Logical Data
+and the IFLR X axis values. It is keyed on the absolute path, size, modification time and a hash of the start and end of
+the file so a stale cache is ignored (and replaced). Reading and writing is done by ``TotalDepth.common.npz_cache``.
+
+The cache is either a sidecar file next to the RP66V1 file or in a cache directory, see ``cache_path()``.
+
+Loading the cache and replaying it into a ``LogicalIndex`` is done by ``LogicalFile.LogicalIndex``.
+"""
+import typing
+
+import numpy as np
+
+from TotalDepth.RP66V1 import ExceptionTotalDepthRP66V1
+from TotalDepth.common import npz_cache
+from TotalDepth.common.npz_cache import default_cache_dir
+
+
+class ExceptionIndexCache(ExceptionTotalDepthRP66V1):
+    pass
+
+
+#: Increment this when the layout of the cache changes.
+VERSION = 2
+#: Suffix of the sidecar file.
+SIDECAR_SUFFIX = '.td_index.npz'
+
+
+def cache_path(path: str, cache_dir: str) -> str:
+    """Returns the path of the cache file for the RP66V1 file at path.
+    If cache_dir is the empty string then this is a sidecar file next to the RP66V1 file, otherwise the cache is
+    in cache_dir with a name derived from the absolute path of the RP66V1 file."""
+    return npz_cache.cache_path(path, cache_dir, SIDECAR_SUFFIX)
+
+
+def file_key(path: str) -> typing.Dict[str, typing.Union[int, str]]:
+    """The key that identifies the version of the RP66V1 file that the cache was created from."""
+    return npz_cache.file_key(path, VERSION)
+
+
+def write(path_cache: str, key: typing.Dict[str, typing.Union[int, str]], metadata: typing.Dict[str, typing.Any],
+          arrays: typing.Dict[str, np.ndarray]) -> None:
+    """Writes the cache atomically. metadata must be JSON serialisable, the key is added to it."""
+    try:
+        npz_cache.write(path_cache, key, metadata, arrays)
+    except npz_cache.ExceptionNpzCache as err:
+        raise ExceptionIndexCache(str(err)) from err
+
+
+def read(path_cache: str, key: typing.Dict[str, typing.Union[int, str]]) \
+        -> typing.Union[None, typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, np.ndarray]]]:
+    """Reads the cache and returns (metadata, arrays) or None if there is no cache, it is unreadable or the key does not
+    match."""
+    return npz_cache.read(path_cache, key)
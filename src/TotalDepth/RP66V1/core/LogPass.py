@@ -120,6 +120,25 @@ class RP66V1FrameChannel(LogPass.FrameChannel):
             value = RepCode.code_read(self.rep_code, ld)
             self.array[dim] = value
 
+    @property
+    def raw_dtype(self) -> np.dtype:
+        """The numpy dtype that describes the raw bytes of one frame of this channel.
+        Will raise an ExceptionFrameChannel if the Representation Code can not be described this way."""
+        try:
+            return np.dtype((RepCode.numpy_raw_dtype(self.rep_code), self.dimensions))
+        except RepCode.ExceptionRepCode as err:
+            raise ExceptionFrameChannel(f'raw_dtype() on unsupported Rep Code {self.rep_code}') from err
+
+    def read_raw_array(self, raw_array: np.ndarray, array_index: int) -> None:
+        """Converts and copies an array of raw values, as read by ``raw_dtype``, into the numpy array starting at the
+        array index. raw_array has the shape (frames, *dimensions)."""
+        if array_index + len(raw_array) > len(self.array):
+            raise ExceptionFrameChannel(
+                f'FrameChannelDLIS.read_raw_array() frames {array_index} + {len(raw_array)}'
+                f' is > than array size {len(self.array)}.'
+            )
+        self.array[array_index:array_index + len(raw_array)] = RepCode.numpy_raw_convert(self.rep_code, raw_array)
+
     def seek(self, ld: LogicalData) -> None:
         """Increments the logical data without reading any values into the array."""
         if len(self.array) != 0:
@@ -131,10 +150,20 @@ class RP66V1FrameArray(LogPass.FrameArray):
     """
     In the olden days we would record this on a single chunk of continuous film.
     """
+    def __init__(self, ident: typing.Hashable, description: typing.Union[str, bytes]):
+        super().__init__(ident, description)
+        # Lazily created numpy structured dtype of a complete frame, see frame_dtype.
+        self._frame_dtype: typing.Union[None, np.dtype] = None
+
+    def append(self, channel: RP66V1FrameChannel) -> None:
+        """Add a channel to the Array."""
+        super().append(channel)
+        self._frame_dtype = None
+
     def _handle_remaining(self, ld: LogicalData, frame_number: int) -> None:
         """What to do if there is unread data."""
         if ld.remain != 0:
-            msg = f'Not all logical data consumed, frame {frame_number} remaining {ld.remain} bytes: {ld.view_remaining(ld.remain)}'
+            msg = f'Not all logical data consumed, frame {frame_number} remaining {ld.remain} bytes: {bytes(ld.view_remaining(ld.remain))}'
             logger.warning(msg)
             # raise ExceptionFrameArray(msg)
 
@@ -153,6 +182,50 @@ class RP66V1FrameArray(LogPass.FrameArray):
                 channel.seek(ld)
         self._handle_remaining(ld, frame_number)
 
+    @property
+    def is_fixed_length(self) -> bool:
+        """True if every channel has a fixed length numeric Representation Code that numpy can decode directly. In that
+        case whole frames can be decoded with ``read_frames()``."""
+        return len(self.channels) > 0 and all(RepCode.has_numpy_raw_dtype(c.rep_code) for c in self.channels)
+
+    @property
+    def len_input_bytes(self) -> int:
+        """The number of RP66V1 bytes to read for one complete frame.
+
+        Will raise an ExceptionFrameChannel if any channel is not represented by a fixed length Representation Code."""
+        return sum(channel.len_input_bytes for channel in self.channels)
+
+    @property
+    def frame_dtype(self) -> np.dtype:
+        """A numpy structured dtype that describes the raw bytes of a complete frame with one field per channel.
+
+        Will raise an ExceptionFrameChannel if any channel can not be described this way, see ``is_fixed_length``."""
+        if self._frame_dtype is None:
+            # Field names are the channel indexes as idents are not necessarily valid or unique strings.
+            self._frame_dtype = np.dtype([(str(c), channel.raw_dtype) for c, channel in enumerate(self.channels)])
+            assert self._frame_dtype.itemsize == self.len_input_bytes
+        return self._frame_dtype
+
+    def read_frames(self, by: typing.Union[bytes, bytearray, memoryview],
+                    array_index: int,
+                    channels: typing.Union[typing.Set[typing.Hashable], None] = None) -> int:
+        """Decodes the raw bytes of one or more consecutive frames with a single numpy call and copies the values
+        into the numpy arrays starting at array_index. The bytes must be the frame data only, without IFLR preambles.
+
+        channels, if not None, limits the population to those channels (and the X axis).
+
+        Returns the number of frames decoded."""
+        frame_dtype = self.frame_dtype
+        if len(by) % frame_dtype.itemsize != 0:
+            raise ExceptionFrameArray(
+                f'Length of frame bytes {len(by)} is not a multiple of the frame length {frame_dtype.itemsize}'
+            )
+        frames = np.frombuffer(by, dtype=frame_dtype)
+        for c, channel in enumerate(self.channels):
+            if channels is None or c == 0 or channel.ident in channels:
+                channel.read_raw_array(frames[str(c)], array_index)
+        return len(frames)
+
     @property
     def x_axis_len_input_bytes(self) -> int:
         """The number of RP66V1 bytes to read for one frame of the X axis.
@@ -30,10 +30,12 @@ import logging
 import pickle
 import typing
 
+import numpy as np
+
 from TotalDepth.RP66V1 import ExceptionTotalDepthRP66V1
 from TotalDepth.RP66V1.core.LogicalRecord import EFLR
 from TotalDepth.RP66V1.core.LogicalRecord import IFLR
-from TotalDepth.RP66V1.core import File, Index
+from TotalDepth.RP66V1.core import File, Index, IndexCache
 from TotalDepth.RP66V1.core import RepCode
 from TotalDepth.RP66V1.core import LogPass
 from TotalDepth.RP66V1.core import XAxis
@@ -67,11 +69,93 @@ class ExceptionLogicalIndexCtor(ExceptionLogicalIndex):
     pass
 
 
+class EFLRCache:
+    """A bounded Least Recently Used cache of EFLRs that are parsed on demand from the file.
+    The file must be open, that is within the LogicalIndex context manager, when an EFLR is not in the cache."""
+    def __init__(self, logical_record_index: Index.LogicalRecordIndex, max_size: int):
+        if max_size < 1:
+            raise ExceptionLogicalIndexCtor(f'EFLR cache size must be >= 1 not {max_size}')
+        self._logical_record_index = logical_record_index
+        self.max_size = max_size
+        # Key is the LRSH file position.
+        self._cache: typing.Dict[int, EFLR.ExplicitlyFormattedLogicalRecord] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """The number of EFLRs in the cache."""
+        return len(self._cache)
+
+    def __contains__(self, position: File.LogicalRecordPosition) -> bool:
+        """True if the EFLR at this position is in the cache."""
+        return position.lrsh_position in self._cache
+
+    def get(self, position: File.LogicalRecordPosition) -> EFLR.ExplicitlyFormattedLogicalRecord:
+        """Return the EFLR at the position parsing it from the file if necessary."""
+        key = position.lrsh_position
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self.misses += 1
+        file_logical_data = self._logical_record_index.get_file_logical_data_at_position(position)
+        eflr = EFLR.ExplicitlyFormattedLogicalRecord(file_logical_data.lr_type, file_logical_data.logical_data)
+        self._cache[key] = eflr
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return eflr
+
+    def clear(self) -> None:
+        """Empty the cache."""
+        self._cache.clear()
+
+
+class LazyEFLR:
+    """Stands in for an ExplicitlyFormattedLogicalRecord where only the Logical Record type and Set have been read.
+    The complete EFLR is parsed from the file on demand and is held in an EFLRCache.
+    All other attributes are those of the complete EFLR."""
+    def __init__(self, position: File.LogicalRecordPosition, lr_type: int, eflr_set: EFLR.Set, eflr_cache: EFLRCache):
+        self.position = position
+        self.lr_type: int = lr_type
+        self.set: EFLR.Set = eflr_set
+        self._eflr_cache = eflr_cache
+
+    @property
+    def eflr(self) -> EFLR.ExplicitlyFormattedLogicalRecord:
+        """The complete EFLR."""
+        return self._eflr_cache.get(self.position)
+
+    @property
+    def is_cached(self) -> bool:
+        """True if the complete EFLR is currently in the cache."""
+        return self.position in self._eflr_cache
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Private names are not delegated, this also prevents recursion when unpickling.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.eflr, name)
+
+    def __len__(self) -> int:
+        return len(self.eflr)
+
+    def __getitem__(self, item) -> EFLR.Object:
+        return self.eflr[item]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyEFLR):
+            other = other.eflr
+        return self.eflr == other
+
+    def __str__(self) -> str:
+        return f'<ExplicitlyFormattedLogicalRecord {str(self.set)}>'
+
+
 class PositionEFLR(typing.NamedTuple):
     """POD class that represents the Logical Record Segment Header position in the file of the Explicitly Formatted
     Logical Record and the EFLR itself."""
     lrsh_position: File.LogicalRecordPosition
-    eflr: EFLR.ExplicitlyFormattedLogicalRecord
+    eflr: typing.Union[EFLR.ExplicitlyFormattedLogicalRecord, LazyEFLR]
 
 
 class LogicalFile:
@@ -102,6 +186,8 @@ class LogicalFile:
     DUPE_EFLR_CHANNEL_STRATEGY = DuplicateObjectStrategy.REPLACE
     DUPE_EFLR_CHANNEL_LOGGER = logger.warning
     ALLOWABLE_ORIGIN_SET_TYPES = (b'ORIGIN', b'WELL-REFERENCE')
+    #: When populating fixed length frames the frame data is decoded in batches of approximately this many bytes.
+    POPULATE_BATCH_BYTES = 1024**2
 
     def __init__(self, logical_record_index: Index.LogicalRecordIndex,
                  file_logical_data: File.FileLogicalData,
@@ -128,6 +214,8 @@ class LogicalFile:
         self.frame: typing.Union[None, EFLR.ExplicitlyFormattedLogicalRecord] = None
         self.log_pass: typing.Union[None, LogPass.LogPass] = None
         self.iflr_position_map: typing.Dict[RepCode.ObjectName, XAxis.XAxis] = {}
+        # Lazily evaluated, see iflr_index_read_length()
+        self._iflr_index_read_length: typing.Union[None, int] = None
 
     def _check_fld_matches_eflr(self, file_logical_data: File.FileLogicalData,
                                 eflr: EFLR.ExplicitlyFormattedLogicalRecord) -> None:
@@ -247,18 +335,54 @@ class LogicalFile:
         self._check_fld_iflr(file_logical_data, iflr)
         frame_array: LogPass.FrameArray = self.log_pass[iflr.object_name]
         frame_array.read_x_axis(file_logical_data.logical_data, frame_number=0)
-        if iflr.object_name not in self.iflr_position_map:
-            self.iflr_position_map[iflr.object_name] = XAxis.XAxis(
-                frame_array.x_axis.ident,
-                frame_array.x_axis.long_name,
-                frame_array.x_axis.units,
-            )
-        self.iflr_position_map[iflr.object_name].append(
+        self.add_iflr_reference(
+            iflr.object_name,
             file_logical_data.position,
             iflr.frame_number,
             frame_array.x_axis.array.mean(),
         )
 
+    def add_iflr_reference(self, object_name: RepCode.ObjectName, position: File.LogicalRecordPosition,
+                           frame_number: int, x_axis: typing.Union[int, float]) -> None:
+        """Appends the IFLR position, frame number and X axis value to the iflr_position_map.
+        This is used by ``add_iflr()`` and when restoring a LogicalIndex from a cache."""
+        self._x_axis(object_name).append(position, frame_number, x_axis)
+
+    def add_iflr_references(self, object_name: RepCode.ObjectName, vr_positions: np.ndarray,
+                            lrsh_positions: np.ndarray, frame_numbers: np.ndarray, x_values: np.ndarray) -> None:
+        """Extends the iflr_position_map with arrays of IFLR positions, frame numbers and X axis values.
+        This is used when restoring a LogicalIndex from a cache."""
+        self._x_axis(object_name).extend(vr_positions, lrsh_positions, frame_numbers, x_values)
+
+    def _x_axis(self, object_name: RepCode.ObjectName) -> XAxis.XAxis:
+        """Returns the XAxis in iflr_position_map for the object name, creating it if necessary."""
+        if object_name not in self.iflr_position_map:
+            frame_array: LogPass.FrameArray = self.log_pass[object_name]
+            self.iflr_position_map[object_name] = XAxis.XAxis(
+                frame_array.x_axis.ident,
+                frame_array.x_axis.long_name,
+                frame_array.x_axis.units,
+            )
+        return self.iflr_position_map[object_name]
+
+    def iflr_index_read_length(self) -> int:
+        """The number of bytes of the Logical Data of any IFLR in this Logical File that are needed by ``add_iflr()``.
+        This is the maximum IFLR preamble length plus the largest X axis length of any Frame Array.
+        Returns -1, meaning all the Logical Data, if there is no Log Pass yet or an X axis is variable length."""
+        if self.log_pass is None:
+            return -1
+        if self._iflr_index_read_length is None:
+            try:
+                x_axis_length = max(
+                    (frame_array.x_axis_len_input_bytes for frame_array in self.log_pass.frame_arrays), default=0
+                )
+            except (LogPass.ExceptionFrameChannel, IndexError):
+                # Variable length X axis or a Frame Array with no channels.
+                self._iflr_index_read_length = -1
+            else:
+                self._iflr_index_read_length = IFLR.PREAMBLE_MAX_LENGTH + x_axis_length
+        return self._iflr_index_read_length
+
     def num_frames(self, frame_array: LogPass.RP66V1FrameArray) -> int:
         """Return the number of frames in the FrameArray"""
         return len(self.iflr_position_map[frame_array.ident])
@@ -279,50 +403,197 @@ class LogicalFile:
 
         The FrameArray will be populated and this returns the number of frames populated.
         """
+        self._check_frame_array(frame_array)
+        iflrs: XAxis.XAxis = self.iflr_position_map[frame_array.ident]
+        if frame_slice is not None:
+            frame_numbers = frame_slice.indices(len(iflrs))
+        else:
+            frame_numbers = list(range(len(iflrs)))
+        logger.debug(f'populate_frame_array(): len(iflrs): {len(iflrs)} slice: {frame_slice}'
+                     f' num_frames: {len(frame_numbers)}.')
+        return self._populate_frame_array_frames(frame_array, iflrs, frame_numbers, channels)
+
+    def populate_frame_array_chunks(
+            self,
+            frame_array: LogPass.RP66V1FrameArray,
+            chunk_frames: int,
+            frame_slice: typing.Union[Slice.Slice, Slice.Sample, None] = None,
+            channels: typing.Union[typing.Set[typing.Hashable], None] = None,
+    ) -> typing.Iterator[int]:
+        """Populates a FrameArray with successive chunks of at most chunk_frames frames and yields the number of frames
+        in each chunk. The FrameArray contents are only valid until the next iteration. This limits the memory used
+        for large FrameArrays, for example those with image channels.
+
+        If chunk_frames is less than one then all the frames are populated at once as ``populate_frame_array()``.
+
+        frame_slice and channels are as ``populate_frame_array()``.
+        """
+        self._check_frame_array(frame_array)
+        iflrs: XAxis.XAxis = self.iflr_position_map[frame_array.ident]
+        if frame_slice is not None:
+            frame_numbers = frame_slice.indices(len(iflrs))
+        else:
+            frame_numbers = list(range(len(iflrs)))
+        if chunk_frames < 1:
+            chunk_frames = max(1, len(frame_numbers))
+        for index_from in range(0, len(frame_numbers), chunk_frames):
+            yield self._populate_frame_array_frames(
+                frame_array, iflrs, frame_numbers[index_from:index_from + chunk_frames], channels
+            )
+
+    def populate_frame_array_x_range(
+            self,
+            frame_array: LogPass.RP66V1FrameArray,
+            x_from: typing.Union[int, float],
+            x_to: typing.Union[int, float],
+            channels: typing.Union[typing.Set[typing.Hashable], None] = None,
+    ) -> int:
+        """Populates a FrameArray with channel values for the frames whose X axis value is in the closed interval between
+        x_from and x_to. These values are in the units of the X axis, for example a depth range of 1500 to 1800 metres.
+        Only the IFLRs in range are read, see ``XAxis.indexes_in_range()``.
+
+        frame_array must be a member of the LogPass in this LogicalFile.
+
+        channels Allows partial population of specific channels.
+
+        The FrameArray will be populated in frame order and this returns the number of frames populated, if this is zero
+        then every channel has an empty array.
+        """
+        self._check_frame_array(frame_array)
+        iflrs: XAxis.XAxis = self.iflr_position_map[frame_array.ident]
+        frame_numbers = iflrs.indexes_in_range(x_from, x_to).tolist()
+        logger.debug(f'populate_frame_array_x_range(): len(iflrs): {len(iflrs)} range: {x_from} to {x_to}'
+                     f' num_frames: {len(frame_numbers)}.')
+        if len(frame_numbers) == 0:
+            # FrameArray.init_arrays() does not allow zero frames.
+            for channel in frame_array.channels:
+                channel.init_array(0)
+            return 0
+        return self._populate_frame_array_frames(frame_array, iflrs, frame_numbers, channels)
+
+    def _check_frame_array(self, frame_array: LogPass.RP66V1FrameArray) -> None:
+        """Raises if frame_array is not a member of the LogPass in this LogicalFile."""
         if self.log_pass is None:
             raise ExceptionLogicalFile(f'populate_frame_array(): when no Log Pass')
         if not id(frame_array) in [id(v) for v in self.log_pass.frame_arrays]:
             raise ExceptionLogicalFile(f'populate_frame_array(): given FrameArray is not in Log Pass')
-        iflrs: XAxis.XAxis = self.iflr_position_map[frame_array.ident]
-        if len(iflrs):
-            # Set partial frames
-            if frame_slice is not None:
-                range_gen = frame_slice.gen_indices(len(iflrs))
-                num_frames = frame_slice.count(len(iflrs))
-            else:
-                range_gen = range(len(iflrs))
-                num_frames = len(iflrs)
-            # Set partial channels
-            if channels is not None:
-                frame_array.init_arrays_partial(num_frames, channels)
-            else:
-                frame_array.init_arrays(num_frames)
-            # Now populate
-            logger.debug(f'populate_frame_array(): len(iflrs): {len(iflrs)} slice: {frame_slice}'
-                         f' num_frames: {num_frames} range_gen: {range_gen}.')
-            for array_index, frame_number in enumerate(range_gen):
-                iflr_reference = iflrs[frame_number]
-                fld: File.FileLogicalData = self._logical_record_index.get_file_logical_data_at_position(
-                    iflr_reference.logical_record_position
-                )
-                # Create an IFLR but we don't use it, just the remaining bytes in the Logical Data.
-                _iflr = IFLR.IndirectlyFormattedLogicalRecord(fld.lr_type, fld.logical_data)
-                if channels is not None:
-                    frame_array.read_partial(fld.logical_data, array_index, channels)
-                else:
-                    frame_array.read(fld.logical_data, array_index)
+
+    def _populate_frame_array_frames(self,
+                                     frame_array: LogPass.RP66V1FrameArray,
+                                     iflrs: XAxis.XAxis,
+                                     frame_numbers: typing.List[int],
+                                     channels: typing.Union[typing.Set[typing.Hashable], None]) -> int:
+        """Populates a FrameArray with the given frame numbers, these are indexes into iflrs.
+        Returns the number of frames populated."""
+        num_frames = len(frame_numbers)
+        # Set partial channels
+        if channels is not None:
+            frame_array.init_arrays_partial(num_frames, channels)
         else:
-            num_frames = 0
             frame_array.init_arrays(num_frames)
+        if num_frames:
+            if frame_array.is_fixed_length:
+                self._populate_frame_array_vectorised(frame_array, iflrs, frame_numbers, channels)
+            else:
+                array_indexes = self._sort_by_file_position(iflrs, frame_numbers, 0, len(frame_numbers))
+                file_logical_datas = self._logical_record_index.iter_file_logical_data_at_positions(
+                    iflrs.logical_record_position(frame_numbers[array_index]) for array_index in array_indexes
+                )
+                for array_index, fld in zip(array_indexes, file_logical_datas):
+                    # Create an IFLR but we don't use it, just the remaining bytes in the Logical Data.
+                    _iflr = IFLR.IndirectlyFormattedLogicalRecord(fld.lr_type, fld.logical_data)
+                    if channels is not None:
+                        frame_array.read_partial(fld.logical_data, array_index, channels)
+                    else:
+                        frame_array.read(fld.logical_data, array_index)
         return num_frames
 
+    @staticmethod
+    def _sort_by_file_position(iflrs: XAxis.XAxis, frame_numbers: typing.List[int],
+                               index_from: int, index_to: int) -> typing.List[int]:
+        """Returns the array indexes from index_from to index_to sorted so that the corresponding IFLRs are in
+        increasing file order. This is usually a no-op but reversed or irregular selections then become a sequential
+        read of the file."""
+        lrsh_positions = iflrs.lrsh_positions[frame_numbers[index_from:index_to]]
+        return (np.argsort(lrsh_positions, kind='stable') + index_from).tolist()
+
+    def _populate_frame_array_vectorised(self,
+                                         frame_array: LogPass.RP66V1FrameArray,
+                                         iflrs: XAxis.XAxis,
+                                         frame_numbers: typing.List[int],
+                                         channels: typing.Union[typing.Set[typing.Hashable], None]) -> None:
+        """Populates a FrameArray where every channel is fixed length. The frame data from a batch of IFLRs is read
+        sequentially into a single buffer and decoded with one numpy call per batch, see
+        ``RP66V1FrameArray.read_frames()``."""
+        frame_length = frame_array.len_input_bytes
+        frames_per_batch = max(1, self.POPULATE_BATCH_BYTES // frame_length)
+        for batch_start in range(0, len(frame_numbers), frames_per_batch):
+            batch_stop = min(batch_start + frames_per_batch, len(frame_numbers))
+            array_indexes = self._sort_by_file_position(iflrs, frame_numbers, batch_start, batch_stop)
+            file_logical_datas = self._logical_record_index.iter_file_logical_data_at_positions(
+                iflrs.logical_record_position(frame_numbers[array_index]) for array_index in array_indexes
+            )
+            buffer = bytearray((batch_stop - batch_start) * frame_length)
+            for array_index, fld in zip(array_indexes, file_logical_datas):
+                frame_number = frame_numbers[array_index]
+                # Create an IFLR but we don't use it, it positions the Logical Data at the start of the frame data.
+                _iflr = IFLR.IndirectlyFormattedLogicalRecord(fld.lr_type, fld.logical_data)
+                ld: File.LogicalData = fld.logical_data
+                if ld.remain < frame_length:
+                    raise ExceptionLogicalFile(
+                        f'populate_frame_array(): frame {frame_number} has {ld.remain} bytes but needs {frame_length}'
+                    )
+                if ld.remain != frame_length:
+                    logger.warning(
+                        f'Not all logical data consumed, frame {frame_number}'
+                        f' remaining {ld.remain - frame_length} bytes'
+                    )
+                buffer_index = (array_index - batch_start) * frame_length
+                buffer[buffer_index:buffer_index + frame_length] = ld.view_remaining(frame_length)
+            frame_array.read_frames(buffer, batch_start, channels)
+
 
 class LogicalIndex:
-    """This takes a RP66V1 file and indexes it into a sequence of Logical Files."""
-    def __init__(self, path_or_file: typing.Union[str, typing.BinaryIO]):
+    """This takes a RP66V1 file and indexes it into a sequence of Logical Files.
+
+    If iflr_partial_read is True then only the preamble and the X axis of each IFLR is read from the file when indexing
+    rather than the complete frame, see ``LogicalFile.iflr_index_read_length()``.
+
+    cache_dir controls a persistent cache of the index for files given by path, see ``IndexCache``.
+    None means no cache, the empty string means a sidecar file next to the RP66V1 file, otherwise it is the directory
+    to keep the caches in. If not given the class attribute ``CACHE_DIR`` is used or, if that is None, the environment
+    variable set by the ``--index-cache`` command line option, see ``IndexCache.default_cache_dir()``.
+    The cache is loaded if it is valid for the file otherwise the file is indexed and the cache (re)written.
+
+    If lazy_eflrs is True then, apart from those in ``EAGER_EFLR_SET_TYPES``, only the position, type and Set of each
+    EFLR is recorded when indexing. These are represented by a ``LazyEFLR`` that parses the EFLR from the file on first
+    access, this must be within the context manager. The parsed EFLRs are held in a Least Recently Used cache of size
+    ``LAZY_EFLR_CACHE_SIZE``. If not given the class attribute ``LAZY_EFLRS`` is used.
+    """
+    #: The default cache_dir for all instances.
+    CACHE_DIR: typing.Union[None, str] = None
+    #: The default lazy_eflrs for all instances.
+    LAZY_EFLRS: bool = False
+    #: The maximum number of lazily parsed EFLRs that are kept.
+    LAZY_EFLR_CACHE_SIZE: int = 16
+    #: EFLR Set types that are always parsed when indexing as the LogicalFile needs them.
+    EAGER_EFLR_SET_TYPES: typing.Tuple[bytes, ...] = (b'FILE-HEADER', b'ORIGIN', b'WELL-REFERENCE', b'CHANNEL', b'FRAME')
+
+    def __init__(self, path_or_file: typing.Union[str, typing.BinaryIO], iflr_partial_read: bool = True,
+                 cache_dir: typing.Union[None, str] = None, lazy_eflrs: typing.Union[None, bool] = None):
+        self.iflr_partial_read = iflr_partial_read
+        self.cache_dir = cache_dir if cache_dir is not None else self.CACHE_DIR
+        if self.cache_dir is None:
+            self.cache_dir = IndexCache.default_cache_dir()
+        self.lazy_eflrs = lazy_eflrs if lazy_eflrs is not None else self.LAZY_EFLRS
+        # Only files given by path can be cached.
+        self._cache_path: typing.Union[None, str] = None
+        if self.cache_dir is not None and isinstance(path_or_file, str):
+            self._cache_path = IndexCache.cache_path(path_or_file, self.cache_dir)
         self.logical_files: typing.List[LogicalFile] = []
         # Low level index of Logical Records. A reference to this is given to every LogicalFile
         self._logical_record_index = Index.LogicalRecordIndex(path_or_file)
+        self.eflr_cache = EFLRCache(self._logical_record_index, self.LAZY_EFLR_CACHE_SIZE)
         # TODO: Created from the FILE-HEADER values
         # {ID : {SEQUENCE-NUMBER : index_into_self.logical_files, ...}, ...}
         self.sequence_map: typing.Dict[str, typing.Dict[int, int]] = {}
@@ -349,24 +620,60 @@ class LogicalIndex:
         """A list of Visible Record positions. This is used by the XML index for example."""
         return self._logical_record_index.visible_record_positions
 
+    def _add_eflr(self, file_logical_data: File.FileLogicalData) -> None:
+        """Adds an EFLR either to the current Logical File or as the start of a new one."""
+        eflr: typing.Union[None, EFLR.ExplicitlyFormattedLogicalRecord, LazyEFLR] = None
+        if self.lazy_eflrs:
+            file_logical_data.logical_data.rewind()
+            eflr_set = EFLR.Set(file_logical_data.logical_data)
+            if eflr_set.type not in self.EAGER_EFLR_SET_TYPES:
+                eflr = LazyEFLR(file_logical_data.position, file_logical_data.lr_type, eflr_set, self.eflr_cache)
+        if eflr is None:
+            eflr = EFLR.ExplicitlyFormattedLogicalRecord(file_logical_data.lr_type, file_logical_data.logical_data)
+        if len(self.logical_files) == 0 or self.logical_files[-1].is_next(eflr):
+            self.logical_files.append(LogicalFile(self._logical_record_index, file_logical_data, eflr))
+        else:
+            self.logical_files[-1].add_eflr(file_logical_data, eflr)
+
     def __enter__(self):
         """Context manager support."""
+        if self._cache_path is not None:
+            key = IndexCache.file_key(self._logical_record_index.path)
+            cached = IndexCache.read(self._cache_path, key)
+            if cached is not None:
+                try:
+                    self._enter_from_cache(*cached)
+                except (ExceptionTotalDepthRP66V1, IndexError, KeyError, ValueError) as err:
+                    logger.warning(f'Ignoring index cache {self._cache_path} that can not be restored: {err}')
+                    self._logical_record_index._exit()
+                else:
+                    return self
+            self._enter_from_file(key)
+        else:
+            self._enter_from_file(None)
+        return self
+
+    def _enter_from_file(self, cache_key: typing.Union[None, typing.Dict[str, typing.Union[int, str]]]) -> None:
+        """Index the file. If cache_key is not None then the cache is written."""
         self._logical_record_index._enter()
         self.logical_files = []
+        # Records of what is needed to write the cache.
+        eflr_lr_indexes: typing.List[int] = []
+        eflr_bytes: typing.List[bytes] = []
         for lr_index in range(len(self._logical_record_index)):
-            # TODO: This is greedy and for IFLRs we could only read a partial amount for performance.
-            #  See FrameArray.x_axis_len_input_bytes
-            file_logical_data = self._logical_record_index.get_file_logical_data(lr_index, 0, -1)
+            length = -1
+            if self.iflr_partial_read and len(self.logical_files) \
+                    and not self._logical_record_index[lr_index].description.attributes.is_eflr:
+                length = self.logical_files[-1].iflr_index_read_length()
+            file_logical_data = self._logical_record_index.get_file_logical_data(lr_index, 0, length)
             assert file_logical_data.is_sealed()
             if not file_logical_data.lr_is_encrypted:
                 if file_logical_data.lr_is_eflr:
                     # EFLRs
-                    eflr = EFLR.ExplicitlyFormattedLogicalRecord(file_logical_data.lr_type,
-                                                                 file_logical_data.logical_data)
-                    if len(self.logical_files) == 0 or self.logical_files[-1].is_next(eflr):
-                        self.logical_files.append(LogicalFile(self._logical_record_index, file_logical_data, eflr))
-                    else:
-                        self.logical_files[-1].add_eflr(file_logical_data, eflr)
+                    self._add_eflr(file_logical_data)
+                    if cache_key is not None:
+                        eflr_lr_indexes.append(lr_index)
+                        eflr_bytes.append(bytes(file_logical_data.logical_data.bytes))
                 else:
                     # IFLRs
                     if len(self.logical_files) == 0:
@@ -377,10 +684,82 @@ class LogicalIndex:
                         self.logical_files[-1].add_iflr(file_logical_data, iflr)
                     # else:
                     #     logger.warning(f'Ignoring empty IFLR at {file_logical_data.position}')
-        return self
+        if cache_key is not None:
+            self._write_cache(cache_key, eflr_lr_indexes, eflr_bytes)
+
+    def _write_cache(self, cache_key: typing.Dict[str, typing.Union[int, str]],
+                     eflr_lr_indexes: typing.List[int],
+                     eflr_bytes: typing.List[bytes]) -> None:
+        """Write the cache, failure is logged but is otherwise ignored."""
+        lr_pos_desc = self._logical_record_index.lr_pos_desc
+        iflr_object_names = []
+        x_axes = []
+        for logical_file_index, logical_file in enumerate(self.logical_files):
+            for object_name, x_axis in logical_file.iflr_position_map.items():
+                iflr_object_names.append([logical_file_index, object_name.O, object_name.C, object_name.I.decode('latin-1')])
+                x_axes.append(x_axis)
+        arrays = {
+            'lr_vr_position': np.array([v.position.vr_position for v in lr_pos_desc], dtype=np.int64),
+            'lr_lrsh_position': np.array([v.position.lrsh_position for v in lr_pos_desc], dtype=np.int64),
+            'lr_attributes': np.array([v.description.attributes.attributes for v in lr_pos_desc], dtype=np.uint8),
+            'lr_type': np.array([v.description.lr_type for v in lr_pos_desc], dtype=np.uint8),
+            'lr_ld_length': np.array([v.description.ld_length for v in lr_pos_desc], dtype=np.int64),
+            'eflr_lr_index': np.array(eflr_lr_indexes, dtype=np.int64),
+            'eflr_offset': np.cumsum([0] + [len(v) for v in eflr_bytes], dtype=np.int64),
+            'eflr_bytes': np.frombuffer(b''.join(eflr_bytes), dtype=np.uint8),
+            'iflr_offset': np.cumsum([0] + [len(v) for v in x_axes], dtype=np.int64),
+            'iflr_vr_position': np.concatenate([v.vr_positions for v in x_axes] + [np.empty(0, dtype=np.int64)]),
+            'iflr_lrsh_position': np.concatenate([v.lrsh_positions for v in x_axes] + [np.empty(0, dtype=np.int64)]),
+            'iflr_frame_number': np.concatenate([v.frame_numbers for v in x_axes] + [np.empty(0, dtype=np.int64)]),
+            'iflr_x_axis': np.concatenate([v.x_values for v in x_axes] + [np.empty(0, dtype=np.float64)]),
+        }
+        metadata = {
+            'iflr_object_names': iflr_object_names,
+        }
+        try:
+            IndexCache.write(self._cache_path, cache_key, metadata, arrays)
+        except OSError as err:
+            logger.warning(f'Can not write index cache {self._cache_path}: {err}')
+
+    def _enter_from_cache(self, metadata: typing.Dict[str, typing.Any], arrays: typing.Dict[str, np.ndarray]) -> None:
+        """Restore the index from the cache, the file is opened for subsequent reads but not scanned."""
+        lr_pos_desc = [
+            File.LRPosDesc(
+                File.LogicalRecordPosition.from_positions(int(vr_position), int(lrsh_position)),
+                File.LogicalDataDescription(
+                    File.LogicalRecordSegmentHeaderAttributes(int(attributes)), int(lr_type), int(ld_length)
+                )
+            )
+            for vr_position, lrsh_position, attributes, lr_type, ld_length in zip(
+                arrays['lr_vr_position'], arrays['lr_lrsh_position'], arrays['lr_attributes'], arrays['lr_type'],
+                arrays['lr_ld_length'],
+            )
+        ]
+        self._logical_record_index._enter(lr_pos_desc)
+        self.logical_files = []
+        eflr_offset = arrays['eflr_offset']
+        eflr_bytes = arrays['eflr_bytes'].tobytes()
+        for i, lr_index in enumerate(arrays['eflr_lr_index']):
+            position, description = lr_pos_desc[lr_index]
+            file_logical_data = File.FileLogicalData.from_logical_data(
+                position, description.attributes.attributes, description.lr_type,
+                eflr_bytes[eflr_offset[i]:eflr_offset[i + 1]]
+            )
+            self._add_eflr(file_logical_data)
+        iflr_offset = arrays['iflr_offset']
+        for i, (logical_file_index, o, c, ident) in enumerate(metadata['iflr_object_names']):
+            index_from, index_to = iflr_offset[i], iflr_offset[i + 1]
+            self.logical_files[logical_file_index].add_iflr_references(
+                RepCode.ObjectName(o, c, ident.encode('latin-1')),
+                arrays['iflr_vr_position'][index_from:index_to],
+                arrays['iflr_lrsh_position'][index_from:index_to],
+                arrays['iflr_frame_number'][index_from:index_to],
+                arrays['iflr_x_axis'][index_from:index_to],
+            )
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager support."""
         self._logical_record_index._exit()
+        self.eflr_cache.clear()
         self.logical_files = []
         return False
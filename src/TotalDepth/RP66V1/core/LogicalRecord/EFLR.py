@@ -80,6 +80,48 @@ class ExceptionEFLRObjectDuplicateLabel(ExceptionEFLRObject):
     pass
 
 
+class AttributeFormat(typing.NamedTuple):
+    """The characteristics of an attribute Component Descriptor byte, pre-computed for fast decoding.
+    See [RP66V1 Section 3.2.2.1 Component Descriptor Figure 3-5]."""
+    component_descriptor: ComponentDescriptor
+    has_L: bool
+    has_C: bool
+    has_R: bool
+    has_U: bool
+    has_V: bool
+
+
+def _attribute_format(descriptor: int) -> AttributeFormat:
+    component_descriptor = ComponentDescriptor(descriptor)
+    return AttributeFormat(
+        component_descriptor,
+        bool(component_descriptor.has_attribute_L),
+        bool(component_descriptor.has_attribute_C),
+        bool(component_descriptor.has_attribute_R),
+        bool(component_descriptor.has_attribute_U),
+        bool(component_descriptor.has_attribute_V),
+    )
+
+
+REP_CODE_IDENT: int = RepCode.REP_CODE_STR_TO_INT['IDENT']
+#: AttributeFormat for every attribute group Component Descriptor byte, indexed by that byte.
+ATTRIBUTE_FORMATS: typing.Tuple[AttributeFormat, ...] = tuple(
+    _attribute_format(d) for d in range(ComponentDescriptor.ROLE_OBJECT)
+)
+#: Map of Component Descriptor byte to whether it is an Object, populated on demand.
+#: Bytes that are invalid Component Descriptors are not cached so they raise every time.
+_COMPONENT_DESCRIPTOR_IS_OBJECT: typing.Dict[int, bool] = {}
+
+
+def _is_object(descriptor: int) -> bool:
+    """Equivalent to ComponentDescriptor(descriptor).is_object but cached."""
+    try:
+        return _COMPONENT_DESCRIPTOR_IS_OBJECT[descriptor]
+    except KeyError:
+        ret = _COMPONENT_DESCRIPTOR_IS_OBJECT[descriptor] = ComponentDescriptor(descriptor).is_object
+        return ret
+
+
 class Set:
     """Class that represents a component set. See [RP66V1 3.2.2.1 Component Descriptor]"""
     def __init__(self, ld: LogicalData):
@@ -161,7 +203,7 @@ class TemplateAttribute(AttributeBase):
         if self.component_descriptor.has_attribute_U:
             self.units = RepCode.UNITS(ld)
         if self.component_descriptor.has_attribute_V:
-            self.value = [RepCode.code_read(self.rep_code, ld) for _i in range(self.count)]
+            self.value = RepCode.code_read_list(self.rep_code, ld, self.count)
 
 
 class Attribute(AttributeBase):
@@ -189,10 +231,121 @@ class Attribute(AttributeBase):
         else:
             self.units = template_attribute.units
         if self.component_descriptor.has_attribute_V:
-            self.value = [RepCode.code_read(self.rep_code, ld) for _i in range(self.count)]
+            self.value = RepCode.code_read_list(self.rep_code, ld, self.count)
         else:
             self.value = template_attribute.value
 
+    @classmethod
+    def from_format(cls, attribute_format: AttributeFormat, ld: LogicalData,
+                    template_attribute: TemplateAttribute) -> 'Attribute':
+        """Equivalent to the constructor but with the Component Descriptor already decoded."""
+        ret = cls.__new__(cls)
+        ret.component_descriptor = attribute_format.component_descriptor
+        ret.label = RepCode.IDENT(ld) if attribute_format.has_L else template_attribute.label
+        ret.count = RepCode.UVARI(ld) if attribute_format.has_C else template_attribute.count
+        ret.rep_code = RepCode.USHORT(ld) if attribute_format.has_R else template_attribute.rep_code
+        ret.units = RepCode.UNITS(ld) if attribute_format.has_U else template_attribute.units
+        if attribute_format.has_V:
+            ret.value = RepCode.code_read_list(ret.rep_code, ld, ret.count)
+        else:
+            ret.value = template_attribute.value
+        return ret
+
+    @staticmethod
+    def skip_format(attribute_format: AttributeFormat, ld: LogicalData, template_attribute: TemplateAttribute) -> None:
+        """Skips over the Logical Data that from_format() would read without creating an Attribute."""
+        if attribute_format.has_L:
+            RepCode.code_skip_list(REP_CODE_IDENT, ld, 1)
+        count = RepCode.UVARI(ld) if attribute_format.has_C else template_attribute.count
+        rep_code = RepCode.USHORT(ld) if attribute_format.has_R else template_attribute.rep_code
+        if attribute_format.has_U:
+            RepCode.code_skip_list(REP_CODE_IDENT, ld, 1)
+        if attribute_format.has_V:
+            RepCode.code_skip_list(rep_code, ld, count)
+
+
+class TemplatePlan:
+    """A Template compiled into a plan for decoding the attributes of its Objects.
+    For each column this has the TemplateAttribute, that provides the defaults, and whether the column is invariant or
+    absent so that the Object attributes can be read without re-examining the Template."""
+    def __init__(self, template: 'Template'):
+        self.template_attrs: typing.Tuple[TemplateAttribute, ...] = tuple(template.attrs)
+        self.invariant: typing.Tuple[bool, ...] = tuple(
+            attr.component_descriptor.is_invariant_attribute for attr in template.attrs
+        )
+        self.absent: typing.Tuple[bool, ...] = tuple(
+            attr.component_descriptor.is_absent_attribute for attr in template.attrs
+        )
+        self.labels: typing.Tuple[bytes, ...] = tuple(attr.label for attr in template.attrs)
+        self.attr_label_map: typing.Dict[bytes, int] = dict(template.attr_label_map)
+
+    def __len__(self) -> int:
+        """Return the number of columns."""
+        return len(self.template_attrs)
+
+    def _attribute_format(self, ld: LogicalData) -> AttributeFormat:
+        descriptor = ld.read()
+        if descriptor >= ComponentDescriptor.ROLE_OBJECT:
+            raise ExceptionEFLRObject(
+                f'Component Descriptor does not represent a attribute but a {ComponentDescriptor(descriptor).type}.'
+            )
+        return ATTRIBUTE_FORMATS[descriptor]
+
+    def read_attributes(self, ld: LogicalData) -> typing.Tuple[typing.List[typing.Union[AttributeBase, None]],
+                                                               typing.Dict[bytes, int]]:
+        """Read the attributes of an Object, ld is positioned after the Object name.
+        Returns the list of attributes and the map of label to index."""
+        attrs: typing.List[typing.Union[AttributeBase, None]] = []
+        has_labels = False
+        index: int = 0
+        while True:
+            attribute_format = self._attribute_format(ld)
+            template_attribute = self.template_attrs[index]
+            if self.invariant[index]:
+                attrs.append(template_attribute)
+            elif self.absent[index]:
+                attrs.append(None)
+            else:
+                # TODO: Check the attribute label is the same as the template. Reference [RP66V1 Section 4.5]
+                attrs.append(Attribute.from_format(attribute_format, ld, template_attribute))
+                has_labels |= attribute_format.has_L
+                if ld.remain == 0 or _is_object(ld.peek()):
+                    break
+            index += 1
+        if len(attrs) < len(self.template_attrs):
+            attrs.extend(self.template_attrs[len(attrs):])
+        if len(self.template_attrs) != len(attrs):
+            raise ExceptionEFLRObject(
+                f'Template specifies {len(self.template_attrs)} attributes but Logical Data has {len(attrs)}'
+            )
+        if not has_labels:
+            # All the labels come from the Template which has already checked for duplicates.
+            return attrs, dict(self.attr_label_map)
+        attr_label_map: typing.Dict[bytes, int] = {}
+        for a, attr in enumerate(attrs):
+            if attr is None:
+                label = self.labels[a]
+            else:
+                label = attr.label
+                # TODO: Assert that the attribute label is the same as the template. Reference [RP66V1 Section 4.5]
+            if label in attr_label_map:
+                raise ExceptionEFLRObjectDuplicateLabel(f'Duplicate Attribute label {label}')
+            attr_label_map[label] = a
+        return attrs, attr_label_map
+
+    def skip_attributes(self, ld: LogicalData) -> None:
+        """Skip over the attributes of an Object, ld is positioned after the Object name.
+        This is much cheaper than read_attributes() as no Attributes are created."""
+        index: int = 0
+        while True:
+            attribute_format = self._attribute_format(ld)
+            template_attribute = self.template_attrs[index]
+            if not self.invariant[index] and not self.absent[index]:
+                Attribute.skip_format(attribute_format, ld, template_attribute)
+                if ld.remain == 0 or _is_object(ld.peek()):
+                    break
+            index += 1
+
 
 class Template:
     """Class that represents a component template. See [RP66V1 3.2.2.1 Component Descriptor]"""
@@ -200,11 +353,20 @@ class Template:
         self.attrs: typing.List[TemplateAttribute] = []
         self.attr_label_map: typing.Dict[bytes, int] = {}
         self.logical_data_consumed = 0
+        self._plan: typing.Union[None, TemplatePlan] = None
+
+    @property
+    def plan(self) -> TemplatePlan:
+        """The TemplatePlan that is used to decode the Objects, this is compiled once on demand."""
+        if self._plan is None:
+            self._plan = TemplatePlan(self)
+        return self._plan
 
 
     def read(self, ld: LogicalData):
         """Populate the template with the Logical Data."""
         ld_index = ld.index
+        self._plan = None
         while True:
             component_descriptor = ComponentDescriptor(ld.read())
             if not component_descriptor.is_attribute_group:
@@ -251,51 +413,53 @@ class Template:
 
 class Object:
     """Class that represents a component object. See [RP66V1 3.2.2.1 Component Descriptor].
-    Essentially this is one row in the table as a list of Atributes."""
-    def __init__(self, ld: LogicalData, template: Template):
-        component_descriptor = ComponentDescriptor(ld.read())
-        if not component_descriptor.is_object:
+    Essentially this is one row in the table as a list of Atributes.
+
+    If lazy is True then only the name is decoded, the attributes are decoded on first access to ``attrs`` or
+    ``attr_label_map`` from a copy of the Logical Data for this Object."""
+    def __init__(self, ld: LogicalData, template: Template, lazy: bool = False):
+        descriptor = ld.read()
+        if not _is_object(descriptor):
             raise ExceptionEFLRObject(
-                f'Component Descriptor does not represent a object but a {component_descriptor.type}.')
+                f'Component Descriptor does not represent a object but a {ComponentDescriptor(descriptor).type}.')
         self.name: RepCode.ObjectName = RepCode.OBNAME(ld)
-        self.attrs: typing.List[typing.Union[AttributeBase, None]] = []
-        self.attr_label_map: typing.Dict[bytes, int] = {}
-        index: int = 0
-        while True:
-            component_descriptor = ComponentDescriptor(ld.read())
-            if not component_descriptor.is_attribute_group:
-                raise ExceptionEFLRObject(
-                    f'Component Descriptor does not represent a attribute but a {component_descriptor.type}.'
-                )
-            if template[index].component_descriptor.is_invariant_attribute:
-                self.attrs.append(template[index])
-            elif template[index].component_descriptor.is_absent_attribute:
-                self.attrs.append(None)
-            else:
-                # TODO: Check the attribute label is the same as the template. Reference [RP66V1 Section 4.5]
-                self.attrs.append(Attribute(component_descriptor, ld, template[index]))
-                if ld.remain == 0 or ComponentDescriptor(ld.peek()).is_object:
-                    break
-                # next_component_descriptor = ComponentDescriptor(ld.peek())
-                # if next_component_descriptor.is_object:
-                #     break
-            index += 1
-        while len(self.attrs) < len(template):
-            self.attrs.append(template[len(self.attrs)])
-        if len(template) != len(self.attrs):
-            raise ExceptionEFLRObject(
-                f'Template specifies {len(template)} attributes but Logical Data has {len(self.attrs)}'
-            )
-        # Now populate self.attr_label_map
-        for a, attr in enumerate(self.attrs):
-            if attr is None:
-                label = template.attrs[a].label
-            else:
-                label = attr.label
-                # TODO: Assert that the attribute label is the same as the template. Reference [RP66V1 Section 4.5]
-            if label in self.attr_label_map:
-                raise ExceptionEFLRObjectDuplicateLabel(f'Duplicate Attribute label {label}')
-            self.attr_label_map[label] = a
+        self._template_plan: typing.Union[None, TemplatePlan] = None
+        self._lazy_bytes: typing.Union[None, bytes] = None
+        self._attrs: typing.Union[None, typing.List[typing.Union[AttributeBase, None]]] = None
+        self._attr_label_map: typing.Union[None, typing.Dict[bytes, int]] = None
+        if lazy:
+            ld_index = ld.index
+            template.plan.skip_attributes(ld)
+            self._template_plan = template.plan
+            # Copy as ld might be a memoryview of a file that is closed before the attributes are accessed.
+            self._lazy_bytes = bytes(ld.bytes[ld_index:ld.index])
+        else:
+            self._attrs, self._attr_label_map = template.plan.read_attributes(ld)
+
+    def _materialise(self) -> None:
+        """Decode the attributes of a lazy Object."""
+        self._attrs, self._attr_label_map = self._template_plan.read_attributes(LogicalData(self._lazy_bytes))
+        self._template_plan = None
+        self._lazy_bytes = None
+
+    @property
+    def attrs(self) -> typing.List[typing.Union[AttributeBase, None]]:
+        """The list of Attributes, None for absent Attributes."""
+        if self._attrs is None:
+            self._materialise()
+        return self._attrs
+
+    @property
+    def attr_label_map(self) -> typing.Dict[bytes, int]:
+        """The map of Attribute label to index into ``attrs``."""
+        if self._attr_label_map is None:
+            self._materialise()
+        return self._attr_label_map
+
+    @property
+    def is_materialised(self) -> bool:
+        """False if this is a lazy Object whose attributes have not yet been decoded."""
+        return self._attrs is not None
 
     def __len__(self) -> int:
         """Return the number of attributes (columns) for this row."""
@@ -402,9 +566,12 @@ class ExplicitlyFormattedLogicalRecord:
     DUPE_OBJECT_STRATEGY = DuplicateObjectStrategy.REPLACE
     #: What level to log duplicate object operations.
     DUPE_OBJECT_LOGGER = logger.warning
+    #: The default for lazy_objects. If True the Object attributes are only decoded when first accessed.
+    LAZY_OBJECTS = False
 
-    def __init__(self, lr_type: int, ld: LogicalData):
+    def __init__(self, lr_type: int, ld: LogicalData, lazy_objects: typing.Union[None, bool] = None):
         self.lr_type: int = lr_type
+        lazy = lazy_objects if lazy_objects is not None else self.LAZY_OBJECTS
         ld.rewind()
         self.set: Set = Set(ld)
         self.template: Template = Template()
@@ -419,7 +586,7 @@ class ExplicitlyFormattedLogicalRecord:
         if ld:
             self.template.read(ld)
             while ld:
-                obj = Object(ld, self.template)
+                obj = Object(ld, self.template, lazy)
                 if obj.name not in temp_object_name_map:
                     temp_object_name_map[obj.name] = len(self.objects)
                     self.objects.append(obj)
@@ -34,6 +34,11 @@ class ExceptionIFLR(ExceptionTotalDepthRP66V1):
 logger = logging.getLogger(__file__)
 
 
+#: The maximum length of the IFLR preamble: OBNAME (ORIGIN UVARI + USHORT + IDENT) then the frame number UVARI.
+#: Reading this many bytes plus the length of the X axis is sufficient to index an IFLR.
+PREAMBLE_MAX_LENGTH = 4 + 1 + 1 + 255 + 4
+
+
 class IndirectlyFormattedLogicalRecord:
     """Indirectly Formatted Logical Record has an OBNAME as its identity, a UVARI as the frame number then free data.
     This just reads the OBNAME and UVARI but not the free data.
@@ -137,38 +137,183 @@ class XAxis:
     """This represents an X axis of a log pass for a particular object in that log pass.
     It has an ident, long name and units. It accumulates, for every IFLR in the set, the VR position LRSH position, frame number
     and X axis value.
+
+    These are held in parallel numpy arrays that grow in amortised constant time. Indexing returns an IFLRReference.
+    A position of None is stored as -1.
+
+    ``indexes_in_range()`` finds the IFLRs within a range of X axis values by binary search. If the X axis is not
+    monotonic a sorted secondary index is built (once) to search on.
     """
+    #: Initial capacity of the arrays, they double in size when full.
+    INITIAL_CAPACITY = 16
+
     def __init__(self, ident: bytes, long_name: bytes, units: bytes):
         self.ident = ident
         self.long_name = long_name
         self.units = units
-        self._data: typing.List[IFLRReference] = []
+        self._size = 0
+        self._vr_position: np.ndarray = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._lrsh_position: np.ndarray = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._frame_number: np.ndarray = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._x_value: np.ndarray = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
         self._summary: typing.Union[None, XAxisSummary] = None
+        self._reset_search()
+
+    def _reset_search(self) -> None:
+        """Discard the lazily computed monotonic state and sorted secondary index."""
+        self._monotonic: typing.Union[None, int] = None
+        self._sort_index: typing.Union[None, np.ndarray] = None
+        self._sorted_x_values: typing.Union[None, np.ndarray] = None
 
-    def append(self, position: File.LogicalRecordPosition, frame_number: int, x_axis: typing.Union[int, float]) -> None:
-        """Add a IFLRReference to the XAxis."""
+    def _reserve(self, size: int) -> None:
+        """Make sure that the arrays can hold at least size values."""
+        if size > len(self._x_value):
+            capacity = max(size, 2 * len(self._x_value), self.INITIAL_CAPACITY)
+            for name in ('_vr_position', '_lrsh_position', '_frame_number', '_x_value'):
+                array = getattr(self, name)
+                new_array = np.empty(capacity, dtype=array.dtype)
+                new_array[:self._size] = array[:self._size]
+                setattr(self, name, new_array)
+
+    def append(self, position: typing.Union[None, File.LogicalRecordPosition], frame_number: int,
+               x_axis: typing.Union[int, float]) -> None:
+        """Add a IFLR position, frame number and X axis value to the XAxis."""
         # TODO: Verify the data position, frame number increasing etc.
         self._summary = None
-        self._data.append(IFLRReference(position, frame_number, x_axis))
+        self._reset_search()
+        self._reserve(self._size + 1)
+        if position is None:
+            self._vr_position[self._size] = self._lrsh_position[self._size] = -1
+        else:
+            self._vr_position[self._size] = position.vr_position
+            self._lrsh_position[self._size] = position.lrsh_position
+        self._frame_number[self._size] = frame_number
+        self._x_value[self._size] = x_axis
+        self._size += 1
+
+    def extend(self, vr_positions: np.ndarray, lrsh_positions: np.ndarray, frame_numbers: np.ndarray,
+               x_values: np.ndarray) -> None:
+        """Add arrays of IFLR positions, frame numbers and X axis values to the XAxis."""
+        length = len(x_values)
+        if not len(vr_positions) == len(lrsh_positions) == len(frame_numbers) == length:
+            raise ValueError(
+                f'XAxis.extend() arrays must be the same length not {len(vr_positions)}, {len(lrsh_positions)},'
+                f' {len(frame_numbers)}, {length}'
+            )
+        self._summary = None
+        self._reset_search()
+        self._reserve(self._size + length)
+        self._vr_position[self._size:self._size + length] = vr_positions
+        self._lrsh_position[self._size:self._size + length] = lrsh_positions
+        self._frame_number[self._size:self._size + length] = frame_numbers
+        self._x_value[self._size:self._size + length] = x_values
+        self._size += length
 
-    def __getitem__(self, item) -> IFLRReference:
-        """Return the IFLRReference for the index."""
-        return self._data[item]
+    @property
+    def vr_positions(self) -> np.ndarray:
+        """A read only view of the Visible Record positions."""
+        return self._view(self._vr_position)
+
+    @property
+    def lrsh_positions(self) -> np.ndarray:
+        """A read only view of the Logical Record Segment Header positions."""
+        return self._view(self._lrsh_position)
+
+    @property
+    def frame_numbers(self) -> np.ndarray:
+        """A read only view of the frame numbers."""
+        return self._view(self._frame_number)
+
+    @property
+    def x_values(self) -> np.ndarray:
+        """A read only view of the X axis values."""
+        return self._view(self._x_value)
+
+    def _view(self, array: np.ndarray) -> np.ndarray:
+        ret = array[:self._size]
+        ret.flags.writeable = False
+        return ret
+
+    def logical_record_position(self, index: int) -> typing.Union[None, File.LogicalRecordPosition]:
+        """Return the LogicalRecordPosition of the IFLR at the index."""
+        vr_position = int(self._vr_position[index])
+        if vr_position < 0:
+            return None
+        return File.LogicalRecordPosition.from_positions(vr_position, int(self._lrsh_position[index]))
+
+    def __getitem__(self, item) -> typing.Union[IFLRReference, typing.List[IFLRReference]]:
+        """Return the IFLRReference for the index or a list of them for a slice."""
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(self._size))]
+        if item < 0:
+            item += self._size
+        if not 0 <= item < self._size:
+            raise IndexError(f'XAxis index {item} out of range for length {self._size}')
+        return IFLRReference(
+            self.logical_record_position(item), int(self._frame_number[item]), float(self._x_value[item])
+        )
+
+    def __iter__(self) -> typing.Iterator[IFLRReference]:
+        for i in range(self._size):
+            yield self[i]
 
     def __len__(self) -> int:
         """Return the number of IFLRs."""
-        return len(self._data)
+        return self._size
+
+    def __getstate__(self):
+        """Pickle only the used part of the arrays."""
+        state = self.__dict__.copy()
+        for name in ('_vr_position', '_lrsh_position', '_frame_number', '_x_value'):
+            state[name] = state[name][:self._size].copy()
+        state['_sort_index'] = state['_sorted_x_values'] = None
+        return state
+
+    @property
+    def monotonic(self) -> int:
+        """1 if the X axis values never decrease, -1 if they never increase (but do decrease), 0 otherwise.
+        An X axis with less than two values is regarded as increasing. A NaN makes the X axis non-monotonic."""
+        if self._monotonic is None:
+            diff = np.diff(self.x_values)
+            if np.all(diff >= 0):
+                self._monotonic = 1
+            elif np.all(diff <= 0):
+                self._monotonic = -1
+            else:
+                self._monotonic = 0
+        return self._monotonic
+
+    def indexes_in_range(self, x_from: typing.Union[int, float], x_to: typing.Union[int, float]) -> np.ndarray:
+        """Returns an increasing array of the indexes of the IFLRs whose X axis value is in the closed interval between
+        x_from and x_to, these are in the units of the X axis. The order of x_from and x_to does not matter.
+
+        This is a binary search on a monotonic X axis. For a non-monotonic X axis a sorted secondary index is
+        searched, it is created on first use."""
+        x_min, x_max = min(x_from, x_to), max(x_from, x_to)
+        monotonic = self.monotonic
+        if monotonic > 0:
+            x_values = self.x_values
+            return np.arange(np.searchsorted(x_values, x_min, 'left'), np.searchsorted(x_values, x_max, 'right'))
+        if monotonic < 0:
+            x_values = self.x_values[::-1]
+            index_from = np.searchsorted(x_values, x_min, 'left')
+            index_to = np.searchsorted(x_values, x_max, 'right')
+            return np.arange(self._size - index_to, self._size - index_from)
+        if self._sort_index is None:
+            self._sort_index = np.argsort(self.x_values, kind='stable')
+            self._sorted_x_values = self.x_values[self._sort_index]
+        index_from = np.searchsorted(self._sorted_x_values, x_min, 'left')
+        index_to = np.searchsorted(self._sorted_x_values, x_max, 'right')
+        return np.sort(self._sort_index[index_from:index_to])
+
+    def compute_spacing(self) -> typing.Union[XAxisSpacingSummary, None]:
+        """Computes the summary of the first differential of the X axis or None if there are less than two values."""
+        return compute_spacing(self.x_values)
 
     @property
     def summary(self) -> XAxisSummary:
         """Lazily compute the summary."""
         if self._summary is None:
-            x_array: np.ndarray = np.empty(len(self._data), dtype=np.float64)
-            for i in range(len(self._data)):
-                x_array[i] = self._data[i].x_axis
-            self._summary = XAxisSummary(x_array.min(), x_array.max(), len(x_array), compute_spacing(x_array))
+            x_array: np.ndarray = self.x_values
+            self._summary = XAxisSummary(x_array.min(), x_array.max(), len(x_array), self.compute_spacing())
         return self._summary
-
-    # TODO: Add an API that can turn an X axis value into the nearest frame number. Needs to cope with decreasing data.
-
-
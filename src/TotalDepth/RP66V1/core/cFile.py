@@ -18,7 +18,8 @@
 #
 # Paul Ross: apaulross@gmail.com
 
-# This is a placeholder that can be replaced by 'TotalDepth/RP66V1/core/cFile.so'
+# This is a placeholder that is replaced by 'TotalDepth/RP66V1/core/cFile.so' when the extension is built.
+# The extension provides NativeFileRead and ExceptionNativeFileRead, see pFile.FileRead.
 #     Extension(
 #         'TotalDepth.RP66V1.core.cFile',
 #         sources=[
@@ -18,7 +18,9 @@
 #
 # Paul Ross: apaulross@gmail.com
 
-# This is a placeholder can be replaced by 'TotalDepth/RP66V1/core/cRepCode.so'
+# This is a placeholder that is replaced by 'TotalDepth/RP66V1/core/cRepCode.so' when the extension is built.
+# The extension provides native versions of the pRepCode functions that take a LogicalData, code_read(),
+# code_read_list() and code_skip_list().
 #     Extension(
 #         'TotalDepth.RP66V1.core.cRepCode',
 #         sources=[
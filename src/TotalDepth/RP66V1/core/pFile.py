@@ -20,22 +20,37 @@
 """
 Handles low level RP66V1 operations.
 
-TODO: Replace this with the C/C++ implementation.
+If the native extension ``cFile`` has been built then ``FileRead`` uses it to scan the file and read Logical Data,
+falling back to this Python implementation if the native reader reports an error or is not available.
+
+Files opened by path are also memory mapped, if possible, so that random access to Logical Data is done by slicing the
+mapped file. In that case ``LogicalData`` wraps a ``memoryview`` and single segment Logical Records are not copied.
 """
 
 import copy
 import hashlib
 import io
 import logging
+import mmap
 import re
+import struct
 import typing
 
 from TotalDepth.RP66V1 import ExceptionTotalDepthRP66V1
+from TotalDepth.RP66V1.core import cFile
 from TotalDepth.util.bin_file_type import format_bytes
 
 
 logger = logging.getLogger(__file__)
 
+#: The native file reader if the cFile extension has been built, otherwise None.
+#: Set this to None to force the Python implementation.
+NativeFileRead = getattr(cFile, 'NativeFileRead', None)
+#: The exception raised by the native file reader.
+ExceptionNativeFileRead = getattr(cFile, 'ExceptionNativeFileRead', None)
+#: If True then files opened by path are memory mapped. Set this to False to force reading with seek()/read().
+USE_MMAP = True
+
 
 class ExceptionFile(ExceptionTotalDepthRP66V1):
     pass
@@ -532,6 +547,14 @@ class LogicalRecordPosition:
         self.vr_position: int = vr.position
         self.lrsh_position: int = lrsh.position
 
+    @classmethod
+    def from_positions(cls, vr_position: int, lrsh_position: int) -> 'LogicalRecordPosition':
+        """Create from absolute file positions that have already been checked, for example by the native reader."""
+        ret = cls.__new__(cls)
+        ret.vr_position = vr_position
+        ret.lrsh_position = lrsh_position
+        return ret
+
     def __str__(self):
         return f'LogicalRecordPosition: VR: 0x{self.vr_position:08x} LRSH: 0x{self.lrsh_position:08x}'
 
@@ -572,9 +595,10 @@ class LRPosDesc(typing.NamedTuple):
 
 
 class LogicalData:
-    """Class that holds data bytes and can successively read them maintaining an index of what has been read."""
-    def __init__(self, by: bytes):
-        self.bytes: bytes = by
+    """Class that holds data bytes and can successively read them maintaining an index of what has been read.
+    The data can be bytes or a memoryview, for example a slice of a memory mapped file."""
+    def __init__(self, by: typing.Union[bytes, memoryview]):
+        self.bytes: typing.Union[bytes, memoryview] = by
         self.index: int = 0
         self._sha1: typing.Union[hashlib.sha1, None] = None
 
@@ -595,8 +619,9 @@ class LogicalData:
         """Increments the index. There is no error checking."""
         self.index += length
 
-    def view_remaining(self, length: int) -> bytes:
-        """Read only method to return a slice of length from the current index.
+    def view_remaining(self, length: int) -> typing.Union[bytes, memoryview]:
+        """Read only method to return a slice of length from the current index, this is not copied if the data is a
+        memoryview.
         Usage ``ld.view_remaining(ld.remain)`` to see all the remaining data."""
         if length < 0:
             raise IndexError(f'view_remaining length {length} must be >= 0')
@@ -609,7 +634,8 @@ class LogicalData:
             raise IndexError(
                 f'Chunk length {length} is out of range where remain is {self.remain} of length {len(self.bytes)}'
             )
-        ret = self.bytes[self.index:self.index + length]
+        # bytes() is a no-op for bytes but copies a memoryview slice so that the caller can hold on to it.
+        ret = bytes(self.bytes[self.index:self.index + length])
         self.index += length
         return ret
 
@@ -665,6 +691,22 @@ class FileLogicalData:
         self.logical_data: typing.Union[None, LogicalData] = None
         assert self._invariants()
 
+    @classmethod
+    def from_logical_data(cls, position: LogicalRecordPosition, attributes: int, lr_type: int,
+                          by: bytes) -> 'FileLogicalData':
+        """Create a sealed FileLogicalData from the position, LRSH attributes, Logical Record type and the complete
+        Logical Data. This is used when the data has been assembled elsewhere, for example by the native reader."""
+        ret = cls.__new__(cls)
+        ret.position = position
+        ret.lr_type = lr_type
+        lrsh_attributes = LogicalRecordSegmentHeaderAttributes(attributes)
+        ret.lr_is_eflr = lrsh_attributes.is_eflr
+        ret.lr_is_encrypted = lrsh_attributes.is_encrypted
+        ret._bytes = None
+        ret.logical_data = LogicalData(by)
+        assert ret._invariants()
+        return ret
+
     def _invariants(self) -> bool:
         return (self._bytes is None) != (self.logical_data is None)
 
@@ -710,6 +752,13 @@ class FileLogicalData:
 
 class FileRead:
     """RP66V1 file reader."""
+    #: The minimum block size used by iter_file_logical_data() when the file is not memory mapped.
+    BATCH_READ_BYTES = 1024**2
+    #: A block is doubled up to this multiple of BATCH_READ_BYTES, after that get_file_logical_data() is used.
+    BATCH_READ_MAX_MULTIPLE = 16
+    #: struct format of a Visible Record header (length, 0xff, 0x01) or a LRSH (length, attributes, record type).
+    MMAP_HEADER_STRUCT = struct.Struct('>HBB')
+
     def __init__(self, path_or_file: typing.Union[str, typing.BinaryIO]):
         if isinstance(path_or_file, str):
             self.file = None
@@ -726,6 +775,10 @@ class FileRead:
         self.sul = None
         self.visible_record = None
         self.logical_record_segment_header = None
+        # The native reader and the memory map, only used when we have a path to a file.
+        self._native = None
+        self._mmap: typing.Union[None, mmap.mmap] = None
+        self._mmap_view: typing.Union[None, memoryview] = None
 
     def _enter(self):
         if self.file is None:
@@ -733,6 +786,21 @@ class FileRead:
             self.must_close = True
         else:
             self.file.seek(0)
+        if self.must_close and NativeFileRead is not None:
+            try:
+                self._native = NativeFileRead(self.path)
+            except ExceptionNativeFileRead as err:
+                logger.debug(f'FileRead can not use native reader: {err}')
+                self._native = None
+        if self.must_close and USE_MMAP:
+            try:
+                self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError) as err:
+                # For example an empty file.
+                logger.debug(f'FileRead can not memory map the file: {err}')
+                self._mmap = None
+            else:
+                self._mmap_view = memoryview(self._mmap)
         # Read the Storage Unit Label, see [RP66V1] 2.3.2
         try:
             self.sul = StorageUnitLabel(self.file.read(StorageUnitLabel.SIZE))
@@ -751,6 +819,18 @@ class FileRead:
 
     def _exit(self):
         assert self.file is not None
+        if self._native is not None:
+            self._native.close()
+            self._native = None
+        if self._mmap is not None:
+            self._mmap_view.release()
+            self._mmap_view = None
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Some LogicalData still refers to the map, it will be unmapped when they are garbage collected.
+                pass
+            self._mmap = None
         if self.must_close:
             self.file.close()
         else:
@@ -893,7 +973,189 @@ class FileRead:
         - LogicalDataDescription: This provides some basic information about the Logical Data such as attributes
             Logical Record type and the Logical Data length. This will be of interest to indexers to offer up to their
             callers.
+
+        This uses the native reader if available, otherwise the memory mapped file if available.
         """
+        if self._native is not None:
+            try:
+                positions = self._native.logical_record_positions()
+            except ExceptionNativeFileRead as err:
+                logger.debug(f'FileRead.iter_logical_record_positions() native reader failed: {err}')
+            else:
+                for vr_position, lrsh_position, attributes, record_type, ld_length in positions:
+                    yield LRPosDesc(
+                        LogicalRecordPosition.from_positions(vr_position, lrsh_position),
+                        LogicalDataDescription(LogicalRecordSegmentHeaderAttributes(attributes), record_type, ld_length)
+                    )
+                return
+        if self._mmap_view is not None:
+            positions = self._mmap_logical_record_positions()
+            if positions is not None:
+                yield from positions
+                return
+        yield from self._iter_logical_record_positions()
+
+    @classmethod
+    def _buffer_header(cls, view: memoryview, index: int) -> typing.Union[None, typing.Tuple[int, int, int]]:
+        """Returns the (length, byte, byte) of a Visible Record or LRSH header at the index in the buffer or None if
+        the buffer is too short."""
+        if index + cls.MMAP_HEADER_STRUCT.size > len(view):
+            return None
+        return cls.MMAP_HEADER_STRUCT.unpack_from(view, index)
+
+    @classmethod
+    def _buffer_visible_record_length(cls, view: memoryview, index: int) -> typing.Union[None, int]:
+        """Returns the length of a valid Visible Record at the index in the buffer, None if the buffer is too short or
+        the Visible Record is invalid."""
+        header = cls._buffer_header(view, index)
+        if header is None:
+            return None
+        length, version_hi, version_lo = header
+        if (version_hi << 8 | version_lo) != VisibleRecord.VERSION \
+                or not VisibleRecord.MIN_LENGTH <= length <= VisibleRecord.MAX_LENGTH:
+            return None
+        return length
+
+    @staticmethod
+    def _buffer_position_is_valid(vr_position: int, vr_length: int, lrsh_position: int, lrsh_length: int) -> bool:
+        """The checks made by LogicalRecordPosition.__init__()."""
+        return StorageUnitLabel.SIZE + VisibleRecord.NUMBER_OF_HEADER_BYTES <= lrsh_position \
+            and vr_position + VisibleRecord.NUMBER_OF_HEADER_BYTES <= lrsh_position \
+            and lrsh_position <= vr_position + vr_length - LOGICAL_RECORD_SEGMENT_MINIMUM_SIZE \
+            and LOGICAL_RECORD_SEGMENT_MINIMUM_SIZE <= lrsh_length <= vr_length - VisibleRecord.NUMBER_OF_HEADER_BYTES
+
+    @staticmethod
+    def _buffer_logical_data_length(lrsh_length: int, attributes: int) -> int:
+        """Equivalent to LogicalRecordSegmentHeader.logical_data_length."""
+        ret = lrsh_length - LogicalRecordSegmentHeader.HEAD_LENGTH
+        if attributes & 0x04:
+            ret -= 2
+        if attributes & 0x02:
+            ret -= 2
+        return ret
+
+    def _mmap_logical_record_positions(self) -> typing.Union[None, typing.List[LRPosDesc]]:
+        """Equivalent to _iter_logical_record_positions() using the memory mapped file.
+        This returns None if anything is irregular so that the caller can use the Python implementation to raise the
+        appropriate exception."""
+        ret = []
+        vr_position = StorageUnitLabel.SIZE
+        previous_lrsh_is_last = True
+        vr_first = lrsh_first = vr_first_length = None
+        attributes_first = record_type_first = logical_data_length = 0
+        while True:
+            if self._buffer_header(self._mmap_view, vr_position) is None:
+                break
+            vr_length = self._buffer_visible_record_length(self._mmap_view, vr_position)
+            if vr_length is None:
+                return None
+            vr_next = vr_position + vr_length
+            lrsh_position = vr_position + VisibleRecord.NUMBER_OF_HEADER_BYTES
+            while True:
+                header = self._buffer_header(self._mmap_view, lrsh_position)
+                if header is None:
+                    break
+                lrsh_length, attributes, record_type = header
+                is_first = attributes & 0x40 == 0
+                is_last = attributes & 0x20 == 0
+                if lrsh_length < LogicalRecordSegmentHeader.HEAD_LENGTH or is_first != previous_lrsh_is_last:
+                    return None
+                if is_first:
+                    vr_first, vr_first_length, lrsh_first = vr_position, vr_length, lrsh_position
+                    attributes_first, record_type_first = attributes, record_type
+                    logical_data_length = 0
+                    if not self._buffer_position_is_valid(vr_position, vr_length, lrsh_position, lrsh_length):
+                        return None
+                logical_data_length += self._buffer_logical_data_length(lrsh_length, attributes)
+                if is_last:
+                    ret.append(
+                        LRPosDesc(
+                            LogicalRecordPosition.from_positions(vr_first, lrsh_first),
+                            LogicalDataDescription(
+                                LogicalRecordSegmentHeaderAttributes(attributes_first),
+                                record_type_first,
+                                logical_data_length
+                            )
+                        )
+                    )
+                previous_lrsh_is_last = is_last
+                lrsh_position += lrsh_length
+                if lrsh_position == vr_next:
+                    break
+                if lrsh_position > vr_next:
+                    return None
+            vr_position = vr_next
+        return ret
+
+    def _buffer_file_logical_data(self, view: memoryview, base: int, position: LogicalRecordPosition,
+                                  offset: int, length: int) -> typing.Union[None, FileLogicalData]:
+        """Equivalent to get_file_logical_data() where view is the file content starting at the file position base,
+        for example the memory mapped file with a base of 0.
+        The Logical Data is a slice of the view if the data is in a single Logical Record Segment, otherwise the
+        segments are joined.
+        This returns None if anything is irregular or the view is too short so that the caller can try again or use the
+        Python implementation to raise the appropriate exception."""
+        vr_index = position.vr_position - base
+        if vr_index < 0 or position.vr_position < StorageUnitLabel.SIZE:
+            return None
+        vr_length = self._buffer_visible_record_length(view, vr_index)
+        if vr_length is None:
+            return None
+        vr_next = vr_index + vr_length
+        lrsh_index = position.lrsh_position - base
+        header = self._buffer_header(view, lrsh_index)
+        if header is None \
+                or not self._buffer_position_is_valid(position.vr_position, vr_length, position.lrsh_position, header[0]):
+            return None
+        attributes_first, record_type_first = header[1], header[2]
+        all_bytes = offset == 0 and length < 0
+        bytes_read = logical_data_index = 0
+        segments = []
+        while True:
+            lrsh_length, attributes, _record_type = header
+            data_length = self._buffer_logical_data_length(lrsh_length, attributes)
+            data_from = lrsh_index + LogicalRecordSegmentHeader.HEAD_LENGTH
+            data_to = data_from + data_length
+            if data_length <= 0 or data_to > len(view):
+                return None
+            if attributes & 0x01 and not attributes & 0x10:
+                pad_len = view[data_to - 1]
+                if pad_len > data_length:
+                    return None
+                # This matches the Python implementation where a pad length of zero removes everything.
+                data_to = data_to - pad_len if pad_len else data_from
+            # Same slicing as get_file_logical_data()
+            if all_bytes:
+                segments.append(view[data_from:data_to])
+            elif bytes_read != length:
+                segment_length = data_to - data_from
+                index_from = max(0, offset - logical_data_index)
+                index_to = index_from + length - bytes_read if length >= 0 else segment_length
+                index_from = data_from + min(index_from, segment_length)
+                index_to = data_from + min(index_to, segment_length)
+                segments.append(view[index_from:index_to])
+                bytes_read += index_to - index_from
+                logical_data_index += segment_length
+            if attributes & 0x20 == 0:
+                break
+            lrsh_index += lrsh_length
+            if lrsh_index == vr_next:
+                vr_length = self._buffer_visible_record_length(view, lrsh_index)
+                if vr_length is None:
+                    return None
+                vr_next = lrsh_index + vr_length
+                lrsh_index += VisibleRecord.NUMBER_OF_HEADER_BYTES
+            header = self._buffer_header(view, lrsh_index)
+            if header is None:
+                return None
+        if len(segments) == 1:
+            by = segments[0]
+        else:
+            by = b''.join(segments)
+        return FileLogicalData.from_logical_data(position, attributes_first, record_type_first, by)
+
+    def _iter_logical_record_positions(self) -> typing.Sequence[LRPosDesc]:
+        """Python implementation of iter_logical_record_positions()."""
         # Set this as if there was a previous LRSH that was the last of the sequence.
         previous_lrsh_is_last: bool = True
         vr_first = lrsh_first = logical_data_length = None
@@ -941,6 +1203,20 @@ class FileRead:
         """
         if offset < 0:
             raise ExceptionFileRead(f'offset must be >= 0 not {offset}')
+        if self._mmap_view is not None:
+            file_logical_data = self._buffer_file_logical_data(self._mmap_view, 0, position, offset, length)
+            if file_logical_data is not None:
+                return file_logical_data
+            logger.debug(f'FileRead.get_file_logical_data() memory map can not read {position}')
+        if self._native is not None:
+            try:
+                attributes, lr_type, by = self._native.logical_data(
+                    position.vr_position, position.lrsh_position, offset, length
+                )
+            except ExceptionNativeFileRead as err:
+                logger.debug(f'FileRead.get_file_logical_data() native reader failed: {err}')
+            else:
+                return FileLogicalData.from_logical_data(position, attributes, lr_type, by)
         # Hmm, seek() always succeeds and tell() returns the current position even if > EOF.
         self.file.seek(position.vr_position)
         # May raise
@@ -963,7 +1239,7 @@ class FileRead:
                     file_logical_data.add_bytes(by)
                 else:
                     index_from = max(0, offset - logical_data_index)
-                    index_to = index_from + length if length >= 0 else len(by)
+                    index_to = index_from + length - bytes_read if length >= 0 else len(by)
                     by_slice = by[index_from:index_to]
                     file_logical_data.add_bytes(by_slice)
                     bytes_read += len(by_slice)
@@ -974,6 +1250,54 @@ class FileRead:
         file_logical_data.seal()
         return file_logical_data
 
+    def iter_file_logical_data(self, positions: typing.Iterable[LogicalRecordPosition],
+                               offset: int = 0, length: int = -1) -> typing.Iterator[FileLogicalData]:
+        """
+        Yields a FileLogicalData object for each Logical Record position in turn.
+        This is equivalent to calling ``get_file_logical_data()`` for each position but without a seek() and read()
+        for every Visible Record, LRSH and Logical Data fragment. Instead the file is read in blocks of at least
+        ``BATCH_READ_BYTES`` and the Logical Records decoded from the block. Positions that are not in the current
+        block start a new block so gaps, for example a strided selection of IFLRs, are skipped. This is most efficient
+        if the positions are in increasing file order.
+
+        If the file is memory mapped the memory map is used directly. Otherwise if the native reader is available that
+        is used as it has its own block buffer.
+
+        The Logical Data may be a memoryview of the block. Irregular Logical Records, or those that do not fit in a block
+        of ``BATCH_READ_BYTES * BATCH_READ_MAX_MULTIPLE``, are read with ``get_file_logical_data()`` so that the same
+        exceptions are raised.
+        """
+        if offset < 0:
+            raise ExceptionFileRead(f'offset must be >= 0 not {offset}')
+        block = memoryview(b'')
+        block_position = 0
+        for position in positions:
+            if self._mmap_view is not None:
+                file_logical_data = self._buffer_file_logical_data(self._mmap_view, 0, position, offset, length)
+            elif self._native is not None:
+                file_logical_data = None
+            else:
+                file_logical_data = self._buffer_file_logical_data(block, block_position, position, offset, length)
+                if file_logical_data is None:
+                    # Start a new block at this position, doubling it if a previous block was too short.
+                    read_size = self.BATCH_READ_BYTES
+                    if block_position == position.vr_position:
+                        read_size = max(read_size, 2 * len(block))
+                    max_read_size = self.BATCH_READ_BYTES * self.BATCH_READ_MAX_MULTIPLE
+                    while read_size <= max_read_size:
+                        self.file.seek(position.vr_position)
+                        block = memoryview(self.file.read(read_size))
+                        block_position = position.vr_position
+                        file_logical_data = self._buffer_file_logical_data(
+                            block, block_position, position, offset, length
+                        )
+                        if file_logical_data is not None or len(block) < read_size:
+                            break
+                        read_size *= 2
+            if file_logical_data is None:
+                file_logical_data = self.get_file_logical_data(position, offset, length)
+            yield file_logical_data
+
     def validate_positions(self) -> None:
         """Iterate through the Visible Records and Logical Record Segment Headers and raise a
         ExceptionFileReadPositionsInconsistent on the first inconsistent position."""
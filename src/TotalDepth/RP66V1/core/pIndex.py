@@ -65,12 +65,16 @@ class LogicalRecordIndex:
     def __getitem__(self, item) -> File.LRPosDesc:
         return self.lr_pos_desc[item]
 
-    def _enter(self):
-        """Populate the internal representation from a File.FileRead."""
+    def _enter(self, lr_pos_desc: typing.Union[None, typing.List[File.LRPosDesc]] = None):
+        """Populate the internal representation from a File.FileRead.
+        If lr_pos_desc is given, for example from a cache, then that is used rather than scanning the file."""
         # Initialise the File.FileRead
         self.rp66v1_file._enter()
         # Initialise self and scan the File.FileRead
-        self.lr_pos_desc = list(self.rp66v1_file.iter_logical_record_positions())
+        if lr_pos_desc is None:
+            self.lr_pos_desc = list(self.rp66v1_file.iter_logical_record_positions())
+        else:
+            self.lr_pos_desc = lr_pos_desc
 
     def __enter__(self):
         self._enter()
@@ -138,6 +142,20 @@ class LogicalRecordIndex:
         """
         return self.rp66v1_file.get_file_logical_data(position, offset, length)
 
+    def iter_file_logical_data_at_positions(self, positions: typing.Iterable[File.LogicalRecordPosition],
+                                            offset: int = 0,
+                                            length: int = -1) -> typing.Iterator[File.FileLogicalData]:
+        """
+        Yields a FileLogicalData object for each of the Logical Record positions.
+        This coalesces the file reads so is much faster than repeated calls to ``get_file_logical_data_at_position()``
+        when the positions are in increasing file order. See ``File.FileRead.iter_file_logical_data()``.
+
+        :param: positions The Logical Record positions in the file.
+        :param: offset An integer offset into the Logical Record data, default 0.
+        :param: length An integer length the Logical Record data, default of -1 is all.
+        """
+        return self.rp66v1_file.iter_file_logical_data(positions, offset, length)
+
     def validate(self):
         """Perform validation checks."""
         self.rp66v1_file.validate_positions()
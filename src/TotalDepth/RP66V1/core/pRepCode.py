@@ -614,9 +614,8 @@ UNITS_ALLOWABLE_CHARACTERS: typing.Set[int] = set(
 UNITS_ALLOWABLE_CHARACTERS_AS_STRING: str = ''.join(sorted(chr(v) for v in UNITS_ALLOWABLE_CHARACTERS))
 
 
-def UNITS(ld: LogicalData) -> bytes:
-    """Read UNITS from the LogicalData."""
-    ret: bytes = _pascal_string(ld)
+def _check_units(ret: bytes) -> None:
+    """Logs a warning if the UNITS has characters that are not allowed."""
     # [RP66V1 Appendix B, B.27 Code UNITS: Units Expression]
     bad_chars = set(ret) - UNITS_ALLOWABLE_CHARACTERS
     if bad_chars:
@@ -627,6 +626,12 @@ def UNITS(ld: LogicalData) -> bytes:
         # warnings.warn(msg)
         logger.warning(msg)
         # raise ExceptionRepCode(msg)
+
+
+def UNITS(ld: LogicalData) -> bytes:
+    """Read UNITS from the LogicalData."""
+    ret: bytes = _pascal_string(ld)
+    _check_units(ret)
     return ret
 
 
@@ -671,6 +676,33 @@ def code_read(rep_code: int, ld: LogicalData):
     except KeyError as err:
         raise ExceptionRepCode(f'Unsupported Representation code {rep_code}') from err
 
+
+def code_read_list(rep_code: int, ld: LogicalData, count: int) -> typing.List[typing.Any]:
+    """Read count Rep Code values from the LogicalData as a list."""
+    if count <= 0:
+        return []
+    try:
+        function = REP_CODE_MAP[rep_code]
+    except KeyError as err:
+        raise ExceptionRepCode(f'Unsupported Representation code {rep_code}') from err
+    return [function(ld) for _i in range(count)]
+
+
+def code_skip_list(rep_code: int, ld: LogicalData, count: int) -> None:
+    """Skip over count Rep Code values in the LogicalData, fixed length values are not decoded.
+    May raise an IndexError if there is not enough data."""
+    if count <= 0:
+        return
+    if rep_code not in REP_CODE_MAP:
+        raise ExceptionRepCode(f'Unsupported Representation code {rep_code}')
+    if rep_code in REP_CODE_FIXED_LENGTHS:
+        length = REP_CODE_FIXED_LENGTHS[rep_code] * count
+        if length > ld.remain:
+            raise IndexError(f'Skip length {length} is out of range where remain is {ld.remain}')
+        ld.seek(length)
+    else:
+        code_read_list(rep_code, ld, count)
+
 # Numpy related stuff
 
 #: Numpy dtypes, numeric Rep Codes only.
@@ -703,6 +735,81 @@ def numpy_dtype(rep_code: int):
         raise ExceptionRepCode(f'Unsupported Representation code {rep_code}') from err
 
 
+#: Numpy dtypes that describe the raw (big-endian) bytes of fixed length numeric Rep Codes as they appear in a file.
+#: This allows a whole frame, or a run of frames, to be decoded with a single ``np.frombuffer()`` call.
+#: ISINGL and VSINGL are not IEEE so are read as unsigned 32 bit words and then converted by
+#: ``numpy_raw_convert()``.
+REP_CODE_NUMPY_RAW_TYPE_MAP: typing.Dict[int, np.dtype] = {
+    2: np.dtype('>f4'),  # FSINGL
+    5: np.dtype('>u4'),  # ISINGL, needs conversion.
+    6: np.dtype('>u4'),  # VSINGL, needs conversion.
+    7: np.dtype('>f8'),  # FDOUBL
+    12: np.dtype('i1'),  # SSHORT
+    13: np.dtype('>i2'),  # SNORM
+    14: np.dtype('>i4'),  # SLONG
+    15: np.dtype('u1'),  # USHORT
+    16: np.dtype('>u2'),  # UNORM
+    17: np.dtype('>u4'),  # ULONG
+}
+assert set(REP_CODE_NUMPY_RAW_TYPE_MAP.keys()) - set(REP_CODE_NUMPY_TYPE_MAP.keys()) == set()
+assert all(REP_CODE_NUMPY_RAW_TYPE_MAP[k].itemsize == REP_CODE_FIXED_LENGTHS[k] for k in REP_CODE_NUMPY_RAW_TYPE_MAP)
+
+
+def has_numpy_raw_dtype(rep_code: int) -> bool:
+    """True if the Rep Code can be decoded directly from raw bytes by numpy."""
+    return rep_code in REP_CODE_NUMPY_RAW_TYPE_MAP
+
+
+def numpy_raw_dtype(rep_code: int) -> np.dtype:
+    """Returns the numpy dtype that describes the raw bytes of the Rep Code.
+    Will raise ExceptionRepCode for Rep codes that can not be described this way."""
+    try:
+        return REP_CODE_NUMPY_RAW_TYPE_MAP[rep_code]
+    except KeyError as err:
+        raise ExceptionRepCode(f'Representation code {rep_code} has no raw numpy dtype') from err
+
+
+def ISINGL_array(words: np.ndarray) -> np.ndarray:
+    """Representation code 5, IBM 360 single precision floating point.
+    Converts an array of unsigned 32 bit words to an array of float64.
+    This is the vectorised equivalent of ``ISINGL()``."""
+    words = words.astype(np.uint32)
+    exponent = ((words >> 24) & 0x7f).astype(np.int32) - 64
+    mantissa = (words & 0xffffff).astype(np.float64) / 0x1000000
+    ret = mantissa * np.power(16.0, exponent)
+    return np.where(words & 0x80000000, -ret, ret)
+
+
+def VSINGL_array(words: np.ndarray) -> np.ndarray:
+    """Representation code 6, VAX single precision floating point.
+    Converts an array of unsigned 32 bit words, where the word is the big-endian interpretation of the four bytes, to
+    an array of float64.
+    This is the vectorised equivalent of ``VSINGL()``."""
+    words = words.astype(np.uint32)
+    sign = (words >> 16) & 0x80
+    mantissa = ((words >> 24) & 0x7f) << 16 | (words & 0xff) << 8 | (words >> 8) & 0xff
+    exponent = (((words >> 16) & 0x7f) << 1 | (words >> 31)).astype(np.int32)
+    ret = (0.5 + mantissa.astype(np.float64) / (1 << 23)) * np.power(2.0, exponent - 128)
+    ret = np.where(sign, -ret, ret)
+    # If the exponent and sign are zero the value is zero, the mantissa is arbitrary.
+    return np.where((exponent == 0) & (sign == 0), 0.0, ret)
+
+
+#: Map of Rep Codes that need conversion after being read with their raw numpy dtype.
+REP_CODE_NUMPY_RAW_CONVERT_MAP: typing.Dict[int, typing.Callable[[np.ndarray], np.ndarray]] = {
+    5: ISINGL_array,
+    6: VSINGL_array,
+}
+
+
+def numpy_raw_convert(rep_code: int, array: np.ndarray) -> np.ndarray:
+    """Given an array read with ``numpy_raw_dtype(rep_code)`` this returns an array of the values. For most Rep Codes
+    this is the array itself."""
+    if rep_code in REP_CODE_NUMPY_RAW_CONVERT_MAP:
+        return REP_CODE_NUMPY_RAW_CONVERT_MAP[rep_code](array)
+    return array
+
+
 class NumericCategory(enum.Enum):
     """Categories of Representation Codes. Useful for deciding absent value.
     NOTE: Compound types are category NONE as they do not have a single absent value.
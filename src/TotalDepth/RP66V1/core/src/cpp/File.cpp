@@ -0,0 +1,273 @@
+//
+//  File.cpp
+//  TotalDepth
+//
+//  Native RP66V1 Visible Record and Logical Record Segment Header walker.
+//
+
+#include "File.h"
+
+#include <algorithm>
+#include <cerrno>
+#include <cstring>
+#include <sstream>
+
+namespace RP66V1 {
+
+    const size_t STORAGE_UNIT_LABEL_SIZE = 80;
+    const uint16_t VISIBLE_RECORD_VERSION = 0xff01;
+    const size_t VISIBLE_RECORD_HEADER_LENGTH = 4;
+    const size_t LRSH_HEAD_LENGTH = 4;
+    const size_t LOGICAL_RECORD_SEGMENT_MINIMUM_SIZE = 16;
+    const size_t VISIBLE_RECORD_MIN_LENGTH = LOGICAL_RECORD_SEGMENT_MINIMUM_SIZE + VISIBLE_RECORD_HEADER_LENGTH;
+    const size_t VISIBLE_RECORD_MAX_LENGTH = 0x4000;
+
+    int64_t LogicalRecordSegmentHeader::logical_data_length() const {
+        int64_t ret = static_cast<int64_t>(length) - static_cast<int64_t>(LRSH_HEAD_LENGTH);
+        if (has_checksum()) {
+            ret -= 2;
+        }
+        if (has_trailing_length()) {
+            ret -= 2;
+        }
+        return ret;
+    }
+
+    FileRead::FileRead(const std::string &path, size_t block_size) :
+        _path(path), _file(NULL), _block(block_size), _block_position(0), _block_length(0) {
+        _file = fopen(path.c_str(), "rb");
+        if (_file == NULL) {
+            std::ostringstream os;
+            os << "Can not open \"" << path << "\": " << strerror(errno);
+            throw ExceptionFileRead(os.str());
+        }
+    }
+
+    FileRead::~FileRead() {
+        close();
+    }
+
+    void FileRead::close() {
+        if (_file) {
+            fclose(_file);
+            _file = NULL;
+        }
+        _block_length = 0;
+    }
+
+    size_t FileRead::_read(uint64_t position, size_t count, uint8_t *dest) {
+        if (_file == NULL) {
+            throw ExceptionFileRead("File is closed.");
+        }
+        if (position >= _block_position && position + count <= _block_position + _block_length) {
+            // Fast path, all in the current block
+            memcpy(dest, _block.data() + (position - _block_position), count);
+            return count;
+        }
+        if (count > _block.size()) {
+            // Too big for the block so read directly.
+            if (fseeko(_file, static_cast<off_t>(position), SEEK_SET)) {
+                throw ExceptionFileRead("Can not seek.");
+            }
+            return fread(dest, 1, count, _file);
+        }
+        // Refill the block from the position.
+        if (fseeko(_file, static_cast<off_t>(position), SEEK_SET)) {
+            throw ExceptionFileRead("Can not seek.");
+        }
+        _block_position = position;
+        _block_length = fread(_block.data(), 1, _block.size(), _file);
+        size_t available = std::min(count, _block_length);
+        memcpy(dest, _block.data(), available);
+        return available;
+    }
+
+    bool FileRead::_read_visible_record(uint64_t position, VisibleRecord &vr) {
+        uint8_t by[VISIBLE_RECORD_HEADER_LENGTH];
+        if (_read(position, VISIBLE_RECORD_HEADER_LENGTH, by) != VISIBLE_RECORD_HEADER_LENGTH) {
+            return false;
+        }
+        vr.position = position;
+        vr.length = static_cast<uint16_t>(by[0] << 8 | by[1]);
+        vr.version = static_cast<uint16_t>(by[2] << 8 | by[3]);
+        std::ostringstream os;
+        if (vr.version != VISIBLE_RECORD_VERSION) {
+            os << "Visible Record at 0x" << std::hex << position << " has version 0x" << vr.version;
+            throw ExceptionFileRead(os.str());
+        }
+        if (vr.length < VISIBLE_RECORD_MIN_LENGTH || vr.length > VISIBLE_RECORD_MAX_LENGTH) {
+            os << "Visible Record at 0x" << std::hex << position << " has invalid length 0x" << vr.length;
+            throw ExceptionFileRead(os.str());
+        }
+        return true;
+    }
+
+    bool FileRead::_read_lrsh(uint64_t position, LogicalRecordSegmentHeader &lrsh) {
+        uint8_t by[LRSH_HEAD_LENGTH];
+        if (_read(position, LRSH_HEAD_LENGTH, by) != LRSH_HEAD_LENGTH) {
+            return false;
+        }
+        lrsh.position = position;
+        lrsh.length = static_cast<uint16_t>(by[0] << 8 | by[1]);
+        lrsh.attributes = by[2];
+        lrsh.record_type = by[3];
+        if (lrsh.length < LRSH_HEAD_LENGTH) {
+            // The Python implementation would not make progress.
+            std::ostringstream os;
+            os << "LRSH at 0x" << std::hex << position << " has invalid length 0x" << lrsh.length;
+            throw ExceptionFileRead(os.str());
+        }
+        return true;
+    }
+
+    void FileRead::_check_position(const VisibleRecord &vr, const LogicalRecordSegmentHeader &lrsh) const {
+        // Mirrors the checks made by pFile.LogicalRecordPosition
+        if (vr.position < STORAGE_UNIT_LABEL_SIZE
+            || lrsh.position < STORAGE_UNIT_LABEL_SIZE + VISIBLE_RECORD_HEADER_LENGTH
+            || lrsh.position + LOGICAL_RECORD_SEGMENT_MINIMUM_SIZE > vr.position + vr.length
+            || lrsh.length < LOGICAL_RECORD_SEGMENT_MINIMUM_SIZE
+            || lrsh.length > vr.length - VISIBLE_RECORD_HEADER_LENGTH
+            || vr.position + VISIBLE_RECORD_HEADER_LENGTH > lrsh.position) {
+            std::ostringstream os;
+            os << "Inconsistent Visible Record at 0x" << std::hex << vr.position << " and LRSH at 0x" << lrsh.position;
+            throw ExceptionFileRead(os.str());
+        }
+    }
+
+    void FileRead::_read_full_logical_data(const LogicalRecordSegmentHeader &lrsh, std::string &data) {
+        int64_t length = lrsh.logical_data_length();
+        if (length <= 0) {
+            std::ostringstream os;
+            os << "LRSH at 0x" << std::hex << lrsh.position << " has no logical data";
+            throw ExceptionFileRead(os.str());
+        }
+        data.resize(static_cast<size_t>(length));
+        uint8_t *dest = reinterpret_cast<uint8_t *>(&data[0]);
+        if (_read(lrsh.position + LRSH_HEAD_LENGTH, static_cast<size_t>(length), dest) != static_cast<size_t>(length)) {
+            std::ostringstream os;
+            os << "Premature EOF reading LRSH at 0x" << std::hex << lrsh.position;
+            throw ExceptionFileRead(os.str());
+        }
+        if (lrsh.must_strip_padding()) {
+            size_t pad_length = dest[length - 1];
+            if (pad_length > static_cast<size_t>(length)) {
+                std::ostringstream os;
+                os << "LRSH at 0x" << std::hex << lrsh.position << " pad length exceeds data length";
+                throw ExceptionFileRead(os.str());
+            }
+            // NOTE: A pad length of zero removes everything, this matches the Python implementation by[:-0]
+            if (pad_length == 0) {
+                data.clear();
+            } else {
+                data.resize(static_cast<size_t>(length) - pad_length);
+            }
+        }
+    }
+
+    std::vector<LRPosDesc> FileRead::logical_record_positions() {
+        std::vector<LRPosDesc> ret;
+        VisibleRecord vr;
+        VisibleRecord vr_first = {0, 0, 0};
+        LogicalRecordSegmentHeader lrsh;
+        LogicalRecordSegmentHeader lrsh_first = {0, 0, 0, 0};
+        bool previous_lrsh_is_last = true;
+        int64_t logical_data_length = 0;
+        uint64_t vr_position = STORAGE_UNIT_LABEL_SIZE;
+
+        while (_read_visible_record(vr_position, vr)) {
+            uint64_t lrsh_position = vr.position + VISIBLE_RECORD_HEADER_LENGTH;
+            while (_read_lrsh(lrsh_position, lrsh)) {
+                if (lrsh.is_first() && ! previous_lrsh_is_last) {
+                    std::ostringstream os;
+                    os << "Current LRSH is first but previous is not last @ 0x" << std::hex << lrsh.position;
+                    throw ExceptionFileRead(os.str());
+                }
+                if (previous_lrsh_is_last && ! lrsh.is_first()) {
+                    std::ostringstream os;
+                    os << "Previous LRSH is last but current is not first @ 0x" << std::hex << lrsh.position;
+                    throw ExceptionFileRead(os.str());
+                }
+                if (lrsh.is_first()) {
+                    vr_first = vr;
+                    lrsh_first = lrsh;
+                    logical_data_length = 0;
+                }
+                logical_data_length += lrsh.logical_data_length();
+                if (lrsh.is_last()) {
+                    _check_position(vr_first, lrsh_first);
+                    LRPosDesc pos_desc = {
+                        vr_first.position, lrsh_first.position,
+                        lrsh_first.attributes, lrsh_first.record_type,
+                        logical_data_length
+                    };
+                    ret.push_back(pos_desc);
+                    previous_lrsh_is_last = true;
+                } else {
+                    previous_lrsh_is_last = false;
+                }
+                uint64_t next_position = lrsh.next_position();
+                if (next_position == vr.next_position()) {
+                    break;
+                }
+                lrsh_position = next_position;
+            }
+            vr_position = vr.next_position();
+        }
+        return ret;
+    }
+
+    void FileRead::logical_data(uint64_t vr_position, uint64_t lrsh_position, int64_t offset, int64_t length,
+                                LogicalRecordSegmentHeader &lrsh_first, std::string &data) {
+        VisibleRecord vr;
+        LogicalRecordSegmentHeader lrsh;
+        if (offset < 0) {
+            throw ExceptionFileRead("Offset must be >= 0.");
+        }
+        if (! _read_visible_record(vr_position, vr)) {
+            throw ExceptionFileRead("Visible Record EOF.");
+        }
+        if (! _read_lrsh(lrsh_position, lrsh)) {
+            throw ExceptionFileRead("LogicalRecordSegmentHeader EOF.");
+        }
+        _check_position(vr, lrsh);
+        lrsh_first = lrsh;
+        const bool all_bytes = offset == 0 && length < 0;
+        int64_t bytes_read = 0;
+        int64_t logical_data_index = 0;
+        std::string by;
+        while (true) {
+            if (all_bytes || bytes_read != length) {
+                _read_full_logical_data(lrsh, by);
+                const int64_t by_length = static_cast<int64_t>(by.size());
+                if (all_bytes) {
+                    data += by;
+                } else {
+                    // Same semantics as the Python slice by[index_from:index_to]
+                    int64_t index_from = std::max(static_cast<int64_t>(0), offset - logical_data_index);
+                    int64_t index_to = length >= 0 ? index_from + length - bytes_read : by_length;
+                    index_from = std::min(index_from, by_length);
+                    index_to = std::min(index_to, by_length);
+                    if (index_to > index_from) {
+                        data.append(by, static_cast<size_t>(index_from), static_cast<size_t>(index_to - index_from));
+                        bytes_read += index_to - index_from;
+                    }
+                    logical_data_index += by_length;
+                }
+            }
+            if (lrsh.is_last()) {
+                break;
+            }
+            uint64_t next_position = lrsh.next_position();
+            if (next_position == vr.next_position()) {
+                if (! _read_visible_record(next_position, vr)) {
+                    throw ExceptionFileRead("Visible Record EOF.");
+                }
+                next_position = vr.position + VISIBLE_RECORD_HEADER_LENGTH;
+            }
+            if (! _read_lrsh(next_position, lrsh)) {
+                throw ExceptionFileRead("LogicalRecordSegmentHeader EOF.");
+            }
+        }
+    }
+
+} // namespace RP66V1
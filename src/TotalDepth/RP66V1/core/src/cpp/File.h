@@ -0,0 +1,111 @@
+//
+//  File.h
+//  TotalDepth
+//
+//  Native RP66V1 Visible Record and Logical Record Segment Header walker.
+//  This mirrors the semantics of TotalDepth.RP66V1.core.pFile.FileRead.iter_logical_record_positions() and
+//  TotalDepth.RP66V1.core.pFile.FileRead.get_file_logical_data().
+//
+//  Errors are reported by throwing ExceptionFileRead, the caller is expected to fall back to the Python
+//  implementation to get the precise Python exception.
+//
+
+#ifndef RP66V1File_h
+#define RP66V1File_h
+
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace RP66V1 {
+
+    /* See [RP66V1 Section 2.3.2 Storage Unit Label (SUL)]. */
+    extern const size_t STORAGE_UNIT_LABEL_SIZE;
+    /* See [RP66V1 Section 2.3.6]. */
+    extern const uint16_t VISIBLE_RECORD_VERSION;
+    extern const size_t VISIBLE_RECORD_HEADER_LENGTH;
+    extern const size_t VISIBLE_RECORD_MIN_LENGTH;
+    extern const size_t VISIBLE_RECORD_MAX_LENGTH;
+    /* See [RP66V1 Section 2.2.2.1]. */
+    extern const size_t LRSH_HEAD_LENGTH;
+    extern const size_t LOGICAL_RECORD_SEGMENT_MINIMUM_SIZE;
+
+    class ExceptionFileRead : public std::runtime_error {
+    public:
+        explicit ExceptionFileRead(const std::string &message) : std::runtime_error(message) {}
+    };
+
+    /* The position and description of a Logical Record, equivalent to pFile.LRPosDesc. */
+    struct LRPosDesc {
+        uint64_t vr_position;
+        uint64_t lrsh_position;
+        uint8_t attributes;
+        uint8_t record_type;
+        int64_t logical_data_length;
+    };
+
+    /* Logical Record Segment Header, see [RP66V1 Section 2.2.2.1]. */
+    struct LogicalRecordSegmentHeader {
+        uint64_t position;
+        uint16_t length;
+        uint8_t attributes;
+        uint8_t record_type;
+
+        bool is_eflr() const { return (attributes & 0x80) != 0; }
+        bool is_first() const { return (attributes & 0x40) == 0; }
+        bool is_last() const { return (attributes & 0x20) == 0; }
+        bool is_encrypted() const { return (attributes & 0x10) != 0; }
+        bool has_checksum() const { return (attributes & 0x04) != 0; }
+        bool has_trailing_length() const { return (attributes & 0x02) != 0; }
+        bool has_pad_bytes() const { return (attributes & 0x01) != 0; }
+        bool must_strip_padding() const { return has_pad_bytes() && ! is_encrypted(); }
+        uint64_t next_position() const { return position + length; }
+        int64_t logical_data_length() const;
+    };
+
+    /* Visible Record header, see [RP66V1 Section 2.3.6]. */
+    struct VisibleRecord {
+        uint64_t position;
+        uint16_t length;
+        uint16_t version;
+
+        uint64_t next_position() const { return position + length; }
+    };
+
+    /* Reads an RP66V1 file through a block buffer so that scanning the headers runs at disk speed. */
+    class FileRead {
+    public:
+        explicit FileRead(const std::string &path, size_t block_size = 1 << 20);
+        ~FileRead();
+        FileRead(const FileRead &rhs) = delete;
+        FileRead &operator=(const FileRead &rhs) = delete;
+
+        /* Equivalent of pFile.FileRead.iter_logical_record_positions(). */
+        std::vector<LRPosDesc> logical_record_positions();
+        /* Equivalent of pFile.FileRead.get_file_logical_data(), the logical data is appended to data. */
+        void logical_data(uint64_t vr_position, uint64_t lrsh_position, int64_t offset, int64_t length,
+                          LogicalRecordSegmentHeader &lrsh_first, std::string &data);
+        void close();
+        const std::string &path() const { return _path; }
+    protected:
+        /* Reads up to count bytes at the file position, returns the number read. */
+        size_t _read(uint64_t position, size_t count, uint8_t *dest);
+        /* Return true if a complete header was read, false on EOF. Throws on invalid data. */
+        bool _read_visible_record(uint64_t position, VisibleRecord &vr);
+        bool _read_lrsh(uint64_t position, LogicalRecordSegmentHeader &lrsh);
+        void _check_position(const VisibleRecord &vr, const LogicalRecordSegmentHeader &lrsh) const;
+        void _read_full_logical_data(const LogicalRecordSegmentHeader &lrsh, std::string &data);
+    private:
+        std::string _path;
+        FILE *_file;
+        std::vector<uint8_t> _block;
+        uint64_t _block_position;
+        size_t _block_length;
+    };
+
+} // namespace RP66V1
+
+#endif /* RP66V1File_h */
@@ -0,0 +1,160 @@
+//
+//  RepCode.cpp
+//  TotalDepth
+//
+//  Native RP66V1 Representation Code decoders, see RepCode.h
+//
+
+#include "RepCode.h"
+
+#include <cmath>
+#include <cstring>
+
+namespace RP66V1 {
+
+    const uint8_t *Reader::chunk(size_t length) {
+        if (length > remain()) {
+            throw ExceptionRepCodeIndex(
+                "Chunk length " + std::to_string(length) + " is out of range where remain is "
+                + std::to_string(remain()) + " of length " + std::to_string(_length)
+            );
+        }
+        const uint8_t *ret = _data + _index;
+        _index += length;
+        return ret;
+    }
+
+    static uint32_t _big_endian_32(const uint8_t *p) {
+        return (static_cast<uint32_t>(p[0]) << 24) | (static_cast<uint32_t>(p[1]) << 16)
+            | (static_cast<uint32_t>(p[2]) << 8) | static_cast<uint32_t>(p[3]);
+    }
+
+    double FSINGL(Reader &reader) {
+        uint32_t word = _big_endian_32(reader.chunk(4));
+        float value;
+        static_assert(sizeof(value) == sizeof(word), "float must be 32 bits");
+        std::memcpy(&value, &word, sizeof(value));
+        return value;
+    }
+
+    double ISINGL(Reader &reader) {
+        /* IBM 360 single precision, see pRepCode.ISINGL(). */
+        const uint8_t *b = reader.chunk(4);
+        int exponent = b[0] & 0x7f;
+        uint32_t mantissa = (static_cast<uint32_t>(b[1]) << 16) | (static_cast<uint32_t>(b[2]) << 8) | b[3];
+        double ret = std::ldexp(static_cast<double>(mantissa), 4 * (exponent - 64) - 24);
+        if (b[0] & 0x80) {
+            return -ret;
+        }
+        return ret;
+    }
+
+    double VSINGL(Reader &reader) {
+        /* VAX single precision, see pRepCode.VSINGL(). */
+        const uint8_t *b = reader.chunk(4);
+        int sign = b[1] & 0x80;
+        uint32_t mantissa = (static_cast<uint32_t>(b[0] & 0x7f) << 16) | (static_cast<uint32_t>(b[3]) << 8) | b[2];
+        int exponent = ((b[1] & 0x7f) << 1) | ((b[0] & 0x80) >> 7);
+        if (exponent == 0 && sign == 0) {
+            return 0.0;
+        }
+        double value = std::ldexp(0.5 + std::ldexp(static_cast<double>(mantissa), -23), exponent - 128);
+        if (sign) {
+            return -value;
+        }
+        return value;
+    }
+
+    double FDOUBL(Reader &reader) {
+        const uint8_t *b = reader.chunk(8);
+        uint64_t word = (static_cast<uint64_t>(_big_endian_32(b)) << 32) | _big_endian_32(b + 4);
+        double value;
+        static_assert(sizeof(value) == sizeof(word), "double must be 64 bits");
+        std::memcpy(&value, &word, sizeof(value));
+        return value;
+    }
+
+    int SSHORT(Reader &reader) {
+        return static_cast<int8_t>(reader.read());
+    }
+
+    int SNORM(Reader &reader) {
+        const uint8_t *b = reader.chunk(2);
+        return static_cast<int16_t>((b[0] << 8) | b[1]);
+    }
+
+    long SLONG(Reader &reader) {
+        return static_cast<int32_t>(_big_endian_32(reader.chunk(4)));
+    }
+
+    unsigned int USHORT(Reader &reader) {
+        return reader.read();
+    }
+
+    unsigned int UNORM(Reader &reader) {
+        const uint8_t *b = reader.chunk(2);
+        return (b[0] << 8) | b[1];
+    }
+
+    unsigned long ULONG(Reader &reader) {
+        return _big_endian_32(reader.chunk(4));
+    }
+
+    uint32_t UVARI(Reader &reader) {
+        uint32_t value = reader.read();
+        if ((value & 0xc0) == 0x80) {
+            // Two bytes
+            value = ((value & 0x7f) << 8) | reader.read();
+        } else if ((value & 0xc0) == 0xc0) {
+            // Four bytes
+            const uint8_t *b = reader.chunk(3);
+            value = ((value & 0x3f) << 24) | (static_cast<uint32_t>(b[0]) << 16)
+                | (static_cast<uint32_t>(b[1]) << 8) | b[2];
+        }
+        return value;
+    }
+
+    StringRef IDENT(Reader &reader) {
+        size_t length = reader.read();
+        return StringRef{reader.chunk(length), length};
+    }
+
+    StringRef ASCII(Reader &reader) {
+        size_t length = UVARI(reader);
+        return StringRef{reader.chunk(length), length};
+    }
+
+    DateTime DTIME(Reader &reader) {
+        const uint8_t *b = reader.chunk(8);
+        DateTime ret;
+        ret.year = b[0] + 1900;
+        ret.tz = (b[1] >> 4) & 0xf;
+        ret.month = b[1] & 0xf;
+        ret.day = b[2];
+        ret.hour = b[3];
+        ret.minute = b[4];
+        ret.second = b[5];
+        ret.millisecond = (b[6] << 8) | b[7];
+        return ret;
+    }
+
+    ObjectName OBNAME(Reader &reader) {
+        ObjectName ret;
+        ret.origin = UVARI(reader);
+        ret.copy = reader.read();
+        ret.identifier = IDENT(reader);
+        return ret;
+    }
+
+    bool units_allowable(const StringRef &units) {
+        for (size_t i = 0; i < units.length; ++i) {
+            uint8_t c = units.data[i];
+            if (! ((c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z') || (c >= '0' && c <= '9') || c == ' '
+                   || c == '-' || c == '.' || c == '/' || c == '(' || c == ')' || c == '%')) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+} // namespace RP66V1
@@ -0,0 +1,94 @@
+//
+//  RepCode.h
+//  TotalDepth
+//
+//  Native RP66V1 Representation Code decoders, see [RP66V1 Appendix B].
+//  This mirrors the semantics of TotalDepth.RP66V1.core.pRepCode.
+//
+//  Data is read from a Reader that references an existing buffer, the caller owns the buffer.
+//  Reading past the end of the data throws ExceptionRepCodeIndex.
+//
+
+#ifndef RP66V1RepCode_h
+#define RP66V1RepCode_h
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+
+namespace RP66V1 {
+
+    class ExceptionRepCodeIndex : public std::out_of_range {
+    public:
+        explicit ExceptionRepCodeIndex(const std::string &message) : std::out_of_range(message) {}
+    };
+
+    /* Reads successive bytes from a buffer, equivalent to pFile.LogicalData. */
+    class Reader {
+    public:
+        Reader(const uint8_t *data, size_t length, size_t index) : _data(data), _length(length), _index(index) {}
+        size_t index() const { return _index; }
+        size_t remain() const { return _index < _length ? _length - _index : 0; }
+        /* Returns the next byte and increments the index. */
+        uint8_t read() {
+            if (_index >= _length) {
+                throw ExceptionRepCodeIndex("index out of range");
+            }
+            return _data[_index++];
+        }
+        /* Returns a pointer to the next length bytes and increments the index. */
+        const uint8_t *chunk(size_t length);
+    private:
+        const uint8_t *_data;
+        size_t _length;
+        size_t _index;
+    };
+
+    /* A string, such as an IDENT, ASCII or UNITS, that references the Reader's buffer. */
+    struct StringRef {
+        const uint8_t *data;
+        size_t length;
+    };
+
+    /* Representation code 21, see [RP66V1 Appendix B Section B.21]. */
+    struct DateTime {
+        int year;
+        int tz;
+        int month;
+        int day;
+        int hour;
+        int minute;
+        int second;
+        int millisecond;
+    };
+
+    /* Representation code 23, see [RP66V1 Appendix B Section B.23]. */
+    struct ObjectName {
+        uint32_t origin;
+        uint8_t copy;
+        StringRef identifier;
+    };
+
+    double FSINGL(Reader &reader);
+    double ISINGL(Reader &reader);
+    double VSINGL(Reader &reader);
+    double FDOUBL(Reader &reader);
+    int SSHORT(Reader &reader);
+    int SNORM(Reader &reader);
+    long SLONG(Reader &reader);
+    unsigned int USHORT(Reader &reader);
+    unsigned int UNORM(Reader &reader);
+    unsigned long ULONG(Reader &reader);
+    uint32_t UVARI(Reader &reader);
+    StringRef IDENT(Reader &reader);
+    StringRef ASCII(Reader &reader);
+    DateTime DTIME(Reader &reader);
+    ObjectName OBNAME(Reader &reader);
+
+    /* Returns true if all the characters are allowed in UNITS, see pRepCode.UNITS_ALLOWABLE_CHARACTERS. */
+    bool units_allowable(const StringRef &units);
+
+} // namespace RP66V1
+
+#endif /* RP66V1RepCode_h */
@@ -0,0 +1,265 @@
+//
+//  cFile.cpp
+//  TotalDepth
+//
+//  CPython interface to the native RP66V1 file reader in File.cpp
+//
+//  This provides the type NativeFileRead that has the methods:
+//
+//  logical_record_positions() -> [(vr_position, lrsh_position, attributes, record_type, logical_data_length), ...]
+//  logical_data(vr_position, lrsh_position, offset=0, length=-1) -> (attributes, record_type, bytes)
+//  close()
+//
+//  On any error ExceptionNativeFileRead is raised, TotalDepth.RP66V1.core.pFile then falls back to the Python
+//  implementation. The exception is running out of memory which raises MemoryError.
+//
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+
+#include <exception>
+#include <new>
+#include <string>
+#include <vector>
+
+#include "File.h"
+
+static PyObject *ExceptionNativeFileRead = NULL;
+
+typedef struct {
+    PyObject_HEAD
+    RP66V1::FileRead *p_file_read;
+} NativeFileRead;
+
+static void
+NativeFileRead_dealloc(NativeFileRead *self) {
+    delete self->p_file_read;
+    self->p_file_read = NULL;
+    Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+static PyObject *
+NativeFileRead_new(PyTypeObject *type, PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds)) {
+    NativeFileRead *self = (NativeFileRead *) type->tp_alloc(type, 0);
+    if (self != NULL) {
+        self->p_file_read = NULL;
+    }
+    return (PyObject *) self;
+}
+
+static int
+NativeFileRead_init(NativeFileRead *self, PyObject *args, PyObject *kwds) {
+    static const char *kwlist[] = {"path", NULL};
+    PyObject *path_bytes = NULL;
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "O&", const_cast<char **>(kwlist),
+                                      PyUnicode_FSConverter, &path_bytes)) {
+        return -1;
+    }
+    std::string path(PyBytes_AS_STRING(path_bytes), PyBytes_GET_SIZE(path_bytes));
+    Py_DECREF(path_bytes);
+    delete self->p_file_read;
+    self->p_file_read = NULL;
+    try {
+        self->p_file_read = new RP66V1::FileRead(path);
+    } catch (const RP66V1::ExceptionFileRead &err) {
+        PyErr_SetString(ExceptionNativeFileRead, err.what());
+        return -1;
+    } catch (const std::bad_alloc &) {
+        PyErr_NoMemory();
+        return -1;
+    } catch (const std::exception &err) {
+        PyErr_SetString(ExceptionNativeFileRead, err.what());
+        return -1;
+    }
+    return 0;
+}
+
+static bool
+_check_open(NativeFileRead *self) {
+    if (self->p_file_read == NULL) {
+        PyErr_SetString(ExceptionNativeFileRead, "NativeFileRead is not initialised or is closed.");
+        return false;
+    }
+    return true;
+}
+
+static PyObject *
+NativeFileRead_logical_record_positions(NativeFileRead *self, PyObject *Py_UNUSED(ignored)) {
+    std::vector<RP66V1::LRPosDesc> positions;
+    std::string error_message;
+    /* The Python exception type to raise, this is set without the GIL and raised with it. */
+    PyObject *error_type = NULL;
+    PyObject *ret = NULL;
+
+    if (! _check_open(self)) {
+        return NULL;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    try {
+        positions = self->p_file_read->logical_record_positions();
+    } catch (const RP66V1::ExceptionFileRead &err) {
+        error_message = err.what();
+        error_type = ExceptionNativeFileRead;
+    } catch (const std::bad_alloc &) {
+        error_type = PyExc_MemoryError;
+    } catch (const std::exception &err) {
+        error_message = err.what();
+        error_type = ExceptionNativeFileRead;
+    }
+    Py_END_ALLOW_THREADS
+    if (error_type == PyExc_MemoryError) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    if (error_type != NULL) {
+        PyErr_SetString(error_type, error_message.c_str());
+        return NULL;
+    }
+    ret = PyList_New(static_cast<Py_ssize_t>(positions.size()));
+    if (ret == NULL) {
+        return NULL;
+    }
+    for (size_t i = 0; i < positions.size(); ++i) {
+        const RP66V1::LRPosDesc &pos_desc = positions[i];
+        PyObject *item = Py_BuildValue(
+            "KKiiL",
+            static_cast<unsigned long long>(pos_desc.vr_position),
+            static_cast<unsigned long long>(pos_desc.lrsh_position),
+            static_cast<int>(pos_desc.attributes),
+            static_cast<int>(pos_desc.record_type),
+            static_cast<long long>(pos_desc.logical_data_length)
+        );
+        if (item == NULL) {
+            Py_DECREF(ret);
+            return NULL;
+        }
+        /* Steals reference. */
+        PyList_SET_ITEM(ret, static_cast<Py_ssize_t>(i), item);
+    }
+    return ret;
+}
+
+static PyObject *
+NativeFileRead_logical_data(NativeFileRead *self, PyObject *args, PyObject *kwds) {
+    static const char *kwlist[] = {"vr_position", "lrsh_position", "offset", "length", NULL};
+    unsigned long long vr_position = 0;
+    unsigned long long lrsh_position = 0;
+    long long offset = 0;
+    long long length = -1;
+    RP66V1::LogicalRecordSegmentHeader lrsh_first;
+    std::string data;
+    std::string error_message;
+    /* The Python exception type to raise, this is set without the GIL and raised with it. */
+    PyObject *error_type = NULL;
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "KK|LL", const_cast<char **>(kwlist),
+                                      &vr_position, &lrsh_position, &offset, &length)) {
+        return NULL;
+    }
+    if (! _check_open(self)) {
+        return NULL;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    try {
+        self->p_file_read->logical_data(vr_position, lrsh_position, offset, length, lrsh_first, data);
+    } catch (const RP66V1::ExceptionFileRead &err) {
+        error_message = err.what();
+        error_type = ExceptionNativeFileRead;
+    } catch (const std::bad_alloc &) {
+        error_type = PyExc_MemoryError;
+    } catch (const std::exception &err) {
+        error_message = err.what();
+        error_type = ExceptionNativeFileRead;
+    }
+    Py_END_ALLOW_THREADS
+    if (error_type == PyExc_MemoryError) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    if (error_type != NULL) {
+        PyErr_SetString(error_type, error_message.c_str());
+        return NULL;
+    }
+    return Py_BuildValue(
+        "iiy#",
+        static_cast<int>(lrsh_first.attributes),
+        static_cast<int>(lrsh_first.record_type),
+        data.data(),
+        static_cast<Py_ssize_t>(data.size())
+    );
+}
+
+static PyObject *
+NativeFileRead_close(NativeFileRead *self, PyObject *Py_UNUSED(ignored)) {
+    if (self->p_file_read) {
+        self->p_file_read->close();
+    }
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef NativeFileRead_methods[] = {
+    {"logical_record_positions", (PyCFunction) NativeFileRead_logical_record_positions, METH_NOARGS,
+        "Scans the file and returns a list of tuples:"
+        " (vr_position, lrsh_position, attributes, record_type, logical_data_length)."
+        " This has the semantics of FileRead.iter_logical_record_positions()."
+    },
+    {"logical_data", (PyCFunction) NativeFileRead_logical_data, METH_VARARGS | METH_KEYWORDS,
+        "logical_data(vr_position, lrsh_position, offset=0, length=-1) -> (attributes, record_type, bytes)."
+        " This has the semantics of FileRead.get_file_logical_data()."
+    },
+    {"close", (PyCFunction) NativeFileRead_close, METH_NOARGS,
+        "Close the file."
+    },
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+static PyTypeObject NativeFileReadType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+};
+
+static PyModuleDef cFilemodule = {
+    PyModuleDef_HEAD_INIT,
+    "cFile",
+    "CPython extension that reads RP66V1 Visible Records and Logical Record Segment Headers.",
+    -1,     /* m_size - support for sub-interpreters. */
+    NULL,
+    NULL, /* m_slots - An array of slot definitions for multi-phase initialization. */
+    NULL, /* m_traverse - A traversal function to call during GC traversal of the module object. */
+    NULL, /* m_clear - A clear function to call during GC clearing of the module object. */
+    NULL  /* m_free - A function to call during deallocation of the module object. */
+};
+
+PyMODINIT_FUNC
+PyInit_cFile(void)
+{
+    NativeFileReadType.tp_name = "cFile.NativeFileRead";
+    NativeFileReadType.tp_doc = "Native RP66V1 file reader.";
+    NativeFileReadType.tp_basicsize = sizeof(NativeFileRead);
+    NativeFileReadType.tp_itemsize = 0;
+    NativeFileReadType.tp_flags = Py_TPFLAGS_DEFAULT;
+    NativeFileReadType.tp_new = NativeFileRead_new;
+    NativeFileReadType.tp_init = (initproc) NativeFileRead_init;
+    NativeFileReadType.tp_dealloc = (destructor) NativeFileRead_dealloc;
+    NativeFileReadType.tp_methods = NativeFileRead_methods;
+    if (PyType_Ready(&NativeFileReadType) < 0) {
+        return NULL;
+    }
+    PyObject *m = PyModule_Create(&cFilemodule);
+    if (m == NULL) {
+        return NULL;
+    }
+    ExceptionNativeFileRead = PyErr_NewException("cFile.ExceptionNativeFileRead", NULL, NULL);
+    Py_XINCREF(ExceptionNativeFileRead);
+    if (PyModule_AddObject(m, "ExceptionNativeFileRead", ExceptionNativeFileRead) < 0) {
+        Py_XDECREF(ExceptionNativeFileRead);
+        Py_CLEAR(ExceptionNativeFileRead);
+        Py_DECREF(m);
+        return NULL;
+    }
+    Py_INCREF(&NativeFileReadType);
+    if (PyModule_AddObject(m, "NativeFileRead", (PyObject *) &NativeFileReadType) < 0) {
+        Py_DECREF(&NativeFileReadType);
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
+}
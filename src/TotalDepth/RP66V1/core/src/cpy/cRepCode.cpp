@@ -0,0 +1,502 @@
+//
+//  cRepCode.cpp
+//  TotalDepth
+//
+//  CPython interface to the native RP66V1 Representation Code decoders in RepCode.cpp
+//
+//  Each function takes a TotalDepth.RP66V1.core.File.LogicalData and has the same signature, result and effect on
+//  LogicalData.index as the function of the same name in TotalDepth.RP66V1.core.pRepCode. The data is decoded directly
+//  from the buffer of LogicalData.bytes without creating intermediate bytes objects.
+//
+//  The additional function code_read_list(rep_code, ld, count) is the equivalent of
+//  [code_read(rep_code, ld) for _i in range(count)] and code_skip_list(rep_code, ld, count) skips over those values.
+//
+//  Reading beyond the end of the data raises an IndexError and LogicalData.index is unchanged.
+//
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+
+#include <string>
+
+#include "RepCode.h"
+
+/* Objects from TotalDepth.RP66V1.core.pRepCode */
+static PyObject *ExceptionRepCode = NULL;
+static PyObject *ObjectName = NULL;
+static PyObject *ObjectReference = NULL;
+static PyObject *DateTime = NULL;
+static PyObject *check_units = NULL;
+/* Interned attribute names */
+static PyObject *str_bytes = NULL;
+static PyObject *str_index = NULL;
+
+/* Gives access to the buffer and index of a LogicalData. */
+class LogicalDataBuffer {
+public:
+    LogicalDataBuffer() : _ld(NULL), _buffer({NULL, NULL}), _index(0) {}
+    ~LogicalDataBuffer() {
+        if (_buffer.obj) {
+            PyBuffer_Release(&_buffer);
+        }
+    }
+    /* Returns false and sets a Python exception on failure. */
+    bool acquire(PyObject *ld) {
+        _ld = ld;
+        PyObject *by = PyObject_GetAttr(ld, str_bytes);
+        if (by == NULL) {
+            return false;
+        }
+        int result = PyObject_GetBuffer(by, &_buffer, PyBUF_SIMPLE);
+        Py_DECREF(by);
+        if (result) {
+            return false;
+        }
+        PyObject *index = PyObject_GetAttr(ld, str_index);
+        if (index == NULL) {
+            return false;
+        }
+        _index = PyLong_AsSsize_t(index);
+        Py_DECREF(index);
+        if (_index == -1 && PyErr_Occurred()) {
+            return false;
+        }
+        if (_index < 0) {
+            PyErr_Format(PyExc_IndexError, "LogicalData index %zd is negative", _index);
+            return false;
+        }
+        return true;
+    }
+    RP66V1::Reader reader() const {
+        return RP66V1::Reader(static_cast<const uint8_t *>(_buffer.buf), static_cast<size_t>(_buffer.len),
+                              static_cast<size_t>(_index));
+    }
+    /* Sets the LogicalData index. Returns false and sets a Python exception on failure. */
+    bool set_index(const RP66V1::Reader &reader) {
+        PyObject *index = PyLong_FromSize_t(reader.index());
+        if (index == NULL) {
+            return false;
+        }
+        int result = PyObject_SetAttr(_ld, str_index, index);
+        Py_DECREF(index);
+        return result == 0;
+    }
+private:
+    PyObject *_ld;
+    Py_buffer _buffer;
+    Py_ssize_t _index;
+};
+
+static PyObject *
+_string_ref_as_bytes(const RP66V1::StringRef &string_ref) {
+    return PyBytes_FromStringAndSize(reinterpret_cast<const char *>(string_ref.data),
+                                     static_cast<Py_ssize_t>(string_ref.length));
+}
+
+static PyObject *
+_object_name(const RP66V1::ObjectName &object_name) {
+    PyObject *identifier = _string_ref_as_bytes(object_name.identifier);
+    if (identifier == NULL) {
+        return NULL;
+    }
+    PyObject *ret = PyObject_CallFunction(ObjectName, "kiN", static_cast<unsigned long>(object_name.origin),
+                                          static_cast<int>(object_name.copy), identifier);
+    return ret;
+}
+
+static PyObject *
+_date_time(const RP66V1::DateTime &date_time) {
+    /* pRepCode.DateTime reads a LogicalData in __init__ so create it without calling that and set the attributes. */
+    PyObject *ret = PyObject_CallMethod(DateTime, "__new__", "O", DateTime);
+    if (ret == NULL) {
+        return NULL;
+    }
+    const struct {
+        const char *name;
+        int value;
+    } attributes[] = {
+        {"year", date_time.year},
+        {"tz", date_time.tz},
+        {"month", date_time.month},
+        {"day", date_time.day},
+        {"hour", date_time.hour},
+        {"minute", date_time.minute},
+        {"second", date_time.second},
+        {"millisecond", date_time.millisecond},
+    };
+    for (const auto &attribute: attributes) {
+        PyObject *value = PyLong_FromLong(attribute.value);
+        if (value == NULL || PyObject_SetAttrString(ret, attribute.name, value)) {
+            Py_XDECREF(value);
+            Py_DECREF(ret);
+            return NULL;
+        }
+        Py_DECREF(value);
+    }
+    return ret;
+}
+
+static PyObject *
+_units(const RP66V1::StringRef &units) {
+    PyObject *ret = _string_ref_as_bytes(units);
+    if (ret != NULL && ! RP66V1::units_allowable(units)) {
+        /* Let the Python implementation report the disallowed characters. */
+        PyObject *result = PyObject_CallFunctionObjArgs(check_units, ret, NULL);
+        if (result == NULL) {
+            Py_DECREF(ret);
+            return NULL;
+        }
+        Py_DECREF(result);
+    }
+    return ret;
+}
+
+/* Reads a value of the Representation Code as a new reference or NULL with an exception set.
+ * Can throw RP66V1::ExceptionRepCodeIndex. */
+static PyObject *
+_code_read(int rep_code, RP66V1::Reader &reader) {
+    switch (rep_code) {
+        case 2:
+            return PyFloat_FromDouble(RP66V1::FSINGL(reader));
+        case 5:
+            return PyFloat_FromDouble(RP66V1::ISINGL(reader));
+        case 6:
+            return PyFloat_FromDouble(RP66V1::VSINGL(reader));
+        case 7:
+            return PyFloat_FromDouble(RP66V1::FDOUBL(reader));
+        case 12:
+            return PyLong_FromLong(RP66V1::SSHORT(reader));
+        case 13:
+            return PyLong_FromLong(RP66V1::SNORM(reader));
+        case 14:
+            return PyLong_FromLong(RP66V1::SLONG(reader));
+        case 15:
+        case 26:
+            // USHORT and STATUS
+            return PyLong_FromUnsignedLong(RP66V1::USHORT(reader));
+        case 16:
+            return PyLong_FromUnsignedLong(RP66V1::UNORM(reader));
+        case 17:
+            return PyLong_FromUnsignedLong(RP66V1::ULONG(reader));
+        case 18:
+        case 22:
+            // UVARI and ORIGIN
+            return PyLong_FromUnsignedLong(RP66V1::UVARI(reader));
+        case 19:
+            return _string_ref_as_bytes(RP66V1::IDENT(reader));
+        case 20:
+            return _string_ref_as_bytes(RP66V1::ASCII(reader));
+        case 21:
+            return _date_time(RP66V1::DTIME(reader));
+        case 23:
+            return _object_name(RP66V1::OBNAME(reader));
+        case 24: {
+            PyObject *object_type = _string_ref_as_bytes(RP66V1::IDENT(reader));
+            if (object_type == NULL) {
+                return NULL;
+            }
+            PyObject *object_name = NULL;
+            try {
+                object_name = _object_name(RP66V1::OBNAME(reader));
+            } catch (const RP66V1::ExceptionRepCodeIndex &err) {
+                Py_DECREF(object_type);
+                throw;
+            }
+            if (object_name == NULL) {
+                Py_DECREF(object_type);
+                return NULL;
+            }
+            return PyObject_CallFunction(ObjectReference, "NN", object_type, object_name);
+        }
+        case 27:
+            return _units(RP66V1::IDENT(reader));
+        default:
+            PyErr_Format(ExceptionRepCode, "Unsupported Representation code %d", rep_code);
+            return NULL;
+    }
+}
+
+/* Reads count values of the Representation Code from the LogicalData.
+ * If as_list is false then count must be 1 and the value is returned rather than a list. */
+static PyObject *
+_read(int rep_code, PyObject *ld, Py_ssize_t count, bool as_list) {
+    LogicalDataBuffer buffer;
+    PyObject *ret = NULL;
+
+    if (! buffer.acquire(ld)) {
+        return NULL;
+    }
+    RP66V1::Reader reader = buffer.reader();
+    try {
+        if (as_list) {
+            ret = PyList_New(count);
+            if (ret == NULL) {
+                return NULL;
+            }
+            for (Py_ssize_t i = 0; i < count; ++i) {
+                PyObject *value = _code_read(rep_code, reader);
+                if (value == NULL) {
+                    Py_DECREF(ret);
+                    return NULL;
+                }
+                /* Steals reference. */
+                PyList_SET_ITEM(ret, i, value);
+            }
+        } else {
+            ret = _code_read(rep_code, reader);
+            if (ret == NULL) {
+                return NULL;
+            }
+        }
+    } catch (const RP66V1::ExceptionRepCodeIndex &err) {
+        Py_XDECREF(ret);
+        PyErr_SetString(PyExc_IndexError, err.what());
+        return NULL;
+    }
+    if (! buffer.set_index(reader)) {
+        Py_DECREF(ret);
+        return NULL;
+    }
+    return ret;
+}
+
+/* Returns the size of a fixed length Representation Code or 0 if it is variable length. */
+static size_t
+_fixed_length(int rep_code) {
+    switch (rep_code) {
+        case 12: case 15: case 26:
+            return 1;
+        case 13: case 16:
+            return 2;
+        case 2: case 5: case 6: case 14: case 17:
+            return 4;
+        case 7: case 21:
+            return 8;
+        default:
+            return 0;
+    }
+}
+
+/* Skips count values of the Representation Code without creating any Python objects.
+ * Can throw RP66V1::ExceptionRepCodeIndex. */
+static void
+_code_skip(int rep_code, RP66V1::Reader &reader, size_t count) {
+    size_t length = _fixed_length(rep_code);
+    if (length) {
+        if (count > reader.remain() / length) {
+            throw RP66V1::ExceptionRepCodeIndex("index out of range");
+        }
+        reader.chunk(length * count);
+        return;
+    }
+    for (size_t i = 0; i < count; ++i) {
+        switch (rep_code) {
+            case 18:
+            case 22:
+                RP66V1::UVARI(reader);
+                break;
+            case 19:
+            case 27:
+                RP66V1::IDENT(reader);
+                break;
+            case 20:
+                RP66V1::ASCII(reader);
+                break;
+            case 23:
+                RP66V1::OBNAME(reader);
+                break;
+            case 24:
+                RP66V1::IDENT(reader);
+                RP66V1::OBNAME(reader);
+                break;
+            default:
+                // Excluded by _rep_code_supported().
+                break;
+        }
+    }
+}
+
+#define REP_CODE_FUNCTION(name, rep_code) \
+static PyObject * \
+name(PyObject *Py_UNUSED(module), PyObject *ld) { \
+    return _read(rep_code, ld, 1, false); \
+}
+
+REP_CODE_FUNCTION(FSINGL, 2)
+REP_CODE_FUNCTION(ISINGL, 5)
+REP_CODE_FUNCTION(VSINGL, 6)
+REP_CODE_FUNCTION(FDOUBL, 7)
+REP_CODE_FUNCTION(SSHORT, 12)
+REP_CODE_FUNCTION(SNORM, 13)
+REP_CODE_FUNCTION(SLONG, 14)
+REP_CODE_FUNCTION(USHORT, 15)
+REP_CODE_FUNCTION(UNORM, 16)
+REP_CODE_FUNCTION(ULONG, 17)
+REP_CODE_FUNCTION(UVARI, 18)
+REP_CODE_FUNCTION(IDENT, 19)
+REP_CODE_FUNCTION(ASCII, 20)
+REP_CODE_FUNCTION(DTIME, 21)
+REP_CODE_FUNCTION(ORIGIN, 22)
+REP_CODE_FUNCTION(OBNAME, 23)
+REP_CODE_FUNCTION(OBJREF, 24)
+REP_CODE_FUNCTION(STATUS, 26)
+REP_CODE_FUNCTION(UNITS, 27)
+
+/* Returns true if the Representation Code is supported by _code_read(), this matches pRepCode.REP_CODE_MAP. */
+static bool
+_rep_code_supported(long rep_code) {
+    switch (rep_code) {
+        case 2: case 5: case 6: case 7:
+        case 12: case 13: case 14: case 15: case 16: case 17: case 18: case 19:
+        case 20: case 21: case 22: case 23: case 24: case 26: case 27:
+            return true;
+        default:
+            return false;
+    }
+}
+
+/* Converts the rep_code argument to an int, anything else is an unsupported Representation Code.
+ * Returns false and sets a Python exception on failure. */
+static bool
+_rep_code_as_int(PyObject *rep_code_object, int *rep_code) {
+    if (PyLong_Check(rep_code_object)) {
+        long value = PyLong_AsLong(rep_code_object);
+        if (! PyErr_Occurred() && _rep_code_supported(value)) {
+            *rep_code = static_cast<int>(value);
+            return true;
+        }
+        PyErr_Clear();
+    }
+    PyErr_Format(ExceptionRepCode, "Unsupported Representation code %S", rep_code_object);
+    return false;
+}
+
+static PyObject *
+code_read(PyObject *Py_UNUSED(module), PyObject *args) {
+    PyObject *rep_code_object;
+    PyObject *ld;
+    int rep_code;
+    if (! PyArg_ParseTuple(args, "OO", &rep_code_object, &ld)) {
+        return NULL;
+    }
+    if (! _rep_code_as_int(rep_code_object, &rep_code)) {
+        return NULL;
+    }
+    return _read(rep_code, ld, 1, false);
+}
+
+static PyObject *
+code_read_list(PyObject *Py_UNUSED(module), PyObject *args) {
+    PyObject *rep_code_object;
+    PyObject *ld;
+    Py_ssize_t count;
+    int rep_code;
+    if (! PyArg_ParseTuple(args, "OOn", &rep_code_object, &ld, &count)) {
+        return NULL;
+    }
+    if (count <= 0) {
+        return PyList_New(0);
+    }
+    if (! _rep_code_as_int(rep_code_object, &rep_code)) {
+        return NULL;
+    }
+    return _read(rep_code, ld, count, true);
+}
+
+static PyObject *
+code_skip_list(PyObject *Py_UNUSED(module), PyObject *args) {
+    PyObject *rep_code_object;
+    PyObject *ld;
+    Py_ssize_t count;
+    int rep_code;
+    if (! PyArg_ParseTuple(args, "OOn", &rep_code_object, &ld, &count)) {
+        return NULL;
+    }
+    if (count <= 0) {
+        Py_RETURN_NONE;
+    }
+    if (! _rep_code_as_int(rep_code_object, &rep_code)) {
+        return NULL;
+    }
+    LogicalDataBuffer buffer;
+    if (! buffer.acquire(ld)) {
+        return NULL;
+    }
+    RP66V1::Reader reader = buffer.reader();
+    try {
+        _code_skip(rep_code, reader, static_cast<size_t>(count));
+    } catch (const RP66V1::ExceptionRepCodeIndex &err) {
+        PyErr_SetString(PyExc_IndexError, err.what());
+        return NULL;
+    }
+    if (! buffer.set_index(reader)) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+#define REP_CODE_METHOD(name, doc) {#name, (PyCFunction)name, METH_O, doc}
+
+static PyMethodDef cRepCode_methods[] = {
+    REP_CODE_METHOD(FSINGL, "Representation code 2, IEEE single precision floating point."),
+    REP_CODE_METHOD(ISINGL, "Representation code 5, IBM 360 single precision floating point."),
+    REP_CODE_METHOD(VSINGL, "Representation code 6, VAX single precision floating point."),
+    REP_CODE_METHOD(FDOUBL, "Representation code 7, IEEE double precision floating point."),
+    REP_CODE_METHOD(SSHORT, "Representation code 12, Signed 1-byte integer."),
+    REP_CODE_METHOD(SNORM, "Representation code 13, Signed 2-byte integer."),
+    REP_CODE_METHOD(SLONG, "Representation code 14, Signed 4-byte integer."),
+    REP_CODE_METHOD(USHORT, "Representation code 15, Unsigned 1-byte integer."),
+    REP_CODE_METHOD(UNORM, "Representation code 16, Unsigned 2-byte integer."),
+    REP_CODE_METHOD(ULONG, "Representation code 17, Unsigned 4-byte integer."),
+    REP_CODE_METHOD(UVARI, "Representation code 18, Variable-length unsigned integer."),
+    REP_CODE_METHOD(IDENT, "Representation code 19, Variable length identifier."),
+    REP_CODE_METHOD(ASCII, "Representation code 20, Variable length ASCII string."),
+    REP_CODE_METHOD(DTIME, "Representation code 21, Date/time."),
+    REP_CODE_METHOD(ORIGIN, "Representation code 22, an alias for UVARI."),
+    REP_CODE_METHOD(OBNAME, "Representation code 23, Object name."),
+    REP_CODE_METHOD(OBJREF, "Representation code 24, Object reference."),
+    REP_CODE_METHOD(STATUS, "Representation code 26, Boolean status value."),
+    REP_CODE_METHOD(UNITS, "Representation code 27, Units expression."),
+    {"code_read", (PyCFunction)code_read, METH_VARARGS,
+        "code_read(rep_code, ld) reads the Rep Code value from the LogicalData."
+    },
+    {"code_read_list", (PyCFunction)code_read_list, METH_VARARGS,
+        "code_read_list(rep_code, ld, count) reads a list of count Rep Code values from the LogicalData."
+    },
+    {"code_skip_list", (PyCFunction)code_skip_list, METH_VARARGS,
+        "code_skip_list(rep_code, ld, count) skips over count Rep Code values in the LogicalData."
+    },
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+static PyModuleDef cRepCodemodule = {
+    PyModuleDef_HEAD_INIT,
+    "cRepCode",
+    "CPython extension to decode RP66V1 representation codes.",
+    -1,
+    cRepCode_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit_cRepCode(void) {
+    PyObject *p_rep_code = PyImport_ImportModule("TotalDepth.RP66V1.core.pRepCode");
+    if (p_rep_code == NULL) {
+        return NULL;
+    }
+    ExceptionRepCode = PyObject_GetAttrString(p_rep_code, "ExceptionRepCode");
+    ObjectName = PyObject_GetAttrString(p_rep_code, "ObjectName");
+    ObjectReference = PyObject_GetAttrString(p_rep_code, "ObjectReference");
+    DateTime = PyObject_GetAttrString(p_rep_code, "DateTime");
+    check_units = PyObject_GetAttrString(p_rep_code, "_check_units");
+    Py_DECREF(p_rep_code);
+    str_bytes = PyUnicode_InternFromString("bytes");
+    str_index = PyUnicode_InternFromString("index");
+    if (ExceptionRepCode == NULL || ObjectName == NULL || ObjectReference == NULL || DateTime == NULL
+        || check_units == NULL || str_bytes == NULL || str_index == NULL) {
+        return NULL;
+    }
+    return PyModule_Create(&cRepCodemodule);
+}
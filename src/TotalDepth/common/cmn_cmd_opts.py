@@ -25,6 +25,7 @@ Copyright (c) 2010-2019 Paul Ross. All rights reserved.
 import logging
 import multiprocessing
 import argparse
+import os
 import sys
 
 __author__  = 'Paul Ross'
@@ -34,6 +35,8 @@ __rights__  = 'Copyright (c) 2010-2019 Paul Ross. All rights reserved.'
 
 import typing
 
+from TotalDepth.common import npz_cache
+
 
 def arg_parser(desc, prog=None, version=None, **kwargs) -> argparse.ArgumentParser:
     """Return an command line parser with the standard pre-set options.
@@ -178,4 +181,45 @@ def number_multiprocessing_jobs(parsed_args) -> int:
         return parsed_args.jobs
     return 1
 
+
+def add_job_engine(parser: argparse.ArgumentParser) -> None:
+    """Adds the per-file timeout and resume journal options used by ``TotalDepth.common.job_engine`` as --timeout and
+    --journal."""
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=0.0,
+        help="When multiprocessing the maximum time in seconds to process a single file, zero is no limit."
+             " Default: %(default)s.",
+    )
+    parser.add_argument(
+        "--journal",
+        type=str,
+        default='',
+        help="When multiprocessing record successful results in this journal file."
+             " If the journal exists then files already processed with the same options are not processed again."
+             " The journal must only be writable by the current user."
+             " Default: %(default)s.",
+    )
+
 # ============ END: Multiprocessing ==================
+
+
+def add_index_cache(parser: argparse.ArgumentParser) -> None:
+    """Adds the file index cache directory used by the RP66V1 and LIS indexers as --index-cache."""
+    parser.add_argument(
+        "--index-cache",
+        type=str,
+        default=None,
+        metavar='DIR',
+        help="Cache the index of each file in this directory so that repeated runs do not re-index unchanged files."
+             " An empty string puts the cache in a sidecar file next to each file. Default: no cache.",
+    )
+
+
+def set_index_cache(parsed_args) -> None:
+    """Sets the default index cache directory from the ``--index-cache`` option.
+    This sets an environment variable so that it applies to any worker processes, see ``npz_cache.default_cache_dir()``.
+    """
+    if getattr(parsed_args, 'index_cache', None) is not None:
+        os.environ[npz_cache.INDEX_CACHE_ENV] = parsed_args.index_cache
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# Part of TotalDepth: Petrophysical data processing and presentation.
+# Copyright (C) 2011-2021 Paul Ross
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Paul Ross: apaulross@gmail.com
+"""
+Runs a function over many files in parallel worker processes. This is shared by the tools that process a directory
+tree such as ``TotalDepth.RP66V1.ScanHTML``.
+
+Compared with ``multiprocessing.Pool.apply_async()`` and waiting for every result this:
+
+- Yields each ``JobResult`` as soon as it is available so memory is bounded by what the caller keeps.
+- Schedules the largest files first so that one big file does not start last and extend the run.
+- Gives each worker one job at a time so that a job that exceeds the timeout, or a worker that crashes, can be killed
+  and the worker replaced without affecting the other jobs.
+- Optionally records every successful result in a journal so an interrupted run can be resumed. Jobs already in the
+  journal with the same arguments are not run again, their journaled results are yielded instead. Jobs that failed
+  are run again.
+
+Example::
+
+    for job_result in job_engine.run(index_a_single_file, job_engine.dir_walk_jobs(dir_in, dir_out, True, (False,))):
+        if job_result.ok:
+            print(job_result.result)
+
+The function and its arguments must be picklable, so the function must be at module level.
+
+The journal contains pickled results so reading it can run arbitrary code. It is created readable and writable only by
+the current user and a journal that is not owned by the current user, or is writable by the group or others, is
+rejected with ``ExceptionJobEngine``.
+"""
+import base64
+import collections
+import hashlib
+import json
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import stat
+import time
+import typing
+
+from TotalDepth import ExceptionTotalDepth
+from TotalDepth.util import DirWalk
+
+
+logger = logging.getLogger(__file__)
+
+
+class ExceptionJobEngine(ExceptionTotalDepth):
+    """Specialisation of exception for the job engine."""
+    pass
+
+
+class Job(typing.NamedTuple):
+    """A unit of work. key must be unique within a run and is usually the input path. size is used for scheduling,
+    usually the file size. The function is called as function(*args)."""
+    key: str
+    size: int
+    args: typing.Tuple[typing.Any, ...]
+
+
+class JobResult(typing.NamedTuple):
+    """The result of a Job. If error is non-empty then the job raised, timed out or crashed and result is None."""
+    key: str
+    result: typing.Any
+    error: str
+    time: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error == ''
+
+
+#: Error message prefixes for jobs that did not return.
+ERROR_TIMEOUT = 'Timeout'
+ERROR_CRASHED = 'Worker crashed'
+
+
+def dir_walk_jobs(dir_in: str, dir_out: str, recursive: bool, args: typing.Tuple[typing.Any, ...] = (),
+                  fn_match: str = '') -> typing.List[Job]:
+    """Returns a list of Jobs from a directory walk, each has the arguments (path_in, path_out, *args)."""
+    return [
+        Job(t.filePathIn, os.path.getsize(t.filePathIn), (t.filePathIn, t.filePathOut) + tuple(args))
+        for t in DirWalk.dirWalk(dir_in, dir_out, theFnMatch=fn_match, recursive=recursive, bigFirst=False)
+    ]
+
+
+def schedule(jobs: typing.Iterable[Job]) -> typing.List[Job]:
+    """Returns the jobs largest first, ties are in the original order."""
+    return sorted(jobs, key=lambda job: job.size, reverse=True)
+
+
+def _worker(connection: multiprocessing.connection.Connection) -> None:
+    """Worker process main loop, receives (function, args) and sends back (result, error). None terminates."""
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message is None:
+            break
+        function, args = message
+        try:
+            reply = (function(*args), '')
+        except Exception as err:
+            logger.exception(f'Job {args!r} failed.')
+            reply = (None, f'{type(err).__name__}: {err}')
+        try:
+            connection.send(reply)
+        except Exception as err:
+            # For example the result is not picklable.
+            connection.send((None, f'{type(err).__name__}: {err}'))
+
+
+class _WorkerProcess:
+    """A worker process and the job that it is running, if any."""
+    def __init__(self):
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.job: typing.Union[None, Job] = None
+        self.time_start = 0.0
+
+    def start(self, function: typing.Callable, job: Job) -> None:
+        self.job = job
+        self.time_start = time.perf_counter()
+        self.connection.send((function, job.args))
+
+    def finish(self, result: typing.Any, error: str) -> JobResult:
+        ret = JobResult(self.job.key, result, error, time.perf_counter() - self.time_start)
+        self.job = None
+        return ret
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def close(self) -> None:
+        if self.job is None and self.process.is_alive():
+            try:
+                self.connection.send(None)
+                self.process.join(timeout=1.0)
+            except (BrokenPipeError, OSError):
+                pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+def args_digest(args: typing.Tuple[typing.Any, ...]) -> str:
+    """A digest of the arguments of a Job, journaled results are only reused for jobs with the same digest."""
+    return hashlib.sha1(pickle.dumps(args)).hexdigest()
+
+
+def _check_journal(journal: typing.IO, journal_path: str) -> None:
+    """Raises an ExceptionJobEngine if the open journal could have been written by another user."""
+    journal_stat = os.fstat(journal.fileno())
+    if hasattr(os, 'getuid') and journal_stat.st_uid != os.getuid():
+        raise ExceptionJobEngine(f'Journal {journal_path} is not owned by the current user.')
+    if journal_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise ExceptionJobEngine(f'Journal {journal_path} is writable by the group or others.')
+
+
+def _open_journal(journal_path: str) -> typing.TextIO:
+    """Opens the journal for appending, creating it readable and writable only by the current user."""
+    journal = os.fdopen(os.open(journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600), 'a')
+    try:
+        _check_journal(journal, journal_path)
+    except ExceptionJobEngine:
+        journal.close()
+        raise
+    return journal
+
+
+def read_journal(journal_path: str) -> typing.Dict[typing.Tuple[str, str], JobResult]:
+    """Reads a journal and returns a dict of {(key, args_digest): JobResult, ...} of the successful results.
+    An incomplete last line, for example from an interrupted write, is ignored.
+    Raises an ExceptionJobEngine if the journal could have been written by another user."""
+    ret: typing.Dict[typing.Tuple[str, str], JobResult] = {}
+    if journal_path and os.path.exists(journal_path):
+        with open(journal_path) as journal:
+            _check_journal(journal, journal_path)
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                    if entry['error']:
+                        continue
+                    result = pickle.loads(base64.b64decode(entry['result']))
+                except Exception as err:
+                    logger.warning(f'Ignoring unreadable journal line in {journal_path}: {err}')
+                    continue
+                ret[(entry['key'], entry['args'])] = JobResult(entry['key'], result, entry['error'], entry['time'])
+    return ret
+
+
+def _write_journal(journal: typing.TextIO, job_result: JobResult, digest: str) -> None:
+    entry = {
+        'key': job_result.key,
+        'args': digest,
+        'error': job_result.error,
+        'time': job_result.time,
+        'result': base64.b64encode(pickle.dumps(job_result.result)).decode('ascii'),
+    }
+    journal.write(json.dumps(entry) + '\n')
+    journal.flush()
+
+
+def run(function: typing.Callable, jobs: typing.Iterable[Job], processes: int = 0, timeout: float = 0.0,
+        journal_path: str = '') -> typing.Iterator[JobResult]:
+    """Runs function(*job.args) for every job in parallel worker processes and yields a JobResult as each completes.
+
+    processes is the number of worker processes, less than one means the number of CPUs.
+
+    timeout is the maximum time in seconds for each job, zero or less means no limit. A job that exceeds this is killed
+    and its error starts with ``ERROR_TIMEOUT``. A job whose worker dies has an error that starts with
+    ``ERROR_CRASHED``. A job that raises has an error of the exception type and message.
+
+    If journal_path is given then every successful result is appended to it and on a later run the jobs already in the
+    journal with the same arguments are not run again, instead their journaled results are yielded first. See the
+    module documentation for the restrictions on the journal file.
+    """
+    jobs = schedule(jobs)
+    journaled = read_journal(journal_path)
+    digests = {job.key: args_digest(job.args) for job in jobs} if journal_path else {}
+    for job in jobs:
+        if (job.key, digests.get(job.key)) in journaled:
+            yield journaled[(job.key, digests[job.key])]
+    pending = collections.deque(job for job in jobs if (job.key, digests.get(job.key)) not in journaled)
+    if len(pending) < len(jobs):
+        logger.info(f'run(): resuming from {journal_path} with {len(jobs) - len(pending)} jobs complete.')
+    if not pending:
+        return
+    if processes < 1:
+        processes = multiprocessing.cpu_count()
+    logger.info(f'run(): {len(pending)} jobs on {min(processes, len(pending))} processes timeout {timeout}.')
+    journal = _open_journal(journal_path) if journal_path else None
+    workers = [_WorkerProcess() for _i in range(min(processes, len(pending)))]
+    try:
+        while True:
+            for worker in workers:
+                if worker.job is None and pending:
+                    worker.start(function, pending.popleft())
+            busy = [worker for worker in workers if worker.job is not None]
+            if not busy:
+                break
+            wait_timeout = None
+            if timeout > 0.0:
+                wait_timeout = max(0.0, min(w.time_start for w in busy) + timeout - time.perf_counter())
+            multiprocessing.connection.wait(
+                [w.connection for w in busy] + [w.process.sentinel for w in busy], wait_timeout
+            )
+            for i, worker in enumerate(workers):
+                if worker is None or worker.job is None:
+                    continue
+                job_result = None
+                if worker.connection.poll():
+                    try:
+                        job_result = worker.finish(*worker.connection.recv())
+                    except (EOFError, OSError):
+                        pass
+                if job_result is None:
+                    if not worker.process.is_alive():
+                        job_result = worker.finish(None, f'{ERROR_CRASHED} with exit code {worker.process.exitcode}')
+                    elif timeout > 0.0 and time.perf_counter() - worker.time_start > timeout:
+                        job_result = worker.finish(None, f'{ERROR_TIMEOUT} after {timeout} seconds')
+                    else:
+                        continue
+                    logger.error(f'run(): job {job_result.key} failed: {job_result.error}')
+                    worker.kill()
+                    workers[i] = _WorkerProcess() if pending else None
+                if journal is not None and job_result.ok:
+                    _write_journal(journal, job_result, digests[job_result.key])
+                yield job_result
+            workers = [worker for worker in workers if worker is not None]
+    finally:
+        for worker in workers:
+            if worker is not None:
+                worker.close()
+        if journal is not None:
+            journal.close()
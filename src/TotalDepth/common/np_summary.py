@@ -25,6 +25,8 @@ import functools
 import numpy as np
 import typing
 
+from TotalDepth.common import AbsentValue
+
 
 class ArraySummary(typing.NamedTuple):
     """Contains the summary of an array of numbers."""
@@ -182,3 +184,187 @@ def summarise_array(array: np.array, flatten: bool = True) -> ArraySummary:
             array[-1],
         )
         return result
+
+
+class SummaryAccumulator:
+    """
+    Accumulates the summary of an array that is presented in successive chunks so that the whole array need never be
+    resident. Each chunk is reduced with numpy and the mean and variance are merged across chunks with the pairwise
+    algorithm of Chan et al. (a generalisation of Welford's algorithm).
+
+    Values adjacent across a chunk boundary are compared so the counts and activity are the same as
+    ``summarise_array()`` on the concatenated array.
+
+    As ``summarise_array()`` of a masked array the mean and standard deviation have the dtype that numpy gives for the
+    values, for example float32 for float32 values, and the activity is masked if it can not be computed.
+
+    The median can not be computed exactly in bounded memory so it is the median of a uniform random sample of
+    ``median_sample_size`` values retained by reservoir sampling (Vitter's Algorithm R). The random number generator is
+    seeded so the result is repeatable. The median is exact if the count of values does not exceed
+    ``median_sample_size``, see ``median_is_exact``.
+    """
+    MEDIAN_SAMPLE_SIZE = 1 << 16
+    #: Default seed of the random number generator used for the median sample.
+    MEDIAN_SEED = 0
+
+    def __init__(self, median_sample_size: typing.Union[int, None] = None, seed: typing.Union[int, None] = None):
+        self.median_sample_size = self.MEDIAN_SAMPLE_SIZE if median_sample_size is None else median_sample_size
+        self.len = 0
+        self.count = 0
+        self.min = None
+        self.max = None
+        # The dtype of the mean and standard deviation, set from the first values.
+        self._dtype = np.dtype(np.float64)
+        self._mean = 0.0
+        # Sum of squares of differences from the mean.
+        self.m2 = 0.0
+        self.count_eq = 0
+        self.count_dec = 0
+        self.count_inc = 0
+        # Sum of absolute log2 differences and the number of them.
+        self._activity_sum = 0.0
+        self._activity_count = 0
+        self.first = None
+        self.last = None
+        self._median_sample: typing.Union[np.ndarray, None] = None
+        self._rng = np.random.default_rng(self.MEDIAN_SEED if seed is None else seed)
+
+    def add(self, array: np.ndarray, flatten: bool = True) -> None:
+        """Add a chunk of values. Masked values are ignored as ``summarise_array()``."""
+        if flatten:
+            array = array.flatten()
+        self.len += array.size
+        if hasattr(array, 'mask'):
+            array = array[~np.ma.getmaskarray(array)].data
+        if array.size == 0:
+            return
+        # Prefix the last value from the previous chunk so that boundary differences are counted.
+        if self.last is not None:
+            array_diff = np.concatenate(([self.last], array))
+        else:
+            array_diff = array
+        counts = count_eq_dec_inc(array_diff, flatten=False)
+        self.count_eq += counts[0]
+        self.count_dec += counts[1]
+        self.count_inc += counts[2]
+        if len(array_diff) > 1:
+            # Differences involving zero or negative values are ignored as activity() does with a masked array.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                log2_array = np.log2(array_diff)
+                log2_diff = np.abs(log2_array[1:] - log2_array[:-1])
+            log2_diff = log2_diff[np.isfinite(log2_diff)]
+            self._activity_sum += log2_diff.sum()
+            self._activity_count += len(log2_diff)
+        # Extreme values
+        chunk_min = array.min()
+        chunk_max = array.max()
+        if self.min is None or chunk_min < self.min:
+            self.min = chunk_min
+        if self.max is None or chunk_max > self.max:
+            self.max = chunk_max
+        # Merge the mean and variance
+        chunk_count = array.size
+        chunk_mean = array.mean(dtype=np.float64)
+        chunk_m2 = ((array - chunk_mean) ** 2).sum(dtype=np.float64)
+        total = self.count + chunk_count
+        if self.count == 0:
+            if np.issubdtype(array.dtype, np.inexact):
+                self._dtype = array.dtype
+            self._mean = chunk_mean
+            self.m2 = chunk_m2
+        else:
+            delta = chunk_mean - self._mean
+            self._mean += delta * chunk_count / total
+            self.m2 += chunk_m2 + delta ** 2 * self.count * chunk_count / total
+        self._add_median_sample(array)
+        self.count = total
+        if self.first is None:
+            self.first = array[0]
+        self.last = array[-1]
+
+    def _add_median_sample(self, array: np.ndarray) -> None:
+        """Add the values to the reservoir sample, self.count is the number of values before this chunk."""
+        if self._median_sample is None:
+            self._median_sample = np.empty(self.median_sample_size, dtype=array.dtype)
+        # Fill the reservoir with the first values.
+        fill = min(max(self.median_sample_size - self.count, 0), array.size)
+        self._median_sample[self.count:self.count + fill] = array[:fill]
+        remaining = array[fill:]
+        if remaining.size:
+            # The value with (zero based) index i of all values replaces a random sample with probability size / (i + 1)
+            indexes = self._rng.integers(0, np.arange(self.count + fill, self.count + array.size) + 1)
+            replace = indexes < self.median_sample_size
+            # If a sample is replaced more than once in this chunk then the last value wins.
+            positions, last = np.unique(indexes[replace][::-1], return_index=True)
+            self._median_sample[positions] = remaining[replace][::-1][last]
+
+    @property
+    def mean(self) -> float:
+        """The mean, in the dtype that numpy gives for the values."""
+        return self._dtype.type(self._mean)
+
+    def std(self, ddof: int = 0) -> float:
+        """The standard deviation, ddof=0 is the population standard deviation, as numpy, ddof=1 is the sample
+        standard deviation. Returns NaN if there are insufficient values."""
+        if self.count - ddof <= 0:
+            return float('nan')
+        return self._dtype.type(np.sqrt(self.m2 / (self.count - ddof)))
+
+    @property
+    def median_is_exact(self) -> bool:
+        """True if the median is of all the values rather than a sample of them."""
+        return self.count <= self.median_sample_size
+
+    @property
+    def median(self) -> float:
+        """The median, possibly of a random sample, see the class documentation."""
+        if self.count == 0:
+            return float('nan')
+        return np.median(self._median_sample[:min(self.count, self.median_sample_size)])
+
+    @property
+    def activity(self) -> float:
+        """The activity as ``activity()`` of a masked array, this is masked if there are no pairs of positive
+        values."""
+        if self._activity_count == 0:
+            return np.ma.masked
+        return self._activity_sum / self._activity_count
+
+    def summary(self) -> typing.Union[ArraySummary, None]:
+        """Returns the ArraySummary of all the values. As ``summarise_array()`` this returns None if there are less
+        than two values."""
+        if self.count > 1:
+            return ArraySummary(
+                self.len,
+                (self.count,),
+                self.count,
+                self.min,
+                self.max,
+                self.mean,
+                self.std(),
+                self.median,
+                self.count_eq,
+                self.count_dec,
+                self.count_inc,
+                self.activity,
+                self.first,
+                self.last,
+            )
+
+
+def accumulate_frame_array(frame_array, chunks: typing.Iterable[int]) -> typing.Tuple[int, typing.List[SummaryAccumulator]]:
+    """
+    Summarises a ``TotalDepth.common.LogPass.FrameArray`` that is populated in chunks. chunks is an iterable that
+    populates the frame array and yields the number of frames in each chunk such as RP66V1
+    ``LogicalFile.populate_frame_array_chunks()``.
+
+    Returns the total number of frames and a SummaryAccumulator for each channel. Absent values are ignored, their
+    count is ``accumulator.len - accumulator.count``.
+    """
+    accumulators = [SummaryAccumulator() for _channel in frame_array.channels]
+    num_frames = 0
+    for chunk_frames in chunks:
+        num_frames += chunk_frames
+        for channel, accumulator in zip(frame_array.channels, accumulators):
+            accumulator.add(AbsentValue.mask_absent_values(channel.array))
+    return num_frames, accumulators
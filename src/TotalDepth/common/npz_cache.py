@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# Part of TotalDepth: Petrophysical data processing and presentation.
+# Copyright (C) 2011-2021 Paul Ross
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Paul Ross: apaulross@gmail.com
+"""
+Atomic ``.npz`` caches of numpy arrays with JSON metadata, keyed on the identity of the file they were created from.
+
+This is shared by the RP66V1 and LIS index caches and the channel pyramid sidecar. The key is a JSON serialisable dict,
+usually from ``file_key()`` with format specific additions. ``read()`` returns None, rather than raising, if the cache is
+missing, unreadable (truncated, corrupt or not a cache at all) or the key does not match so the caller can rebuild it.
+"""
+import hashlib
+import json
+import logging
+import os
+import typing
+import zipfile
+
+import numpy as np
+
+from TotalDepth import ExceptionTotalDepth
+
+
+logger = logging.getLogger(__file__)
+
+
+class ExceptionNpzCache(ExceptionTotalDepth):
+    pass
+
+
+#: The number of bytes at the start and end of the file used for the content hash.
+CONTENT_HASH_BYTES = 1024**2
+#: The name of the array that holds the JSON metadata.
+METADATA_NAME = 'metadata'
+#: Environment variable that sets the default cache directory of the file index caches, see ``default_cache_dir()``.
+INDEX_CACHE_ENV = 'TOTALDEPTH_INDEX_CACHE'
+#: Exceptions that np.load() and decoding the metadata raise on a cache that is not readable.
+READ_EXCEPTIONS = (OSError, EOFError, ValueError, KeyError, TypeError, zipfile.BadZipFile)
+
+
+def default_cache_dir() -> typing.Union[None, str]:
+    """The cache directory from the environment variable INDEX_CACHE_ENV or None if it is not set.
+    As with a cache_dir argument the empty string means sidecar files. This is set by the ``--index-cache`` command line
+    option, see ``cmn_cmd_opts.add_index_cache()``, and is inherited by any worker processes."""
+    return os.environ.get(INDEX_CACHE_ENV)
+
+
+def cache_path(path: str, cache_dir: str, suffix: str) -> str:
+    """Returns the path of the cache file for the file at path.
+    If cache_dir is the empty string then this is a sidecar file next to the file, otherwise the cache is in cache_dir
+    with a name derived from the absolute path of the file."""
+    if cache_dir == '':
+        return path + suffix
+    name = hashlib.sha1(os.path.abspath(path).encode('utf-8', 'surrogateescape')).hexdigest()
+    return os.path.join(cache_dir, name + suffix)
+
+
+def content_hash(path: str, size: int) -> str:
+    """A SHA1 hash of the size and the first and last CONTENT_HASH_BYTES of the file.
+    This detects most changes to a file without reading all of it."""
+    sha1 = hashlib.sha1(str(size).encode('ascii'))
+    with open(path, 'rb') as file:
+        sha1.update(file.read(CONTENT_HASH_BYTES))
+        if size > CONTENT_HASH_BYTES:
+            file.seek(max(CONTENT_HASH_BYTES, size - CONTENT_HASH_BYTES))
+            sha1.update(file.read(CONTENT_HASH_BYTES))
+    return sha1.hexdigest()
+
+
+def file_key(path: str, version: int, **kwargs) -> typing.Dict[str, typing.Any]:
+    """The key that identifies the version of the file that the cache was created from.
+    Any keyword arguments are added to the key, they must be JSON serialisable."""
+    stat = os.stat(path)
+    ret = {
+        'version': version,
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'hash': content_hash(path, stat.st_size),
+    }
+    ret.update(kwargs)
+    return ret
+
+
+def write(path_cache: str, key: typing.Dict[str, typing.Any], metadata: typing.Any,
+          arrays: typing.Dict[str, np.ndarray]) -> None:
+    """Writes the cache atomically. metadata must be JSON serialisable, the key is added to it."""
+    if METADATA_NAME in arrays:
+        raise ExceptionNpzCache(f'Array name "{METADATA_NAME}" is reserved.')
+    metadata_bytes = json.dumps({'key': key, 'metadata': metadata}).encode('utf-8')
+    directory = os.path.dirname(path_cache)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    path_temp = f'{path_cache}.{os.getpid()}.tmp'
+    try:
+        with open(path_temp, 'wb') as file:
+            np.savez(file, **{METADATA_NAME: np.frombuffer(metadata_bytes, dtype=np.uint8)}, **arrays)
+        os.replace(path_temp, path_cache)
+    finally:
+        if os.path.exists(path_temp):
+            os.remove(path_temp)
+
+
+def read(path_cache: str, key: typing.Dict[str, typing.Any]) \
+        -> typing.Union[None, typing.Tuple[typing.Any, typing.Dict[str, np.ndarray]]]:
+    """Reads the cache and returns (metadata, arrays) or None if there is no cache, it is unreadable or the key does not
+    match."""
+    if not os.path.isfile(path_cache):
+        return None
+    try:
+        with np.load(path_cache, allow_pickle=False) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+        content = json.loads(arrays.pop(METADATA_NAME).tobytes().decode('utf-8'))
+        if content['key'] != key:
+            logger.info(f'Ignoring stale cache {path_cache}')
+            return None
+        metadata = content['metadata']
+    except READ_EXCEPTIONS as err:
+        logger.warning(f'Ignoring unreadable cache {path_cache}: {err!r}')
+        return None
+    return metadata, arrays
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# Part of TotalDepth: Petrophysical data processing and presentation.
+# Copyright (C) 2011-2021 Paul Ross
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Paul Ross: apaulross@gmail.com
+"""
+Multi-resolution summaries of log channels for drawing overviews without reading the original file.
+
+A ``Pyramid`` has levels that each summarise 2, 4, 8... frames per bin. Every bin has the first and last X axis value
+and, for each channel, the minimum, maximum, sum and count of the valid values. Absent (masked or NaN) values are
+ignored. The raw frames (a factor of 1) are not kept, the finest level summarises pairs of frames.
+
+A ``Pyramid`` is built incrementally by a ``PyramidBuilder`` so large log passes can be read in chunks, for example
+with RP66V1::
+
+    builder = pyramid.PyramidBuilder()
+    for _num_frames in logical_file.populate_frame_array_chunks(frame_array, 4096):
+        frame_array.mask_array(absent_value)
+        builder.add_frame_array(frame_array)
+    pyr = builder.pyramid()
+
+Or from a LIS ``LogPass``, one pyramid per channel as burst channels have their own X axis::
+
+    x, values = log_pass.outpPointsArrays(mnem)
+    pyr = pyramid.Pyramid.from_arrays(x, {mnem: values}, absent_value=log_pass.nullValue)
+
+Then ``pyr.query(channel, x_from, x_to, number_of_points)`` returns the coarsest summary with at least that many bins
+in the range.
+
+Pyramids are saved in a ``.npz`` sidecar file next to the original with ``write()`` and loaded with ``read()``, this
+returns None if the sidecar is missing, unreadable or stale. The sidecar is read and written by ``npz_cache``.
+"""
+import logging
+import typing
+
+import numpy as np
+
+from TotalDepth import ExceptionTotalDepth
+from TotalDepth.common import npz_cache
+
+
+logger = logging.getLogger(__file__)
+
+
+class ExceptionPyramid(ExceptionTotalDepth):
+    """Specialisation of an exception class for pyramids."""
+    pass
+
+
+#: Increment this when the layout of the sidecar changes.
+VERSION = 2
+#: Suffix of the sidecar file.
+SIDECAR_SUFFIX = '.td_pyramid.npz'
+#: The number of bins of one level that are combined into a bin of the next level.
+LEVEL_FACTOR = 2
+#: The names of the summary arrays of each channel in each level.
+CHANNEL_ARRAY_NAMES = ('min', 'max', 'sum', 'count')
+
+
+class Summary(typing.NamedTuple):
+    """A summary of a channel from one level. factor is the number of frames in each bin, the other fields are arrays
+    with a value for each bin. min, max and mean are NaN where the bin has no valid values."""
+    factor: int
+    x_first: np.ndarray
+    x_last: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    mean: np.ndarray
+    count: np.ndarray
+
+
+class Level:
+    """One level of a pyramid. x_first and x_last are shared by all channels, channels is a dict of
+    {ident: {'min': array, 'max': array, 'sum': array, 'count': array}, ...}."""
+    def __init__(self, factor: int, x_first: np.ndarray, x_last: np.ndarray,
+                 channels: typing.Dict[str, typing.Dict[str, np.ndarray]]):
+        self.factor = factor
+        self.x_first = x_first
+        self.x_last = x_last
+        self.channels = channels
+
+    def __len__(self) -> int:
+        return len(self.x_first)
+
+    def reduce(self) -> 'Level':
+        """Returns the next level by combining pairs of bins. An odd last bin is combined with an empty bin."""
+        pad = len(self) % LEVEL_FACTOR
+        x_last = self.x_last[1::LEVEL_FACTOR]
+        if pad:
+            x_last = np.append(x_last, self.x_last[-1])
+        channels = {}
+        for ident, arrays in self.channels.items():
+            channels[ident] = {
+                'min': np.fmin(arrays['min'][0::2], _pad(arrays['min'][1::2], pad, np.nan)),
+                'max': np.fmax(arrays['max'][0::2], _pad(arrays['max'][1::2], pad, np.nan)),
+                'sum': arrays['sum'][0::2] + _pad(arrays['sum'][1::2], pad, 0.0),
+                'count': arrays['count'][0::2] + _pad(arrays['count'][1::2], pad, 0),
+            }
+        return Level(self.factor * LEVEL_FACTOR, self.x_first[0::LEVEL_FACTOR].copy(), x_last, channels)
+
+    def summary(self, ident: str, select: typing.Union[slice, np.ndarray] = slice(None)) -> Summary:
+        """Returns the Summary of the channel for the selected bins."""
+        arrays = self.channels[ident]
+        count = arrays['count'][select]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, arrays['sum'][select] / count, np.nan)
+        return Summary(self.factor, self.x_first[select], self.x_last[select],
+                       arrays['min'][select], arrays['max'][select], mean, count)
+
+
+def _pad(array: np.ndarray, pad: int, value: typing.Union[int, float]) -> np.ndarray:
+    if pad:
+        return np.append(array, np.array([value], dtype=array.dtype))
+    return array
+
+
+def _frame_values(values: np.ndarray, absent_value: typing.Union[None, int, float]) -> np.ndarray:
+    """Returns the values as a float64 array of shape (frames, values_per_frame) with absent values as NaN."""
+    if np.ma.isMaskedArray(values):
+        ret = values.astype(np.float64).filled(np.nan)
+    else:
+        ret = np.array(values, dtype=np.float64)
+    ret = ret.reshape(len(ret), -1)
+    invalid = ~np.isfinite(ret)
+    if absent_value is not None:
+        invalid |= ret == absent_value
+    ret[invalid] = np.nan
+    return ret
+
+
+class PyramidBuilder:
+    """Accumulates frames in chunks then builds a Pyramid."""
+    def __init__(self):
+        self._x: typing.List[np.ndarray] = []
+        self._channels: typing.Dict[str, typing.Dict[str, typing.List[np.ndarray]]] = {}
+
+    @property
+    def num_frames(self) -> int:
+        return sum(len(x) for x in self._x)
+
+    def add(self, x: np.ndarray, channels: typing.Dict[typing.Hashable, np.ndarray],
+            absent_value: typing.Union[None, int, float] = None) -> None:
+        """Adds a chunk of frames. x is the X axis, channels is {ident: array, ...} where each array has the same
+        length as x and may have further dimensions. The channels must be the same for every chunk.
+        Masked values, non-finite values and values equal to absent_value are ignored."""
+        x = np.array(x, dtype=np.float64).reshape(-1)
+        if self._x and set(str(k) for k in channels.keys()) != set(self._channels.keys()):
+            raise ExceptionPyramid(
+                f'Channels {sorted(str(k) for k in channels.keys())} differ from {sorted(self._channels.keys())}'
+            )
+        for ident, values in channels.items():
+            if len(values) != len(x):
+                raise ExceptionPyramid(f'Channel {ident} has {len(values)} frames but the X axis has {len(x)}')
+        self._x.append(x)
+        for ident, values in channels.items():
+            frame_values = _frame_values(values, absent_value)
+            arrays = self._channels.setdefault(str(ident), {name: [] for name in CHANNEL_ARRAY_NAMES})
+            if frame_values.shape[1]:
+                valid = ~np.isnan(frame_values)
+                arrays['min'].append(np.fmin.reduce(frame_values, axis=1))
+                arrays['max'].append(np.fmax.reduce(frame_values, axis=1))
+                arrays['sum'].append(np.nansum(frame_values, axis=1))
+                arrays['count'].append(np.count_nonzero(valid, axis=1).astype(np.int64))
+            else:
+                arrays['min'].append(np.full(len(x), np.nan))
+                arrays['max'].append(np.full(len(x), np.nan))
+                arrays['sum'].append(np.zeros(len(x)))
+                arrays['count'].append(np.zeros(len(x), dtype=np.int64))
+
+    def add_frame_array(self, frame_array, absent_value: typing.Union[None, int, float] = None) -> None:
+        """Adds the frames in a ``TotalDepth.common.LogPass.FrameArray``. Channel 0 is the X axis, the other numeric
+        channels are summarised. Channels that have been masked by ``FrameArray.mask_array()`` have their absent
+        values ignored."""
+        channels = {}
+        for channel in frame_array.channels[1:]:
+            if np.issubdtype(channel.array.dtype, np.number):
+                channels[channel.ident] = channel.array
+        self.add(frame_array.x_axis.array, channels, absent_value)
+
+    def pyramid(self) -> 'Pyramid':
+        """Returns the Pyramid of all the frames added so far."""
+        if self.num_frames == 0:
+            raise ExceptionPyramid('Can not build a pyramid with no frames.')
+        x = np.concatenate(self._x)
+        base = Level(
+            1, x, x,
+            {
+                ident: {name: np.concatenate(arrays[name]) for name in CHANNEL_ARRAY_NAMES}
+                for ident, arrays in self._channels.items()
+            }
+        )
+        levels = [base.reduce()]
+        while len(levels[-1]) > 1:
+            levels.append(levels[-1].reduce())
+        return Pyramid(len(x), levels)
+
+
+class Pyramid:
+    """Multi-resolution summaries of a set of channels that share an X axis. levels are finest first."""
+    def __init__(self, num_frames: int, levels: typing.List[Level]):
+        if not levels:
+            raise ExceptionPyramid('A pyramid must have at least one level.')
+        self.num_frames = num_frames
+        self.levels = levels
+
+    @classmethod
+    def from_arrays(cls, x: np.ndarray, channels: typing.Dict[typing.Hashable, np.ndarray],
+                    absent_value: typing.Union[None, int, float] = None) -> 'Pyramid':
+        """Returns a Pyramid from a complete X axis and channels, see ``PyramidBuilder.add()``."""
+        builder = PyramidBuilder()
+        builder.add(x, channels, absent_value)
+        return builder.pyramid()
+
+    @classmethod
+    def from_frame_array(cls, frame_array, absent_value: typing.Union[None, int, float] = None) -> 'Pyramid':
+        """Returns a Pyramid from a populated ``TotalDepth.common.LogPass.FrameArray``."""
+        builder = PyramidBuilder()
+        builder.add_frame_array(frame_array, absent_value)
+        return builder.pyramid()
+
+    @property
+    def channels(self) -> typing.List[str]:
+        return list(self.levels[0].channels.keys())
+
+    def __str__(self) -> str:
+        return f'<Pyramid frames: {self.num_frames} channels: {len(self.channels)}' \
+            f' levels: {[len(level) for level in self.levels]}>'
+
+    def query(self, ident: typing.Hashable, x_from: float, x_to: float, number_of_points: int) -> Summary:
+        """Returns the Summary of the channel from the coarsest level that has at least number_of_points bins that
+        overlap the range x_from to x_to (in either order). If no level has that many then the finest level is used."""
+        ident = str(ident)
+        if ident not in self.levels[0].channels:
+            raise ExceptionPyramid(f'No channel {ident} in {self.channels}')
+        x_lo, x_hi = min(x_from, x_to), max(x_from, x_to)
+        for level in reversed(self.levels):
+            select = (np.maximum(level.x_first, level.x_last) >= x_lo) \
+                & (np.minimum(level.x_first, level.x_last) <= x_hi)
+            if np.count_nonzero(select) >= number_of_points or level is self.levels[0]:
+                return level.summary(ident, select)
+
+
+def sidecar_path(path: str) -> str:
+    """Returns the path of the pyramid sidecar for the file at path."""
+    return path + SIDECAR_SUFFIX
+
+
+def file_key(path: str) -> typing.Dict[str, typing.Union[int, str]]:
+    """The key that identifies the version of the file that the pyramids were created from."""
+    return npz_cache.file_key(path, VERSION)
+
+
+def _array_name(p: int, l: int, name: str, c: typing.Union[None, int] = None) -> str:
+    if c is None:
+        return f'p{p}_l{l}_{name}'
+    return f'p{p}_l{l}_c{c}_{name}'
+
+
+def write(path_sidecar: str, key: typing.Dict[str, typing.Union[int, str]],
+          pyramids: typing.Dict[str, Pyramid]) -> None:
+    """Writes the pyramids atomically. pyramids is a dict of {name: Pyramid, ...}, name might be the Log Pass or
+    Frame Array identity."""
+    metadata = []
+    arrays = {}
+    for p, (name, pyr) in enumerate(pyramids.items()):
+        channels = pyr.channels
+        metadata.append({
+            'name': str(name),
+            'num_frames': pyr.num_frames,
+            'factors': [level.factor for level in pyr.levels],
+            'channels': channels,
+        })
+        for l, level in enumerate(pyr.levels):
+            arrays[_array_name(p, l, 'x_first')] = level.x_first
+            arrays[_array_name(p, l, 'x_last')] = level.x_last
+            for c, ident in enumerate(channels):
+                for array_name in CHANNEL_ARRAY_NAMES:
+                    arrays[_array_name(p, l, array_name, c)] = level.channels[ident][array_name]
+    npz_cache.write(path_sidecar, key, metadata, arrays)
+
+
+def read(path_sidecar: str, key: typing.Dict[str, typing.Union[int, str]]) \
+        -> typing.Union[None, typing.Dict[str, Pyramid]]:
+    """Reads the sidecar and returns {name: Pyramid, ...} or None if there is no sidecar, it is unreadable or the key
+    does not match."""
+    cached = npz_cache.read(path_sidecar, key)
+    if cached is None:
+        return None
+    metadata_pyramids, arrays = cached
+    try:
+        ret = {}
+        for p, metadata in enumerate(metadata_pyramids):
+            levels = []
+            for l, factor in enumerate(metadata['factors']):
+                channels = {
+                    ident: {array_name: arrays[_array_name(p, l, array_name, c)] for array_name in CHANNEL_ARRAY_NAMES}
+                    for c, ident in enumerate(metadata['channels'])
+                }
+                levels.append(
+                    Level(factor, arrays[_array_name(p, l, 'x_first')], arrays[_array_name(p, l, 'x_last')], channels)
+                )
+            ret[metadata['name']] = Pyramid(metadata['num_frames'], levels)
+    except (KeyError, TypeError, ValueError, ExceptionPyramid) as err:
+        logger.warning(f'Ignoring unreadable pyramid sidecar {path_sidecar}: {err}')
+        return None
+    return ret
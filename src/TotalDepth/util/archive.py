@@ -26,7 +26,6 @@ import collections
 import datetime
 import functools
 import logging
-import multiprocessing
 import os
 import pprint
 import shutil
@@ -37,6 +36,7 @@ import zipfile
 
 import TotalDepth.util.bin_file_type
 from TotalDepth.common import cmn_cmd_opts
+from TotalDepth.common import job_engine
 from TotalDepth.common import statistics
 from TotalDepth.util import DirWalk
 
@@ -347,16 +347,25 @@ def explore_tree_single_process(path: str, recurse: bool) -> typing.List[FileBas
     return result
 
 
-def explore_tree_multi_process(path: str, recurse: bool, jobs: int) -> typing.List[FileBase]:
-    """Multiprocessing code to scan an archive."""
-    if jobs < 1:
-        jobs = multiprocessing.cpu_count()
+def explore_tree_multi_process(path: str, recurse: bool, jobs: int,
+                               timeout: float = 0.0, journal_path: str = '') -> typing.List[FileBase]:
+    """Multiprocessing code to scan an archive, see ``job_engine.run()`` for jobs, timeout and journal_path."""
     print(f'Analysing archive with a {jobs} processes.')
     logging.info('explore_tree_multi_process(): Setting multi-processing jobs to %d' % jobs)
-    pool = multiprocessing.Pool(processes=jobs)
-    tasks = ((directory, file_name) for directory, file_name in _gen_dirs_and_files(path, recurse))
-    results = [r.get() for r in [pool.apply_async(_process_file, t) for t in tasks]]
-    return [r for r in results if r is not None]
+    tasks = [
+        job_engine.Job(
+            os.path.join(directory, file_name), os.path.getsize(os.path.join(directory, file_name)),
+            (directory, file_name)
+        )
+        for directory, file_name in _gen_dirs_and_files(path, recurse)
+    ]
+    ret: typing.List[FileBase] = []
+    for job_result in job_engine.run(_process_file, tasks, jobs, timeout, journal_path):
+        if not job_result.ok:
+            logger.error(f'Failed to examine {job_result.key}: {job_result.error}')
+        elif job_result.result is not None:
+            ret.append(job_result.result)
+    return ret
 
 
 def copy_tree(path_from: str, path_to: str, recurse: bool,
@@ -474,6 +483,7 @@ will be copied across."""
     )
     cmn_cmd_opts.add_log_level(parser, level=20)
     cmn_cmd_opts.add_multiprocessing(parser)
+    cmn_cmd_opts.add_job_engine(parser)
     file_types = ', '.join(sorted(TotalDepth.util.bin_file_type.BINARY_FILE_TYPES_SUPPORTED))
     parser.add_argument(
         '--file-type', default=[], action='append',
@@ -513,7 +523,9 @@ will be copied across."""
             else:
                 print('Analysing archive.')
                 if cmn_cmd_opts.multiprocessing_requested(args) and os.path.isdir(args.path_in):
-                    files: typing.List[FileBase] = explore_tree_multi_process(args.path_in, args.recurse, args.jobs)
+                    files: typing.List[FileBase] = explore_tree_multi_process(
+                        args.path_in, args.recurse, args.jobs, args.timeout, args.journal
+                    )
                 else:
                     files: typing.List[FileBase] = explore_tree_single_process(args.path_in, args.recurse)
                 analyse_archive(files, args.file_type, args.bytes, args.histogram)
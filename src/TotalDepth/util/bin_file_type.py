@@ -359,16 +359,18 @@ def _xml(fobj: typing.BinaryIO) -> str:
 def _dat(fobj: typing.BinaryIO) -> str:
     """Returns 0 if the file is a DAT file, non-zero otherwise.
     """
+    fobj.seek(0)
+    # Read the binary file as text, can_parse_file() only reads as far as the first data row.
+    text_file = io.TextIOWrapper(fobj, encoding='ascii')
     try:
-        fobj.seek(0)
-        # Bit of a hack to convert a binary file to a text one
-        text_file = io.StringIO(fobj.read().decode('ascii'))
-    except UnicodeDecodeError:
-        return ''
-    else:
         if DAT_parser.can_parse_file(text_file):
             return 'DAT'
-        return ''
+    except UnicodeDecodeError:
+        pass
+    finally:
+        # Do not let the wrapper close fobj.
+        text_file.detach()
+    return ''
 
 
 def _segy(fobj: typing.BinaryIO) -> str:
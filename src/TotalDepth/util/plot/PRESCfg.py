@@ -236,6 +236,8 @@ import math
 #import numbers
 import collections
 
+import numpy
+
 from TotalDepth.LIS import ExceptionTotalDepthLIS
 from TotalDepth.LIS.core import LogiRec
 from TotalDepth.LIS.core import Mnem
@@ -469,7 +471,15 @@ class LineTransBase(object):
         pos is a float that is the physical plot position of the value.
         TODO: Benchmark this, it could be slow."""
         raise NotImplementedError()
-    
+
+    def wrapPosArray(self, values):
+        """For a numpy array of values returns three numpy arrays (wrap, pos, valid).
+        wrap and pos are the same as wrapPos() for each value, wrap is an array
+        of floats with integer values.
+        valid is a boolean array that is False where the value can not be
+        plotted (wrapPos() would raise), wrap and pos are meaningless there."""
+        raise NotImplementedError()
+
     def offScale(self, w):
         """Returns 0 if wrap integer is on scale depending on the backup setting.
         Returns -1 if off scale low, +1 if off scale high."""
@@ -516,6 +526,17 @@ class LineTransLin(LineTransBase):
         f = self._lP + (p - w) * self._pWidth
         return w, f
 
+    def wrapPosArray(self, values):
+        """For a numpy array of values returns three numpy arrays (wrap, pos, valid).
+        See LineTransBase.wrapPosArray()."""
+        with numpy.errstate(invalid='ignore', over='ignore'):
+            p = (values - self._lL) / self._den
+            valid = numpy.isfinite(p)
+            p = numpy.where(valid, p, 0.0)
+            w = numpy.floor(p)
+            f = self._lP + (p - w) * self._pWidth
+        return w, f, valid
+
 class LineTransLog10(LineTransBase):
     """Logrithmic grid."""
     def __init__(self, leftP, rightP, leftL, rightR, backup=BACKUP_ALL):
@@ -549,6 +570,21 @@ class LineTransLog10(LineTransBase):
         w = math.floor(p)
         r = self._lP + (p - w) * self._pWidth
         return w, r
+
+    def wrapPosArray(self, values):
+        """For a numpy array of values returns three numpy arrays (wrap, pos, valid).
+        Zero or negative values are not valid. See LineTransBase.wrapPosArray().
+        math.log10() is used rather than numpy.log10() as the latter can differ in
+        the last bit and the results must be identical to wrapPos()."""
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            valid = values > 0.0
+            ratios = numpy.where(valid, values, self._lL) / self._lL
+            p = numpy.fromiter(map(math.log10, ratios.tolist()), dtype=numpy.float64, count=len(ratios)) / self._den
+            valid &= numpy.isfinite(p)
+            p = numpy.where(valid, p, 0.0)
+            w = numpy.floor(p)
+            r = self._lP + (p - w) * self._pWidth
+        return w, r, valid
 #===============================
 # Section: Line transformations.
 #===============================
@@ -119,6 +119,8 @@ import logging
 import collections
 import pprint
 #import math
+
+import numpy
 #from optparse import OptionParser
 
 from TotalDepth.LIS import ExceptionTotalDepthLIS
@@ -154,13 +156,41 @@ class ExceptionTotalDepthPlotRoll(ExceptionTotalDepthLISPlot):
     """Exception for plotting."""
     pass
 
+def retDecimatedIndexes(theTracPos, theDepth, theRowDepth):
+    """Given numpy arrays of track positions and depths of the points of a
+    polyline this returns a sorted numpy array of the indexes of the points to
+    keep so that the polyline looks the same when rendered in rows of
+    theRowDepth.
+    Consecutive points in the same row are reduced to the first, minimum
+    track position, maximum track position and last point, in their
+    original order.
+    If theRowDepth <= 0 then all indexes are returned."""
+    numPoints = len(theDepth)
+    if theRowDepth <= 0 or numPoints <= 4:
+        return numpy.arange(numPoints)
+    myRowS = numpy.floor(theDepth / theRowDepth)
+    # Segment number of each run of consecutive points in the same row
+    mySegS = numpy.concatenate(([0], numpy.cumsum(myRowS[1:] != myRowS[:-1])))
+    myStartS = numpy.flatnonzero(numpy.concatenate(([True], mySegS[1:] != mySegS[:-1])))
+    myStopS = numpy.concatenate((myStartS[1:], [numPoints])) - 1
+    # Order by segment then track position, the first of each segment is the
+    # minimum track position and the last is the maximum.
+    myOrder = numpy.lexsort((theTracPos, mySegS))
+    return numpy.unique(numpy.concatenate((myStartS, myStopS, myOrder[myStartS], myOrder[myStopS])))
+
+
 # Describes a curve plots data, fn is the track transfer function, buffer is a
 # list of Coord.Pt() and prevWrap is the previous wrap value.
 class CurvePlotData(object):
+    """The state of a single curve whilst plotting an output.
+    buffer is a list of (x, pos) pairs of numpy arrays that make up the current polyline.
+    polyLines is a list of (key, x, pos) of the completed polylines where key
+    is a tuple that orders the polylines of all curves."""
     def __init__(self, theId, theFn):
         self._id = theId
         self._fn = theFn
         self.buffer = []
+        self.polyLines = []
         self.prevWrap = None
     
     def __str__(self):
@@ -173,6 +203,22 @@ class CurvePlotData(object):
     @property
     def id(self):
         return self._id
+
+    def append(self, theX, thePos):
+        """Adds points to the buffer, theX and thePos are numpy arrays or numbers."""
+        self.buffer.append((numpy.atleast_1d(theX), numpy.atleast_1d(thePos)))
+
+    def flush(self, theKey):
+        """Completes the buffer as a polyline, if there is one, with the given ordering key."""
+        if len(self.buffer) > 0:
+            self.polyLines.append(
+                (
+                    theKey + (len(self.polyLines),),
+                    numpy.concatenate([b[0] for b in self.buffer]),
+                    numpy.concatenate([b[1] for b in self.buffer]),
+                )
+            )
+            self.buffer = []
     
 #############################################################################
 # Section: Code that handles the curve scales (or legends) that appear at top
@@ -555,6 +601,10 @@ class Plot(object):
     #: Maximum number of backup lines that can cross a single track in a single X step
     #: See the source of ``_filterCrossLineList()`` for an explanation.
     MAX_BACKUP_TRACK_CROSSING_LINES = 4
+    #: Curves are decimated so that there are at most four points per row of
+    #: this depth, see ``retDecimatedIndexes()``. The default is one SVG pixel.
+    #: Zero or less means no decimation.
+    DECIMATION_ROW_DEPTH = Coord.Dim(1.0 / PlotConstants.VIEW_BOX_UNITS_PER_PLOT_UNITS, PlotConstants.DEFAULT_PLOT_UNITS)
     
     def __init__(self, theFilmCfg, thePresCfg, theScale=0):
         # A FILMCfg.FilmCfg() object
@@ -1320,99 +1370,116 @@ class Plot(object):
         logging.info('Plot._plotSingleOutput(theFilmId={!r:s} theOutpId={!r:s}'.format(theFilmID, theOutpID))
         assert(self._presCfg.usesOutpChannel(theFilmID, theOutpID))
         assert(theFrameHolder.hasOutpMnem(theOutpID))
-        # Given an output ID select all curve IDs and iterate through their
-        # X/v points and scale them accordingly; X by the X axis scale and v by
-        # the tracValueFunction() and the track dimensions. Finally assemble
-        # into a SVG polyline in user units and send to the XML stream.
+        # Given an output ID select all curve IDs and take their X/v points as
+        # arrays and scale them accordingly; X by the X axis scale and v by
+        # the tracValueFunction() and the track dimensions. Null values and
+        # changes of wrap break the curve into polylines, these are
+        # assembled in user units and sent to the XML stream in the same
+        # order as plotting point by point.
         #
         myCurvIdS = self._presCfg.outpCurveIDs(theFilmID, theOutpID)
         myCurvPlotS = [CurvePlotData(c, self._presCfg[c].tracValueFunction(theFilmID)) for c in myCurvIdS]
         logging.debug('Plot._plotSingleOutput: myCurvPlotS: {!r:s}'.format([str(c) for c in myCurvPlotS]))
-        xPrev = None
-        ptPrevS = [None] * len(myCurvIdS)
-        numPoints = 0
-        numMathErrors = 0
         if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._plotSingleOutput(theFilmId={!r:s} theOutpId={!r:s} '.format(theFilmID, theOutpID))
-        for x, v in theFrameHolder.genOutpPoints(theOutpID):
-            # If v is a null or absent value then flush the buffer and start again
-            if v == theFrameHolder.nullValue:
-                for cuPlot in myCurvPlotS:
-                    self._flushPolyLineBuffer(cuPlot, xS)
-                continue
-            for cuIdx in range(len(myCurvIdS)):
-                numPoints += 1
-                # myCuPlot is a CurvePlotData object
-                myCuPlot = myCurvPlotS[cuIdx]
-                # Scale v by the track function
-                try:
-                    wr, pt = myCuPlot.fn.wrapPos(v)
-                except PRESCfg.ExceptionLineTransBaseMath:
-                    numMathErrors += 1
-                else:
-                    # print('Plot._plotSingleOutput(): x={:8.3f} v={:8.3f} wr={:4s} pt={:8.3f}'.format(x, v, str(wr), pt))
-                    if wr != myCuPlot.prevWrap and xPrev is not None and ptPrevS[cuIdx] is not None:
-                        # Interpolate wrapping
-                        self._interpolateBackup(
-                            myCuPlot,
-                            xS,
-                            thePlRo,
-                            # theTwd and theLtb
-                            self._presCfg[myCuPlot.id].tracWidthData(theFilmID),
-                            self._presCfg[myCuPlot.id].tracValueFunction(theFilmID),
-                            xPrev,
-                            x,
-                            pt,
-                            myCuPlot.prevWrap,
-                            wr,
-                            theFrameHolder.xAxisUnits,
-                        )
-                    if not myCuPlot.fn.offScale(wr):
-                        # Add to the buffer
-                        myCuPlot.buffer.append(thePlRo.polyLinePt(EngVal.EngVal(x, theFrameHolder.xAxisUnits), pt))
-                    myCuPlot.prevWrap = wr
-                    ptPrevS[cuIdx] = pt
-            xPrev = x
+        xArray, vArray = theFrameHolder.outpPointsArrays(theOutpID)
+        # Null or absent values flush all the curves
+        isNull = vArray == theFrameHolder.nullValue
+        nullIdxS = numpy.flatnonzero(isNull)
+        dataIdxS = numpy.flatnonzero(~isNull)
+        numPoints = len(dataIdxS) * len(myCurvIdS)
+        numMathErrors = 0
+        for cuIdx, myCuPlot in enumerate(myCurvPlotS):
+            numMathErrors += self._retCurvePolyLines(
+                theFilmID, cuIdx, myCuPlot, xArray, vArray, nullIdxS, dataIdxS, theFrameHolder.xAxisUnits
+            )
         logging.info('DONE: Plot._plotSingleOutput(theFilmId={!r:s} theOutpId={!r:s}'.format(theFilmID, theOutpID))
         if COMMENTS_IN_SVG_TRACE: xS.comment(' DONE: Plot._plotSingleOutput(theFilmId={!r:s} theOutpId={!r:s} '.format(theFilmID, theOutpID))
-        for cuPlot in myCurvPlotS:
-            self._flushPolyLineBuffer(cuPlot, xS)
+        myPolyLineS = sorted(
+            ((key, cuPlot.id, x, pos) for cuPlot in myCurvPlotS for key, x, pos in cuPlot.polyLines),
+            key=lambda t: t[0],
+        )
+        for _key, curvId, x, pos in myPolyLineS:
+            self._writePolyLine(curvId, thePlRo, theFrameHolder.xAxisUnits, x, pos, xS)
         if numMathErrors > 0:
             logging.warning('Plot._plotSingleOutput(): {:d} maths errors plotting output {!r:s}'.format(numMathErrors,
                                                                                                         theOutpID))
         return myCurvIdS, numPoints
+
+    def _retCurvePolyLines(self, theFilmID, theCuIdx, theCuPlot, xArray, vArray, nullIdxS, dataIdxS, theXUnits):
+        """Computes the polylines for a single curve into theCuPlot.polyLines.
+        xArray, vArray are the X axis and values as numpy arrays.
+        nullIdxS, dataIdxS are the indexes into those arrays of null and non-null values.
+        Each polyline key is (index of the point that completes the polyline, theCuIdx, ...).
+        Returns the number of values that could not be transformed to a plot position."""
+        myWrapS, myPosS, isValid = theCuPlot.fn.wrapPosArray(vArray[dataIdxS])
+        numMathErrors = len(isValid) - numpy.count_nonzero(isValid)
+        # Indexes into xArray of the points that can be plotted
+        myIdxS = dataIdxS[isValid]
+        myWrapS = myWrapS[isValid]
+        myPosS = myPosS[isValid]
+        # Events are (index into xArray, index into myIdxS of a wrap change or None for a null value)
+        myEventS = [(i, None) for i in nullIdxS.tolist()]
+        myEventS += [(myIdxS[k], k) for k in (numpy.flatnonzero(myWrapS[1:] != myWrapS[:-1]) + 1).tolist()]
+        myEventS.sort()
+        myStart = 0
+        for xIdx, k in myEventS:
+            myStop = k if k is not None else numpy.searchsorted(myIdxS, xIdx)
+            if myStop > myStart:
+                if not theCuPlot.fn.offScale(int(myWrapS[myStart])):
+                    theCuPlot.append(xArray[myIdxS[myStart:myStop]], myPosS[myStart:myStop])
+                theCuPlot.prevWrap = int(myWrapS[myStop - 1])
+                myStart = myStop
+            if k is None:
+                theCuPlot.flush((xIdx, theCuIdx))
+            else:
+                # Interpolate wrapping, X previous is the last non-null point
+                self._interpolateBackup(
+                    theCuPlot,
+                    (xIdx, theCuIdx),
+                    # theTwd and theLtb
+                    self._presCfg[theCuPlot.id].tracWidthData(theFilmID),
+                    theCuPlot.fn,
+                    xArray[dataIdxS[numpy.searchsorted(dataIdxS, xIdx) - 1]],
+                    xArray[xIdx],
+                    myPosS[k],
+                    int(myWrapS[k]),
+                )
+        if len(myIdxS) > myStart:
+            if not theCuPlot.fn.offScale(int(myWrapS[myStart])):
+                theCuPlot.append(xArray[myIdxS[myStart:]], myPosS[myStart:])
+            theCuPlot.prevWrap = int(myWrapS[-1])
+        theCuPlot.flush((len(xArray), theCuIdx))
+        return numMathErrors
+
+    def _writePolyLine(self, theCurvID, thePlRo, theXUnits, xArray, posArray, xS):
+        """Write a polyline for the curve from numpy arrays of X axis values and plot positions.
+        The polyline is decimated to rows of DECIMATION_ROW_DEPTH."""
+        if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._writePolyLine() curve={:s}'.format(theCurvID.pStr()))
+        myAttrs = Stroke.retSVGAttrsFromStroke(self._presCfg[theCurvID].codiStroke)
+        myAttrs['fill'] = "none"
+        # PlotRoll.polyLinePt() works on arrays as well as numbers
+        myPt = thePlRo.polyLinePt(EngVal.EngVal(xArray, theXUnits), posArray)
+        myTracPosS, myDepthS = myPt.x.value, myPt.y.value
+        myIdxS = retDecimatedIndexes(
+            myTracPosS,
+            myDepthS,
+            self.DECIMATION_ROW_DEPTH.convert(PlotConstants.DEFAULT_PLOT_UNITS).value \
+                * PlotConstants.VIEW_BOX_UNITS_PER_PLOT_UNITS,
+        )
+        if len(myIdxS) < len(myDepthS):
+            myTracPosS, myDepthS = myTracPosS[myIdxS], myDepthS[myIdxS]
+        with SVGWriter.SVGPolylineXY(xS, myTracPosS, myDepthS, attrs=myAttrs):
+            pass
     
-    def _flushPolyLineBuffer(self, theCurvPlotData, xS):
-        """Flush buffer and plot the points."""
-        if len(theCurvPlotData.buffer) > 0:
-            if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._flushPolyLineBuffer() curve={:s}'.format(theCurvPlotData.id.pStr()))
-            myAttrs = Stroke.retSVGAttrsFromStroke(self._presCfg[theCurvPlotData.id].codiStroke)
-            myAttrs['fill'] = "none"
-            with SVGWriter.SVGPolyline(
-                    xS,
-                    theCurvPlotData.buffer,
-                    attrs=myAttrs):
-                pass
-            # Now flush the buffer
-            theCurvPlotData.buffer = []
-    
-    def _interpolateBackup(self, theCuPlot, xS, thePlRo, theTwd, theLtb, xPrev, xNow, pNow, wrapPrev, wrapNow, theXUnits):
+    def _interpolateBackup(self, theCuPlot, theKey, theTwd, theLtb, xPrev, xNow, pNow, wrapNow):
         """Handles the case where the curve is on a backup track.
+        theKey is the ordering key of any polylines that are completed here.
         theTwd is a TrackWidthData object, theLtb is derived from LineTransBase.
         xPrev/xNow is the previous/current X axis value as a number. 
-        pNow is the previous/current plot deflection as a number in plot units. 
-        wrapPrev/wrapNow are integers (or None) of the wrap state for the curve.
+        pNow is the current plot deflection as a number in plot units. 
+        wrapNow is an integer of the wrap state for the curve, the previous
+        wrap state is theCuPlot.prevWrap.
         See notebook for 2011-05-13/15/16/17"""
-        if COMMENTS_IN_SVG_TRACE:
-            xS.comment(
-                ' Plot._interpolateBackup(): xPrev={:s} xNow={:s} pNow={:s} wrapPrev={:s} wrapNow={:s} '.format(
-                    str(xPrev),
-                    str(xNow),
-                    str(pNow),
-                    str(wrapPrev),
-                    str(wrapNow),
-                )
-            )
-        # Interpolate wrapping
         polyEnd, wrapLines, polyStart = self._retInterpolateWrapPoints(
                 theTwd,
                 theLtb,
@@ -1425,40 +1492,24 @@ class Plot(object):
         assert(polyEnd is None or len(polyEnd) == 2)
         assert(len(wrapLines) % 2 == 0)
         assert(len(polyStart) in (0, 2))
-#        logging.debug('Plot._interpolateBackup()   polyEnd {:s}'.format(str(polyEnd)))
-#        logging.debug('Plot._interpolateBackup() wrapLines {:s}'.format(str(wrapLines)))
-#        logging.debug('Plot._interpolateBackup() polyStart {:s}'.format(str(polyStart)))
-#        logging.debug('')
-        if COMMENTS_IN_SVG_TRACE:
-            xS.comment(' Plot._interpolateBackup()   polyEnd {:s} '.format(str(polyEnd)))
-            xS.comment(' Plot._interpolateBackup() wrapLines {:s} '.format(str(wrapLines)))
-            xS.comment(' Plot._interpolateBackup() polyStart {:s} '.format(str(polyStart)))
         # End existing polyline
         if polyEnd is not None:
-            if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._interpolateBackup() appending as polyEnd is not None {:s}'.format(thePlRo.polyLinePt(polyEnd[0], polyEnd[1].value)))
-            theCuPlot.buffer.append(thePlRo.polyLinePt(EngVal.EngVal(polyEnd[0], theXUnits), polyEnd[1].value))
-        # Flush buffer
-        self._flushPolyLineBuffer(theCuPlot, xS)
-        if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot.Plot._interpolateBackup() flushed polyline at wrap change ')
-        theCuPlot.buffer = []
-        # Handle crossing lines
-        if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot.Plot._interpolateBackup() writing crossing lines ')
+            theCuPlot.append(polyEnd[0], polyEnd[1].value)
+        theCuPlot.flush(theKey)
+        # Handle crossing lines, write a line from [c] to [c+1]
         for c in range(0, len(wrapLines), 2):
-            # Write a line from [c] to [c+1]
-            if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._interpolateBackup() appending cross line[0] {:s}'.format(thePlRo.polyLinePt(wrapLines[c][0], wrapLines[c][1].value)))
-            theCuPlot.buffer.append(thePlRo.polyLinePt(EngVal.EngVal(wrapLines[c][0], theXUnits), wrapLines[c][1].value))
-            if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._interpolateBackup() appending cross line[1] {:s}'.format(thePlRo.polyLinePt(wrapLines[c+1][0], wrapLines[c+1][1].value)))
-            theCuPlot.buffer.append(thePlRo.polyLinePt(EngVal.EngVal(wrapLines[c+1][0], theXUnits), wrapLines[c+1][1].value))
-            self._flushPolyLineBuffer(theCuPlot, xS)
-            theCuPlot.buffer = []
-        if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot.Plot._interpolateBackup() have written crossing lines ')
+            theCuPlot.append(
+                [wrapLines[c][0], wrapLines[c+1][0]],
+                [wrapLines[c][1].value, wrapLines[c+1][1].value],
+            )
+            theCuPlot.flush(theKey)
         # Now start of next polyline
         if len(polyStart) > 0:
-            if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._interpolateBackup() starting new line[0] {:s}'.format(thePlRo.polyLinePt(polyStart[0][0], polyStart[0][1].value)))
-            theCuPlot.buffer.append(thePlRo.polyLinePt(EngVal.EngVal(polyStart[0][0], theXUnits), polyStart[0][1].value))
             # Note: polyStart[1][1] is a number not a Dim()
-            if COMMENTS_IN_SVG_TRACE: xS.comment(' Plot._interpolateBackup() starting new line[1] {:s}'.format(thePlRo.polyLinePt(polyStart[1][0], polyStart[1][1])))
-            theCuPlot.buffer.append(thePlRo.polyLinePt(EngVal.EngVal(polyStart[1][0], theXUnits), polyStart[1][1]))
+            theCuPlot.append(
+                [polyStart[0][0], polyStart[1][0]],
+                [polyStart[0][1].value, polyStart[1][1]],
+            )
 
     def _retInterpolateWrapPoints(self, theTwd, theLtb, xPrev, xNow, pNow, wrapPrev, wrapNow):
         """This returns a set of generated points when a change in a 'wrap'
@@ -213,6 +213,26 @@ class SVGPolyline(SVGPointList):
         them to the User Coordinate System."""
         super(SVGPolyline, self).__init__(theXmlStream, 'polyline', pointS, attrs)
     
+class SVGPolylineXY(XmlWrite.Element):
+    """A polyline in SVG. Initialise the polyline with a stream, and two numpy
+    arrays of x and y values in the User Coordinate System.
+    
+    This writes the same as SVGPolyline but without creating a Coord.Pt() for each point.
+    """
+    def __init__(self, theXmlStream, xS, yS, attrs=None):
+        """Initialise the polyline with a stream, and two numpy arrays of x and y values."""
+        if len(xS) != len(yS):
+            raise ExceptionSVGWriter(
+                'SVGPolylineXY(): length of x {:d} does not match length of y {:d}'.format(len(xS), len(yS))
+            )
+        myFmt = DEFAULT_VALUE_FORMAT_POINTS + ',' + DEFAULT_VALUE_FORMAT_POINTS
+        _attrs = {
+            'points' : ' '.join(map(myFmt.format, xS.tolist(), yS.tolist()))
+        }
+        if attrs:
+            _attrs.update(attrs)
+        super(SVGPolylineXY, self).__init__(theXmlStream, 'polyline', _attrs)
+
 class SVGPolygon(SVGPointList):
     """A polygon in SVG. Initialise the polygon with a stream, and a list of Coord.Pt() objects.
     
@@ -1,6 +1,7 @@
 import io
 import math
 
+import numpy as np
 import pytest
 
 from TotalDepth.BIT import ReadBIT
@@ -63,6 +64,45 @@ def test_isingl_float_to_bytes(float_value, bytes_value):
     assert result == bytes_value
 
 
+@pytest.mark.parametrize(
+    'float_value, bytes_value',
+    ISINGL_EXAMPLES
+)
+def test_isingl_floats_from_bytes(float_value, bytes_value):
+    result = ReadBIT.floats_from_bytes(bytes_value)
+    assert result.dtype == np.float64
+    assert len(result) == 1
+    assert math.isclose(result[0], float_value, rel_tol=1e-7)
+
+
+def test_floats_from_bytes_same_as_gen_floats():
+    b = b''.join(bytes_value for _float_value, bytes_value in ISINGL_EXAMPLES)
+    expected = []
+    for offset in range(0, len(b), ReadBIT.LEN_FLOAT_BYTES):
+        sign = b[offset] & 0x80
+        exp = b[offset] & 0x7f
+        mantissa = b[offset + 1] << 16 | b[offset + 2] << 8 | b[offset + 3]
+        value = mantissa / 0xffffff * 16 ** (exp - 64)
+        expected.append(-value if sign else value)
+    assert ReadBIT.floats_from_bytes(b).tolist() == expected
+    assert list(ReadBIT.gen_floats(b)) == expected
+
+
+@pytest.mark.parametrize(
+    'b, count, expected',
+    (
+        (b'', -1, []),
+        (b'\x42\x99\x00\x00\xc2\x99\x00\x00', -1, [153.0, -153.0]),
+        (b'\x42\x99\x00\x00\xc2\x99\x00\x00', 1, [153.0]),
+        # Trailing partial value is ignored.
+        (b'\x42\x99\x00\x00\xc2\x99', -1, [153.0]),
+    )
+)
+def test_floats_from_bytes_count(b, count, expected):
+    result = ReadBIT.floats_from_bytes(b, count)
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
 def test_binary_data_end():
     tell = 0x128
     tell += 4
@@ -405,6 +445,31 @@ def test_create_bit_frame_array_from_file_temporary_frames_empty():
         assert frame_array[0]._temporary_frames == []
 
 
+def test_create_bit_frame_array_from_file_x_axis():
+    with io.BytesIO(EXAMPLE_BIT_FILE) as file:
+        bit_frame_array = ReadBIT.create_bit_frame_array_from_file(file)[0]
+        x_axis = bit_frame_array.frame_array.x_axis.array
+        assert x_axis.shape == (128, 1)
+        np.testing.assert_array_equal(x_axis[:, 0], 11916.0 - 0.25 * np.arange(128))
+
+
+def test_create_bit_frame_array_from_file_channel_major():
+    with io.BytesIO(EXAMPLE_BIT_FILE) as file:
+        bit_frame_array = ReadBIT.create_bit_frame_array_from_file(file)[0]
+    # Decode the data blocks value by value, channel major within each block.
+    expected = [[] for _name in bit_frame_array.channel_names]
+    with io.BytesIO(EXAMPLE_BIT_FILE) as file:
+        tif_blocks = [b for b in ReadBIT.yield_tif_blocks(file) if b.tif_type == ReadBIT.TifType.DATA][1:]
+    for tif_block in tif_blocks:
+        values = list(ReadBIT.gen_floats(tif_block.payload))
+        num_frames = len(values) // len(expected)
+        for c in range(len(expected)):
+            expected[c].extend(values[c * num_frames:(c + 1) * num_frames])
+    for c, channel in enumerate(bit_frame_array.frame_array.channels[1:]):
+        assert channel.array.shape == (128, 1)
+        assert channel.array[:, 0].tolist() == expected[c]
+
+
 @pytest.mark.parametrize(
     'attribute, expected',
     (
@@ -328,3 +328,64 @@ def test_parse_minimal_example_file_missing_channel():
     frame_array = DAT_parser.parse_file(file_object)
     assert len(frame_array) == 4
     assert [len(frame_array[i]) for i in range(len(frame_array))] == [3, 3, 3, 3]
+
+
+def _example_dat_file_with_rows(num_rows: int, bad_row: int = -1) -> str:
+    """Returns a minimal DAT file with num_rows of data, if bad_row >= 0 that row has a bad BDIA value."""
+    lines = [EXAMPLE_MINIMAL_DAT_FILE.splitlines()[i] for i in range(6)]
+    for r in range(num_rows):
+        bdia = 'bad' if r == bad_row else f'{r / 4:.2f}'
+        lines.append(f'{1165665017 + r} 09Dec06 11-50-17 {r} {bdia}')
+    return '\n'.join(lines) + '\n'
+
+
+@pytest.mark.parametrize('chunk_frames', (1, 2, 3, 7, 8192))
+def test_parse_file_chunks(monkeypatch, chunk_frames):
+    monkeypatch.setattr(DAT_parser, 'DATA_CHUNK_FRAMES', chunk_frames)
+    frame_array = DAT_parser.parse_file(io.StringIO(_example_dat_file_with_rows(2000)))
+    assert [frame_array[i].array.shape for i in range(len(frame_array))] == [(2000, 1)] * 5
+    assert frame_array[3].array[:, 0].tolist() == list(range(2000))
+    assert frame_array[4].array[:, 0].tolist() == [float(f'{r / 4:.2f}') for r in range(2000)]
+    assert frame_array.x_axis[(1999, 0)] == datetime.datetime(2006, 12, 9, 12, 23, 36)
+
+
+def test_parse_file_no_data():
+    frame_array = DAT_parser.parse_file(io.StringIO(_example_dat_file_with_rows(0)))
+    assert [frame_array[i].array.shape for i in range(len(frame_array))] == [(0, 1)] * 5
+
+
+@pytest.mark.parametrize('chunk_frames', (1, 3, 8192))
+@pytest.mark.parametrize('bad_row', (0, 4, 9))
+def test_parse_file_chunks_bad_value(monkeypatch, chunk_frames, bad_row):
+    monkeypatch.setattr(DAT_parser, 'DATA_CHUNK_FRAMES', chunk_frames)
+    with pytest.raises(DAT_parser.ExceptionDATRead) as err:
+        DAT_parser.parse_file(io.StringIO(_example_dat_file_with_rows(10, bad_row)))
+    assert err.value.args[0] == (
+        f"Line: {bad_row + 7}: Can not convert value. Error: could not convert string to float: 'bad'"
+    )
+
+
+def test_can_parse_file():
+    assert DAT_parser.can_parse_file(io.StringIO(EXAMPLE_MINIMAL_DAT_FILE))
+
+
+def test_can_parse_file_stops_after_first_row():
+    # Bad values after the first row are not read.
+    file_object = io.StringIO(EXAMPLE_MINIMAL_DAT_FILE + 'garbage\n' * 1000)
+    assert DAT_parser.can_parse_file(file_object)
+    assert file_object.tell() < len(EXAMPLE_MINIMAL_DAT_FILE) + len('garbage\n')
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        '',
+        'asdadf\nasdsa',
+        # Declarations but no data.
+        '\n'.join(EXAMPLE_MINIMAL_DAT_FILE.splitlines()[:6]),
+        # Over long line.
+        'UTIM Unix Time ' + 'x' * DAT_parser.SNIFF_MAX_LINE_LENGTH + '\n',
+    )
+)
+def test_can_parse_file_false(value):
+    assert not DAT_parser.can_parse_file(io.StringIO(value))
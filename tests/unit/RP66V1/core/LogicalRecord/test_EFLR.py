@@ -1160,3 +1160,92 @@ def test_ExplicitlyFormattedLogicalRecord_key_values(sort_order, expected):
     result = eflr.key_values(stringify_function=stringify.stringify_object_by_type, sort=sort_order)
     # print(result)
     assert result == expected
+
+
+@pytest.mark.parametrize('descriptor', range(0x60))
+def test_ATTRIBUTE_FORMATS(descriptor):
+    attribute_format = EFLR.ATTRIBUTE_FORMATS[descriptor]
+    component_descriptor = ComponentDescriptor(descriptor)
+    assert attribute_format.component_descriptor == component_descriptor
+    assert attribute_format.has_L == bool(component_descriptor.has_attribute_L)
+    assert attribute_format.has_C == bool(component_descriptor.has_attribute_C)
+    assert attribute_format.has_R == bool(component_descriptor.has_attribute_R)
+    assert attribute_format.has_U == bool(component_descriptor.has_attribute_U)
+    assert attribute_format.has_V == bool(component_descriptor.has_attribute_V)
+
+
+def test_Template_plan():
+    template = EFLR.Template()
+    template.read(LogicalData(TEMPLATE_BYTES))
+    plan = template.plan
+    assert plan is template.plan
+    assert len(plan) == 5
+    assert plan.labels == (b'LONG-NAME', b'ELEMENT-LIMIT', b'REPRESENTATION-CODE', b'UNITS', b'DIMENSION')
+    assert plan.invariant == (False,) * 5
+    assert plan.absent == (False,) * 5
+
+
+def test_Object_with_labels():
+    template = EFLR.Template()
+    template.read(LogicalData(b'\x34\x01A\x13\x34\x01B\x13\x70'))
+    # Attribute: LV then Attribute: V
+    obj = EFLR.Object(LogicalData(b'\x70\x00\x00\x01X\x31\x01A\x01a\x21\x01b'), template)
+    assert obj.attr_label_map == {b'A': 0, b'B': 1}
+    assert obj[b'A'].value == [b'a']
+    assert obj[b'B'].value == [b'b']
+
+
+def test_Object_with_labels_raises_duplicate():
+    template = EFLR.Template()
+    template.read(LogicalData(b'\x34\x01A\x13\x34\x01B\x13\x70'))
+    # Attribute: LV then Attribute: LV both labelled A
+    with pytest.raises(EFLR.ExceptionEFLRObjectDuplicateLabel):
+        EFLR.Object(LogicalData(b'\x70\x00\x00\x01X\x31\x01A\x01a\x31\x01A\x01b'), template)
+
+
+def test_Object_raises_not_attribute():
+    template = EFLR.Template()
+    template.read(LogicalData(b'\x34\x01A\x13\x34\x01B\x13\x70'))
+    with pytest.raises(EFLR.ExceptionEFLRObject) as err:
+        EFLR.Object(LogicalData(b'\x70\x00\x00\x01X\xf0\x01A'), template)
+    assert err.value.args[0] == 'Component Descriptor does not represent a attribute but a Set.'
+
+
+# PARAMETER_TABLE_BYTES without the three pad bytes.
+@pytest.mark.parametrize('by', (LOGICAL_BYTES_FROM_STANDARD, PARAMETER_TABLE_BYTES[:-3]))
+@pytest.mark.parametrize('as_memoryview', (False, True))
+def test_ExplicitlyFormattedLogicalRecord_lazy_objects(by, as_memoryview):
+    eflr_eager = EFLR.ExplicitlyFormattedLogicalRecord(3, LogicalData(by))
+    if as_memoryview:
+        by = memoryview(by)
+    ld = LogicalData(by)
+    eflr_lazy = EFLR.ExplicitlyFormattedLogicalRecord(3, ld, lazy_objects=True)
+    assert ld.remain == 0
+    assert eflr_lazy.logical_data_consumed == eflr_eager.logical_data_consumed
+    assert all(obj.is_materialised for obj in eflr_eager.objects)
+    assert not any(obj.is_materialised for obj in eflr_lazy.objects)
+    assert [obj.name for obj in eflr_lazy.objects] == [obj.name for obj in eflr_eager.objects]
+    if as_memoryview:
+        by.release()
+    assert eflr_lazy == eflr_eager
+    assert all(obj.is_materialised for obj in eflr_lazy.objects)
+    assert eflr_lazy.str_long() == eflr_eager.str_long()
+
+
+def test_ExplicitlyFormattedLogicalRecord_lazy_objects_class_default():
+    class LazyEFLR(EFLR.ExplicitlyFormattedLogicalRecord):
+        LAZY_OBJECTS = True
+
+    eflr = LazyEFLR(3, LogicalData(LOGICAL_BYTES_FROM_STANDARD))
+    assert not eflr.objects[0].is_materialised
+    eflr = LazyEFLR(3, LogicalData(LOGICAL_BYTES_FROM_STANDARD), lazy_objects=False)
+    assert eflr.objects[0].is_materialised
+
+
+def test_ExplicitlyFormattedLogicalRecord_lazy_objects_getitem():
+    eflr = EFLR.ExplicitlyFormattedLogicalRecord(3, LogicalData(LOGICAL_BYTES_FROM_STANDARD), lazy_objects=True)
+    obj = eflr[ObjectName(O=1, C=0, I=b'PRESSURE')]
+    assert not obj.is_materialised
+    assert obj[b'UNITS'].value == [b'PSI']
+    assert obj.is_materialised
+    assert not eflr[ObjectName(O=0, C=0, I=b'TIME')].is_materialised
@@ -6,6 +6,7 @@ import typing
 import pytest
 
 from TotalDepth.RP66V1.core import File
+from TotalDepth.RP66V1.core import pFile
 
 # from . import test_data
 from tests.unit.RP66V1.core import test_data
@@ -780,6 +781,15 @@ def test_logical_data_chunk(reads, len_chunk, chunk):
     assert ld.chunk(len_chunk) == chunk
 
 
+def test_logical_data_chunk_memoryview():
+    ld = File.LogicalData(memoryview(b'\x00\x01\x02\x03'))
+    ld.read()
+    assert ld.view_remaining(2) == b'\x01\x02'
+    chunk = ld.chunk(2)
+    assert isinstance(chunk, bytes)
+    assert chunk == b'\x01\x02'
+
+
 def test_logical_data_chunk_raises():
     ld = File.LogicalData(b'\x00\x01\x02\x03')
     ld.read()
@@ -1600,4 +1610,160 @@ def test_file_get_file_logical_data_partial_raises_on_negative_offset():
             assert err.value.args[0] == 'offset must be >= 0 not -1'
 
 
+def _file_read_results(monkeypatch, path: str, backend: str,
+                       offset: int, length: int) -> typing.Tuple[typing.List[str], typing.List[bytes]]:
+    with monkeypatch.context() as context:
+        if backend != 'native':
+            context.setattr(pFile, 'NativeFileRead', None)
+        context.setattr(pFile, 'USE_MMAP', backend == 'mmap')
+        with File.FileRead(path) as file_read:
+            positions = [str(v) for v in file_read.iter_logical_record_positions()]
+            data = [
+                bytes(file_read.get_file_logical_data(lrp, offset, length).logical_data.bytes)
+                for lrp, _lrd in file_read.iter_logical_record_positions()
+            ]
+    return positions, data
+
+
+@pytest.mark.skipif(File.NativeFileRead is None, reason='Native cFile extension not built.')
+@pytest.mark.parametrize(
+    'file_bytes',
+    (
+        test_data.BASIC_FILE,
+        test_data.BASIC_FILE_WITH_TWO_VISIBLE_RECORDS_NO_IFLRS,
+        test_data.MINIMAL_FILE,
+        test_data.SMALL_FILE,
+        test_data.FILE_256kb,
+    )
+)
+@pytest.mark.parametrize('offset, length', ((0, -1), (0, 4), (2, 8), (5, -1), (0x1f7, -1)))
+def test_file_native_matches_python(monkeypatch, tmpdir, file_bytes, offset, length):
+    path = tmpdir.join('rp66v1file.dlis').strpath
+    with open(path, 'wb') as temp_file:
+        temp_file.write(file_bytes)
+    with File.FileRead(path) as file_read:
+        assert file_read._native is not None
+    native = _file_read_results(monkeypatch, path, 'native', offset, length)
+    assert native == _file_read_results(monkeypatch, path, 'python', offset, length)
+
+
+@pytest.mark.parametrize(
+    'file_bytes',
+    (
+        test_data.BASIC_FILE,
+        test_data.BASIC_FILE_WITH_TWO_VISIBLE_RECORDS_NO_IFLRS,
+        test_data.MINIMAL_FILE,
+        test_data.SMALL_FILE,
+        test_data.FILE_256kb,
+    )
+)
+@pytest.mark.parametrize('offset, length', ((0, -1), (0, 4), (2, 8), (5, -1), (0x1f7, -1)))
+def test_file_mmap_matches_python(monkeypatch, tmpdir, file_bytes, offset, length):
+    path = tmpdir.join('rp66v1file.dlis').strpath
+    with open(path, 'wb') as temp_file:
+        temp_file.write(file_bytes)
+    mapped = _file_read_results(monkeypatch, path, 'mmap', offset, length)
+    assert mapped == _file_read_results(monkeypatch, path, 'python', offset, length)
+
+
+def test_file_mmap_logical_data_is_memoryview(monkeypatch, tmpdir):
+    monkeypatch.setattr(pFile, 'NativeFileRead', None)
+    path = tmpdir.join('rp66v1file.dlis').strpath
+    with open(path, 'wb') as temp_file:
+        temp_file.write(test_data.BASIC_FILE)
+    with File.FileRead(path) as file_read:
+        lr_pos_descs = list(file_read.iter_logical_record_positions())
+        file_logical_data = file_read.get_file_logical_data(lr_pos_descs[0].position)
+    # Still usable after the file has been closed.
+    assert isinstance(file_logical_data.logical_data.bytes, memoryview)
+    assert len(file_logical_data) == lr_pos_descs[0].description.ld_length
+    assert isinstance(file_logical_data.logical_data.chunk(4), bytes)
+
+
+def test_file_mmap_falls_back_to_python_exception(monkeypatch, tmpdir):
+    monkeypatch.setattr(pFile, 'NativeFileRead', None)
+    path = tmpdir.join('rp66v1file.dlis').strpath
+    with open(path, 'wb') as temp_file:
+        temp_file.write(test_data.FILE_WITH_SECOND_LRSH_NOT_FIRST_RECORD)
+    with File.FileRead(path) as file_read:
+        assert file_read._mmap is not None
+        with pytest.raises(File.ExceptionLogicalRecordSegmentHeaderSequence):
+            list(file_read.iter_logical_record_positions())
+
+
+@pytest.mark.parametrize('backend', ('python', 'mmap', 'native'))
+@pytest.mark.parametrize('offset, length', ((0, 4), (0, 200), (2, 8), (100, 300), (0x1f7, 0x3000)))
+def test_file_partial_read_multi_segment(monkeypatch, tmpdir, backend, offset, length):
+    if backend == 'native' and File.NativeFileRead is None:
+        pytest.skip('Native cFile extension not built.')
+    path = tmpdir.join('rp66v1file.dlis').strpath
+    with open(path, 'wb') as temp_file:
+        temp_file.write(test_data.FILE_256kb)
+    _positions, full = _file_read_results(monkeypatch, path, backend, 0, -1)
+    _positions, partial = _file_read_results(monkeypatch, path, backend, offset, length)
+    assert partial == [by[offset:offset + length] for by in full]
+
+
+@pytest.mark.parametrize('backend', ('python', 'mmap', 'native'))
+@pytest.mark.parametrize('batch_read_bytes', (64, 4096, 1024**2))
+@pytest.mark.parametrize('position_slice', (slice(None), slice(None, None, 5), slice(None, None, -1)))
+@pytest.mark.parametrize('offset, length', ((0, -1), (2, 8), (0x1f7, 0x3000)))
+def test_file_iter_file_logical_data(monkeypatch, tmpdir, backend, batch_read_bytes, position_slice, offset, length):
+    if backend == 'native' and File.NativeFileRead is None:
+        pytest.skip('Native cFile extension not built.')
+    path = tmpdir.join('rp66v1file.dlis').strpath
+    with open(path, 'wb') as temp_file:
+        temp_file.write(test_data.FILE_256kb)
+    monkeypatch.setattr(File.FileRead, 'BATCH_READ_BYTES', batch_read_bytes)
+    if backend != 'native':
+        monkeypatch.setattr(pFile, 'NativeFileRead', None)
+    monkeypatch.setattr(pFile, 'USE_MMAP', backend == 'mmap')
+    with File.FileRead(path) as file_read:
+        positions = [lr_pos_desc.position for lr_pos_desc in file_read.iter_logical_record_positions()][position_slice]
+        expected = [bytes(file_read.get_file_logical_data(p, offset, length).logical_data.bytes) for p in positions]
+        result = [
+            bytes(fld.logical_data.bytes) for fld in file_read.iter_file_logical_data(positions, offset, length)
+        ]
+    assert result == expected
+
+
+def test_file_iter_file_logical_data_block_size_limit(monkeypatch):
+    read_sizes = []
+
+    class RecordReads(io.BytesIO):
+        def read(self, size=-1):
+            read_sizes.append(size)
+            return super().read(size)
+
+    monkeypatch.setattr(pFile, 'NativeFileRead', None)
+    monkeypatch.setattr(File.FileRead, 'BATCH_READ_BYTES', 64)
+    # A Logical Record that can never be decoded from a block.
+    monkeypatch.setattr(File.FileRead, '_buffer_file_logical_data', lambda *args: None)
+    with File.FileRead(RecordReads(test_data.FILE_256kb)) as file_read:
+        position = next(file_read.iter_logical_record_positions()).position
+        read_sizes.clear()
+        result = list(file_read.iter_file_logical_data([position]))
+        expected = bytes(file_read.get_file_logical_data(position).logical_data.bytes)
+    assert [bytes(fld.logical_data.bytes) for fld in result] == [expected]
+    assert max(read_sizes) == 64 * File.FileRead.BATCH_READ_MAX_MULTIPLE
+
+
+def test_file_iter_file_logical_data_raises(monkeypatch):
+    monkeypatch.setattr(pFile, 'NativeFileRead', None)
+    with File.FileRead(io.BytesIO(test_data.BASIC_FILE)) as file_read:
+        position = File.LogicalRecordPosition.from_positions(len(test_data.BASIC_FILE), len(test_data.BASIC_FILE) + 4)
+        with pytest.raises(File.ExceptionVisibleRecordEOF):
+            list(file_read.iter_file_logical_data([position]))
+
+
+@pytest.mark.skipif(File.NativeFileRead is None, reason='Native cFile extension not built.')
+def test_file_native_falls_back_to_python_exception(tmpdir):
+    path = tmpdir.join('rp66v1file.dlis').strpath
+    with open(path, 'wb') as temp_file:
+        temp_file.write(test_data.FILE_WITH_SECOND_LRSH_NOT_FIRST_RECORD)
+    with File.FileRead(path) as file_read:
+        with pytest.raises(File.ExceptionLogicalRecordSegmentHeaderSequence):
+            list(file_read.iter_logical_record_positions())
+
+
 # ==================== END: Test of FileRead ========================
@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pytest
+
+from TotalDepth.RP66V1.core import IndexCache
+from TotalDepth.common import npz_cache
+
+
+def test_cache_path_sidecar():
+    assert IndexCache.cache_path('spam/eggs.dlis', '') == 'spam/eggs.dlis' + IndexCache.SIDECAR_SUFFIX
+
+
+def test_cache_path_cache_dir():
+    path = IndexCache.cache_path('spam/eggs.dlis', 'cache')
+    assert os.path.dirname(path) == 'cache'
+    assert path.endswith(IndexCache.SIDECAR_SUFFIX)
+    assert path != IndexCache.cache_path('spam/chips.dlis', 'cache')
+
+
+def _write_file(tmpdir) -> str:
+    path = tmpdir.join('file.dlis').strpath
+    with open(path, 'wb') as file:
+        file.write(b'\x00' * 128)
+    return path
+
+
+def test_write_read(tmpdir):
+    path = _write_file(tmpdir)
+    path_cache = IndexCache.cache_path(path, tmpdir.join('cache').strpath)
+    arrays = {'spam': np.arange(8, dtype=np.int64), 'eggs': np.array([1.5, 2.5])}
+    IndexCache.write(path_cache, IndexCache.file_key(path), {'chips': [1, 'two']}, arrays)
+    metadata, arrays_read = IndexCache.read(path_cache, IndexCache.file_key(path))
+    assert metadata == {'chips': [1, 'two']}
+    assert sorted(arrays_read.keys()) == ['eggs', 'spam']
+    for name in arrays:
+        np.testing.assert_array_equal(arrays_read[name], arrays[name])
+
+
+def test_read_missing(tmpdir):
+    path = _write_file(tmpdir)
+    assert IndexCache.read(IndexCache.cache_path(path, ''), IndexCache.file_key(path)) is None
+
+
+def test_read_stale(tmpdir):
+    path = _write_file(tmpdir)
+    path_cache = IndexCache.cache_path(path, '')
+    IndexCache.write(path_cache, IndexCache.file_key(path), {}, {})
+    with open(path, 'ab') as file:
+        file.write(b'\x00')
+    assert IndexCache.read(path_cache, IndexCache.file_key(path)) is None
+
+
+def test_read_corrupt(tmpdir):
+    path = _write_file(tmpdir)
+    path_cache = IndexCache.cache_path(path, '')
+    with open(path_cache, 'wb') as file:
+        file.write(b'Not a numpy file.')
+    assert IndexCache.read(path_cache, IndexCache.file_key(path)) is None
+
+
+@pytest.mark.parametrize('fraction', (0.0, 0.25, 0.5, 0.99))
+def test_read_truncated(tmpdir, fraction):
+    path = _write_file(tmpdir)
+    path_cache = IndexCache.cache_path(path, '')
+    IndexCache.write(path_cache, IndexCache.file_key(path), {'chips': 1}, {'spam': np.arange(1024)})
+    with open(path_cache, 'r+b') as file:
+        file.truncate(int(os.path.getsize(path_cache) * fraction))
+    assert IndexCache.read(path_cache, IndexCache.file_key(path)) is None
+
+
+def test_write_raises_on_reserved_name(tmpdir):
+    path = _write_file(tmpdir)
+    with pytest.raises(IndexCache.ExceptionIndexCache):
+        IndexCache.write(IndexCache.cache_path(path, ''), IndexCache.file_key(path), {},
+                         {npz_cache.METADATA_NAME: np.arange(4)})
@@ -271,6 +271,60 @@ def test_read_iflr_partial():
     assert str(frame_array.channels[8].array) == """[]"""
 
 
+def test_frame_array_is_fixed_length():
+    log_pass = _log_pass()
+    frame_array: LogPass.RP66V1FrameArray = log_pass[FRAME_ARRAY_IDENT]
+    assert frame_array.is_fixed_length
+    assert frame_array.len_input_bytes == 9 * 4
+    assert frame_array.frame_dtype.itemsize == 9 * 4
+
+
+def test_read_frames():
+    log_pass = _log_pass()
+    frame_array: LogPass.RP66V1FrameArray = log_pass[FRAME_ARRAY_IDENT]
+    frame_array.init_arrays(len(IFLR_BYTES))
+    for f, by in enumerate(IFLR_BYTES):
+        iflr, logical_data = _iflr_and_logical_data_from_bytes(by)
+        frame_array.read(logical_data, f)
+    expected = [channel.array.copy() for channel in frame_array.channels]
+    frame_array.init_arrays(len(IFLR_BYTES))
+    for channel in frame_array.channels:
+        channel.array.fill(0.0)
+    frame_bytes = bytearray()
+    for by in IFLR_BYTES:
+        iflr, logical_data = _iflr_and_logical_data_from_bytes(by)
+        frame_bytes += logical_data.view_remaining(logical_data.remain)
+    assert frame_array.read_frames(frame_bytes, 0) == len(IFLR_BYTES)
+    for channel, expected_array in zip(frame_array.channels, expected):
+        assert channel.array.dtype == expected_array.dtype
+        assert np.array_equal(channel.array, expected_array)
+
+
+def test_read_frames_partial():
+    log_pass = _log_pass()
+    frame_array: LogPass.RP66V1FrameArray = log_pass[FRAME_ARRAY_IDENT]
+    channels = {'DEPT', 'INC', 'SECT'}
+    frame_array.init_arrays_partial(len(IFLR_BYTES), channels)
+    frame_bytes = bytearray()
+    for by in IFLR_BYTES:
+        iflr, logical_data = _iflr_and_logical_data_from_bytes(by)
+        frame_bytes += logical_data.view_remaining(logical_data.remain)
+    assert frame_array.read_frames(frame_bytes, 0, channels) == len(IFLR_BYTES)
+    assert frame_array.shape == [(8, 1), (8, 1), (0, 1), (0, 1), (8, 1), (0, 1), (0, 1), (0, 1), (0, 1)]
+    assert list(frame_array.channels[0].array[:, 0]) == [
+        75197.0, 154724.0, 234606.0, 311024.0, 381102.0, 386839.0, 428193.0, 447720.0,
+    ]
+
+
+def test_read_frames_raises_on_partial_frame():
+    log_pass = _log_pass()
+    frame_array: LogPass.RP66V1FrameArray = log_pass[FRAME_ARRAY_IDENT]
+    frame_array.init_arrays(1)
+    with pytest.raises(LogPass.ExceptionFrameArray) as err:
+        frame_array.read_frames(b'\x00' * 35, 0)
+    assert err.value.args[0] == 'Length of frame bytes 35 is not a multiple of the frame length 36'
+
+
 def test_log_pass_write_XML():
     log_pass = _log_pass()
     ostream = io.StringIO()
@@ -1,12 +1,15 @@
 import copy
 import io
+import os
 import pprint
 
 import numpy as np
 import pytest
 
-from TotalDepth.RP66V1.core import LogicalFile, RepCode
+from TotalDepth.RP66V1.core import IndexCache, LogicalFile, RepCode
+from TotalDepth.RP66V1.core.LogicalRecord import EFLR, IFLR
 from TotalDepth.common import Slice
+from TotalDepth.common import npz_cache
 from tests.unit.RP66V1.core import test_data
 
 
@@ -64,6 +67,210 @@ def test_logical_index_logical_file_iflr_position_map():
         assert list(logical_file.iflr_position_map.keys()) == [expected_key]
 
 
+def test_logical_index_logical_file_iflr_index_read_length():
+    fobj = io.BytesIO(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(fobj) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        x_axis_length = logical_file.log_pass.frame_arrays[0].x_axis_len_input_bytes
+        assert logical_file.iflr_index_read_length() == IFLR.PREAMBLE_MAX_LENGTH + x_axis_length
+
+
+@pytest.mark.parametrize('by', (test_data.BASIC_FILE, test_data.FILE_256kb, test_data.SMALL_FILE))
+def test_logical_index_iflr_partial_read_matches_full_read(by):
+    result = []
+    for iflr_partial_read in (False, True):
+        with LogicalFile.LogicalIndex(io.BytesIO(by), iflr_partial_read=iflr_partial_read) as logical_index:
+            result.append(
+                [
+                    {str(k): v.summary for k, v in logical_file.iflr_position_map.items()}
+                    for logical_file in logical_index.logical_files
+                ]
+            )
+    assert result[0] == result[1]
+
+
+def _logical_index_summary(logical_index: LogicalFile.LogicalIndex) -> list:
+    ret = []
+    for logical_file in logical_index.logical_files:
+        ret.append([(str(position_eflr.lrsh_position), str(position_eflr.eflr)) for position_eflr in logical_file.eflrs])
+        for object_name, x_axis in logical_file.iflr_position_map.items():
+            ret.append(
+                (
+                    str(object_name),
+                    [(str(v.logical_record_position), v.frame_number, v.x_axis) for v in x_axis],
+                )
+            )
+    return ret
+
+
+@pytest.mark.parametrize('by', (test_data.BASIC_FILE, test_data.FILE_256kb, test_data.SMALL_FILE))
+def test_logical_index_cache(tmpdir, by):
+    path = tmpdir.join('file.dlis').strpath
+    with open(path, 'wb') as file:
+        file.write(by)
+    cache_dir = tmpdir.join('cache').strpath
+    with LogicalFile.LogicalIndex(path) as logical_index:
+        expected = _logical_index_summary(logical_index)
+    with LogicalFile.LogicalIndex(path, cache_dir=cache_dir) as logical_index:
+        assert _logical_index_summary(logical_index) == expected
+    assert os.path.isfile(IndexCache.cache_path(path, cache_dir))
+    with LogicalFile.LogicalIndex(path, cache_dir=cache_dir) as logical_index:
+        assert _logical_index_summary(logical_index) == expected
+        # Data can still be read.
+        if logical_index[0].has_log_pass:
+            frame_array = logical_index[0].log_pass[0]
+            assert logical_index[0].populate_frame_array(frame_array) > 0
+
+
+def test_logical_index_cache_from_cache_does_not_index(tmpdir, monkeypatch):
+    path = tmpdir.join('file.dlis').strpath
+    with open(path, 'wb') as file:
+        file.write(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(path, cache_dir='') as logical_index:
+        expected = _logical_index_summary(logical_index)
+    assert os.path.isfile(path + IndexCache.SIDECAR_SUFFIX)
+
+    def _raise(*args, **kwargs):
+        raise AssertionError('File should not be indexed.')
+
+    monkeypatch.setattr(LogicalFile.LogicalIndex, '_enter_from_file', _raise)
+    with LogicalFile.LogicalIndex(path, cache_dir='') as logical_index:
+        assert _logical_index_summary(logical_index) == expected
+
+
+def test_logical_index_cache_stale(tmpdir):
+    path = tmpdir.join('file.dlis').strpath
+    with open(path, 'wb') as file:
+        file.write(test_data.SMALL_FILE)
+    with LogicalFile.LogicalIndex(path, cache_dir='') as logical_index:
+        assert len(logical_index) == 1
+    # Replace the file with a different one, the cache should be rebuilt.
+    with open(path, 'wb') as file:
+        file.write(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(path) as logical_index:
+        expected = _logical_index_summary(logical_index)
+    with LogicalFile.LogicalIndex(path, cache_dir='') as logical_index:
+        assert _logical_index_summary(logical_index) == expected
+    key = IndexCache.file_key(path)
+    assert IndexCache.read(path + IndexCache.SIDECAR_SUFFIX, key) is not None
+
+
+def test_logical_index_cache_truncated(tmpdir):
+    path = tmpdir.join('file.dlis').strpath
+    with open(path, 'wb') as file:
+        file.write(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(path, cache_dir='') as logical_index:
+        expected = _logical_index_summary(logical_index)
+    path_cache = IndexCache.cache_path(path, '')
+    with open(path_cache, 'r+b') as file:
+        file.truncate(os.path.getsize(path_cache) // 2)
+    with LogicalFile.LogicalIndex(path, cache_dir='') as logical_index:
+        assert _logical_index_summary(logical_index) == expected
+    # The cache has been rebuilt.
+    assert IndexCache.read(path_cache, IndexCache.file_key(path)) is not None
+
+
+def test_logical_index_cache_dir_from_environment(tmpdir, monkeypatch):
+    path = tmpdir.join('file.dlis').strpath
+    with open(path, 'wb') as file:
+        file.write(test_data.BASIC_FILE)
+    monkeypatch.setenv(npz_cache.INDEX_CACHE_ENV, '')
+    with LogicalFile.LogicalIndex(path) as logical_index:
+        assert logical_index.cache_dir == ''
+    assert os.path.isfile(IndexCache.cache_path(path, ''))
+
+
+def test_logical_index_cache_file_object_is_not_cached(tmpdir):
+    cache_dir = tmpdir.join('cache').strpath
+    with LogicalFile.LogicalIndex(io.BytesIO(test_data.BASIC_FILE), cache_dir=cache_dir) as logical_index:
+        assert len(logical_index) == 1
+    assert not os.path.exists(cache_dir)
+
+
+def _eflrs_str_long(logical_index):
+    return [
+        [(str(position), eflr.str_long()) for position, eflr in logical_file.eflrs]
+        for logical_file in logical_index.logical_files
+    ]
+
+
+@pytest.mark.parametrize('by', (test_data.BASIC_FILE, test_data.FILE_256kb, test_data.SMALL_FILE))
+def test_logical_index_lazy_eflrs(by):
+    with LogicalFile.LogicalIndex(io.BytesIO(by)) as logical_index:
+        expected = _eflrs_str_long(logical_index)
+        expected_summary = _logical_index_summary(logical_index)
+    with LogicalFile.LogicalIndex(io.BytesIO(by), lazy_eflrs=True) as logical_index:
+        assert _logical_index_summary(logical_index) == expected_summary
+        for logical_file in logical_index.logical_files:
+            for _position, eflr in logical_file.eflrs:
+                if eflr.set.type in LogicalFile.LogicalIndex.EAGER_EFLR_SET_TYPES:
+                    assert isinstance(eflr, EFLR.ExplicitlyFormattedLogicalRecord)
+                else:
+                    assert isinstance(eflr, LogicalFile.LazyEFLR)
+                    assert not eflr.is_cached
+        assert len(logical_index.eflr_cache) == 0
+        assert _eflrs_str_long(logical_index) == expected
+        assert len(logical_index.eflr_cache) > 0
+    assert len(logical_index.eflr_cache) == 0
+
+
+def test_logical_index_lazy_eflrs_eq():
+    with LogicalFile.LogicalIndex(io.BytesIO(test_data.BASIC_FILE)) as logical_index:
+        expected = [eflr for _position, eflr in logical_index[0].eflrs]
+    with LogicalFile.LogicalIndex(io.BytesIO(test_data.BASIC_FILE), lazy_eflrs=True) as logical_index:
+        result = [eflr for _position, eflr in logical_index[0].eflrs]
+        lazy_eflrs = [eflr for eflr in result if isinstance(eflr, LogicalFile.LazyEFLR)]
+        assert len(lazy_eflrs) > 0
+        for lazy_eflr in lazy_eflrs:
+            assert lazy_eflr == lazy_eflr
+            assert lazy_eflr == lazy_eflr.eflr
+            assert lazy_eflr.eflr == lazy_eflr
+        assert [str(eflr) for eflr in result] == [str(eflr) for eflr in expected]
+        assert [len(eflr) for eflr in result] == [len(eflr) for eflr in expected]
+        assert [eflr[0].name for eflr in result] == [eflr[0].name for eflr in expected]
+
+
+def test_logical_index_lazy_eflrs_lru(monkeypatch):
+    monkeypatch.setattr(LogicalFile.LogicalIndex, 'LAZY_EFLR_CACHE_SIZE', 2)
+    monkeypatch.setattr(LogicalFile.LogicalIndex, 'LAZY_EFLRS', True)
+    with LogicalFile.LogicalIndex(io.BytesIO(test_data.BASIC_FILE)) as logical_index:
+        lazy_eflrs = [eflr for _position, eflr in logical_index[0].eflrs if isinstance(eflr, LogicalFile.LazyEFLR)]
+        assert len(lazy_eflrs) > 2
+        cache = logical_index.eflr_cache
+        eflr_0 = lazy_eflrs[0].eflr
+        assert lazy_eflrs[0].eflr is eflr_0
+        assert (cache.hits, cache.misses) == (1, 1)
+        lazy_eflrs[1].objects
+        assert lazy_eflrs[0].is_cached
+        assert lazy_eflrs[1].is_cached
+        # Access 0 so that 1 is the least recently used.
+        lazy_eflrs[0].template
+        lazy_eflrs[2].objects
+        assert len(cache) == 2
+        assert lazy_eflrs[0].is_cached
+        assert not lazy_eflrs[1].is_cached
+        assert lazy_eflrs[2].is_cached
+        # Evicted EFLRs are parsed again.
+        assert lazy_eflrs[1].objects
+        assert not lazy_eflrs[0].is_cached
+        assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_logical_index_lazy_eflrs_private_attribute_raises():
+    with LogicalFile.LogicalIndex(io.BytesIO(test_data.BASIC_FILE), lazy_eflrs=True) as logical_index:
+        lazy_eflr = logical_index[0].eflrs[3].eflr
+        assert isinstance(lazy_eflr, LogicalFile.LazyEFLR)
+        with pytest.raises(AttributeError):
+            lazy_eflr._no_such_attribute
+        with pytest.raises(AttributeError):
+            lazy_eflr.no_such_attribute
+
+
+def test_eflr_cache_raises_size():
+    with pytest.raises(LogicalFile.ExceptionLogicalIndexCtor):
+        LogicalFile.EFLRCache(None, 0)
+
+
 def test_logical_index_logical_file_iflr_position_map_x_axis_summary():
     fobj = io.BytesIO(test_data.BASIC_FILE)
     with LogicalFile.LogicalIndex(fobj) as logical_index:
@@ -187,3 +394,116 @@ def test_logical_file_populate_frame_array_partial_split():
         frame_slice = Slice.Sample(64)
         frame_count = logical_file.populate_frame_array(frame_array, frame_slice)
         assert frame_count == 64
+
+
+@pytest.mark.parametrize(
+    'x_from, x_to, expected_count',
+    (
+        (2889.0, 2955.0, 649),
+        (2955.0, 2889.0, 649),
+        (2900.05, 2910.05, 100),
+        (0.0, 1.0, 0),
+    )
+)
+def test_logical_file_populate_frame_array_x_range(x_from, x_to, expected_count):
+    fobj = io.BytesIO(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(fobj) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        frame_array = logical_file.log_pass[0]
+        logical_file.populate_frame_array(frame_array)
+        x_axis = frame_array.x_axis.array[:, 0].astype(np.float64)
+        selection = (x_axis >= min(x_from, x_to)) & (x_axis <= max(x_from, x_to))
+        expected = [channel.array[selection].copy() for channel in frame_array.channels]
+        frame_count = logical_file.populate_frame_array_x_range(frame_array, x_from, x_to)
+        assert frame_count == expected_count
+        assert frame_array.shape == [(expected_count, 1)] * 5
+        for channel, expected_array in zip(frame_array.channels, expected):
+            np.testing.assert_array_equal(channel.array, expected_array)
+
+
+
+@pytest.mark.parametrize(
+    'chunk_frames, frame_slice',
+    (
+        (0, None),
+        (1000, None),
+        (7, None),
+        (7, Slice.Slice(8, 64, 2)),
+        (64, Slice.Sample(64)),
+    )
+)
+def test_logical_file_populate_frame_array_chunks(chunk_frames, frame_slice):
+    fobj = io.BytesIO(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(fobj) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        frame_array = logical_file.log_pass[0]
+        logical_file.populate_frame_array(frame_array, frame_slice)
+        expected = [channel.array.copy() for channel in frame_array.channels]
+        results = [[] for _channel in frame_array.channels]
+        chunk_sizes = []
+        for frame_count in logical_file.populate_frame_array_chunks(frame_array, chunk_frames, frame_slice):
+            chunk_sizes.append(frame_count)
+            if chunk_frames > 0:
+                assert frame_count <= chunk_frames
+            for channel, result in zip(frame_array.channels, results):
+                assert len(channel.array) == frame_count
+                result.append(channel.array.copy())
+        assert sum(chunk_sizes) == len(expected[0])
+        for result, expected_array in zip(results, expected):
+            np.testing.assert_array_equal(np.concatenate(result), expected_array)
+
+def test_logical_file_populate_frame_array_x_range_channels():
+    fobj = io.BytesIO(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(fobj) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        frame_array = logical_file.log_pass[0]
+        channels = {frame_array.channels[i].ident for i in (1, 4)}
+        frame_count = logical_file.populate_frame_array_x_range(frame_array, 2900.05, 2910.05, channels=channels)
+        assert frame_count == 100
+        assert frame_array.shape == [(100, 1), (100, 1), (0, 1), (0, 1), (100, 1)]
+
+
+def test_logical_file_populate_frame_array_x_range_raises_if_frame_array_not_member():
+    fobj = io.BytesIO(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(fobj) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        frame_array_copy = copy.copy(logical_file.log_pass[0])
+        with pytest.raises(LogicalFile.ExceptionLogicalFile) as err:
+            logical_file.populate_frame_array_x_range(frame_array_copy, 0.0, 1.0)
+        assert err.value.args[0] == 'populate_frame_array(): given FrameArray is not in Log Pass'
+
+
+@pytest.mark.parametrize('batch_bytes', (64, 1024**2))
+def test_logical_file_populate_frame_array_reversed(monkeypatch, batch_bytes):
+    monkeypatch.setattr(LogicalFile.LogicalFile, 'POPULATE_BATCH_BYTES', batch_bytes)
+    fobj = io.BytesIO(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(fobj) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        frame_array = logical_file.log_pass[0]
+        logical_file.populate_frame_array(frame_array)
+        expected = [channel.array[::-1].copy() for channel in frame_array.channels]
+        logical_file.populate_frame_array(frame_array, Slice.Slice(None, None, -1))
+        for channel, expected_array in zip(frame_array.channels, expected):
+            np.testing.assert_array_equal(channel.array, expected_array)
+
+
+@pytest.mark.parametrize('frame_slice', (None, Slice.Slice(8, 64, 2), Slice.Sample(64)))
+def test_logical_file_populate_frame_array_vectorised_matches_per_value(frame_slice):
+    fobj = io.BytesIO(test_data.BASIC_FILE)
+    with LogicalFile.LogicalIndex(fobj) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        frame_array = logical_file.log_pass[0]
+        assert frame_array.is_fixed_length
+        logical_file.populate_frame_array(frame_array, frame_slice)
+        vectorised = [channel.array.copy() for channel in frame_array.channels]
+        # Now the per-value path
+        iflrs = logical_file.iflr_position_map[frame_array.ident]
+        range_gen = frame_slice.gen_indices(len(iflrs)) if frame_slice is not None else range(len(iflrs))
+        for array_index, frame_number in enumerate(range_gen):
+            fld = logical_index._logical_record_index.get_file_logical_data_at_position(
+                iflrs[frame_number].logical_record_position
+            )
+            IFLR.IndirectlyFormattedLogicalRecord(fld.lr_type, fld.logical_data)
+            frame_array.read(fld.logical_data, array_index)
+        for channel, expected in zip(frame_array.channels, vectorised):
+            assert np.array_equal(channel.array, expected)
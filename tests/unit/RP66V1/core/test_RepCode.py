@@ -12,7 +12,7 @@ import datetime
 import numpy as np
 import pytest
 
-from TotalDepth.RP66V1.core import RepCode
+from TotalDepth.RP66V1.core import RepCode, cRepCode, pRepCode
 from TotalDepth.RP66V1.core.File import LogicalData
 
 
@@ -826,3 +826,208 @@ def test_numpy_dtype_raises():
     with pytest.raises(RepCode.ExceptionRepCode) as err:
         RepCode.numpy_dtype(0)
     assert err.value.args[0] == 'Unsupported Representation code 0'
+
+
+@pytest.mark.parametrize(
+    'rc, expected',
+    (
+        (2, np.dtype('>f4')),
+        (5, np.dtype('>u4')),
+        (7, np.dtype('>f8')),
+        (16, np.dtype('>u2')),
+    )
+)
+def test_numpy_raw_dtype(rc, expected):
+    assert RepCode.has_numpy_raw_dtype(rc)
+    assert RepCode.numpy_raw_dtype(rc) == expected
+
+
+@pytest.mark.parametrize('rc', (0, 18, 19, 21, 23))
+def test_numpy_raw_dtype_raises(rc):
+    assert not RepCode.has_numpy_raw_dtype(rc)
+    with pytest.raises(RepCode.ExceptionRepCode) as err:
+        RepCode.numpy_raw_dtype(rc)
+    assert err.value.args[0] == f'Representation code {rc} has no raw numpy dtype'
+
+
+def test_ISINGL_array():
+    by = b''.join(v[1] for v in ISINGL_EXAMPLES)
+    words = np.frombuffer(by, dtype=RepCode.numpy_raw_dtype(5))
+    result = RepCode.numpy_raw_convert(5, words)
+    assert list(result) == [v[0] for v in ISINGL_EXAMPLES]
+
+
+def test_VSINGL_array():
+    by = b'\x00\x00\x00\x00' + b'\x0c\x44\x00\x80' + b'\x0c\xc4\x00\x80'
+    words = np.frombuffer(by, dtype=RepCode.numpy_raw_dtype(6))
+    result = RepCode.numpy_raw_convert(6, words)
+    assert list(result) == [0.0, 153.0, -153.0]
+
+
+@pytest.mark.parametrize(
+    'rc, by',
+    (
+        (2, b'\x43\x19\x00\x00\xc3\x19\x00\x00'),
+        (7, b'\x40\x63\x20\x00\x00\x00\x00\x00\xc0\x63\x20\x00\x00\x00\x00\x00'),
+        (12, b'\x00\x59\xa7\x80'),
+        (13, b'\x00\x99\xff\x67'),
+        (14, b'\x00\x00\x00\x99\xff\xff\xff\x67'),
+        (15, b'\x00\x59\xd9'),
+        (16, b'\x00\x99\x80\x00'),
+        (17, b'\x00\x00\x00\x99\x80\x00\x00\x00'),
+    )
+)
+def test_numpy_raw_convert_matches_code_read(rc, by):
+    result = RepCode.numpy_raw_convert(rc, np.frombuffer(by, dtype=RepCode.numpy_raw_dtype(rc)))
+    ld = LogicalData(by)
+    expected = []
+    while ld:
+        expected.append(RepCode.code_read(rc, ld))
+    assert list(result) == expected
+
+
+@pytest.mark.parametrize(
+    'rc, by, count, expected',
+    (
+        (2, b'\x43\x19\x00\x00\xc3\x19\x00\x00', 2, [153.0, -153.0]),
+        (18, b'\x01\x80\x80\xc0\x00\x40\x00', 3, [1, 2**7, 2**14]),
+        (19, b'\x03ABC\x00', 2, [b'ABC', b'']),
+        (23, b'\x01\x02\x03ABC\x04\x05\x03DEF', 2,
+         [RepCode.ObjectName(1, 2, b'ABC'), RepCode.ObjectName(4, 5, b'DEF')]),
+        (99, b'', 0, []),
+    )
+)
+def test_code_read_list(rc, by, count, expected):
+    ld = LogicalData(by)
+    assert RepCode.code_read_list(rc, ld, count) == expected
+    assert ld.remain == 0
+
+
+def test_code_read_list_raises():
+    with pytest.raises(RepCode.ExceptionRepCode) as err:
+        RepCode.code_read_list(0, None, 1)
+    assert err.value.args[0] == 'Unsupported Representation code 0'
+
+
+# Examples of all supported Representation Codes for comparing the Python and native implementations.
+REP_CODE_COMPARE_EXAMPLES = (
+    (2, b'\x43\x19\x00\x00'),
+    (2, b'\x7f\x80\x00\x00'),
+    (5, b'\xc2\x76\xa0\x00'),
+    (5, b'\x7f\xff\xff\xff'),
+    (5, b'\x00\x00\x00\x01'),
+    (6, b'\x0c\x44\x00\x80'),
+    (6, b'\x0c\xc4\x00\x80'),
+    (6, b'\x00\x00\x12\x34'),
+    (7, b'\xc0\x63\x20\x00\x00\x00\x00\x00'),
+    (12, b'\xa7'),
+    (13, b'\xff\x67'),
+    (14, b'\xff\xff\xff\x67'),
+    (14, b'\x80\x00\x00\x00'),
+    (15, b'\xd9'),
+    (16, b'\x80\x99'),
+    (17, b'\xff\xff\xff\xff'),
+    (18, b'\x7f'),
+    (18, b'\xbf\xff'),
+    (18, b'\xff\xff\xff\xff'),
+    (19, b'\x03ABC'),
+    (19, b'\x00'),
+    (20, b'\x03ABC'),
+    (20, b'\x80\x03ABC'),
+    (21, b'\x57\x24\x13\x15\x14\x0f\x02\x6c'),
+    (22, b'\x80\x81'),
+    (23, b'\xc0\x00\x40\x00\x02\x03ABC'),
+    (24, b'\x05OTYPE\x01\x02\x03ABC'),
+    (26, b'\x01'),
+    (27, b'\x06 -./()'),
+    (27, b'\x01_'),
+)
+
+
+def _compare_value(value):
+    """Make a value comparable, pRepCode.DateTime has no __eq__."""
+    if isinstance(value, RepCode.DateTime):
+        return value.__class__, str(value), value.tz, value.as_datetime()
+    return value.__class__, value
+
+
+@pytest.mark.skipif(not hasattr(cRepCode, 'code_read'), reason='cRepCode extension not built.')
+@pytest.mark.parametrize('rc, by', REP_CODE_COMPARE_EXAMPLES)
+@pytest.mark.parametrize('as_memoryview', (False, True))
+def test_cRepCode_matches_pRepCode(rc, by, as_memoryview):
+    prefix = b'\xee\xee'
+    by = prefix + by + b'\xff'
+    if as_memoryview:
+        by = memoryview(by)
+    ld_p = LogicalData(by)
+    ld_p.index = len(prefix)
+    ld_c = LogicalData(by)
+    ld_c.index = len(prefix)
+    name = pRepCode.REP_CODE_INT_TO_STR[rc]
+    assert _compare_value(getattr(cRepCode, name)(ld_c)) == _compare_value(getattr(pRepCode, name)(ld_p))
+    assert ld_c.index == ld_p.index == len(by) - 1
+
+
+@pytest.mark.skipif(not hasattr(cRepCode, 'code_read'), reason='cRepCode extension not built.')
+@pytest.mark.parametrize('rc, by', REP_CODE_COMPARE_EXAMPLES)
+def test_cRepCode_code_read_list_matches_pRepCode(rc, by):
+    by = by * 3
+    ld_p = LogicalData(by)
+    ld_c = LogicalData(by)
+    result_c = cRepCode.code_read_list(rc, ld_c, 3)
+    result_p = pRepCode.code_read_list(rc, ld_p, 3)
+    assert [_compare_value(v) for v in result_c] == [_compare_value(v) for v in result_p]
+    assert ld_c.index == ld_p.index == len(by)
+
+
+@pytest.mark.skipif(not hasattr(cRepCode, 'code_read'), reason='cRepCode extension not built.')
+@pytest.mark.parametrize('rc, by', REP_CODE_COMPARE_EXAMPLES)
+def test_cRepCode_raises_index_error(rc, by):
+    ld = LogicalData(by[:-1])
+    with pytest.raises(IndexError):
+        cRepCode.code_read(rc, ld)
+    # Unlike pRepCode the index is unchanged.
+    assert ld.index == 0
+    ld = LogicalData(by * 2 + by[:-1])
+    with pytest.raises(IndexError):
+        cRepCode.code_read_list(rc, ld, 3)
+    assert ld.index == 0
+
+
+@pytest.mark.skipif(not hasattr(cRepCode, 'code_read'), reason='cRepCode extension not built.')
+@pytest.mark.parametrize('rc', (0, 1, 25, 28, -1, 2**70, None, '2'))
+def test_cRepCode_code_read_raises_unsupported(rc):
+    with pytest.raises(pRepCode.ExceptionRepCode) as err:
+        cRepCode.code_read(rc, LogicalData(b'\x00' * 8))
+    assert err.value.args[0] == f'Unsupported Representation code {rc}'
+
+
+@pytest.mark.parametrize('module', (pRepCode, cRepCode))
+@pytest.mark.parametrize('rc, by', REP_CODE_COMPARE_EXAMPLES)
+def test_code_skip_list(module, rc, by):
+    if not hasattr(module, 'code_skip_list'):
+        pytest.skip('cRepCode extension not built.')
+    by = by * 3
+    ld = LogicalData(by)
+    assert module.code_skip_list(rc, ld, 3) is None
+    assert ld.index == len(by)
+
+
+@pytest.mark.parametrize('module', (pRepCode, cRepCode))
+@pytest.mark.parametrize('rc, by', REP_CODE_COMPARE_EXAMPLES)
+def test_code_skip_list_raises_index_error(module, rc, by):
+    if not hasattr(module, 'code_skip_list'):
+        pytest.skip('cRepCode extension not built.')
+    ld = LogicalData(by * 2 + by[:-1])
+    with pytest.raises(IndexError):
+        module.code_skip_list(rc, ld, 3)
+
+
+@pytest.mark.parametrize('module', (pRepCode, cRepCode))
+def test_code_skip_list_raises_unsupported(module):
+    if not hasattr(module, 'code_skip_list'):
+        pytest.skip('cRepCode extension not built.')
+    module.code_skip_list(1, LogicalData(b''), 0)
+    with pytest.raises(pRepCode.ExceptionRepCode) as err:
+        module.code_skip_list(1, LogicalData(b'\x00' * 8), 1)
+    assert err.value.args[0] == 'Unsupported Representation code 1'
@@ -1,4 +1,5 @@
 import io
+import pickle
 
 import numpy as np
 import pytest
@@ -229,3 +230,133 @@ def test_XAxis_getitem(position_xvalues, expected):
     for i in range(len(x_axis)):
         # print(x_axis[i])
         assert x_axis[i] == expected[i]
+
+
+def _x_axis_with_values(count):
+    x_axis = XAxis.XAxis(ident=b'A', long_name=b'B', units=b'C')
+    for i in range(count):
+        x_axis.append(File.LogicalRecordPosition.from_positions(80 + 4 * i, 84 + 4 * i), i + 1, 10.0 + 0.5 * i)
+    return x_axis
+
+
+@pytest.mark.parametrize('count', (0, 1, XAxis.XAxis.INITIAL_CAPACITY, XAxis.XAxis.INITIAL_CAPACITY + 1, 1000))
+def test_XAxis_append_growth(count):
+    x_axis = _x_axis_with_values(count)
+    assert len(x_axis) == count
+    assert list(x_axis.frame_numbers) == list(range(1, count + 1))
+    assert list(x_axis.x_values) == [10.0 + 0.5 * i for i in range(count)]
+    assert list(x_axis.lrsh_positions) == [84 + 4 * i for i in range(count)]
+
+
+def test_XAxis_getitem_position():
+    x_axis = _x_axis_with_values(4)
+    assert x_axis[2] == XAxis.IFLRReference(File.LogicalRecordPosition.from_positions(88, 92), 3, 11.0)
+    assert x_axis[-1] == x_axis[3]
+    assert x_axis[1:3] == [x_axis[1], x_axis[2]]
+    assert list(x_axis) == x_axis[:]
+
+
+@pytest.mark.parametrize('index', (4, -5))
+def test_XAxis_getitem_raises(index):
+    x_axis = _x_axis_with_values(4)
+    with pytest.raises(IndexError):
+        x_axis[index]
+
+
+def test_XAxis_views_read_only():
+    x_axis = _x_axis_with_values(4)
+    with pytest.raises(ValueError):
+        x_axis.x_values[0] = 0.0
+
+
+def test_XAxis_extend():
+    expected = _x_axis_with_values(40)
+    x_axis = _x_axis_with_values(3)
+    x_axis.extend(
+        expected.vr_positions[3:], expected.lrsh_positions[3:], expected.frame_numbers[3:], expected.x_values[3:]
+    )
+    assert x_axis[:] == expected[:]
+    assert x_axis.summary == expected.summary
+
+
+def test_XAxis_extend_raises():
+    x_axis = _x_axis_with_values(0)
+    with pytest.raises(ValueError):
+        x_axis.extend(np.arange(2), np.arange(2), np.arange(2), np.arange(3))
+
+
+@pytest.mark.parametrize('count', (0, 1, 17))
+def test_XAxis_pickle(count):
+    x_axis = _x_axis_with_values(count)
+    result = pickle.loads(pickle.dumps(x_axis))
+    assert result[:] == x_axis[:]
+    result.append(None, count + 1, 0.0)
+    assert len(result) == count + 1
+
+
+def _x_axis_from_x_values(x_values):
+    x_axis = XAxis.XAxis(ident=b'A', long_name=b'B', units=b'C')
+    for i, x_value in enumerate(x_values):
+        x_axis.append(None, i, x_value)
+    return x_axis
+
+
+@pytest.mark.parametrize(
+    'x_values, expected',
+    (
+        ([], 1),
+        ([1.0], 1),
+        ([1.0, 2.0, 2.0, 3.0], 1),
+        ([3.0, 2.0, 2.0, 1.0], -1),
+        ([1.0, 3.0, 2.0], 0),
+        ([1.0, np.nan, 2.0], 0),
+    )
+)
+def test_XAxis_monotonic(x_values, expected):
+    assert _x_axis_from_x_values(x_values).monotonic == expected
+
+
+@pytest.mark.parametrize(
+    'x_values, x_from, x_to, expected',
+    (
+        ([], 0.0, 10.0, []),
+        # Increasing
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 2.0, 4.0, [1, 2, 3]),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 4.0, 2.0, [1, 2, 3]),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 1.5, 3.5, [1, 2]),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], -10.0, 10.0, [0, 1, 2, 3, 4]),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 6.0, 10.0, []),
+        ([1.0, 2.0, 2.0, 2.0, 5.0], 2.0, 2.0, [1, 2, 3]),
+        # Decreasing
+        ([5.0, 4.0, 3.0, 2.0, 1.0], 2.0, 4.0, [1, 2, 3]),
+        ([5.0, 4.0, 3.0, 2.0, 1.0], 1.5, 3.5, [2, 3]),
+        ([5.0, 4.0, 3.0, 2.0, 1.0], 0.0, 0.5, []),
+        ([5.0, 4.0, 4.0, 2.0, 1.0], 4.0, 4.0, [1, 2]),
+        # Non-monotonic, for example a repeat section
+        ([1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0], 2.0, 3.0, [1, 2, 3, 5, 6]),
+        ([1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0], 0.0, 1.5, [0, 4]),
+        ([1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0], 3.5, 4.0, []),
+    )
+)
+def test_XAxis_indexes_in_range(x_values, x_from, x_to, expected):
+    x_axis = _x_axis_from_x_values(x_values)
+    result = x_axis.indexes_in_range(x_from, x_to)
+    assert list(result) == expected
+    # Brute force
+    x_min, x_max = min(x_from, x_to), max(x_from, x_to)
+    assert list(result) == [i for i, x in enumerate(x_values) if x_min <= x <= x_max]
+
+
+def test_XAxis_indexes_in_range_after_append():
+    x_axis = _x_axis_from_x_values([1.0, 3.0, 2.0])
+    assert list(x_axis.indexes_in_range(1.5, 2.5)) == [2]
+    x_axis.append(None, 3, 2.25)
+    assert list(x_axis.indexes_in_range(1.5, 2.5)) == [2, 3]
+    assert x_axis.monotonic == 0
+
+
+def test_XAxis_indexes_in_range_pickle():
+    x_axis = _x_axis_from_x_values([1.0, 3.0, 2.0])
+    x_axis.indexes_in_range(1.5, 2.5)
+    result = pickle.loads(pickle.dumps(x_axis))
+    assert list(result.indexes_in_range(1.5, 2.5)) == [2]
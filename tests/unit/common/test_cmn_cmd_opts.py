@@ -27,6 +27,7 @@ Created on Feb 13, 2012
 import pytest
 
 from TotalDepth.common import cmn_cmd_opts
+from TotalDepth.common import npz_cache
 
 
 @pytest.mark.parametrize(
@@ -183,3 +184,24 @@ def test_basic(args):
 #     # print(myP.format_help())
 #     self.assertEqual("""usage: Program [-h] [--version] [-j JOBS] [-k] [-l LOG_LEVEL] [-g] [-r] in out
 # """, myP.format_usage())
+
+
+@pytest.mark.parametrize(
+    'args, expected',
+    (
+        ([], None),
+        (['--index-cache', ''], ''),
+        (['--index-cache', 'cache'], 'cache'),
+    )
+)
+def test_index_cache(monkeypatch, args, expected):
+    # setenv() first so that monkeypatch restores the environment after set_index_cache().
+    monkeypatch.setenv(npz_cache.INDEX_CACHE_ENV, 'spam')
+    monkeypatch.delenv(npz_cache.INDEX_CACHE_ENV)
+    parser = cmn_cmd_opts.arg_parser("Description of the program", "Name of the program", "0.1.3rc4")
+    cmn_cmd_opts.add_index_cache(parser)
+    parsed_args = parser.parse_args(args)
+    assert parsed_args.index_cache == expected
+    cmn_cmd_opts.set_index_cache(parsed_args)
+    assert npz_cache.default_cache_dir() == expected
+
@@ -0,0 +1,177 @@
+import os
+import time
+
+import pytest
+
+from TotalDepth.common import job_engine
+
+
+def _square(value):
+    return value * value
+
+
+def _raise(value):
+    raise ValueError(f'Bad value {value}')
+
+
+def _sleep(value):
+    time.sleep(value)
+    return value
+
+
+def _unpicklable(value):
+    return lambda: value
+
+
+def _jobs(function_values):
+    return [job_engine.Job(f'{i}', i, (v,)) for i, v in enumerate(function_values)]
+
+
+def test_job_result_ok():
+    assert job_engine.JobResult('a', 1, '', 0.0).ok
+    assert not job_engine.JobResult('a', None, 'Error', 0.0).ok
+
+
+def test_schedule_largest_first():
+    jobs = [job_engine.Job('a', 1, ()), job_engine.Job('b', 3, ()), job_engine.Job('c', 1, ()),
+            job_engine.Job('d', 2, ())]
+    assert [job.key for job in job_engine.schedule(jobs)] == ['b', 'd', 'a', 'c']
+
+
+def test_dir_walk_jobs(tmpdir):
+    dir_in = tmpdir.mkdir('in')
+    dir_in.join('a.dat').write_binary(b'1' * 10)
+    dir_in.mkdir('sub').join('b.dat').write_binary(b'1' * 20)
+    jobs = job_engine.dir_walk_jobs(str(dir_in), 'out', True, ('extra',))
+    assert sorted((os.path.relpath(job.key, str(dir_in)), job.size) for job in jobs) == [
+        ('a.dat', 10), (os.path.join('sub', 'b.dat'), 20),
+    ]
+    assert all(job.args[0] == job.key for job in jobs)
+    assert all(job.args[2:] == ('extra',) for job in jobs)
+
+
+@pytest.mark.parametrize('processes', (1, 2, 8))
+def test_run(processes):
+    results = list(job_engine.run(_square, _jobs(range(10)), processes=processes))
+    assert len(results) == 10
+    assert all(result.ok for result in results)
+    assert {result.key: result.result for result in results} == {f'{i}': i * i for i in range(10)}
+
+
+def test_run_empty():
+    assert list(job_engine.run(_square, [], processes=2)) == []
+
+
+def test_run_exception():
+    results = list(job_engine.run(_raise, _jobs([7]), processes=1))
+    assert len(results) == 1
+    assert results[0].result is None
+    assert results[0].error == 'ValueError: Bad value 7'
+
+
+def test_run_unpicklable_result():
+    results = list(job_engine.run(_unpicklable, _jobs([7]), processes=1))
+    assert len(results) == 1
+    assert not results[0].ok
+
+
+def test_run_crash_continues():
+    """A crashed worker is replaced and the remaining jobs run."""
+    jobs = [job_engine.Job('crash', 100, (0,))] + _jobs([1, 2, 3])
+    results = {r.key: r for r in job_engine.run(_crash_or_square, [
+        job_engine.Job(job.key, job.size, (job.key == 'crash', job.args[0])) for job in jobs
+    ], processes=1)}
+    assert len(results) == 4
+    assert results['crash'].error.startswith(job_engine.ERROR_CRASHED)
+    assert [results[k].result for k in ('0', '1', '2')] == [1, 4, 9]
+
+
+def _crash_or_square(crash, value):
+    if crash:
+        os._exit(1)
+    return value * value
+
+
+def test_run_timeout():
+    jobs = [job_engine.Job('slow', 100, (30.0,)), job_engine.Job('fast', 1, (0.0,))]
+    time_start = time.perf_counter()
+    results = {r.key: r for r in job_engine.run(_sleep, jobs, processes=2, timeout=0.5)}
+    assert time.perf_counter() - time_start < 10.0
+    assert results['slow'].error.startswith(job_engine.ERROR_TIMEOUT)
+    assert results['fast'].ok
+    assert results['fast'].result == 0.0
+
+
+def test_run_journal_resume(tmpdir):
+    journal_path = str(tmpdir.join('journal.jsonl'))
+    jobs = _jobs(range(6))
+    # Interrupt the run after three results.
+    gen = job_engine.run(_square, jobs, processes=1, journal_path=journal_path)
+    first = [next(gen) for _i in range(3)]
+    gen.close()
+    journaled = job_engine.read_journal(journal_path)
+    assert set(journaled.keys()) == {(r.key, job_engine.args_digest((int(r.key),))) for r in first}
+    # Now resume, previous results come from the journal.
+    results = list(job_engine.run(_square, jobs, processes=1, journal_path=journal_path))
+    assert {r.key: r.result for r in results} == {f'{i}': i * i for i in range(6)}
+    assert results[:3] == first
+    assert len(job_engine.read_journal(journal_path)) == 6
+
+
+def test_read_journal_ignores_partial_line(tmpdir):
+    journal_path = str(tmpdir.join('journal.jsonl'))
+    list(job_engine.run(_square, _jobs([2]), processes=1, journal_path=journal_path))
+    with open(journal_path, 'a') as journal:
+        journal.write('{"key": "1", "err')
+    assert list(job_engine.read_journal(journal_path).keys()) == [('0', job_engine.args_digest((2,)))]
+
+
+def test_read_journal_missing():
+    assert job_engine.read_journal('') == {}
+
+
+def test_run_journal_failures_rerun(tmpdir):
+    journal_path = str(tmpdir.join('journal.jsonl'))
+    jobs = [job_engine.Job('crash', 100, (True, 2)), job_engine.Job('ok', 1, (False, 3))]
+    results = {r.key: r for r in job_engine.run(_crash_or_square, jobs, processes=1, journal_path=journal_path)}
+    assert not results['crash'].ok
+    assert [key for key, _digest in job_engine.read_journal(journal_path)] == ['ok']
+    # On resume the failed job runs again.
+    jobs[0] = job_engine.Job('crash', 100, (False, 2))
+    results = {r.key: r for r in job_engine.run(_crash_or_square, jobs, processes=1, journal_path=journal_path)}
+    assert {key: r.result for key, r in results.items()} == {'crash': 4, 'ok': 9}
+
+
+def test_run_journal_different_args(tmpdir):
+    journal_path = str(tmpdir.join('journal.jsonl'))
+    list(job_engine.run(_square, _jobs([2]), processes=1, journal_path=journal_path))
+    # Same key, different arguments, the journaled result is not used.
+    results = list(job_engine.run(_square, _jobs([5]), processes=1, journal_path=journal_path))
+    assert [r.result for r in results] == [25]
+    assert len(job_engine.read_journal(journal_path)) == 2
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX file permissions')
+def test_run_journal_created_private(tmpdir):
+    journal_path = str(tmpdir.join('journal.jsonl'))
+    list(job_engine.run(_square, _jobs([2]), processes=1, journal_path=journal_path))
+    assert os.stat(journal_path).st_mode & 0o077 == 0
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX file permissions')
+def test_read_journal_writable_by_others(tmpdir):
+    journal_path = str(tmpdir.join('journal.jsonl'))
+    list(job_engine.run(_square, _jobs([2]), processes=1, journal_path=journal_path))
+    os.chmod(journal_path, 0o666)
+    with pytest.raises(job_engine.ExceptionJobEngine):
+        job_engine.read_journal(journal_path)
+    with pytest.raises(job_engine.ExceptionJobEngine):
+        list(job_engine.run(_square, _jobs([3]), processes=1, journal_path=journal_path))
+
+
+def test_run_close_after_crash():
+    """Closing the generator after the last worker crashed does not raise."""
+    gen = job_engine.run(_crash_or_square, [job_engine.Job('crash', 1, (True, 0))], processes=1)
+    result = next(gen)
+    assert result.error.startswith(job_engine.ERROR_CRASHED)
+    gen.close()
@@ -235,3 +235,124 @@ def test_summarise_array_str(array_summary, expected):
     # print()
     # print(array_summary.str())
     assert array_summary.str() == expected
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 7, 100))
+@pytest.mark.parametrize('null_value', (None, 4.0, 1.0))
+def test_summary_accumulator_chunks(chunk_size, null_value):
+    array = np.array([2.0 ** (i % 5) for i in range(23)])
+    if null_value is not None:
+        array = array.view(np.ma.MaskedArray)
+        array.mask = (array == null_value)
+    expected = np_summary.summarise_array(array)
+    accumulator = np_summary.SummaryAccumulator()
+    for i in range(0, len(array), chunk_size):
+        accumulator.add(array[i:i + chunk_size])
+    result = accumulator.summary()
+    assert result.len == expected.len
+    assert result.shape == expected.shape
+    assert result.count == expected.count
+    assert result.min == expected.min
+    assert result.max == expected.max
+    assert result.mean == pytest.approx(expected.mean)
+    assert result.std == pytest.approx(expected.std)
+    assert result.median == expected.median
+    assert (result.count_eq, result.count_dec, result.count_inc) == \
+           (expected.count_eq, expected.count_dec, expected.count_inc)
+    assert result.activity == pytest.approx(expected.activity)
+    assert (result.first, result.last) == (expected.first, expected.last)
+
+
+@pytest.mark.parametrize(
+    'array, expected',
+    (
+        (np.array([]), None),
+        (np.array([1.0]), None),
+        (np.ma.masked_array([1.0, 2.0], mask=[False, True]), None),
+    )
+)
+def test_summary_accumulator_insufficient_values(array, expected):
+    accumulator = np_summary.SummaryAccumulator()
+    accumulator.add(array)
+    assert accumulator.summary() == expected
+
+
+def test_summary_accumulator_std_ddof():
+    accumulator = np_summary.SummaryAccumulator()
+    accumulator.add(np.arange(5.0))
+    accumulator.add(np.arange(5.0, 10.0))
+    assert accumulator.std() == pytest.approx(np.arange(10.0).std())
+    assert accumulator.std(ddof=1) == pytest.approx(np.arange(10.0).std(ddof=1))
+
+
+def test_summary_accumulator_large_offset():
+    # Values with a large mean and small variance, the naive sum of squares loses precision.
+    array = 2.8e8 + np.arange(1000.0) % 17
+    accumulator = np_summary.SummaryAccumulator()
+    for i in range(0, len(array), 64):
+        accumulator.add(array[i:i + 64])
+    assert accumulator.std() == pytest.approx(array.std())
+
+
+@pytest.mark.parametrize('median_sample_size', (16, 100, 1000))
+def test_summary_accumulator_median_sampled(median_sample_size):
+    array = np.arange(1000.0)
+    accumulator = np_summary.SummaryAccumulator(median_sample_size)
+    for i in range(0, len(array), 33):
+        accumulator.add(array[i:i + 33])
+    samples = accumulator._median_sample[:min(len(array), median_sample_size)]
+    assert len(samples) == min(len(array), median_sample_size)
+    # Samples are distinct values from the array.
+    assert len(np.unique(samples)) == len(samples)
+    assert np.all(np.isin(samples, array))
+    assert accumulator.median_is_exact == (len(array) <= median_sample_size)
+    assert accumulator.median == pytest.approx(np.median(array), rel=0.25)
+
+
+def test_summary_accumulator_median_periodic():
+    # A fixed stride sample aliases with periodic data and gives a median of 0.0
+    array = np.tile([0.0, 10.0, 10.0, 10.0], 50000)
+    accumulator = np_summary.SummaryAccumulator()
+    for i in range(0, len(array), 4096):
+        accumulator.add(array[i:i + 4096])
+    assert not accumulator.median_is_exact
+    assert accumulator.median == 10.0
+
+
+def test_summary_accumulator_median_repeatable():
+    array = np.random.default_rng(1).normal(size=10000)
+    medians = []
+    for _i in range(2):
+        accumulator = np_summary.SummaryAccumulator(100)
+        for i in range(0, len(array), 128):
+            accumulator.add(array[i:i + 128])
+        medians.append(accumulator.median)
+    assert medians[0] == medians[1]
+
+
+@pytest.mark.parametrize(
+    'dtype, expected',
+    (
+        (np.float32, np.float32),
+        (np.float64, np.float64),
+        (np.int32, np.float64),
+    )
+)
+def test_summary_accumulator_mean_std_dtype(dtype, expected):
+    array = np.ma.masked_array(np.arange(10, dtype=dtype))
+    accumulator = np_summary.SummaryAccumulator()
+    accumulator.add(array[:4])
+    accumulator.add(array[4:])
+    assert accumulator.mean.dtype == expected
+    assert accumulator.mean.dtype == array.mean().dtype
+    assert accumulator.std().dtype == array.std().dtype
+    assert accumulator.std() == pytest.approx(array.std())
+
+
+@pytest.mark.parametrize('array', (np.array([0.0, -1.0, 0.0]), np.array([1.0, -1.0, 2.0])))
+def test_summary_accumulator_activity_masked(array):
+    expected = np_summary.summarise_array(np.ma.masked_array(array))
+    assert expected.activity is np.ma.masked
+    accumulator = np_summary.SummaryAccumulator()
+    accumulator.add(array)
+    assert accumulator.summary().activity is np.ma.masked
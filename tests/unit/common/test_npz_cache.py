@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+import pytest
+
+from TotalDepth.common import npz_cache
+
+
+def _write_file(tmpdir) -> str:
+    path = tmpdir.join('file.dat').strpath
+    with open(path, 'wb') as file:
+        file.write(b'\x00' * 128)
+    return path
+
+
+def test_cache_path():
+    assert npz_cache.cache_path('spam/eggs.dat', '', '.npz') == 'spam/eggs.dat.npz'
+    path = npz_cache.cache_path('spam/eggs.dat', 'cache', '.npz')
+    assert os.path.dirname(path) == 'cache'
+    assert path.endswith('.npz')
+
+
+def test_file_key_extra_values(tmpdir):
+    path = _write_file(tmpdir)
+    key = npz_cache.file_key(path, 3, spam='eggs')
+    assert key['version'] == 3
+    assert key['size'] == 128
+    assert key['spam'] == 'eggs'
+
+
+@pytest.mark.parametrize('size', (0, 16, npz_cache.CONTENT_HASH_BYTES + 7, 3 * npz_cache.CONTENT_HASH_BYTES))
+def test_content_hash_changes_with_last_byte(tmpdir, size):
+    path = tmpdir.join('file.dat').strpath
+    by = bytearray(size + 1)
+    with open(path, 'wb') as file:
+        file.write(by)
+    hash_before = npz_cache.content_hash(path, len(by))
+    by[-1] = 1
+    with open(path, 'wb') as file:
+        file.write(by)
+    assert npz_cache.content_hash(path, len(by)) != hash_before
+
+
+def test_write_read(tmpdir):
+    path = _write_file(tmpdir)
+    path_cache = npz_cache.cache_path(path, '', '.npz')
+    arrays = {'spam': np.arange(8), 'eggs': np.linspace(0.0, 1.0, 5)}
+    npz_cache.write(path_cache, npz_cache.file_key(path, 1), ['chips', 2], arrays)
+    assert sorted(os.listdir(tmpdir)) == ['file.dat', 'file.dat.npz']
+    metadata, arrays_read = npz_cache.read(path_cache, npz_cache.file_key(path, 1))
+    assert metadata == ['chips', 2]
+    assert sorted(arrays_read.keys()) == ['eggs', 'spam']
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(arrays_read[name], array)
+
+
+def test_read_version_mismatch(tmpdir):
+    path = _write_file(tmpdir)
+    path_cache = npz_cache.cache_path(path, '', '.npz')
+    npz_cache.write(path_cache, npz_cache.file_key(path, 1), {}, {})
+    assert npz_cache.read(path_cache, npz_cache.file_key(path, 2)) is None
+
+
+@pytest.mark.parametrize(
+    'content',
+    (
+        b'',
+        b'Not a numpy file.',
+        # A zip file with no metadata.
+        b'PK\x05\x06' + b'\x00' * 18,
+    )
+)
+def test_read_unreadable(tmpdir, content):
+    path = _write_file(tmpdir)
+    path_cache = npz_cache.cache_path(path, '', '.npz')
+    with open(path_cache, 'wb') as file:
+        file.write(content)
+    assert npz_cache.read(path_cache, npz_cache.file_key(path, 1)) is None
+
+
+@pytest.mark.parametrize('fraction', (0.1, 0.5, 0.9, 0.99))
+def test_read_truncated(tmpdir, fraction):
+    path = _write_file(tmpdir)
+    path_cache = npz_cache.cache_path(path, '', '.npz')
+    npz_cache.write(path_cache, npz_cache.file_key(path, 1), {}, {'spam': np.arange(1024)})
+    with open(path_cache, 'r+b') as file:
+        file.truncate(int(os.path.getsize(path_cache) * fraction))
+    assert npz_cache.read(path_cache, npz_cache.file_key(path, 1)) is None
+
+
+def test_write_raises_on_reserved_name(tmpdir):
+    path = _write_file(tmpdir)
+    with pytest.raises(npz_cache.ExceptionNpzCache):
+        npz_cache.write(npz_cache.cache_path(path, '', '.npz'), npz_cache.file_key(path, 1), {},
+                        {npz_cache.METADATA_NAME: np.arange(4)})
@@ -0,0 +1,235 @@
+import io
+import os
+
+import numpy as np
+import pytest
+
+from TotalDepth.RP66V1.core import LogicalFile
+from TotalDepth.common import npz_cache
+from TotalDepth.common import pyramid
+from tests.unit.RP66V1.core import test_data
+
+
+def _example_arrays(num_frames):
+    x = 1000.0 + 0.5 * np.arange(num_frames)
+    channels = {
+        'GR': np.sin(np.arange(num_frames) / 7.0) * 50 + 75,
+        'MULT': np.arange(num_frames * 3, dtype=np.float64).reshape(num_frames, 3),
+    }
+    return x, channels
+
+
+@pytest.mark.parametrize(
+    'num_frames, expected',
+    (
+        (1, [1]),
+        (2, [1]),
+        (3, [2, 1]),
+        (8, [4, 2, 1]),
+        (9, [5, 3, 2, 1]),
+    )
+)
+def test_pyramid_level_lengths(num_frames, expected):
+    x, channels = _example_arrays(num_frames)
+    pyr = pyramid.Pyramid.from_arrays(x, channels)
+    assert [len(level) for level in pyr.levels] == expected
+    assert [level.factor for level in pyr.levels] == [2 ** (i + 1) for i in range(len(expected))]
+    assert pyr.num_frames == num_frames
+
+
+@pytest.mark.parametrize('num_frames', (1, 2, 7, 8, 33))
+def test_pyramid_levels_match_direct_reduction(num_frames):
+    x, channels = _example_arrays(num_frames)
+    pyr = pyramid.Pyramid.from_arrays(x, channels)
+    for level in pyr.levels:
+        for ident, values in channels.items():
+            values = values.reshape(num_frames, -1)
+            for b in range(len(level)):
+                frames = values[b * level.factor:(b + 1) * level.factor]
+                assert level.channels[ident]['min'][b] == frames.min()
+                assert level.channels[ident]['max'][b] == frames.max()
+                assert level.channels[ident]['sum'][b] == pytest.approx(frames.sum())
+                assert level.channels[ident]['count'][b] == frames.size
+            assert level.x_first[b] == x[b * level.factor]
+            assert level.x_last[b] == x[min(num_frames, (b + 1) * level.factor) - 1]
+
+
+@pytest.mark.parametrize('chunk_frames', (1, 3, 16, 100))
+def test_pyramid_builder_chunks(chunk_frames):
+    x, channels = _example_arrays(100)
+    expected = pyramid.Pyramid.from_arrays(x, channels)
+    builder = pyramid.PyramidBuilder()
+    for i in range(0, 100, chunk_frames):
+        builder.add(x[i:i + chunk_frames], {k: v[i:i + chunk_frames] for k, v in channels.items()})
+    result = builder.pyramid()
+    assert len(result.levels) == len(expected.levels)
+    for level_result, level_expected in zip(result.levels, expected.levels):
+        np.testing.assert_array_equal(level_result.x_first, level_expected.x_first)
+        np.testing.assert_array_equal(level_result.x_last, level_expected.x_last)
+        for ident in channels:
+            for name in pyramid.CHANNEL_ARRAY_NAMES:
+                np.testing.assert_allclose(level_result.channels[ident][name], level_expected.channels[ident][name])
+
+
+def test_pyramid_absent_values():
+    x = np.arange(6.0)
+    values = np.array([1.0, -999.25, -999.25, -999.25, np.nan, 4.0])
+    pyr = pyramid.Pyramid.from_arrays(x, {'A': values}, absent_value=-999.25)
+    summary = pyr.levels[0].summary('A')
+    np.testing.assert_array_equal(summary.count, [1, 0, 1])
+    np.testing.assert_array_equal(summary.min, [1.0, np.nan, 4.0])
+    np.testing.assert_array_equal(summary.max, [1.0, np.nan, 4.0])
+    np.testing.assert_array_equal(summary.mean, [1.0, np.nan, 4.0])
+
+
+def test_pyramid_masked_values():
+    x = np.arange(4.0)
+    values = np.ma.masked_array([1.0, 2.0, 3.0, 5.0], mask=[False, True, False, False])
+    pyr = pyramid.Pyramid.from_arrays(x, {'A': values})
+    summary = pyr.levels[-1].summary('A')
+    assert summary.count[0] == 3
+    assert summary.mean[0] == 3.0
+
+
+def test_pyramid_raises_no_frames():
+    with pytest.raises(pyramid.ExceptionPyramid):
+        pyramid.PyramidBuilder().pyramid()
+
+
+def test_pyramid_raises_length_mismatch():
+    with pytest.raises(pyramid.ExceptionPyramid):
+        pyramid.Pyramid.from_arrays(np.arange(4.0), {'A': np.arange(5.0)})
+
+
+def test_pyramid_builder_raises_channel_mismatch():
+    builder = pyramid.PyramidBuilder()
+    builder.add(np.arange(4.0), {'A': np.arange(4.0)})
+    with pytest.raises(pyramid.ExceptionPyramid):
+        builder.add(np.arange(4.0), {'B': np.arange(4.0)})
+
+
+@pytest.mark.parametrize(
+    'x_from, x_to, number_of_points, expected_factor, expected_bins',
+    (
+        # Whole range, one point is the top level.
+        (0.0, 1023.0, 1, 1024, 1),
+        (0.0, 1023.0, 2, 512, 2),
+        (0.0, 1023.0, 100, 8, 128),
+        (1023.0, 0.0, 100, 8, 128),
+        # Part of the range.
+        (0.0, 255.0, 100, 2, 128),
+        (0.0, 255.0, 16, 16, 16),
+        # More points than the finest level has, gives the finest level.
+        (0.0, 15.0, 100, 2, 8),
+        # Outside the range.
+        (2000.0, 3000.0, 4, 2, 0),
+    )
+)
+def test_pyramid_query(x_from, x_to, number_of_points, expected_factor, expected_bins):
+    x = np.arange(1024.0)
+    pyr = pyramid.Pyramid.from_arrays(x, {'A': x * 2})
+    result = pyr.query('A', x_from, x_to, number_of_points)
+    assert result.factor == expected_factor
+    assert len(result.x_first) == expected_bins
+    assert len(result.min) == len(result.max) == len(result.mean) == len(result.count) == expected_bins
+    if expected_bins:
+        np.testing.assert_array_equal(result.min, result.x_first * 2)
+        np.testing.assert_array_equal(result.max, result.x_last * 2)
+
+
+def test_pyramid_query_raises_unknown_channel():
+    pyr = pyramid.Pyramid.from_arrays(np.arange(4.0), {'A': np.arange(4.0)})
+    with pytest.raises(pyramid.ExceptionPyramid):
+        pyr.query('B', 0.0, 4.0, 1)
+
+
+def _write_file(tmpdir, name, content):
+    path = os.path.join(tmpdir, name)
+    with open(path, 'wb') as file:
+        file.write(content)
+    return path
+
+
+def test_pyramid_sidecar_write_read(tmpdir):
+    path = _write_file(tmpdir, 'example.dat', b'some data')
+    x, channels = _example_arrays(37)
+    pyramids = {
+        'one': pyramid.Pyramid.from_arrays(x, channels),
+        'two': pyramid.Pyramid.from_arrays(x[:5], {'GR': channels['GR'][:5]}),
+    }
+    path_sidecar = pyramid.sidecar_path(path)
+    pyramid.write(path_sidecar, pyramid.file_key(path), pyramids)
+    assert sorted(os.listdir(tmpdir)) == ['example.dat', 'example.dat' + pyramid.SIDECAR_SUFFIX]
+    result = pyramid.read(path_sidecar, pyramid.file_key(path))
+    assert list(result.keys()) == ['one', 'two']
+    for name, pyr in pyramids.items():
+        assert result[name].num_frames == pyr.num_frames
+        assert result[name].channels == pyr.channels
+        for level_result, level_expected in zip(result[name].levels, pyr.levels):
+            assert level_result.factor == level_expected.factor
+            np.testing.assert_array_equal(level_result.x_first, level_expected.x_first)
+            np.testing.assert_array_equal(level_result.x_last, level_expected.x_last)
+            for ident in pyr.channels:
+                for array_name in pyramid.CHANNEL_ARRAY_NAMES:
+                    np.testing.assert_array_equal(
+                        level_result.channels[ident][array_name], level_expected.channels[ident][array_name]
+                    )
+
+
+def test_pyramid_sidecar_read_missing(tmpdir):
+    path = _write_file(tmpdir, 'example.dat', b'some data')
+    assert pyramid.read(pyramid.sidecar_path(path), pyramid.file_key(path)) is None
+
+
+def test_pyramid_sidecar_read_stale(tmpdir):
+    path = _write_file(tmpdir, 'example.dat', b'some data')
+    pyramid.write(pyramid.sidecar_path(path), pyramid.file_key(path),
+                  {'one': pyramid.Pyramid.from_arrays(*_example_arrays(8))})
+    _write_file(tmpdir, 'example.dat', b'some other data')
+    assert pyramid.read(pyramid.sidecar_path(path), pyramid.file_key(path)) is None
+
+
+def test_pyramid_sidecar_read_unreadable(tmpdir):
+    path = _write_file(tmpdir, 'example.dat', b'some data')
+    _write_file(tmpdir, 'example.dat' + pyramid.SIDECAR_SUFFIX, b'not a sidecar')
+    assert pyramid.read(pyramid.sidecar_path(path), pyramid.file_key(path)) is None
+
+
+@pytest.mark.parametrize('fraction', (0.0, 0.1, 0.5, 0.99))
+def test_pyramid_sidecar_read_truncated(tmpdir, fraction):
+    path = _write_file(tmpdir, 'example.dat', b'some data')
+    path_sidecar = pyramid.sidecar_path(path)
+    pyramid.write(path_sidecar, pyramid.file_key(path), {'one': pyramid.Pyramid.from_arrays(*_example_arrays(64))})
+    with open(path_sidecar, 'r+b') as file:
+        file.truncate(int(os.path.getsize(path_sidecar) * fraction))
+    assert pyramid.read(path_sidecar, pyramid.file_key(path)) is None
+
+
+def test_pyramid_sidecar_read_missing_arrays(tmpdir):
+    path = _write_file(tmpdir, 'example.dat', b'some data')
+    path_sidecar = pyramid.sidecar_path(path)
+    pyr = pyramid.Pyramid.from_arrays(*_example_arrays(8))
+    pyramid.write(path_sidecar, pyramid.file_key(path), {'one': pyr})
+    metadata, _arrays = npz_cache.read(path_sidecar, pyramid.file_key(path))
+    npz_cache.write(path_sidecar, pyramid.file_key(path), metadata, {})
+    assert pyramid.read(path_sidecar, pyramid.file_key(path)) is None
+
+
+@pytest.mark.parametrize('chunk_frames', (0, 7, 64))
+def test_pyramid_rp66v1_frame_array_chunks(chunk_frames):
+    with LogicalFile.LogicalIndex(io.BytesIO(test_data.BASIC_FILE)) as logical_index:
+        logical_file = logical_index.logical_files[0]
+        frame_array = logical_file.log_pass[0]
+        logical_file.populate_frame_array(frame_array)
+        expected = pyramid.Pyramid.from_frame_array(frame_array)
+        builder = pyramid.PyramidBuilder()
+        for _num_frames in logical_file.populate_frame_array_chunks(frame_array, chunk_frames):
+            builder.add_frame_array(frame_array)
+        result = builder.pyramid()
+    assert result.num_frames == expected.num_frames
+    assert result.channels == [str(channel.ident) for channel in frame_array.channels[1:]]
+    for level_result, level_expected in zip(result.levels, expected.levels):
+        np.testing.assert_array_equal(level_result.x_first, level_expected.x_first)
+        for ident in expected.channels:
+            np.testing.assert_array_equal(level_result.channels[ident]['min'], level_expected.channels[ident]['min'])
+            np.testing.assert_array_equal(level_result.channels[ident]['max'], level_expected.channels[ident]['max'])
@@ -801,6 +801,51 @@ def test_simple_curve_and_array_section_with_wrap_1_missing_value_raises_d():
         assert las_array_section._members == []
 
 
+@pytest.mark.parametrize('wrap', (False, True))
+def test_simple_curve_and_array_section_in_chunks(monkeypatch, wrap):
+    """Array section that is converted in several chunks, one of which has a value that is not a float."""
+    monkeypatch.setattr(LASRead, 'ARRAY_CHUNK_FRAMES', 3)
+    las_curve_section = _ret_simple_curve_section()
+    las_array_section = LASRead.LASSectionArray('A', wrap, las_curve_section)
+    expected = []
+    line_number = 0
+    for frame_number in range(10):
+        values = [1700.0 + frame_number * 0.5] + [float(frame_number * 10 + c) for c in range(1, 5)]
+        strings = [f'{v:.4f}' for v in values]
+        if frame_number == 4:
+            strings[2] = '******'
+            values[2] = -999.25
+        expected.append(values)
+        if wrap:
+            lines = [strings[0], ' '.join(strings[1:3]), ' '.join(strings[3:])]
+        else:
+            lines = [' '.join(strings)]
+        for line in lines:
+            las_array_section.add_member_line(line_number, line)
+            line_number += 1
+    las_array_section.finalise()
+    assert las_array_section.members == []
+    assert las_array_section.frame_array.shape == [(10, 1)] * 5
+    expected_array = np.array(expected).T
+    for i in range(len(las_array_section.frame_array)):
+        assert np.array_equal(las_array_section.frame_array.channels[i].array[:, 0], expected_array[i])
+    assert las_array_section.frame_array['DPHI'].array.mask[4, 0]
+    assert len(list(las_array_section.keys())) == 10
+
+
+def test_simple_curve_and_array_section_in_chunks_raises(monkeypatch):
+    """Column count miss-match in a later chunk reports the frame number in the array section."""
+    monkeypatch.setattr(LASRead, 'ARRAY_CHUNK_FRAMES', 3)
+    las_curve_section = _ret_simple_curve_section()
+    las_array_section = LASRead.LASSectionArray('A', False, las_curve_section)
+    with pytest.raises(LASRead.ExceptionLASRead) as err:
+        for frame_number in range(10):
+            columns = 4 if frame_number == 7 else 5
+            las_array_section.add_member_line(frame_number, ' '.join(['1.0'] * columns))
+        las_array_section.finalise()
+    assert err.value.args[0] == 'Expected 5 columns but found 4 in frame 7'
+
+
 def test_curve_and_array_section_with_time_date():
     las_curve_section = LASRead.LASSection('C')
     las_curve_str = """TIME	    .HHMMSS	       :
@@ -37,6 +37,21 @@ def test_log_pass__array_reduce_raises(array, method, expected):
     assert err.value.args[0] == expected
 
 
+@pytest.mark.parametrize('method', ('first', 'mean', 'median', 'min', 'max'))
+@pytest.mark.parametrize('shape', ((6, 1), (6, 4), (6, 2, 3)))
+def test_log_pass__array_reduce_frames(method, shape):
+    array = np.arange(np.prod(shape), dtype=np.float64).reshape(shape) ** 1.5
+    result = WriteLAS.array_reduce_frames(array, method)
+    expected = np.array([WriteLAS.array_reduce(array[f], method) for f in range(len(array))])
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_log_pass__array_reduce_frames_raises():
+    with pytest.raises(ValueError) as err:
+        WriteLAS.array_reduce_frames(np.arange(5.0), 'FIRST')
+    assert err.value.args[0] == "Array reduction method FIRST is not in ['first', 'max', 'mean', 'median', 'min']"
+
+
 @pytest.mark.parametrize(
     'value, expected',
     (
@@ -221,3 +236,33 @@ GR  .GAPI   : Gamma Ray Dimensions (1,)
     result = out_stream.getvalue()
     # print(result)
     assert result == expected
+
+
+@pytest.mark.parametrize('float_format', ('.3', '.3f', '.2e'))
+def test_las_write_array_section_data_in_chunks(float_format):
+    """Writing the data in chunks of frames is the same as writing all the frames at once."""
+    frame_array = LogPass.FrameArray(ident='IDENT', description='Test FrameArray')
+    frame_array.append(LogPass.FrameChannel('DEPT', 'Depth', 'FEET', (1,), LogPass.DEFAULT_NP_TYPE))
+    frame_array.append(LogPass.FrameChannel('GR  ', 'Gamma Ray', 'GAPI', (1,), LogPass.DEFAULT_NP_TYPE))
+    frame_array.append(LogPass.FrameChannel('MSFL', 'Micro Focused SFL', 'MMOH', (4,), LogPass.DEFAULT_NP_TYPE))
+    frame_array.init_arrays(10)
+    for i in range(10):
+        frame_array['DEPT'][i] = 10 - i
+        frame_array['GR  '][i] = i / 3
+        for j in range(4):
+            frame_array['MSFL'][i, j] = 10 * i + j
+    channels = {'GR  ', 'MSFL'}
+    out_stream = io.StringIO()
+    WriteLAS.write_array_section_data_to_las(frame_array, 'mean', channels, 16, float_format, out_stream)
+    expected = out_stream.getvalue()
+    arrays = [channel.array.copy() for channel in frame_array.channels]
+    out_stream = io.StringIO()
+    for start in range(0, 10, 3):
+        for channel, array in zip(frame_array.channels, arrays):
+            channel.array = array[start:start + 3]
+        WriteLAS.write_array_section_data_to_las(frame_array, 'mean', channels, 16, float_format, out_stream)
+    assert out_stream.getvalue() == expected
+    assert len(expected.splitlines()) == 10
+    assert expected.splitlines()[0] == ' '.join(
+        format(v, float_format).rjust(16) for v in (10.0, 0.0, 1.5)
+    )
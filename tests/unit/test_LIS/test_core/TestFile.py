@@ -28,11 +28,14 @@ __rights__  = 'Copyright (c) 2010 Paul Ross.'
 
 import io
 import os
+import struct
 import sys
+import tempfile
 import time
 import logging
 
 from TotalDepth.LIS.core import File
+from TotalDepth.LIS.core import PhysRec
 from TotalDepth.LIS.core import RepCode
 
 sys.path.append(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
@@ -236,6 +239,114 @@ class TestFileType0_Profile(TestFileType0Base):
         self._ReadFileWithBufferSize(4)
         
 
+class TestFilePadSettings(unittest.TestCase):
+    """Tests scan_file_with_different_padding() against scan_file_no_output() for each option."""
+    TIF = struct.Struct('<3L')
+
+    def _physical_records(self, prs, tif=False):
+        """prs is a list of (logical data, PRH attributes, trailer, pad bytes)."""
+        ret = bytearray()
+        previous = 0
+        for ld, attr, trailer, pad in prs:
+            pr = PhysRec.PR_PRH_LEN_FORMAT.pack(4 + len(ld) + len(trailer)) \
+                 + PhysRec.PR_PRH_ATTR_FORMAT.pack(attr) + ld + trailer
+            if tif:
+                start = len(ret)
+                ret += self.TIF.pack(0, previous, start + 12 + len(pr) + len(pad))
+                previous = start
+            ret += pr + pad
+        if tif:
+            start = len(ret)
+            ret += self.TIF.pack(1, previous, start + 12)
+            ret += self.TIF.pack(1, start, start + 24)
+        return bytes(ret)
+
+    def _assert_single_pass(self, data, pr_limit=0):
+        expected = {
+            settings: File.scan_file_no_output(io.BytesIO(data), True, settings.pad_modulo, settings.pad_non_null,
+                                               pr_limit=pr_limit)
+            for settings in File.PAD_SETTINGS
+        }
+        result = File.scan_file_with_different_padding(io.BytesIO(data), True, pr_limit=pr_limit)
+        self.assertEqual(expected, result)
+        self.assertEqual(list(File.PAD_SETTINGS), list(result.keys()))
+        return result
+
+    def test_00(self):
+        """TestFilePadSettings.test_00(): no padding."""
+        data = self._physical_records([(b'\x00' * 8, 0, b'', b'')] * 4)
+        result = self._assert_single_pass(data)
+        self.assertEqual({4}, set(result.values()))
+
+    def test_01(self):
+        """TestFilePadSettings.test_01(): null padding to 4 bytes."""
+        data = self._physical_records([(b'\xff' * 3, 0, b'', b'\x00'), (b'\xff' * 5, 0, b'', b'\x00' * 3)] * 3)
+        result = self._assert_single_pass(data)
+        self.assertEqual(6, result[File.PhysicalRecordSettings(4, False)])
+        self.assertEqual(File.PhysicalRecordSettings(4, False),
+                         File.best_physical_record_pad_settings(io.BytesIO(data)))
+
+    def test_02(self):
+        """TestFilePadSettings.test_02(): non-null padding to 4 bytes."""
+        data = self._physical_records([(b'\xff' * 3, 0, b'', b'\x01'), (b'\xff' * 5, 0, b'', b'\x01' * 3)] * 3)
+        result = self._assert_single_pass(data)
+        self.assertEqual(6, result[File.PhysicalRecordSettings(4, True)])
+        self.assertEqual(File.PhysicalRecordSettings(4, True), File.best_physical_record_pad_settings(io.BytesIO(data)))
+
+    def test_03(self):
+        """TestFilePadSettings.test_03(): TIF markers with padding and trailers."""
+        prs = [
+            (b'\xff' * 3, 1 << PhysRec.PR_RECORD_NUMBER_BIT, b'\x00\x01', b'\x00'),
+            (b'\xff' * 6, 1 << PhysRec.PR_FILE_NUMBER_BIT, b'\x00\x02', b'\x00\x00'),
+            (b'', 1 << PhysRec.PR_CHECKSUM_BIT, b'\x00\x03', b''),
+        ] * 2
+        for tif in (False, True):
+            data = self._physical_records(prs, tif=tif)
+            self._assert_single_pass(data)
+            for pr_limit in (1, 2, 3, 100):
+                self._assert_single_pass(data, pr_limit=pr_limit)
+
+    def test_04(self):
+        """TestFilePadSettings.test_04(): truncated and corrupt files."""
+        data = self._physical_records([(b'\xff' * 3, 1 << PhysRec.PR_CHECKSUM_BIT, b'\x00\x01', b'\x00')] * 3,
+                                      tif=True)
+        for length in range(len(data)):
+            self._assert_single_pass(data[:length])
+        for index in range(len(data)):
+            corrupt = bytearray(data)
+            corrupt[index] ^= 0xff
+            self._assert_single_pass(bytes(corrupt))
+
+    def test_05(self):
+        """TestFilePadSettings.test_05(): file path, memory mapped."""
+        data = self._physical_records([(b'\xff' * 3, 0, b'', b'\x00')] * 8)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'example.lis')
+            with open(path, 'wb') as file_object:
+                file_object.write(data)
+            self.assertEqual(File.scan_file_with_different_padding(io.BytesIO(data), True),
+                             File.scan_file_with_different_padding(path, True))
+            with open(path, 'rb') as file_object:
+                self.assertEqual(File.scan_file_with_different_padding(io.BytesIO(data), True),
+                                 File.scan_file_with_different_padding(file_object, True))
+            file_read = File.file_read_with_best_physical_record_pad_settings(path, path)
+            self.assertEqual(File.PhysicalRecordSettings(2, False), file_read.physicalRecordSettings)
+            file_read._prh.close()
+
+    def test_06(self):
+        """TestFilePadSettings.test_06(): empty and missing files."""
+        self.assertEqual({0}, set(self._assert_single_pass(b'').values()))
+        result = File.scan_file_with_different_padding('non-existent file', True)
+        self.assertEqual({0}, set(result.values()))
+
+    def test_07(self):
+        """TestFilePadSettings.test_07(): FileRead exposes its Physical Record settings."""
+        data = self._physical_records([(b'\xff' * 3, 0, b'', b'\x01')] * 4)
+        for settings in File.PAD_SETTINGS:
+            self.assertEqual(settings, File.FileRead(io.BytesIO(data), 'MyFile', True, *settings).physicalRecordSettings)
+        self.assertIsNone(File.best_physical_record_pad_settings('non-existent file'))
+
+
 @pytest.mark.slow
 class Special(unittest.TestCase):
     pass
@@ -262,6 +373,7 @@ def unitTest(theVerbosity=2):
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestFileLowLevel))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestFileType0))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestFileType0_Profile))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestFilePadSettings))
     #suite.addTests(unittest.TestLoader().loadTestsFromTestCase(SpecialType0))
     myResult = unittest.TextTestRunner(verbosity=theVerbosity).run(suite)
     return (myResult.testsRun, len(myResult.errors), len(myResult.failures))
@@ -20,8 +20,12 @@
 """Tests the file indexer.
 """
 
+import io
 import logging
+import os
+import shutil
 import sys
+import tempfile
 import time
 # sys.path.append(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
 # import BaseTestClasses
@@ -30,9 +34,12 @@ import time
 ######################
 import unittest
 
+from TotalDepth.LIS.core import File
 from TotalDepth.LIS.core import FileIndexer
+from TotalDepth.LIS.core import IndexCache
 from TotalDepth.LIS.core import LisGen
 from TotalDepth.LIS.core import LogiRec
+from TotalDepth.common import npz_cache
 from tests.unit import BaseTestClasses
 
 __author__  = 'Paul Ross'
@@ -353,6 +360,164 @@ class TestIndex_genPlotRecords(TestFileIndexerBase):
         print('Index pass[0].logPass.longStr():')
         print(myPasses[0].logPass.longStr())
 
+class TestFileIndexCache(TestIndex_genPlotRecords):
+    """Tests FileIndex with a persistent index cache."""
+    def setUp(self):
+        """Set up."""
+        self._tempDir = tempfile.mkdtemp()
+        self._path = os.path.join(self._tempDir, 'example.lis')
+        self._writeLisFile(4)
+
+    def tearDown(self):
+        """Tear down."""
+        shutil.rmtree(self._tempDir)
+
+    def _writeLisFile(self, numLr):
+        """Writes a LIS file with a File Head, a log pass with numLr IFLRs and a File Tail."""
+        myBa = bytearray(self._retFileHead())
+        myLp = self._retLogPassGen()
+        myBa += self.retPrS(myLp.lrBytesDFSR())
+        for i in range(numLr):
+            myBa += self.retPrS(myLp.lrBytes(i*100, 100))
+        myBa += self._retFileTail()
+        with open(self._path, 'wb') as f:
+            f.write(myBa)
+
+    def _retFileIndex(self, cacheDir=None):
+        return FileIndexer.FileIndex(File.FileRead(self._path, self._path), cacheDir=cacheDir)
+
+    def _retCacheKey(self, keepGoing=False):
+        return IndexCache.fileKey(self._path, pad_modulo=0, pad_non_null=False, keep_going=keepGoing, x_axis_index=0)
+
+    def _assertIndexEqual(self, expIdx, actIdx):
+        self.assertEqual(expIdx.lrTypeS, actIdx.lrTypeS)
+        self.assertEqual([i.tell for i in expIdx.genAll()], [i.tell for i in actIdx.genAll()])
+        self.assertEqual(expIdx.numLogPasses(), actIdx.numLogPasses())
+        for expLp, actLp in zip(expIdx.genLogPasses(), actIdx.genLogPasses()):
+            self.assertEqual(str(expLp.logPass.rle), str(actLp.logPass.rle))
+            self.assertEqual(expLp.logPass.totalFrames, actLp.logPass.totalFrames)
+            self.assertEqual(expLp.logPass.xAxisFirstVal, actLp.logPass.xAxisFirstVal)
+            self.assertEqual(expLp.logPass.xAxisLastVal, actLp.logPass.xAxisLastVal)
+            self.assertEqual(expLp.tocStr(), actLp.tocStr())
+
+    def test_00(self):
+        """TestFileIndexCache.test_00(): No cache by default."""
+        myIdx = self._retFileIndex()
+        self.assertEqual(3, len(myIdx))
+        self.assertEqual(['example.lis'], os.listdir(self._tempDir))
+
+    def test_01(self):
+        """TestFileIndexCache.test_01(): Sidecar cache is written then restored."""
+        myIdxExp = self._retFileIndex()
+        myIdx = self._retFileIndex('')
+        self.assertEqual(
+            ['example.lis', 'example.lis' + IndexCache.SIDECAR_SUFFIX],
+            sorted(os.listdir(self._tempDir)),
+        )
+        self._assertIndexEqual(myIdxExp, myIdx)
+        myIdx = self._retFileIndex('')
+        self._assertIndexEqual(myIdxExp, myIdx)
+        self.assertEqual(400, myIdx[1].logPass.totalFrames)
+
+    def test_02(self):
+        """TestFileIndexCache.test_02(): Cache in a cache directory."""
+        myCacheDir = os.path.join(self._tempDir, 'cache')
+        myIdxExp = self._retFileIndex()
+        self._retFileIndex(myCacheDir)
+        self.assertEqual(
+            [os.path.basename(IndexCache.cachePath(self._path, myCacheDir))],
+            os.listdir(myCacheDir),
+        )
+        self._assertIndexEqual(myIdxExp, self._retFileIndex(myCacheDir))
+
+    def test_03(self):
+        """TestFileIndexCache.test_03(): Stale cache is replaced."""
+        self._retFileIndex('')
+        self._writeLisFile(8)
+        myIdxExp = self._retFileIndex()
+        myIdx = self._retFileIndex('')
+        self._assertIndexEqual(myIdxExp, myIdx)
+        self.assertEqual(800, myIdx[1].logPass.totalFrames)
+        self._assertIndexEqual(myIdxExp, self._retFileIndex(''))
+
+    def test_04(self):
+        """TestFileIndexCache.test_04(): Unreadable cache is ignored and replaced."""
+        myPathCache = IndexCache.cachePath(self._path, '')
+        with open(myPathCache, 'wb') as f:
+            f.write(b'not a cache')
+        myIdxExp = self._retFileIndex()
+        self._assertIndexEqual(myIdxExp, self._retFileIndex(''))
+        self.assertIsNotNone(IndexCache.read(myPathCache, self._retCacheKey()))
+
+    def test_05(self):
+        """TestFileIndexCache.test_05(): Cache that does not match the file falls back to indexing the file."""
+        myIdxExp = self._retFileIndex()
+        myPathCache = IndexCache.cachePath(self._path, '')
+        self._retFileIndex('')
+        myMetadata, myArrays = IndexCache.read(myPathCache, self._retCacheKey())
+        # Claim that the DFSR is a table
+        myArrays['lr_type'][1] = LogiRec.LR_TYPE_WELL_DATA
+        IndexCache.write(myPathCache, self._retCacheKey(), myMetadata, myArrays)
+        self._assertIndexEqual(myIdxExp, self._retFileIndex(''))
+
+    def test_06(self):
+        """TestFileIndexCache.test_06(): The class attribute CACHE_DIR is the default."""
+        myIdxExp = self._retFileIndex()
+        FileIndexer.FileIndex.CACHE_DIR = ''
+        try:
+            self._retFileIndex()
+        finally:
+            FileIndexer.FileIndex.CACHE_DIR = None
+        self.assertTrue(os.path.isfile(IndexCache.cachePath(self._path, '')))
+        self._assertIndexEqual(myIdxExp, self._retFileIndex(''))
+
+    def test_07(self):
+        """TestFileIndexCache.test_07(): Files that are not given by path are not cached."""
+        with open(self._path, 'rb') as f:
+            myFile = File.FileRead(io.BytesIO(f.read()), 'MyFile')
+        myIdx = FileIndexer.FileIndex(myFile, cacheDir='')
+        self.assertEqual(3, len(myIdx))
+        self.assertEqual(['example.lis'], os.listdir(self._tempDir))
+
+    def test_08(self):
+        """TestFileIndexCache.test_08(): Different Physical Record settings do not share a cache."""
+        self._retFileIndex('')
+        myFile = File.FileRead(self._path, self._path, keepGoing=True)
+        self.assertIsNone(
+            IndexCache.read(
+                IndexCache.cachePath(self._path, ''),
+                self._retCacheKey(keepGoing=True),
+            )
+        )
+        self.assertEqual(3, len(FileIndexer.FileIndex(myFile, cacheDir='')))
+
+    def test_09(self):
+        """TestFileIndexCache.test_09(): Truncated cache is ignored and replaced."""
+        myIdxExp = self._retFileIndex()
+        self._retFileIndex('')
+        myPathCache = IndexCache.cachePath(self._path, '')
+        with open(myPathCache, 'r+b') as f:
+            f.truncate(os.path.getsize(myPathCache) // 2)
+        self._assertIndexEqual(myIdxExp, self._retFileIndex(''))
+        self.assertIsNotNone(IndexCache.read(myPathCache, self._retCacheKey()))
+
+    def test_10(self):
+        """TestFileIndexCache.test_10(): The --index-cache environment variable is the default if CACHE_DIR is None."""
+        myCacheDir = os.path.join(self._tempDir, 'cache')
+        myIdxExp = self._retFileIndex()
+        myEnvPrev = os.environ.get(npz_cache.INDEX_CACHE_ENV)
+        os.environ[npz_cache.INDEX_CACHE_ENV] = myCacheDir
+        try:
+            self.assertEqual(myCacheDir, IndexCache.defaultCacheDir())
+            self._retFileIndex()
+        finally:
+            if myEnvPrev is None:
+                del os.environ[npz_cache.INDEX_CACHE_ENV]
+            else:
+                os.environ[npz_cache.INDEX_CACHE_ENV] = myEnvPrev
+        self.assertTrue(os.path.isfile(IndexCache.cachePath(self._path, myCacheDir)))
+        self._assertIndexEqual(myIdxExp, self._retFileIndex(myCacheDir))
+
 class Special(unittest.TestCase):
     """Special tests."""
     pass
@@ -365,6 +530,7 @@ def unitTest(theVerbosity=2):
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestIndexMarker))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestIndexUnknownIntFormat))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestIndex_genPlotRecords))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestFileIndexCache))
     myResult = unittest.TextTestRunner(verbosity=theVerbosity).run(suite)
     return (myResult.testsRun, len(myResult.errors), len(myResult.failures))
 ##################
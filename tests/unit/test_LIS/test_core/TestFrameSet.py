@@ -37,6 +37,7 @@ from TotalDepth.LIS.core import LogiRec
 from TotalDepth.LIS.core import FrameSet
 from TotalDepth.LIS.core import cFrameSet
 from TotalDepth.LIS.core import RepCode
+from TotalDepth.common import np_summary
 
 ######################
 # Section: Unit tests.
@@ -1329,6 +1330,41 @@ class TestFrameSet_setFrameBytes(BaseTestClasses.TestBaseFile):
         myFs = FrameSet.FrameSet(self._dfsr, slice(1))
         self.assertRaises(FrameSet.ExceptionFrameSet, myFs.setFrameBytes, b'\x00\x00\x00\x00\x00', 0, 0, 0)
 
+    def test_04(self):
+        """TestFrameSet_setFrameBytes.test_04(): setFrameBytes() channel subset."""
+        myFs = FrameSet.FrameSet(self._dfsr, slice(1))
+        myFs.setFrameBytes(
+            b'\x00\x00\x00\x01\x00\x02\x00\x03\x00\x04\x00\x05\x00\x06\x00\x07' \
+            + b'\x00\x00\x01\x00\x00\x00\x01\x01',
+            0, 3, 4,
+        )
+        self.assertEqual([0., 1., 2., 3., 4., 5., 6., 7., 256., 257.], list(myFs.frame(0)[6:]))
+
+    def test_05(self):
+        """TestFrameSet_setFrameBytes.test_05(): setFramesBytes() is the same as setFrameBytes() on each frame."""
+        myFrameS = [
+            b''.join(RepCode.writeBytes(153.0 + fr * 6 + i, 68) for i in range(6)) \
+            + b''.join(RepCode.STRUCT_RC_79.pack(fr * 8 + i - 16) for i in range(8)) \
+            + RepCode.writeBytes(-fr, 73) + RepCode.writeBytes(fr * 1024, 73)
+            for fr in range(4)
+        ]
+        myFsOne = FrameSet.FrameSet(self._dfsr, slice(4))
+        for fr, by in enumerate(myFrameS):
+            myFsOne.setFrameBytes(by, fr, 0, 4)
+        myFsMany = FrameSet.FrameSet(self._dfsr, slice(4))
+        myFsMany.setFramesBytes(b''.join(myFrameS), 0, 4, 0, 4)
+        for fr in range(4):
+            self.assertTrue((myFsOne.frame(fr) == myFsMany.frame(fr)).all())
+        self.assertEqual(153.0 + 18, myFsMany.frame(3)[0])
+        self.assertEqual(3 * 8 - 16, myFsMany.frame(3)[6])
+        self.assertEqual(-3, myFsMany.frame(3)[14])
+
+    def test_06(self):
+        """TestFrameSet_setFrameBytes.test_06(): setFramesBytes() fails on buffer length."""
+        myFs = FrameSet.FrameSet(self._dfsr, slice(4))
+        self.assertRaises(FrameSet.ExceptionFrameSet, myFs.setFramesBytes, b'\x00' * 47, 0, 1, 0, 4)
+        self.assertRaises(FrameSet.ExceptionFrameSet, myFs.setFramesBytes, b'\x00' * 97, 0, 2, 0, 4)
+
 class TestFrameSet_setFrameBytes_Indirect(BaseTestClasses.TestBaseFile):
     """Tests FrameSet"""
     def setUp(self):
@@ -1959,6 +1995,87 @@ class TestFrameSetAccumulate(BaseTestClasses.TestBaseLogPass):
         self.assertEqual(expVal.shape, myArray.shape)
         self.assertTrue((expVal == myArray).all())
 
+    def _retFrameSetWithAbsent(self, numCh, numFr):
+        """Returns a FrameSet of numCh channels and numFr frames of varying
+        values, some of which are the absent value."""
+        myFile = self._createFileDFSROnly(numCh, 1, 1)
+        myDfsr = LogiRec.LrDFSRRead(myFile)
+        myFs = FrameSet.FrameSet(myDfsr, slice(numFr))
+        for f in range(numFr):
+            fBy = bytearray()
+            for ch in range(numCh):
+                if (f + ch) % 7 == 3:
+                    v = myDfsr.ebs.absentValue
+                else:
+                    v = float(((f * 37 + ch * 11) % 17) - 4)
+                fBy.extend(RepCode.writeBytes68(v))
+            myFs.setFrameBytes(by=fBy, fr=f, chFrom=0, chTo=numCh-1)
+        return myFs
+
+    def test_30(self):
+        """TestFrameSetAccumulate.test_30(): accumulate() with addArray() is the same as add() for each value."""
+        myFs = self._retFrameSetWithAbsent(5, 64)
+        myAccs = [
+            FrameSet.AccCount, FrameSet.AccMin, FrameSet.AccMean, FrameSet.AccMax, FrameSet.AccStDev,
+            FrameSet.AccDec, FrameSet.AccEq, FrameSet.AccInc, FrameSet.AccBias, FrameSet.AccDrift,
+            FrameSet.AccActivity,
+        ]
+        myArray = myFs.accumulate(myAccs)
+        self.assertEqual((5, len(myAccs)), myArray.shape)
+        for ch in range(5):
+            for a, cls in enumerate(myAccs):
+                myAcc = cls()
+                for v in myFs.genChScValues(ch):
+                    if v != myFs._absentValue:
+                        myAcc.add(v)
+                self.assertAlmostEqual(myAcc.value(), myArray[ch, a])
+
+    def test_31(self):
+        """TestFrameSetAccumulate.test_31(): addArray() in chunks is the same as add() for each value."""
+        myValues = numpy.array([4.0, 4.0, 2.0, 8.0, 8.0, 1.0, 3.0, 3.0, 16.0])
+        for cls in (FrameSet.AccDec, FrameSet.AccEq, FrameSet.AccInc, FrameSet.AccBias, FrameSet.AccDrift,
+                    FrameSet.AccActivity, FrameSet.AccStDev):
+            myAcc = cls()
+            for v in myValues:
+                myAcc.add(v)
+            myAccChunks = cls()
+            for i in range(0, len(myValues), 2):
+                myAccChunks.addArray(myValues[i:i + 2])
+            myAccChunks.addArray(myValues[:0])
+            self.assertAlmostEqual(myAcc.value(), myAccChunks.value(), msg=cls.title)
+
+    def test_32(self):
+        """TestFrameSetAccumulate.test_32(): summarise() is the same as np_summary.summarise_array()."""
+        myFs = self._retFrameSetWithAbsent(5, 64)
+        mySummaries = myFs.summarise()
+        self.assertEqual(5, len(mySummaries))
+        for ch in range(5):
+            myValues = numpy.array(list(myFs.genChScValues(ch)))
+            myExp = np_summary.summarise_array(numpy.ma.masked_equal(myValues, myFs._absentValue))
+            myResult = mySummaries[ch].summary()
+            self.assertEqual(myExp.len, myResult.len)
+            self.assertEqual(myExp.count, myResult.count)
+            self.assertEqual(myExp.min, myResult.min)
+            self.assertEqual(myExp.max, myResult.max)
+            self.assertAlmostEqual(myExp.mean, myResult.mean)
+            self.assertAlmostEqual(myExp.std, myResult.std)
+            self.assertEqual(myExp.median, myResult.median)
+            self.assertEqual(
+                (myExp.count_eq, myExp.count_dec, myExp.count_inc),
+                (myResult.count_eq, myResult.count_dec, myResult.count_inc),
+            )
+        # Summarising the same FrameSet twice is the same as summarising twice the frames
+        mySummaries = myFs.summarise(myFs.summarise())
+        self.assertEqual(2 * myExp.len, mySummaries[-1].len)
+        self.assertAlmostEqual(myExp.mean, mySummaries[-1].mean)
+
+    def test_33(self):
+        """TestFrameSetAccumulate.test_33(): summarise() on empty frameset raises."""
+        myFile = self._createFileDFSROnly(4, 1, 1)
+        myDfsr = LogiRec.LrDFSRRead(myFile)
+        myFs = FrameSet.FrameSet(myDfsr, slice(0))
+        self.assertRaises(FrameSet.ExceptionFrameSetEmpty, myFs.summarise)
+
 
 # @pytest.mark.parametrize(
 #     'cls, expected',
@@ -3515,6 +3632,59 @@ class TestFrameSetgenChScPoints(BaseTestClasses.TestBaseLogPass):
             [v for v in myFs.genChScPoints(0, 0)],
         )
 
+class TestFrameSetchScPointsArrays(BaseTestClasses.TestBaseLogPass):
+    """Test the FrameSet chScPointsArrays() against genChScPoints()."""
+    def _retFrameSet(self, numCh, numSa, numBu, numFr):
+        """Returns a FrameSet where channel 0 is the X axis and the other channels have numSa samples and numBu bursts."""
+        myFile = self._createFileDFSROnly(numCh, numSa, numBu)
+        myDfsr = LogiRec.LrDFSRRead(myFile)
+        myFs = FrameSet.FrameSet(myDfsr, slice(numFr))
+        v = 0.0
+        dep = 1000.0
+        for f in range(numFr):
+            fBy = bytearray(RepCode.writeBytes68(dep))
+            dep -= 0.5
+            for ch in range(1, numCh):
+                for i in range(numSa * numBu):
+                    fBy.extend(RepCode.writeBytes68(v))
+                    v += 1.0
+            myFs.setFrameBytes(by=fBy, fr=f, chFrom=0, chTo=numCh-1)
+        return myFs
+
+    def _assertMatchesGen(self, myFs, ch):
+        myX, myV = myFs.chScPointsArrays(ch, 0)
+        self.assertEqual([v for v in myFs.genChScPoints(ch, 0)], list(zip(myX.tolist(), myV.tolist())))
+
+    def test_00(self):
+        """TestFrameSetchScPointsArrays.test_00(): 8 frames of 5 channels, single value."""
+        myFs = self._retFrameSet(5, 1, 1, 8)
+        for ch in range(5):
+            self._assertMatchesGen(myFs, ch)
+        myX, myV = myFs.chScPointsArrays(-1, 0)
+        self.assertEqual(myFs.numFrames, len(myX))
+        self.assertEqual([1000.0 - 0.5 * f for f in range(8)], myX.tolist())
+
+    def test_01(self):
+        """TestFrameSetchScPointsArrays.test_01(): 8 frames of DEPT + 1 channel with 1 sample, 4 bursts."""
+        myFs = self._retFrameSet(2, 1, 4, 8)
+        self._assertMatchesGen(myFs, 0)
+        self._assertMatchesGen(myFs, 1)
+        self.assertEqual(32, len(myFs.chScPointsArrays(1, 0)[0]))
+
+    def test_02(self):
+        """TestFrameSetchScPointsArrays.test_02(): 8 frames of DEPT + 1 channel with 4 samples, 1 burst."""
+        myFs = self._retFrameSet(2, 4, 1, 8)
+        self._assertMatchesGen(myFs, 0)
+        self._assertMatchesGen(myFs, 1)
+
+    def test_03(self):
+        """TestFrameSetchScPointsArrays.test_03(): No frames gives empty arrays."""
+        myFs = self._retFrameSet(2, 1, 1, 0)
+        myX, myV = myFs.chScPointsArrays(1, 0)
+        self.assertEqual((0,), myX.shape)
+        self.assertEqual((0,), myV.shape)
+
+
 class TestFrameSetgenAll(BaseTestClasses.TestBaseLogPass):
     """Test the FrameSet genAll()."""
     def setUp(self):
@@ -1442,6 +1442,28 @@ class TestLogPass_UpDirect_Dipmeter(BaseTestClasses.TestBaseLogPass):
         self.assertEqual(numFrames, self._lp.frameSet.numFrames)
         self.assertEqual(91, self._lp.frameSet.valuesPerFrame)
 
+    def test_40(self):
+        """TestLogPass_UpDirect_Dipmeter.test_40(): DEPT and 234 Dipmeter, summariseFrameSet() in chunks is the same as the whole FrameSet."""
+        self._lp.setFrameSet(self._file, theFrSl=None, theChList=None)
+        expSummaries = self._lp.frameSet.summarise()
+        for chunkFrames in (1, 7, 96, 1000):
+            mySummaries = self._lp.summariseFrameSet(self._file, chunkFrames)
+            self.assertEqual(len(expSummaries), len(mySummaries))
+            for myExp, myResult in zip(expSummaries, mySummaries):
+                self.assertEqual(myExp.count, myResult.count)
+                self.assertEqual(myExp.min, myResult.min)
+                self.assertEqual(myExp.max, myResult.max)
+                self.assertAlmostEqual(myExp.mean, myResult.mean)
+                self.assertAlmostEqual(myExp.std(), myResult.std())
+                self.assertEqual(
+                    (myExp.count_eq, myExp.count_dec, myExp.count_inc),
+                    (myResult.count_eq, myResult.count_dec, myResult.count_inc),
+                )
+
+    def test_41(self):
+        """TestLogPass_UpDirect_Dipmeter.test_41(): DEPT and 234 Dipmeter, genFrameSetChunks() raises on chunkFrames < 1."""
+        self.assertRaises(LogPass.ExceptionLogPass, list, self._lp.genFrameSetChunks(self._file, 0))
+
 class TestLogPass_UpIndirect(BaseTestClasses.TestBaseLogPass):
     """Tests LogPass"""
     def setUp(self):
@@ -1635,6 +1657,19 @@ class TestLogPass_UpIndirect(BaseTestClasses.TestBaseLogPass):
             list(self._logPass.genFrameSetHeadings())
         )
 
+    def test_20(self):
+        """TestLogPass_UpIndirect.test_20(): summariseFrameSet() in chunks of 4 frames."""
+        mySummaries = self._logPass.summariseFrameSet(self._file, 4)
+        self.assertEqual(4, len(mySummaries))
+        for ch, mySummary in enumerate(mySummaries):
+            myValues = numpy.arange(ch, 60.0, 4)
+            self.assertEqual(15, mySummary.count)
+            self.assertEqual(myValues.min(), mySummary.min)
+            self.assertEqual(myValues.max(), mySummary.max)
+            self.assertAlmostEqual(myValues.mean(), mySummary.mean)
+            self.assertAlmostEqual(myValues.std(), mySummary.std())
+            self.assertEqual(14, mySummary.count_inc)
+
 
 @pytest.mark.slow
 class TestLogPass_PerfBase(BaseTestClasses.TestBaseFile):
@@ -33,6 +33,7 @@ import logging
 import io
 
 from TotalDepth.LIS.core import PhysRec
+from TotalDepth.LIS.core import RawStream
 
 sys.path.append(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
 import BaseTestClasses
@@ -774,6 +775,60 @@ class TestPhysRecMultipleReadWithTif(unittest.TestCase):
         self._pr.skipToNextLr()
         self.assertTrue(self._pr.isEOF)
 
+class TestPhysRecReadBlockSize(unittest.TestCase):
+    """Tests reading logical records across the RawStreamRead window with tiny block sizes."""
+    def setUp(self):
+        """Set up."""
+        self._blockSize = RawStream.READ_BLOCK_SIZE
+        myPrs = []
+        # Two logical records each of three physical records with a record number and null padding.
+        for myLr in range(2):
+            for myPr in range(3):
+                myAttr = (1 << PhysRec.PR_RECORD_NUMBER_BIT)
+                if myPr < 2:
+                    myAttr |= 1 << PhysRec.PR_SUCCESSOR_ATTRIBUTE_BIT
+                if myPr > 0:
+                    myAttr |= 1 << PhysRec.PR_PREDECESSOR_ATTRIBUTE_BIT
+                myLd = bytes(range(myLr * 64 + myPr * 16, myLr * 64 + myPr * 16 + 5 + myPr))
+                myPrs.append(
+                    PhysRec.PR_PRH_FORMAT.pack(4 + len(myLd) + 2, myAttr) + myLd
+                    + PhysRec.PR_PRT_REC_NUM_FORMAT.pack(myLr * 3 + myPr) + b'\x00' * (-(6 + len(myLd)) % 4)
+                )
+        self._data = b''.join(myPrs)
+        self._lds = [
+            bytes(range(0, 5)) + bytes(range(16, 22)) + bytes(range(32, 39)),
+            bytes(range(64, 69)) + bytes(range(80, 86)) + bytes(range(96, 103)),
+        ]
+
+    def tearDown(self):
+        """Tear down."""
+        RawStream.READ_BLOCK_SIZE = self._blockSize
+
+    def test_00(self):
+        """TestPhysRecReadBlockSize.test_00(): read complete logical records."""
+        for myBlockSize in (1, 3, 7, 4096):
+            RawStream.READ_BLOCK_SIZE = myBlockSize
+            myPr = PhysRec.PhysRecRead(theFile=io.BytesIO(self._data), theFileId='MyFile', keepGoing=True,
+                                       pad_modulo=4)
+            self.assertEqual(self._lds[0], myPr.readLrBytes())
+            self.assertEqual(self._lds[1], myPr.readLrBytes())
+            self.assertIsNone(myPr.readLrBytes())
+            self.assertTrue(myPr.isEOF)
+
+    def test_01(self):
+        """TestPhysRecReadBlockSize.test_01(): read, skip and seek within logical records."""
+        for myBlockSize in (1, 3, 7, 4096):
+            RawStream.READ_BLOCK_SIZE = myBlockSize
+            myPr = PhysRec.PhysRecRead(theFile=io.BytesIO(self._data), theFileId='MyFile', keepGoing=True,
+                                       pad_modulo=4)
+            self.assertEqual(self._lds[0][:3], myPr.readLrBytes(3))
+            self.assertEqual(9, myPr.skipLrBytes(9))
+            self.assertEqual(self._lds[0][12:], myPr.readLrBytes())
+            self.assertEqual(self._lds[1][:10], myPr.readLrBytes(10))
+            myPr.seekCurrentLrStart()
+            self.assertEqual(self._lds[1], myPr.readLrBytes())
+
+
 class TestPhysRecGenLd(unittest.TestCase):
     """Tests ..."""
     def setUp(self):
@@ -1513,6 +1568,7 @@ def unitTest(theVerbosity=2):
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPhysRecSingleReadWithTif))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPhysRecMultipleRead))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPhysRecMultipleReadWithTif))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPhysRecReadBlockSize))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPhysRecGenLd))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPhysRecMultipleSkip))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPhysRecRandomAccessLogicalData))
@@ -191,6 +191,71 @@ class TestRawStream(unittest.TestCase):
         tE = time.perf_counter() - tS
         sys.stderr.write('Read rate %10.3f kB/s ' % (myStruct.size * myNum/(1024*tE)))
 
+class TestRawStreamRead(unittest.TestCase):
+    """Tests the block buffered RawStreamRead against the underlying file object."""
+    DATA = bytes(range(256)) * 4
+
+    def test_00(self):
+        """TestRawStreamRead.test_00(): read() across window boundaries, small blocks."""
+        for blockSize in (1, 3, 16, 1024):
+            myRs = RawStream.RawStreamRead(io.BytesIO(self.DATA), fileId='MyFile', blockSize=blockSize)
+            myFi = io.BytesIO(self.DATA)
+            for size in (0, 1, 2, 5, 17, 100, 1000):
+                self.assertEqual(myFi.read(size), myRs.read(size))
+                self.assertEqual(myFi.tell(), myRs.tell())
+
+    def test_01(self):
+        """TestRawStreamRead.test_01(): readAndUnpack() across window boundaries matches RawStream."""
+        myStruct = struct.Struct('>HL')
+        for blockSize in (1, 5, 64):
+            myRsRead = RawStream.RawStreamRead(io.BytesIO(self.DATA), fileId='MyFile', blockSize=blockSize)
+            myRs = RawStream.RawStream(io.BytesIO(self.DATA), fileId='MyFile')
+            for _i in range(len(self.DATA) // myStruct.size):
+                self.assertEqual(myRs.readAndUnpack(myStruct), myRsRead.readAndUnpack(myStruct))
+                self.assertEqual(myRs.tell(), myRsRead.tell())
+            with self.assertRaises(RawStream.ExceptionRawStreamEOF):
+                myRsRead.readAndUnpack(myStruct)
+            self.assertEqual(len(self.DATA), myRsRead.tell())
+
+    def test_02(self):
+        """TestRawStreamRead.test_02(): seek() backwards, forwards, past EOF and from the end."""
+        myRs = RawStream.RawStreamRead(io.BytesIO(self.DATA), fileId='MyFile', blockSize=16)
+        myRs.seek(100)
+        self.assertEqual(self.DATA[100:104], myRs.read(4))
+        myRs.seek(10)
+        self.assertEqual(self.DATA[10:14], myRs.read(4))
+        myRs.seek(200, 1)
+        self.assertEqual(214, myRs.tell())
+        self.assertEqual(self.DATA[214:218], myRs.read(4))
+        myRs.seek(-8, 2)
+        self.assertEqual(len(self.DATA) - 8, myRs.tell())
+        self.assertEqual(self.DATA[-8:], myRs.read(100))
+        myRs.seek(len(self.DATA) + 10)
+        self.assertEqual(b'', myRs.read(4))
+        self.assertEqual(len(self.DATA) + 10, myRs.tell())
+        myRs.seek(0)
+        self.assertEqual(self.DATA, myRs.read(-1))
+
+    def test_03(self):
+        """TestRawStreamRead.test_03(): the window is refreshed after seek() and close() raises ValueError."""
+        myRs = RawStream.RawStreamRead(io.BytesIO(self.DATA), fileId='MyFile')
+        myRs.seek(len(self.DATA) - 2)
+        self.assertEqual(self.DATA[-2:], myRs.read(4))
+        myRs.seek(0)
+        self.assertEqual(self.DATA[:4], myRs.read(4))
+        myRs.close()
+        with self.assertRaises(ValueError):
+            myRs.tell()
+        with self.assertRaises(ValueError):
+            myRs.readAndUnpack(struct.Struct('>L'))
+
+    def test_04(self):
+        """TestRawStreamRead.test_04(): write() is not supported."""
+        myRs = RawStream.RawStreamRead(io.BytesIO(self.DATA), fileId='MyFile')
+        with self.assertRaises(RawStream.ExceptionRawStream):
+            myRs.write(b'ABCD')
+
+
 class Special(unittest.TestCase):
     """Special tests."""
     pass
@@ -198,6 +263,7 @@ class Special(unittest.TestCase):
 def unitTest(theVerbosity=2):
     suite = unittest.TestLoader().loadTestsFromTestCase(Special)
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestRawStream))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestRawStreamRead))
     myResult = unittest.TextTestRunner(verbosity=theVerbosity).run(suite)
     return (myResult.testsRun, len(myResult.errors), len(myResult.failures))
 ##################
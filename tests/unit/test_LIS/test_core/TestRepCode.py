@@ -34,12 +34,16 @@ import random
 import io
 import math
 
+import numpy
+
 # Generic methods, these choose between Python and Cython
 from TotalDepth.LIS.core import RepCode
 # Python reference methods
 from TotalDepth.LIS.core import pRepCode
 ## Cython methods
 from TotalDepth.LIS.core import cRepCode
+
+from TotalDepth.LIS.core import cpRepCode
 # For testing read operations
 from TotalDepth.LIS.core import File
 from TotalDepth.LIS.core import PhysRec
@@ -2004,6 +2008,123 @@ class TestRepCodeIndirect(BaseTestClasses.TestRepCodeBase):
         myFile = File.FileRead(theFile=myBy, theFileId='MyFile', keepGoing=True)
         self.assertRaises(RepCode.ExceptionRepCodeUnknown, RepCode.readRepCode, 0, myFile)
 
+class TestRepCodeArray(BaseTestClasses.TestRepCodeBase):
+    """Tests numpy array conversion is identical to readBytes()."""
+    # Rep code 70 is omitted as readBytes() can not read negative values.
+    REP_CODES = (49, 50, 56, 66, 68, 73, 77, 79, 130, 234)
+
+    def _retRandomBytes(self, theRc, theNum):
+        myRandom = random.Random(theRc)
+        return bytes(myRandom.randrange(256) for _i in range(RepCode.wordLength(theRc) * theNum))
+
+    def test_00(self):
+        """TestRepCodeArray.test_00(): readBytesArray() is the same as readBytes()."""
+        for rc in self.REP_CODES:
+            by = self._retRandomBytes(rc, 1024)
+            myArray = RepCode.readBytesArray(rc, by)
+            self.assertEqual(1024, len(myArray))
+            wl = RepCode.wordLength(rc)
+            for i in range(len(myArray)):
+                self.assertEqual(RepCode.readBytes(rc, by[i * wl:(i + 1) * wl]), myArray[i])
+
+    def test_01(self):
+        """TestRepCodeArray.test_01(): readBytesArray() Rep Code 70."""
+        self.assertEqual(
+            [153.25, -153.25, 0.0],
+            list(RepCode.readBytesArray(70, b'\x00\x99\x40\x00\xFF\x66\xC0\x00\x00\x00\x00\x00')),
+        )
+        by = self._retRandomBytes(70, 256)
+        myArray = RepCode.readBytesArray(70, by)
+        for i in range(len(myArray)):
+            self.assertEqual(pRepCode.from70(RepCode.STRUCT_RC_68.unpack(by[i * 4:(i + 1) * 4])[0]), myArray[i])
+
+    def test_02(self):
+        """TestRepCodeArray.test_02(): fromArray() two dimensional."""
+        myWords = numpy.array([[0x4C88, 0xB388], [0x4C88, 0x0000]], dtype=RepCode.numpyWordDtype(49))
+        myArray = RepCode.fromArray(49, myWords)
+        self.assertEqual((2, 2), myArray.shape)
+        self.assertEqual([[153.0, -153.0], [153.0, 0.0]], myArray.tolist())
+
+    def test_03(self):
+        """TestRepCodeArray.test_03(): readBytesArray() fails."""
+        self.assertRaises(RepCode.ExceptionRepCodeUnknown, RepCode.readBytesArray, 65, b'')
+        self.assertRaises(RepCode.ExceptionRepCodeUnknown, RepCode.readBytesArray, 0, b'')
+        self.assertRaises(RepCode.ExceptionRepCodeRead, RepCode.readBytesArray, 68, b'\x00\x00\x00')
+
+class TestRepCodeBytesArray(BaseTestClasses.TestRepCodeBase):
+    """Tests the buffer batch conversions of pRepCode, cRepCode and cpRepCode are identical."""
+    MODULES = (pRepCode, cRepCode, cpRepCode)
+    FROM_REP_CODES = (49, 50, 56, 66, 68, 70, 73, 77, 79, 130, 234)
+    TO_REP_CODES = (56, 66, 68, 73, 77, 79, 130, 234)
+
+    def _retRandomBytes(self, theRc, theNum):
+        myRandom = random.Random(theRc)
+        return bytes(myRandom.randrange(256) for _i in range(RepCode.wordLength(theRc) * theNum))
+
+    def _retValues(self):
+        myRandom = random.Random(68)
+        myValues = [0.0, 153.0, -153.0, 1.0, -1.0, 0.5, -0.5, 1e-40, -1e-45, 1e-50, 1e39, -1e39, 2.0**-130, -2.0**-140]
+        myValues += [myRandom.uniform(-300.0, 300.0) for _i in range(1024)]
+        myValues += [myRandom.uniform(-1, 1) * 10**myRandom.randint(-45, 38) for _i in range(1024)]
+        return numpy.array(myValues)
+
+    def test_00(self):
+        """TestRepCodeBytesArray.test_00(): fromBytesArray() is the same as readBytes() for all modules."""
+        for rc in self.FROM_REP_CODES:
+            by = self._retRandomBytes(rc, 256)
+            wl = RepCode.wordLength(rc)
+            if rc == 70:
+                # readBytes() can not read negative values.
+                myExpected = [pRepCode.from70(RepCode.STRUCT_RC_68.unpack(by[i * 4:(i + 1) * 4])[0]) for i in range(256)]
+            else:
+                myExpected = [RepCode.readBytes(rc, by[i * wl:(i + 1) * wl]) for i in range(256)]
+            for myModule in self.MODULES:
+                myArray = numpy.empty(256)
+                myModule.fromBytesArray(rc, by, myArray)
+                self.assertEqual(myExpected, myArray.tolist(), '{:s} rc={:d}'.format(myModule.__name__, rc))
+
+    def test_01(self):
+        """TestRepCodeBytesArray.test_01(): toBytesArray() is the same for all modules."""
+        myValues = self._retValues()
+        for rc in self.TO_REP_CODES:
+            myResults = []
+            for myModule in self.MODULES:
+                myBytes = bytearray(len(myValues) * RepCode.wordLength(rc))
+                myModule.toBytesArray(rc, myValues, myBytes)
+                myResults.append(myBytes)
+            self.assertEqual(myResults[0], myResults[1], 'rc={:d}'.format(rc))
+            self.assertEqual(myResults[0], myResults[2], 'rc={:d}'.format(rc))
+
+    def test_02(self):
+        """TestRepCodeBytesArray.test_02(): toBytesArray() Rep Code 68 is the same as writeBytes()."""
+        myValues = self._retValues()
+        myExpected = b''.join(RepCode.writeBytes(v, 68) for v in myValues)
+        for myModule in self.MODULES:
+            myBytes = bytearray(len(myValues) * 4)
+            myModule.toBytesArray(68, myValues, myBytes)
+            self.assertEqual(myExpected, myBytes, myModule.__name__)
+
+    def test_03(self):
+        """TestRepCodeBytesArray.test_03(): fromBytesArray() and toBytesArray() fail."""
+        for myModule in self.MODULES:
+            self.assertRaises(ValueError, myModule.fromBytesArray, 65, b'', numpy.empty(0))
+            self.assertRaises(ValueError, myModule.fromBytesArray, 68, b'\x00\x00\x00', numpy.empty(1))
+            self.assertRaises(ValueError, myModule.toBytesArray, 49, numpy.empty(1), bytearray(2))
+            self.assertRaises(ValueError, myModule.toBytesArray, 68, numpy.empty(1), bytearray(3))
+
+    def test_04(self):
+        """TestRepCodeBytesArray.test_04(): writeBytesArray() is the same as writeBytes()."""
+        self.assertEqual(
+            b''.join(RepCode.writeBytes(v, 68) for v in (153.0, -153.0, 0.0)),
+            RepCode.writeBytesArray([153.0, -153.0, 0.0], 68),
+        )
+        self.assertEqual(b''.join(RepCode.writeBytes(v, 73) for v in (153, -153, 0)),
+                         RepCode.writeBytesArray([153, -153, 0], 73))
+        self.assertEqual(b''.join(RepCode.writeBytes(v, 66) for v in (153, 0, 255)),
+                         RepCode.writeBytesArray([153, 0, 255], 66))
+        self.assertEqual(b'', RepCode.writeBytesArray([], 68))
+        self.assertRaises(RepCode.ExceptionRepCodeUnknown, RepCode.writeBytesArray, [1.0], 49)
+
 class Special(unittest.TestCase):
     """Special tests."""
     pass
@@ -2037,6 +2158,8 @@ def unitTest(theVerbosity=2):
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestRepCodeFrom79Time))
     # Misc. tests
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestRepCodeIndirect))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestRepCodeArray))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestRepCodeBytesArray))
     #
     myResult = unittest.TextTestRunner(verbosity=theVerbosity).run(suite)
     return (myResult.testsRun, len(myResult.errors), len(myResult.failures))
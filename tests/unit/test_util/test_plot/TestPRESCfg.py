@@ -33,6 +33,8 @@ import math
 import random
 import pprint
 
+import numpy
+
 from TotalDepth.LIS.core import RepCode
 from TotalDepth.LIS.core import LogiRec
 from TotalDepth.LIS.core import Mnem
@@ -74,6 +76,7 @@ class TestLineTrans(unittest.TestCase):
         self.assertEqual(PRESCfg.BACKUP_ALL, myT._bu)
         self.assertRaises(NotImplementedError, myT.L2P, None)
         self.assertRaises(NotImplementedError, myT.wrapPos, None)
+        self.assertRaises(NotImplementedError, myT.wrapPosArray, None)
         # Test stringify
         str(myT)
         
@@ -185,6 +188,28 @@ class TestLineTrans(unittest.TestCase):
         self.assertEqual((-1, 85.0), myT.wrapPos(0.02))
         self.assertEqual((1, 35.0), myT.wrapPos(20000.0))
         
+    def test_22(self):
+        """TestLineTrans.test_22(): Linear wrapPosArray() is the same as wrapPos()."""
+        myT = PRESCfg.LineTransLin(0.0, 100.0, 40.0, 440.0)
+        myVals = [-360.0, -260.0, 40.0, 440.0, 540.0, 123.456, -1e6, 1e6]
+        myWraps, myPosS, myValid = myT.wrapPosArray(numpy.array(myVals))
+        self.assertTrue(myValid.all())
+        self.assertEqual([myT.wrapPos(v) for v in myVals], list(zip(myWraps.astype(int).tolist(), myPosS.tolist())))
+        myWraps, myPosS, myValid = myT.wrapPosArray(numpy.array([1.0, numpy.nan, numpy.inf]))
+        self.assertEqual([True, False, False], myValid.tolist())
+
+    def test_23(self):
+        """TestLineTrans.test_23(): Log wrapPosArray() is the same as wrapPos() and marks values <= 0 as not valid."""
+        myT = PRESCfg.LineTransLog10(10.0, 110.0, 0.2, 2000.0)
+        myVals = [0.2, 2000.0, 2.0, 20.0, 200.0, 0.01, 1e7, 3.14159, 0.0, -1.0]
+        myWraps, myPosS, myValid = myT.wrapPosArray(numpy.array(myVals))
+        self.assertEqual([True] * 8 + [False, False], myValid.tolist())
+        self.assertEqual(
+            [myT.wrapPos(v) for v in myVals[:8]],
+            list(zip(myWraps[:8].astype(int).tolist(), myPosS[:8].tolist()))
+        )
+        self.assertRaises(PRESCfg.ExceptionLineTransBaseMath, myT.wrapPos, 0.0)
+
     def test_30_00(self):
         """TestLineTrans.test_30_00(): Linear identity transformation, wrapPos(), no backup trace."""
         myT = PRESCfg.LineTransLin(0.0, 100.0, 0.0, 100.0, backup=PRESCfg.BACKUP_NONE)
@@ -34,6 +34,8 @@ import logging
 import pprint
 import io
 import random
+
+import numpy
 #import collections
 try:
     import xml.etree.cElementTree as etree
@@ -641,6 +643,44 @@ class TestPlotRoll(unittest.TestCase):
             pass
 
 
+class TestPlotDecimation(unittest.TestCase):
+    """Tests Plot.retDecimatedIndexes()."""
+    def test_00(self):
+        """TestPlotDecimation.test_00(): Four or fewer points are unchanged."""
+        myIdxS = Plot.retDecimatedIndexes(numpy.array([1.0, 4.0, 2.0, 3.0]), numpy.array([0.1, 0.2, 0.3, 0.4]), 1.0)
+        self.assertEqual([0, 1, 2, 3], myIdxS.tolist())
+
+    def test_01(self):
+        """TestPlotDecimation.test_01(): Zero row depth is no decimation."""
+        myDepthS = numpy.linspace(0.0, 1.0, 100)
+        myIdxS = Plot.retDecimatedIndexes(numpy.sin(myDepthS), myDepthS, 0.0)
+        self.assertEqual(list(range(100)), myIdxS.tolist())
+
+    def test_02(self):
+        """TestPlotDecimation.test_02(): One row is reduced to first, min, max, last in order."""
+        myTracPosS = numpy.array([5.0, 7.0, 9.0, 1.0, 6.0, 3.0, 4.0])
+        myIdxS = Plot.retDecimatedIndexes(myTracPosS, numpy.linspace(10.0, 10.9, len(myTracPosS)), 1.0)
+        self.assertEqual([0, 2, 3, 6], myIdxS.tolist())
+
+    def test_03(self):
+        """TestPlotDecimation.test_03(): Several rows, up and down, each run of a row is reduced."""
+        myTracPosS = numpy.array([5.0, 7.0, 9.0, 1.0, 6.0, 3.0, 4.0, 5.0, 7.0, 9.0, 1.0, 6.0, 3.0, 4.0, 2.0])
+        myDepthS = numpy.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 1.1, 1.2, 1.3, 1.4, 1.5, 0.9, 0.8, 0.7])
+        myIdxS = Plot.retDecimatedIndexes(myTracPosS, myDepthS, 1.0)
+        self.assertEqual([0, 2, 3, 6, 7, 9, 10, 11, 12, 13, 14], myIdxS.tolist())
+
+    def test_04(self):
+        """TestPlotDecimation.test_04(): A dense curve has at most four points per row and keeps its extremes."""
+        myDepthS = numpy.linspace(0.0, 100.0, 100000)
+        myTracPosS = numpy.sin(myDepthS * 13.0) * numpy.cos(myDepthS)
+        myIdxS = Plot.retDecimatedIndexes(myTracPosS, myDepthS, 1.0)
+        self.assertTrue(len(myIdxS) <= 4 * 101)
+        self.assertEqual(0, myIdxS[0])
+        self.assertEqual(len(myDepthS) - 1, myIdxS[-1])
+        self.assertEqual(myTracPosS.min(), myTracPosS[myIdxS].min())
+        self.assertEqual(myTracPosS.max(), myTracPosS[myIdxS].max())
+
+
 class TestPlotBase(BaseTestClasses.TestBaseFile):
     pass
 
@@ -31,6 +31,9 @@ import time
 import logging
 import io
 
+import numpy
+
+
 from TotalDepth.util import XmlWrite
 from TotalDepth.util.plot import SVGWriter, Coord
 
@@ -305,6 +308,29 @@ class TestSVGWriter(unittest.TestCase):
 </svg>
 """)
         
+    def test_05_01(self):
+        """TestSVGlWriter.test_05_01(): a polyline from numpy arrays is the same as from Coord.Pt() objects."""
+        myX = numpy.array([50, 150, 150, 250.04, 250.06], dtype=numpy.float64)
+        myY = numpy.array([375, 375, 325, 325, -0.04], dtype=numpy.float64)
+        myViewPort = Coord.Box(Coord.Dim(12, 'cm'), Coord.Dim(4, 'cm'))
+        myAttrs = {'fill' : 'none', 'stroke' : 'blue', 'stroke-width' : "5"}
+        myF = io.StringIO()
+        with SVGWriter.SVGWriter(myF, myViewPort) as xS:
+            with SVGWriter.SVGPolyline(
+                    xS,
+                    [Coord.Pt(Coord.baseUnitsDim(x), Coord.baseUnitsDim(y)) for x, y in zip(myX, myY)],
+                    myAttrs):
+                pass
+        myExpected = myF.getvalue()
+        myF = io.StringIO()
+        with SVGWriter.SVGWriter(myF, myViewPort) as xS:
+            with SVGWriter.SVGPolylineXY(xS, myX, myY, myAttrs):
+                pass
+        self.assertEqual(myExpected, myF.getvalue())
+        self.assertTrue('points="50.0,375.0 150.0,375.0 150.0,325.0 250.0,325.0 250.1,-0.0"' in myF.getvalue())
+        with SVGWriter.SVGWriter(io.StringIO(), myViewPort) as xS:
+            self.assertRaises(SVGWriter.ExceptionSVGWriter, SVGWriter.SVGPolylineXY, xS, myX, myY[:2])
+
     def test_06(self):
         """TestSVGlWriter.test_06(): a polygon.
         Based on http://www.w3.org/TR/2003/REC-SVG11-20030114/shapes.html#PolygonElement"""